@@ -0,0 +1,293 @@
+"""
+Cold storage for audit trail rows.
+
+Old ``AccountingAuditTrail`` and legacy ``AuditTrail`` rows are moved out of
+the hot tables into gzip-compressed JSON-lines segments, one segment per
+model and calendar month:
+
+    <AUDIT_TRAIL_ARCHIVE_DIR>/<app_label>.<model_name>/<YYYY>/<YYYY-MM>.jsonl.gz
+
+Segments are append-only. Each archive batch is appended as one gzip member
+and synced to disk before its rows are deleted, and readers see all members
+as a single stream. A member cut short by a crash or a full disk still has
+its rows in the table; readers stop before it and the next archive run
+truncates it away before appending.
+"""
+
+import gzip
+import json
+import os
+import zlib
+from datetime import date, datetime, time
+
+from django.apps import apps
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+ARCHIVED_AUDIT_MODELS = ("accounting.AccountingAuditTrail", "payroll.AuditTrail")
+# Compressed bytes read from a segment at a time.
+SEGMENT_READ_SIZE = 1024 * 1024
+
+
+def get_archive_root():
+    return getattr(
+        settings,
+        "AUDIT_TRAIL_ARCHIVE_DIR",
+        os.path.join(settings.BASE_DIR, "audit_archive"),
+    )
+
+
+def _model_label(model):
+    return f"{model._meta.app_label}.{model._meta.model_name}"
+
+
+def _segment_path(model, year, month, root=None):
+    return os.path.join(
+        root or get_archive_root(),
+        _model_label(model),
+        f"{year:04d}",
+        f"{year:04d}-{month:02d}.jsonl.gz",
+    )
+
+
+def _month_start(value):
+    return value.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def _next_month(value):
+    if value.month == 12:
+        return value.replace(year=value.year + 1, month=1)
+    return value.replace(month=value.month + 1)
+
+
+def _aware(value):
+    if isinstance(value, date) and not isinstance(value, datetime):
+        value = datetime.combine(value, time.min)
+    if timezone.is_naive(value):
+        value = timezone.make_aware(value)
+    return value
+
+
+def _serialize_row(instance):
+    return {
+        field.attname: getattr(instance, field.attname)
+        for field in instance._meta.concrete_fields
+    }
+
+
+def _read_segment(path):
+    """
+    Yield ``(end_offset, text)`` for each complete gzip member of a segment.
+
+    Stops at the first truncated or damaged member, which only an interrupted
+    write leaves behind, so the last ``end_offset`` is where intact data ends.
+    """
+    decompressor = zlib.decompressobj(wbits=31)
+    chunks = []
+    consumed = 0
+    with open(path, "rb") as segment:
+        while data := segment.read(SEGMENT_READ_SIZE):
+            while data:
+                try:
+                    chunks.append(decompressor.decompress(data))
+                except zlib.error:
+                    return
+                if not decompressor.eof:
+                    consumed += len(data)
+                    break
+                rest = decompressor.unused_data
+                consumed += len(data) - len(rest)
+                yield consumed, b"".join(chunks).decode("utf-8")
+                decompressor = zlib.decompressobj(wbits=31)
+                chunks = []
+                data = rest
+
+
+def _repair_segment(path):
+    """Truncate a segment after its last intact gzip member."""
+    if not os.path.exists(path):
+        return
+    intact = 0
+    for intact, _text in _read_segment(path):
+        pass
+    if os.path.getsize(path) > intact:
+        with open(path, "r+b") as segment:
+            segment.truncate(intact)
+            os.fsync(segment.fileno())
+
+
+def _append_member(path, lines):
+    """Append ``lines`` to a segment as one gzip member synced to disk."""
+    member = gzip.compress("".join(lines).encode("utf-8"))
+    with open(path, "ab", buffering=0) as segment:
+        size = segment.seek(0, os.SEEK_END)
+        try:
+            view = memoryview(member)
+            while view:
+                view = view[segment.write(view) :]
+            os.fsync(segment.fileno())
+        except BaseException:
+            # Never leave a partial member in front of later appends.
+            segment.truncate(size)
+            raise
+
+
+def archive_audit_rows(model, before, batch_size=1000, dry_run=False, root=None):
+    """
+    Move rows of ``model`` with a timestamp earlier than ``before`` to archive.
+
+    Rows are processed one calendar month at a time in primary-key batches.
+    Each batch is written and synced to its month segment before it is
+    deleted, so an interrupted run leaves rows either in the table or in the
+    archive (a batch may appear twice in its segment if the delete did not
+    commit; readers de-duplicate on ``id`` within each segment).
+
+    Returns:
+        Dictionary mapping ``YYYY-MM`` to the number of archived rows
+    """
+    before = _aware(before)
+    manager = model._base_manager
+    oldest = (
+        manager.filter(timestamp__lt=before)
+        .order_by("timestamp")
+        .values_list("timestamp", flat=True)
+        .first()
+    )
+    summary = {}
+    if oldest is None:
+        return summary
+
+    month_start = _month_start(timezone.localtime(oldest))
+    while month_start < before:
+        month_end = min(_next_month(month_start), before)
+        month_rows = manager.filter(
+            timestamp__gte=month_start, timestamp__lt=month_end
+        ).order_by("pk")
+        key = f"{month_start.year:04d}-{month_start.month:02d}"
+
+        if dry_run:
+            count = month_rows.count()
+            if count:
+                summary[key] = count
+            month_start = _next_month(month_start)
+            continue
+
+        path = _segment_path(model, month_start.year, month_start.month, root=root)
+        _repair_segment(path)
+        last_pk = 0
+        while True:
+            batch = list(month_rows.filter(pk__gt=last_pk)[:batch_size])
+            if not batch:
+                break
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            _append_member(
+                path,
+                [
+                    json.dumps(_serialize_row(instance), cls=DjangoJSONEncoder) + "\n"
+                    for instance in batch
+                ],
+            )
+            pks = [instance.pk for instance in batch]
+            with transaction.atomic():
+                manager.filter(pk__in=pks).delete()
+            summary[key] = summary.get(key, 0) + len(pks)
+            last_pk = pks[-1]
+
+        month_start = _next_month(month_start)
+    return summary
+
+
+def iter_archive_segments(model, start=None, end=None, root=None):
+    """Yield segment paths for ``model`` that overlap ``[start, end]``, oldest first."""
+    model_root = os.path.join(root or get_archive_root(), _model_label(model))
+    if not os.path.isdir(model_root):
+        return
+    start_key = f"{start.year:04d}-{start.month:02d}" if start else None
+    end_key = f"{end.year:04d}-{end.month:02d}" if end else None
+    for year_dir in sorted(os.listdir(model_root)):
+        year_path = os.path.join(model_root, year_dir)
+        if not os.path.isdir(year_path):
+            continue
+        for name in sorted(os.listdir(year_path)):
+            if not name.endswith(".jsonl.gz"):
+                continue
+            key = name[: -len(".jsonl.gz")]
+            if start_key and key < start_key:
+                continue
+            if end_key and key > end_key:
+                continue
+            yield os.path.join(year_path, name)
+
+
+def search_audit_archive(
+    model,
+    start=None,
+    end=None,
+    company_id=None,
+    user_id=None,
+    action=None,
+    content_type_id=None,
+    object_id=None,
+    query=None,
+    root=None,
+):
+    """
+    Yield archived rows of ``model`` matching the given filters.
+
+    Only segments for months overlapping ``start``/``end`` are opened. Rows are
+    yielded as dictionaries keyed by field attname, with ``timestamp`` parsed
+    back into a datetime. ``query`` is a case-insensitive substring match
+    against the action, reason and serialized changes. A segment whose last
+    member was cut short by an interrupted archive run is read up to it.
+    """
+    start = _aware(start) if start else None
+    end = _aware(end) if end else None
+    needle = query.lower() if query else None
+
+    for path in iter_archive_segments(model, start=start, end=end, root=root):
+        # A row is only ever archived into its own month's segment, so
+        # duplicates are confined to one segment.
+        seen_ids = set()
+        for _offset, text in _read_segment(path):
+            for line in text.splitlines():
+                row = json.loads(line)
+                if row["id"] in seen_ids:
+                    continue
+                timestamp = parse_datetime(row["timestamp"])
+                if start and timestamp < start:
+                    continue
+                if end and timestamp > end:
+                    continue
+                if company_id is not None and row.get("company_id") != company_id:
+                    continue
+                if user_id is not None and row.get("user_id") != user_id:
+                    continue
+                if action and row.get("action") != action:
+                    continue
+                if (
+                    content_type_id is not None
+                    and row.get("content_type_id") != content_type_id
+                ):
+                    continue
+                if object_id is not None and row.get("object_id") != object_id:
+                    continue
+                if needle:
+                    haystack = " ".join(
+                        [
+                            row.get("action") or "",
+                            row.get("reason") or "",
+                            json.dumps(row.get("changes") or {}),
+                        ]
+                    ).lower()
+                    if needle not in haystack:
+                        continue
+                seen_ids.add(row["id"])
+                row["timestamp"] = timestamp
+                yield row
+
+
+def get_archived_audit_models():
+    return [apps.get_model(label) for label in ARCHIVED_AUDIT_MODELS]
@@ -1,12 +1,13 @@
+from django.conf import settings
 from django.core.management.base import BaseCommand, CommandError
 from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.models import ContentType
 
 # from django.db import transaction
-# from django.utils import timezone
+from django.utils import timezone
 from django.utils.dateparse import parse_date
 
-# from datetime import datetime, timedelta
+from datetime import timedelta
 # import json
 
 from accounting.models import (
@@ -17,7 +18,9 @@ from accounting.models import (
     JournalEntry,
     AccountingAuditTrail,
 )
+from accounting.audit_archive import archive_audit_rows, search_audit_archive
 from accounting.middleware import set_audit_user, set_audit_metadata
+from payroll.models.utils import AuditTrail
 
 # from accounting.utils import log_accounting_activity
 
@@ -25,12 +28,22 @@ User = get_user_model()
 
 
 class Command(BaseCommand):
-    help = "Manage audit trail: backfill, verify integrity, and cleanup"
+    help = (
+        "Manage audit trail: backfill, verify integrity, cleanup, and archive "
+        "old rows to compressed monthly segments"
+    )
 
     def add_arguments(self, parser):
         parser.add_argument(
             "action",
-            choices=["backfill", "verify", "cleanup", "stats"],
+            choices=[
+                "backfill",
+                "verify",
+                "cleanup",
+                "stats",
+                "archive",
+                "search-archive",
+            ],
             help="Action to perform",
         )
 
@@ -63,12 +76,68 @@ class Command(BaseCommand):
 
         parser.add_argument("--verbose", action="store_true", help="Verbose output")
 
+        parser.add_argument(
+            "--trail",
+            choices=["all", "accounting", "legacy"],
+            default="all",
+            help="Audit table to archive or search (default: all)",
+        )
+
+        parser.add_argument(
+            "--older-than-days",
+            type=int,
+            help=(
+                "Archive rows older than this many days "
+                "(default: AUDIT_TRAIL_RETENTION_DAYS)"
+            ),
+        )
+
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Rows moved per archive batch (default: 1000)",
+        )
+
+        parser.add_argument(
+            "--query", type=str, help="Text to search for in archived rows"
+        )
+
+        parser.add_argument(
+            "--company-id", type=int, help="Restrict archive search to a company"
+        )
+
+        parser.add_argument(
+            "--object-id", type=int, help="Restrict archive search to an object id"
+        )
+
+        parser.add_argument(
+            "--action",
+            type=str,
+            dest="audit_action",
+            help="Restrict archive search to an action, e.g. UPDATE",
+        )
+
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=100,
+            help="Maximum archived rows to print (default: 100)",
+        )
+
     def handle(self, *args, **options):
         action = options["action"]
         model_type = options["model"]
         dry_run = options["dry_run"]
         verbose = options["verbose"]
 
+        if action == "archive":
+            self.archive_audit_trail(options, dry_run)
+            return
+        if action == "search-archive":
+            self.search_archived_audit_trail(options)
+            return
+
         # Set up audit context for management commands
         self.setup_audit_context(options.get("user_id"))
 
@@ -696,3 +765,72 @@ class Command(BaseCommand):
 
         if missing_objects > 0:
             self.stdout.write(f"Entries with missing objects: {missing_objects}")
+
+    def get_archive_models(self, trail):
+        models = []
+        if trail in ["all", "accounting"]:
+            models.append(AccountingAuditTrail)
+        if trail in ["all", "legacy"]:
+            models.append(AuditTrail)
+        return models
+
+    def archive_audit_trail(self, options, dry_run):
+        """Move old audit rows into compressed monthly archive segments."""
+        days = options.get("older_than_days")
+        if days is None:
+            days = settings.AUDIT_TRAIL_RETENTION_DAYS
+        if days < 1:
+            raise CommandError("--older-than-days must be at least 1")
+        before = timezone.now() - timedelta(days=days)
+
+        self.stdout.write(f"Archiving audit rows older than {before:%Y-%m-%d}")
+        if dry_run:
+            self.stdout.write("DRY RUN - No changes will be made")
+
+        for model in self.get_archive_models(options["trail"]):
+            summary = archive_audit_rows(
+                model,
+                before=before,
+                batch_size=options["batch_size"],
+                dry_run=dry_run,
+            )
+            total = sum(summary.values())
+            for month, count in summary.items():
+                self.stdout.write(f"  {model.__name__} {month}: {count}")
+            self.stdout.write(
+                f"{'Would archive' if dry_run else 'Archived'} {total} "
+                f"{model._meta.verbose_name} rows"
+            )
+
+    def search_archived_audit_trail(self, options):
+        """Search archived audit rows and print the matches."""
+        start_date = options.get("start_date")
+        end_date = options.get("end_date")
+        start = parse_date(start_date) if start_date else None
+        # The end date is inclusive, so search up to the following midnight.
+        end = parse_date(end_date) + timedelta(days=1) if end_date else None
+
+        printed = 0
+        limit = options["limit"]
+        for model in self.get_archive_models(options["trail"]):
+            rows = search_audit_archive(
+                model,
+                start=start,
+                end=end,
+                company_id=options.get("company_id"),
+                user_id=options.get("user_id"),
+                action=options.get("audit_action"),
+                object_id=options.get("object_id"),
+                query=options.get("query"),
+            )
+            for row in rows:
+                if printed >= limit:
+                    break
+                self.stdout.write(
+                    f"  {row['timestamp']} - {model.__name__} #{row['id']} - "
+                    f"user={row.get('user_id')} - {row.get('action')} - "
+                    f"{row.get('content_type_id')}:{row.get('object_id')}"
+                )
+                printed += 1
+
+        self.stdout.write(f"Found {printed} archived audit rows")
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.18 on 2026-10-18 21:10
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounting', '0006_financialreportline_formula_and_more'),
+        ('company', '0003_backfill_memberships'),
+        ('contenttypes', '0002_remove_content_type_name'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='accountingaudittrail',
+            index=models.Index(fields=['-timestamp'], name='accounting__timesta_d72cad_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='accountingaudittrail',
+            index=models.Index(fields=['company', '-timestamp'], name='accounting__company_d7929e_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='accountingaudittrail',
+            index=models.Index(fields=['user', '-timestamp'], name='accounting__user_id_367a06_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='accountingaudittrail',
+            index=models.Index(fields=['action', '-timestamp'], name='accounting__action_19b866_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='accountingaudittrail',
+            index=models.Index(fields=['content_type', 'object_id'], name='accounting__content_1dfdd6_idx'),
+        ),
+    ]
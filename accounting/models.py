@@ -11,6 +11,8 @@ from django.apps import apps
 from datetime import date, timedelta
 import json
 
+from .tracking import FieldTrackerMixin
+
 User = get_user_model()
 
 
@@ -24,7 +26,7 @@ class BaseModel(models.Model):
         abstract = True
 
 
-class Account(BaseModel):
+class Account(FieldTrackerMixin, BaseModel):
     class AccountType(models.TextChoices):
         ASSET = "ASSET", _("Asset")
         LIABILITY = "LIABILITY", _("Liability")
@@ -171,7 +173,7 @@ class FinancialReportLine(BaseModel):
         return f"{self.report.code} {self.row_code} - {self.label}"
 
 
-class FiscalYear(BaseModel):
+class FiscalYear(FieldTrackerMixin, BaseModel):
     """Represents a fiscal year for accounting purposes"""
 
     company = models.ForeignKey(
@@ -236,7 +238,7 @@ class FiscalYear(BaseModel):
         # Signal will automatically log the closure through signal handlers
 
 
-class AccountingPeriod(BaseModel):
+class AccountingPeriod(FieldTrackerMixin, BaseModel):
     """Represents an accounting period within a fiscal year"""
 
     fiscal_year = models.ForeignKey(
@@ -417,6 +419,13 @@ class AccountingAuditTrail(BaseModel):
         verbose_name = "Accounting Audit Trail"
         verbose_name_plural = "Accounting Audit Trails"
         ordering = ["-timestamp"]
+        indexes = [
+            models.Index(fields=["-timestamp"]),
+            models.Index(fields=["company", "-timestamp"]),
+            models.Index(fields=["user", "-timestamp"]),
+            models.Index(fields=["action", "-timestamp"]),
+            models.Index(fields=["content_type", "object_id"]),
+        ]
 
     def __str__(self):
         return f"{self.user} performed {self.action} on {self.content_object} at {self.timestamp}"
@@ -475,7 +484,7 @@ class AccountingAuditTrail(BaseModel):
                 create_audit_entry()
 
 
-class Journal(BaseModel):
+class Journal(FieldTrackerMixin, BaseModel):
     class JournalStatus(models.TextChoices):
         DRAFT = "DRAFT", _("Draft")
         PENDING_APPROVAL = "PENDING_APPROVAL", _("Pending Approval")
@@ -725,7 +734,7 @@ class Journal(BaseModel):
         ordering = ["-date", "-created_at"]
 
 
-class JournalEntry(BaseModel):
+class JournalEntry(FieldTrackerMixin, BaseModel):
     class EntryType(models.TextChoices):
         DEBIT = "DEBIT", _("Debit")
         CREDIT = "CREDIT", _("Credit")
@@ -232,25 +232,63 @@ def assign_user_to_payroll_processor_role(user):
     print(f"User {user.email} assigned to Payroll Processor role.")
 
 
+ROLE_GROUP_CACHE_ATTR = "_role_group_names"
+PERMISSION_CACHE_ATTRS = ("_perm_cache", "_user_perm_cache", "_group_perm_cache")
+
+
+def get_user_group_names(user):
+    """
+    Return the names of the user's groups, loaded with one query per user object.
+
+    The result is cached on the user instance, like Django's own permission
+    cache, so for ``request.user`` it lasts exactly one request.
+    """
+    if not getattr(user, "is_authenticated", False) or user.pk is None:
+        return frozenset()
+    group_names = getattr(user, ROLE_GROUP_CACHE_ATTR, None)
+    if group_names is None:
+        group_names = frozenset(user.groups.values_list("name", flat=True))
+        setattr(user, ROLE_GROUP_CACHE_ATTR, group_names)
+    return group_names
+
+
+def clear_user_role_cache(user):
+    """
+    Drop cached group names and permissions from a user instance.
+    """
+    for attr in (ROLE_GROUP_CACHE_ATTR, *PERMISSION_CACHE_ATTRS):
+        try:
+            delattr(user, attr)
+        except AttributeError:
+            pass
+
+
+def has_group(user, group_name):
+    """
+    Check group membership using the cached group names
+    """
+    return group_name in get_user_group_names(user)
+
+
 def is_auditor(user):
     """
     Check if user has auditor role or is superuser
     """
-    return user.is_superuser or user.groups.filter(name="Auditor").exists()
+    return user.is_superuser or has_group(user, "Auditor")
 
 
 def is_accountant(user):
     """
     Check if user has accountant role or is superuser
     """
-    return user.is_superuser or user.groups.filter(name="Accountant").exists()
+    return user.is_superuser or has_group(user, "Accountant")
 
 
 def is_payroll_processor(user):
     """
     Check if user has payroll processor role or is superuser
     """
-    return user.is_superuser or user.groups.filter(name="Payroll Processor").exists()
+    return user.is_superuser or has_group(user, "Payroll Processor")
 
 
 def is_hr_staff(user):
@@ -1,7 +1,11 @@
 from decimal import Decimal
 import re
 
-from accounting.models import FinancialReportLine
+from django.db.models import Case, DecimalField, F, Q, Sum, When, Window
+from django.db.models.expressions import RowRange
+from django.utils.dateparse import parse_date
+
+from accounting.models import Account, FinancialReportLine, Journal, JournalEntry
 
 
 def _evaluate_formula(formula, amounts_by_code):
@@ -72,3 +76,174 @@ def build_financial_report(definition):
         "rows": rows,
         "total": total,
     }
+
+
+# Journal statuses whose entries make up the ledger. A reversed journal stays
+# in the ledger alongside its posted reversal so the pair nets to zero.
+LEDGER_STATUSES = (Journal.JournalStatus.POSTED, Journal.JournalStatus.REVERSED)
+ACTIVITY_PAGE_SIZE = 100
+ACTIVITY_ORDERING = ("journal__date", "journal_id", "pk")
+
+_AMOUNT_FIELD = DecimalField(max_digits=20, decimal_places=2)
+_ZERO = Decimal("0.00")
+
+
+def _signed_amount(account):
+    """Entry amount signed by the account's normal balance side."""
+    if account.type in (Account.AccountType.ASSET, Account.AccountType.EXPENSE):
+        increase = JournalEntry.EntryType.DEBIT
+    else:
+        increase = JournalEntry.EntryType.CREDIT
+    return Case(
+        When(entry_type=increase, then=F("amount")),
+        default=-F("amount"),
+        output_field=_AMOUNT_FIELD,
+    )
+
+
+def encode_activity_cursor(entry):
+    return f"{entry.journal.date.isoformat()}_{entry.journal_id}_{entry.pk}"
+
+
+def decode_activity_cursor(token):
+    """Return ``(date, journal_id, entry_id)`` for a cursor token, or ``None``."""
+    try:
+        raw_date, journal_id, entry_id = (token or "").split("_")
+        cursor_date = parse_date(raw_date)
+        cursor = (cursor_date, int(journal_id), int(entry_id))
+    except ValueError:
+        return None
+    return cursor if cursor_date else None
+
+
+def _before_cursor(cursor):
+    """Q matching entries that sort at or before ``cursor``."""
+    cursor_date, journal_id, entry_id = cursor
+    return (
+        Q(journal__date__lt=cursor_date)
+        | Q(journal__date=cursor_date, journal_id__lt=journal_id)
+        | Q(journal__date=cursor_date, journal_id=journal_id, pk__lte=entry_id)
+    )
+
+
+def get_account_activity_summary(account, start_date=None, end_date=None, cursor=None):
+    """
+    Opening, closing and period totals for an account in a single aggregate.
+
+    ``page_opening_balance`` is the balance just before the first entry after
+    ``cursor``, i.e. the value the running balance of that page starts from.
+    """
+    signed = _signed_amount(account)
+    in_range = Q()
+    if start_date:
+        in_range &= Q(journal__date__gte=start_date)
+    if end_date:
+        in_range &= Q(journal__date__lte=end_date)
+    before_page = in_range & _before_cursor(cursor) if cursor else None
+
+    aggregates = {
+        "current_balance": Sum(signed),
+        "range_delta": Sum(signed, filter=in_range) if in_range else Sum(signed),
+        "total_debits": Sum(
+            "amount", filter=in_range & Q(entry_type=JournalEntry.EntryType.DEBIT)
+        ),
+        "total_credits": Sum(
+            "amount", filter=in_range & Q(entry_type=JournalEntry.EntryType.CREDIT)
+        ),
+    }
+    if start_date:
+        aggregates["opening_balance"] = Sum(
+            signed, filter=Q(journal__date__lt=start_date)
+        )
+    if before_page is not None:
+        aggregates["page_delta"] = Sum(signed, filter=before_page)
+
+    totals = {
+        key: value if value is not None else _ZERO
+        for key, value in account.entries.filter(journal__status__in=LEDGER_STATUSES)
+        .aggregate(**aggregates)
+        .items()
+    }
+    opening_balance = totals.get("opening_balance", _ZERO)
+    return {
+        "opening_balance": opening_balance,
+        "page_opening_balance": opening_balance + totals.get("page_delta", _ZERO),
+        "closing_balance": opening_balance + totals["range_delta"],
+        "current_balance": totals["current_balance"],
+        "total_debits": totals["total_debits"],
+        "total_credits": totals["total_credits"],
+    }
+
+
+def account_activity_entries(account, start_date=None, end_date=None, cursor=None):
+    """
+    Ledger entries for ``account`` annotated with ``running_delta``.
+
+    ``running_delta`` is a window sum over the selected rows, so adding the
+    matching ``page_opening_balance`` gives the running balance of each row.
+    """
+    entries = account.entries.filter(journal__status__in=LEDGER_STATUSES)
+    if start_date:
+        entries = entries.filter(journal__date__gte=start_date)
+    if end_date:
+        entries = entries.filter(journal__date__lte=end_date)
+    if cursor:
+        entries = entries.exclude(_before_cursor(cursor))
+    return (
+        entries.select_related("journal")
+        .annotate(
+            running_delta=Window(
+                Sum(_signed_amount(account)),
+                order_by=[F(field) for field in ACTIVITY_ORDERING],
+                frame=RowRange(start=None, end=0),
+                output_field=_AMOUNT_FIELD,
+            )
+        )
+        .order_by(*ACTIVITY_ORDERING)
+    )
+
+
+def iter_account_activity(
+    account, start_date=None, end_date=None, opening_balance=None, chunk_size=2000
+):
+    """Yield every entry in the range with ``running_balance`` set, in chunks."""
+    if opening_balance is None:
+        opening_balance = get_account_activity_summary(
+            account, start_date=start_date, end_date=end_date
+        )["opening_balance"]
+    entries = account_activity_entries(account, start_date=start_date, end_date=end_date)
+    for entry in entries.iterator(chunk_size=chunk_size):
+        entry.running_balance = opening_balance + entry.running_delta
+        yield entry
+
+
+def get_account_activity_page(
+    account, start_date=None, end_date=None, after=None, page_size=ACTIVITY_PAGE_SIZE
+):
+    """
+    One keyset page of the account activity report.
+
+    ``after`` is the opaque cursor returned as ``next_cursor`` by the previous
+    page. Invalid cursors restart from the first page.
+    """
+    cursor = decode_activity_cursor(after) if after else None
+    summary = get_account_activity_summary(
+        account, start_date=start_date, end_date=end_date, cursor=cursor
+    )
+    entries = list(
+        account_activity_entries(
+            account, start_date=start_date, end_date=end_date, cursor=cursor
+        )[: page_size + 1]
+    )
+    has_next = len(entries) > page_size
+    entries = entries[:page_size]
+    for entry in entries:
+        entry.running_balance = summary["page_opening_balance"] + entry.running_delta
+
+    return {
+        **summary,
+        "entries": entries,
+        "has_next": has_next,
+        "next_cursor": encode_activity_cursor(entries[-1]) if has_next else None,
+        "is_first_page": cursor is None,
+    }
@@ -19,6 +19,7 @@ from .models import (
     JournalEntry,
     AccountingAuditTrail,
 )
+from .tracking import get_audit_changes
 from .utils import get_request_user, get_request_metadata
 
 User = get_user_model()
@@ -84,43 +85,13 @@ def log_model_change(sender, instance, action, changes=None, reason=None):
             log_audit_trail()
 
 
-def get_field_changes(old_instance, new_instance):
-    """
-    Compare two model instances and return field changes.
-
-    Args:
-        old_instance: Original model instance
-        new_instance: Updated model instance
-
-    Returns:
-        Dictionary of field changes
-    """
-    changes = {}
-    for field in new_instance._meta.fields:
-        field_name = field.name
-        if field_name not in ["id", "created_at", "updated_at"]:
-            old_value = getattr(old_instance, field_name)
-            new_value = getattr(new_instance, field_name)
-            if old_value != new_value:
-                changes[field_name] = {
-                    "old": str(old_value) if old_value is not None else None,
-                    "new": str(new_value) if new_value is not None else None,
-                }
-    return changes
-
-
 # Account signal handlers
 @receiver(pre_save, sender=Account)
 def account_pre_save(sender, instance, **kwargs):
     """Track account changes before save."""
-    if instance.pk:
-        try:
-            old_instance = Account.objects.get(pk=instance.pk)
-            instance._audit_changes = get_field_changes(old_instance, instance)
-        except Account.DoesNotExist:
-            instance._audit_changes = {}
-    else:
-        instance._audit_changes = {}
+    instance._audit_changes = get_audit_changes(
+        instance, update_fields=kwargs.get("update_fields")
+    )
 
 
 @receiver(post_save, sender=Account)
@@ -204,14 +175,9 @@ def account_post_delete(sender, instance, **kwargs):
 @receiver(pre_save, sender=FiscalYear)
 def fiscal_year_pre_save(sender, instance, **kwargs):
     """Track fiscal year changes before save."""
-    if instance.pk:
-        try:
-            old_instance = FiscalYear.objects.get(pk=instance.pk)
-            instance._audit_changes = get_field_changes(old_instance, instance)
-        except FiscalYear.DoesNotExist:
-            instance._audit_changes = {}
-    else:
-        instance._audit_changes = {}
+    instance._audit_changes = get_audit_changes(
+        instance, update_fields=kwargs.get("update_fields")
+    )
 
 
 @receiver(post_save, sender=FiscalYear)
@@ -305,14 +271,9 @@ def fiscal_year_post_delete(sender, instance, **kwargs):
 @receiver(pre_save, sender=AccountingPeriod)
 def accounting_period_pre_save(sender, instance, **kwargs):
     """Track accounting period changes before save."""
-    if instance.pk:
-        try:
-            old_instance = AccountingPeriod.objects.get(pk=instance.pk)
-            instance._audit_changes = get_field_changes(old_instance, instance)
-        except AccountingPeriod.DoesNotExist:
-            instance._audit_changes = {}
-    else:
-        instance._audit_changes = {}
+    instance._audit_changes = get_audit_changes(
+        instance, update_fields=kwargs.get("update_fields")
+    )
 
 
 @receiver(post_save, sender=AccountingPeriod)
@@ -406,14 +367,9 @@ def accounting_period_post_delete(sender, instance, **kwargs):
 @receiver(pre_save, sender=Journal)
 def journal_pre_save(sender, instance, **kwargs):
     """Track journal changes before save."""
-    if instance.pk:
-        try:
-            old_instance = Journal.objects.get(pk=instance.pk)
-            instance._audit_changes = get_field_changes(old_instance, instance)
-        except Journal.DoesNotExist:
-            instance._audit_changes = {}
-    else:
-        instance._audit_changes = {}
+    instance._audit_changes = get_audit_changes(
+        instance, update_fields=kwargs.get("update_fields")
+    )
 
 
 @receiver(post_save, sender=Journal)
@@ -538,14 +494,9 @@ def journal_post_delete(sender, instance, **kwargs):
 @receiver(pre_save, sender=JournalEntry)
 def journal_entry_pre_save(sender, instance, **kwargs):
     """Track journal entry changes before save."""
-    if instance.pk:
-        try:
-            old_instance = JournalEntry.objects.get(pk=instance.pk)
-            instance._audit_changes = get_field_changes(old_instance, instance)
-        except JournalEntry.DoesNotExist:
-            instance._audit_changes = {}
-    else:
-        instance._audit_changes = {}
+    instance._audit_changes = get_audit_changes(
+        instance, update_fields=kwargs.get("update_fields")
+    )
 
 
 @receiver(post_save, sender=JournalEntry)
@@ -3,3 +3,26 @@
 Legacy payroll and IOU accounting signal handlers were removed.
 Current posting flows are handled in `payroll.signals`.
 """
+
+from django.contrib.auth import get_user_model
+from django.db.models.signals import m2m_changed
+from django.dispatch import receiver
+
+from .permissions import clear_user_role_cache
+
+User = get_user_model()
+
+
+@receiver(m2m_changed, sender=User.groups.through)
+def clear_role_cache_on_group_change(sender, instance, action, reverse, **kwargs):
+    """
+    Forget cached roles when a user's groups change.
+
+    Only the instance the change was made through can be reached here; other
+    copies of the user (e.g. another request's ``request.user``) reload their
+    groups on their next request.
+    """
+    if action not in {"post_add", "post_remove", "post_clear"}:
+        return
+    if not reverse:
+        clear_user_role_cache(instance)
@@ -0,0 +1,125 @@
+from datetime import date
+from decimal import Decimal
+
+from django.test import TestCase
+
+from accounting.models import (
+    Account,
+    AccountingPeriod,
+    FiscalYear,
+    Journal,
+    JournalEntry,
+)
+from accounting.reporting import (
+    get_account_activity_page,
+    get_account_activity_summary,
+    iter_account_activity,
+)
+from company.models import Company
+
+
+class AccountActivityTests(TestCase):
+    def setUp(self):
+        self.company = Company.objects.create(name="Ledger Co")
+        fiscal_year = FiscalYear.objects.create(
+            company=self.company,
+            year=2024,
+            name="FY 2024",
+            start_date=date(2024, 1, 1),
+            end_date=date(2024, 12, 31),
+        )
+        self.period = AccountingPeriod.objects.create(
+            company=self.company,
+            fiscal_year=fiscal_year,
+            period_number=1,
+            name="2024",
+            start_date=date(2024, 1, 1),
+            end_date=date(2024, 12, 31),
+        )
+        self.cash = Account.objects.create(
+            company=self.company,
+            name="Cash",
+            account_number="1000",
+            type=Account.AccountType.ASSET,
+        )
+        self.revenue = Account.objects.create(
+            company=self.company,
+            name="Sales",
+            account_number="4000",
+            type=Account.AccountType.REVENUE,
+        )
+
+    def _journal(self, day, amount, status=Journal.JournalStatus.POSTED):
+        debit, credit = JournalEntry.EntryType.DEBIT, JournalEntry.EntryType.CREDIT
+        if amount < 0:
+            debit, credit = credit, debit
+        journal = Journal.objects.create(
+            company=self.company,
+            period=self.period,
+            date=day,
+            description=f"Sale {day}",
+            status=status,
+        )
+        JournalEntry.objects.create(
+            journal=journal,
+            account=self.cash,
+            entry_type=debit,
+            amount=abs(amount),
+        )
+        JournalEntry.objects.create(
+            journal=journal,
+            account=self.revenue,
+            entry_type=credit,
+            amount=abs(amount),
+        )
+        return journal
+
+    def test_summary_ignores_unposted_journals(self):
+        self._journal(date(2024, 1, 5), Decimal("100.00"))
+        self._journal(date(2024, 2, 5), Decimal("40.00"))
+        self._journal(date(2024, 2, 6), Decimal("-15.00"))
+        self._journal(date(2024, 2, 7), Decimal("999.00"), Journal.JournalStatus.DRAFT)
+
+        summary = get_account_activity_summary(
+            self.cash, start_date=date(2024, 2, 1), end_date=date(2024, 2, 28)
+        )
+
+        self.assertEqual(summary["opening_balance"], Decimal("100.00"))
+        self.assertEqual(summary["total_debits"], Decimal("40.00"))
+        self.assertEqual(summary["total_credits"], Decimal("15.00"))
+        self.assertEqual(summary["closing_balance"], Decimal("125.00"))
+        self.assertEqual(summary["current_balance"], Decimal("125.00"))
+
+        revenue = get_account_activity_summary(self.revenue)
+        self.assertEqual(revenue["closing_balance"], Decimal("125.00"))
+
+    def test_pages_continue_running_balance(self):
+        for day, amount in [(3, "10.00"), (1, "20.00"), (2, "-5.00"), (2, "7.00")]:
+            self._journal(date(2024, 3, day), Decimal(amount))
+
+        first = get_account_activity_page(self.cash, page_size=2)
+        second = get_account_activity_page(
+            self.cash, after=first["next_cursor"], page_size=2
+        )
+
+        self.assertTrue(first["has_next"])
+        self.assertFalse(second["has_next"])
+        balances = [
+            entry.running_balance for entry in first["entries"] + second["entries"]
+        ]
+        self.assertEqual(
+            balances,
+            [Decimal("20.00"), Decimal("15.00"), Decimal("22.00"), Decimal("32.00")],
+        )
+        self.assertEqual(
+            [entry.running_balance for entry in iter_account_activity(self.cash)],
+            balances,
+        )
+
+    def test_invalid_cursor_restarts_from_first_page(self):
+        self._journal(date(2024, 3, 1), Decimal("20.00"))
+
+        page = get_account_activity_page(self.cash, after="not-a-cursor")
+
+        self.assertTrue(page["is_first_page"])
+        self.assertEqual(len(page["entries"]), 1)
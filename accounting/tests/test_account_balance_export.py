@@ -0,0 +1,130 @@
+import zipfile
+from datetime import date
+from decimal import Decimal
+from io import BytesIO
+from xml.etree import ElementTree
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from accounting.exports import stream_csv, stream_xlsx
+from accounting.models import (
+    Account,
+    AccountingPeriod,
+    FiscalYear,
+    Journal,
+    JournalEntry,
+)
+from accounting.utils import annotate_account_balances
+from company.models import Company
+
+SHEET_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+
+
+class AccountBalanceExportTests(TestCase):
+    def setUp(self):
+        self.company = Company.objects.create(name="Export Co")
+        fiscal_year = FiscalYear.objects.create(
+            company=self.company,
+            year=2024,
+            name="FY 2024",
+            start_date=date(2024, 1, 1),
+            end_date=date(2024, 12, 31),
+        )
+        self.period = AccountingPeriod.objects.create(
+            company=self.company,
+            fiscal_year=fiscal_year,
+            period_number=1,
+            name="2024",
+            start_date=date(2024, 1, 1),
+            end_date=date(2024, 12, 31),
+        )
+        self.cash = Account.objects.create(
+            company=self.company,
+            name="Cash",
+            account_number="1000",
+            type=Account.AccountType.ASSET,
+        )
+        self.revenue = Account.objects.create(
+            company=self.company,
+            name="Sales",
+            account_number="4000",
+            type=Account.AccountType.REVENUE,
+        )
+        self.idle = Account.objects.create(
+            company=self.company,
+            name="Idle",
+            account_number="5000",
+            type=Account.AccountType.EXPENSE,
+        )
+
+    def _sale(self, day, amount, status=Journal.JournalStatus.POSTED):
+        journal = Journal.objects.create(
+            company=self.company,
+            period=self.period,
+            date=day,
+            description="Sale",
+            status=status,
+        )
+        JournalEntry.objects.create(
+            journal=journal,
+            account=self.cash,
+            entry_type=JournalEntry.EntryType.DEBIT,
+            amount=amount,
+        )
+        JournalEntry.objects.create(
+            journal=journal,
+            account=self.revenue,
+            entry_type=JournalEntry.EntryType.CREDIT,
+            amount=amount,
+        )
+
+    def test_balances_come_from_one_query(self):
+        self._sale(date(2024, 1, 10), Decimal("100.00"))
+        self._sale(date(2024, 2, 10), Decimal("50.00"))
+        self._sale(date(2024, 1, 20), Decimal("7.00"), Journal.JournalStatus.DRAFT)
+
+        with CaptureQueriesContext(connection) as ctx:
+            balances = dict(
+                annotate_account_balances(
+                    Account.objects.filter(company=self.company),
+                    as_of_date=date(2024, 1, 31),
+                ).values_list("name", "ledger_balance")
+            )
+
+        self.assertEqual(len(ctx.captured_queries), 1)
+        self.assertEqual(
+            balances,
+            {
+                "Cash": Decimal("100.00"),
+                "Sales": Decimal("100.00"),
+                "Idle": Decimal("0.00"),
+            },
+        )
+        for account in Account.objects.filter(company=self.company):
+            current = annotate_account_balances(
+                Account.objects.filter(pk=account.pk)
+            ).get()
+            self.assertEqual(current.ledger_balance, account.get_balance())
+
+    def test_stream_csv_yields_one_line_per_row(self):
+        chunks = list(stream_csv(["A", "B"], iter([[1, "x"], [2, "y, z"]])))
+
+        self.assertEqual(chunks, ["A,B\r\n", "1,x\r\n", '2,"y, z"\r\n'])
+
+    def test_stream_xlsx_builds_readable_workbook(self):
+        rows = ([str(n), f"Account <{n}>", Decimal("1.50") * n] for n in range(3))
+
+        data = b"".join(stream_xlsx(["Number", "Name", "Balance"], rows))
+
+        with zipfile.ZipFile(BytesIO(data)) as archive:
+            self.assertIn("xl/workbook.xml", archive.namelist())
+            sheet = ElementTree.fromstring(archive.read("xl/worksheets/sheet1.xml"))
+        rows = sheet.findall(f"{SHEET_NS}sheetData/{SHEET_NS}row")
+        self.assertEqual(len(rows), 4)
+        last = [
+            cell.findtext(f"{SHEET_NS}v") or cell.findtext(f"{SHEET_NS}is/{SHEET_NS}t")
+            for cell in rows[-1]
+        ]
+        self.assertEqual(last, ["2", "Account <2>", "3.00"])
@@ -0,0 +1,187 @@
+import gzip
+import os
+import shutil
+import tempfile
+from datetime import datetime, timedelta
+from io import StringIO
+from unittest.mock import patch
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from accounting.audit_archive import archive_audit_rows, search_audit_archive
+from accounting.models import Account, AccountingAuditTrail
+from company.models import Company
+from payroll.models.utils import AuditTrail
+
+
+class AuditTrailArchiveTests(TestCase):
+    def setUp(self):
+        self.archive_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.archive_dir, ignore_errors=True)
+        self.company = Company.objects.create(name="Archive Co")
+        self.account = Account.objects.create(
+            company=self.company,
+            name="Cash",
+            account_number="1000",
+            type=Account.AccountType.ASSET,
+        )
+        self.content_type = ContentType.objects.get_for_model(Account)
+
+    def _audit_row(self, timestamp, action, reason=""):
+        row = AccountingAuditTrail.objects.create(
+            company=self.company,
+            action=action,
+            content_type=self.content_type,
+            object_id=self.account.pk,
+            reason=reason,
+        )
+        AccountingAuditTrail.objects.filter(pk=row.pk).update(timestamp=timestamp)
+        return row
+
+    def test_archive_moves_old_rows_into_monthly_segments(self):
+        old = timezone.make_aware(datetime(2024, 1, 15, 10, 0))
+        older = timezone.make_aware(datetime(2023, 12, 3, 9, 0))
+        recent = timezone.now()
+        self._audit_row(old, AccountingAuditTrail.ActionType.UPDATE, "Renamed cash")
+        self._audit_row(older, AccountingAuditTrail.ActionType.CREATE)
+        kept = self._audit_row(recent, AccountingAuditTrail.ActionType.UPDATE)
+
+        summary = archive_audit_rows(
+            AccountingAuditTrail,
+            before=recent - timedelta(days=30),
+            batch_size=1,
+            root=self.archive_dir,
+        )
+
+        self.assertEqual(summary, {"2023-12": 1, "2024-01": 1})
+        self.assertEqual(
+            list(AccountingAuditTrail.objects.values_list("pk", flat=True)),
+            [kept.pk],
+        )
+
+        rows = list(
+            search_audit_archive(
+                AccountingAuditTrail, query="renamed", root=self.archive_dir
+            )
+        )
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]["company_id"], self.company.pk)
+        self.assertEqual(rows[0]["timestamp"], old)
+
+    def test_search_only_opens_segments_in_range(self):
+        self._audit_row(
+            timezone.make_aware(datetime(2023, 6, 1, 12, 0)),
+            AccountingAuditTrail.ActionType.CREATE,
+        )
+        self._audit_row(
+            timezone.make_aware(datetime(2023, 8, 1, 12, 0)),
+            AccountingAuditTrail.ActionType.POST,
+        )
+        archive_audit_rows(
+            AccountingAuditTrail,
+            before=timezone.make_aware(datetime(2024, 1, 1)),
+            root=self.archive_dir,
+        )
+
+        rows = list(
+            search_audit_archive(
+                AccountingAuditTrail,
+                start=datetime(2023, 7, 1),
+                end=datetime(2023, 12, 31),
+                root=self.archive_dir,
+            )
+        )
+
+        self.assertEqual([row["action"] for row in rows], ["POST"])
+
+    def test_management_command_archives_legacy_trail(self):
+        row = AuditTrail.objects.create(
+            action="Updated Payroll",
+            content_type=self.content_type,
+            object_id=self.account.pk,
+        )
+        AuditTrail.objects.filter(pk=row.pk).update(
+            timestamp=timezone.now() - timedelta(days=400)
+        )
+
+        out = StringIO()
+        with override_settings(AUDIT_TRAIL_ARCHIVE_DIR=self.archive_dir):
+            call_command(
+                "audit_trail_management",
+                "archive",
+                "--trail",
+                "legacy",
+                "--older-than-days",
+                "365",
+                stdout=out,
+            )
+            rows = list(search_audit_archive(AuditTrail, query="payroll"))
+
+        self.assertFalse(AuditTrail.objects.exists())
+        self.assertEqual([archived["id"] for archived in rows], [row.pk])
+        self.assertIn("Archived 1", out.getvalue())
+
+    def test_management_command_searches_archive_by_action(self):
+        timestamp = timezone.make_aware(datetime(2023, 6, 1, 12, 0))
+        self._audit_row(timestamp, AccountingAuditTrail.ActionType.CREATE)
+        updated = self._audit_row(timestamp, AccountingAuditTrail.ActionType.UPDATE)
+        archive_audit_rows(
+            AccountingAuditTrail,
+            before=timezone.make_aware(datetime(2024, 1, 1)),
+            root=self.archive_dir,
+        )
+
+        out = StringIO()
+        with override_settings(AUDIT_TRAIL_ARCHIVE_DIR=self.archive_dir):
+            call_command(
+                "audit_trail_management",
+                "search-archive",
+                "--trail",
+                "accounting",
+                "--action",
+                "UPDATE",
+                stdout=out,
+            )
+
+        self.assertIn(f"#{updated.pk} ", out.getvalue())
+        self.assertIn("Found 1 archived audit rows", out.getvalue())
+
+    def test_truncated_segment_tail_is_skipped_and_repaired(self):
+        timestamp = timezone.make_aware(datetime(2023, 6, 1, 12, 0))
+        first = self._audit_row(timestamp, AccountingAuditTrail.ActionType.CREATE)
+        before = timezone.make_aware(datetime(2024, 1, 1))
+        archive_audit_rows(AccountingAuditTrail, before=before, root=self.archive_dir)
+        path = os.path.join(
+            self.archive_dir, "accounting.accountingaudittrail", "2023", "2023-06.jsonl.gz"
+        )
+        with open(path, "ab") as segment:
+            segment.write(gzip.compress(b'{"id": 0}\n' * 100)[:-12])
+
+        rows = list(search_audit_archive(AccountingAuditTrail, root=self.archive_dir))
+        self.assertEqual([row["id"] for row in rows], [first.pk])
+
+        second = self._audit_row(timestamp, AccountingAuditTrail.ActionType.UPDATE)
+        archive_audit_rows(AccountingAuditTrail, before=before, root=self.archive_dir)
+
+        rows = list(search_audit_archive(AccountingAuditTrail, root=self.archive_dir))
+        self.assertEqual([row["id"] for row in rows], [first.pk, second.pk])
+
+    def test_failed_segment_write_keeps_rows_in_table(self):
+        timestamp = timezone.make_aware(datetime(2023, 6, 1, 12, 0))
+        first = self._audit_row(timestamp, AccountingAuditTrail.ActionType.CREATE)
+        before = timezone.make_aware(datetime(2024, 1, 1))
+        archive_audit_rows(AccountingAuditTrail, before=before, root=self.archive_dir)
+        second = self._audit_row(timestamp, AccountingAuditTrail.ActionType.UPDATE)
+
+        with patch("accounting.audit_archive.os.fsync", side_effect=OSError("disk full")):
+            with self.assertRaises(OSError):
+                archive_audit_rows(
+                    AccountingAuditTrail, before=before, root=self.archive_dir
+                )
+
+        self.assertTrue(AccountingAuditTrail.objects.filter(pk=second.pk).exists())
+        rows = list(search_audit_archive(AccountingAuditTrail, root=self.archive_dir))
+        self.assertEqual([row["id"] for row in rows], [first.pk])
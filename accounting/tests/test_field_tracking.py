@@ -0,0 +1,86 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from accounting.models import Account
+from accounting.tracking import get_audit_changes
+from company.models import Company
+
+
+class FieldTrackingTests(TestCase):
+    def setUp(self):
+        self.company = Company.objects.create(name="Tracked Co")
+        self.account = Account.objects.create(
+            company=self.company,
+            name="Cash",
+            account_number="1000",
+            type=Account.AccountType.ASSET,
+        )
+
+    def _selects(self, queries):
+        return [
+            query["sql"]
+            for query in queries
+            if query["sql"].lstrip().upper().startswith("SELECT")
+        ]
+
+    def test_loaded_instance_diffs_without_select(self):
+        account = Account.objects.get(pk=self.account.pk)
+        account.name = "Cash at Bank"
+
+        with CaptureQueriesContext(connection) as ctx:
+            changes = get_audit_changes(account)
+
+        self.assertEqual(self._selects(ctx.captured_queries), [])
+        self.assertEqual(changes, {"name": {"old": "Cash", "new": "Cash at Bank"}})
+
+    def test_snapshot_is_refreshed_after_save(self):
+        account = Account.objects.get(pk=self.account.pk)
+        account.description = "Main cash"
+        account.save()
+
+        self.assertEqual(get_audit_changes(account), {})
+        self.assertEqual(account.get_loaded_value("description"), "Main cash")
+
+    def test_update_fields_without_tracked_fields_skip_diff(self):
+        account = Account.objects.get(pk=self.account.pk)
+        account.name = "Renamed"
+
+        self.assertEqual(get_audit_changes(account, update_fields=["updated_at"]), {})
+        self.assertEqual(
+            list(get_audit_changes(account, update_fields=["name"]).keys()), ["name"]
+        )
+
+    def test_save_does_not_refetch_row(self):
+        account = Account.objects.get(pk=self.account.pk)
+        account.description = "Petty cash"
+
+        with CaptureQueriesContext(connection) as ctx:
+            account.save(update_fields=["description"])
+
+        self.assertEqual(self._selects(ctx.captured_queries), [])
+
+    def test_foreign_keys_are_compared_by_id_and_shown_by_name(self):
+        other = Company.objects.create(name="Other Co")
+        account = Account.objects.get(pk=self.account.pk)
+        account.company = other
+
+        changes = get_audit_changes(account)
+
+        self.assertEqual(
+            changes["company"],
+            {"old": str(self.company), "new": str(other)},
+        )
+
+    def test_hand_built_instance_falls_back_to_stored_row(self):
+        account = Account(
+            pk=self.account.pk,
+            company=self.company,
+            name="Cash",
+            account_number="1001",
+            type=Account.AccountType.ASSET,
+        )
+
+        changes = get_audit_changes(account)
+
+        self.assertEqual(changes["account_number"], {"old": "1000", "new": "1001"})
@@ -0,0 +1,43 @@
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AnonymousUser, Group
+from django.test import TestCase
+
+from accounting.permissions import (
+    can_access_disciplinary,
+    is_accountant,
+    is_auditor,
+    is_payroll_processor,
+)
+
+User = get_user_model()
+
+
+class RoleCacheTests(TestCase):
+    def setUp(self):
+        self.auditor_group = Group.objects.create(name="Auditor")
+        self.user = User.objects.create_user(
+            email="roles@example.com", password="testpass123"
+        )
+        self.user.groups.add(self.auditor_group)
+        self.user = User.objects.get(pk=self.user.pk)
+
+    def test_role_checks_share_one_group_query(self):
+        with self.assertNumQueries(1):
+            self.assertTrue(is_auditor(self.user))
+            self.assertFalse(is_accountant(self.user))
+            self.assertFalse(is_payroll_processor(self.user))
+            self.assertTrue(can_access_disciplinary(self.user))
+            self.assertTrue(is_auditor(self.user))
+
+    def test_group_change_clears_cached_roles(self):
+        self.assertFalse(is_accountant(self.user))
+
+        self.user.groups.add(Group.objects.create(name="Accountant"))
+        self.assertTrue(is_accountant(self.user))
+
+        self.user.groups.remove(self.auditor_group)
+        self.assertFalse(is_auditor(self.user))
+
+    def test_anonymous_user_has_no_roles(self):
+        with self.assertNumQueries(0):
+            self.assertFalse(is_auditor(AnonymousUser()))
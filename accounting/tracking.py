@@ -0,0 +1,177 @@
+"""
+Change tracking for audited models.
+
+Models that mix in ``FieldTrackerMixin`` keep a snapshot of the field values
+they were loaded with, so audit signal handlers can diff an instance against
+its stored state without re-fetching the row from the database.
+"""
+
+import copy
+
+from django.db import models
+
+
+class FieldTrackerMixin(models.Model):
+    """Abstract mixin that snapshots loaded field values for change tracking."""
+
+    # Fields that never appear in audit change sets.
+    tracking_excluded_fields = ("id", "created_at", "updated_at")
+
+    class Meta:
+        abstract = True
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._snapshot_tracked_fields()
+        return instance
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        self._snapshot_tracked_fields(kwargs.get("update_fields"))
+
+    def refresh_from_db(self, using=None, fields=None, **kwargs):
+        super().refresh_from_db(using=using, fields=fields, **kwargs)
+        self._snapshot_tracked_fields(fields)
+
+    @classmethod
+    def get_tracked_fields(cls):
+        """Return concrete fields that take part in change tracking."""
+        return [
+            field
+            for field in cls._meta.concrete_fields
+            if field.name not in cls.tracking_excluded_fields
+        ]
+
+    def _snapshot_tracked_fields(self, field_names=None):
+        loaded_values = getattr(self, "_loaded_values", None)
+        if field_names is None:
+            loaded_values = {}
+        elif loaded_values is None:
+            # A partial snapshot would hide changes to the other fields.
+            return
+        for field in self.get_tracked_fields():
+            if not _field_selected(field, field_names):
+                continue
+            # Deferred fields are absent from __dict__ until they are accessed.
+            if field.attname not in self.__dict__:
+                continue
+            loaded_values[field.attname] = copy.deepcopy(self.__dict__[field.attname])
+        self._loaded_values = loaded_values
+
+    def has_field_snapshot(self):
+        """Return True when the instance carries a snapshot of its stored state."""
+        return getattr(self, "_loaded_values", None) is not None
+
+    def get_loaded_value(self, field_name, default=None):
+        """Return the stored value of ``field_name`` as it was when loaded."""
+        field = self._meta.get_field(field_name)
+        return (getattr(self, "_loaded_values", None) or {}).get(
+            field.attname, default
+        )
+
+    def get_field_changes(self, update_fields=None):
+        """
+        Compare current field values against the loaded snapshot.
+
+        Args:
+            update_fields: Optional iterable of field names being written; when
+                given, only those fields are compared.
+
+        Returns:
+            Dictionary of field changes in the audit trail format, with
+            related objects shown by their ``str()`` as before
+        """
+        loaded_values = getattr(self, "_loaded_values", None) or {}
+        changes = {}
+        for field in self.get_tracked_fields():
+            if not _field_selected(field, update_fields):
+                continue
+            if field.attname not in loaded_values:
+                continue
+            old_value = loaded_values[field.attname]
+            new_value = getattr(self, field.attname)
+            if old_value != new_value:
+                changes[field.name] = {
+                    "old": _display_value(field, old_value),
+                    "new": _display_value(field, new_value, instance=self),
+                }
+        return changes
+
+
+def _display_value(field, value, instance=None):
+    # Relations compare by id but are shown by the related object, loaded
+    # only for fields that changed; the new one is usually cached already.
+    if value is None:
+        return None
+    if field.is_relation:
+        related = field.get_cached_value(instance, None) if instance else None
+        target = field.target_field.attname
+        if related is None or getattr(related, target) != value:
+            related = (
+                field.related_model._base_manager.filter(**{target: value}).first()
+            )
+        if related is not None:
+            return str(related)
+    return str(value)
+
+
+def _field_selected(field, field_names):
+    # update_fields and refresh_from_db accept both field names and attnames.
+    return (
+        field_names is None
+        or field.name in field_names
+        or field.attname in field_names
+    )
+
+
+def get_audit_changes(instance, update_fields=None):
+    """
+    Return the pending changes of a tracked instance for a ``pre_save`` signal.
+
+    Unsaved instances have no changes. When ``update_fields`` names no tracked
+    field the diff is skipped entirely. Instances built by hand with a primary
+    key (and therefore without a snapshot) fall back to loading the stored row.
+    """
+    if not instance.pk:
+        return {}
+
+    tracked_fields = instance.get_tracked_fields()
+    if update_fields is not None:
+        update_fields = {
+            field.name
+            for field in tracked_fields
+            if _field_selected(field, update_fields)
+        }
+        if not update_fields:
+            return {}
+
+    if not ensure_field_snapshot(instance):
+        return {}
+
+    return instance.get_field_changes(update_fields=update_fields)
+
+
+def ensure_field_snapshot(instance):
+    """
+    Make sure a tracked instance carries a snapshot of its stored state.
+
+    Instances loaded through the ORM already have one. Instances built by hand
+    with a primary key load it once from the database. Returns False when no
+    stored row exists.
+    """
+    if instance.has_field_snapshot():
+        return True
+    if not instance.pk:
+        return False
+
+    stored = (
+        type(instance)
+        ._base_manager.filter(pk=instance.pk)
+        .only(*[field.name for field in instance.get_tracked_fields()])
+        .first()
+    )
+    if stored is None:
+        return False
+    instance._loaded_values = stored._loaded_values
+    return True
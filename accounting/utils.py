@@ -25,7 +25,8 @@ from .signal_handlers import (
 )
 from .permissions import can_reverse_journal
 from django.db import transaction
-from django.db.models import Sum
+from django.db.models import Case, DecimalField, F, Q, Sum, Value, When
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.models import ContentType
@@ -860,6 +861,52 @@ def get_account_balance_as_of(account, as_of_date):
         return credits - debits
 
 
+def annotate_account_balances(accounts, as_of_date=None):
+    """
+    Annotate ``debit_total``, ``credit_total`` and ``ledger_balance`` on accounts.
+
+    Balances are computed in one grouped query. With ``as_of_date`` only posted
+    journals dated on or before it are counted, matching
+    ``get_account_balance_as_of``; without it every entry is counted, matching
+    ``Account.get_balance``.
+    """
+    amount_field = DecimalField(max_digits=20, decimal_places=2)
+    zero = Value(Decimal("0.00"), output_field=amount_field)
+    entry_filter = Q()
+    if as_of_date:
+        entry_filter = Q(
+            entries__journal__date__lte=as_of_date,
+            entries__journal__status=Journal.JournalStatus.POSTED,
+        )
+    return accounts.annotate(
+        debit_total=Coalesce(
+            Sum(
+                "entries__amount",
+                filter=entry_filter & Q(entries__entry_type="DEBIT"),
+                output_field=amount_field,
+            ),
+            zero,
+        ),
+        credit_total=Coalesce(
+            Sum(
+                "entries__amount",
+                filter=entry_filter & Q(entries__entry_type="CREDIT"),
+                output_field=amount_field,
+            ),
+            zero,
+        ),
+    ).annotate(
+        ledger_balance=Case(
+            When(
+                type__in=[Account.AccountType.ASSET, Account.AccountType.EXPENSE],
+                then=F("debit_total") - F("credit_total"),
+            ),
+            default=F("credit_total") - F("debit_total"),
+            output_field=amount_field,
+        )
+    )
+
+
 def get_trial_balance(period=None, as_of_date=None, company=None):
     """
     Generate a trial balance for a period or as of a specific date.
@@ -884,8 +931,11 @@ def get_trial_balance(period=None, as_of_date=None, company=None):
     if company is None:
         raise ValueError("company is required for trial balance")
 
-    for account in Account.objects.filter(company=company):
-        balance = get_account_balance_as_of(account, as_of_date)
+    accounts = annotate_account_balances(
+        Account.objects.filter(company=company), as_of_date=as_of_date
+    )
+    for account in accounts:
+        balance = account.ledger_balance
         if balance != 0:
             trial_balance[account.id] = {
                 "account": account,
@@ -3,11 +3,18 @@ from django.contrib import messages
 from django.contrib.auth.decorators import login_required
 from django.views.generic import ListView, DetailView, CreateView, UpdateView
 from django.views.generic.edit import FormView
-from django.http import JsonResponse, HttpResponseForbidden, HttpResponse
+from django.http import (
+    JsonResponse,
+    HttpResponseForbidden,
+    HttpResponse,
+    FileResponse,
+    StreamingHttpResponse,
+)
 from django.urls import reverse_lazy
 from django.db import transaction
 from django.db.models import Sum, Q, Count
 from django.utils import timezone
+from django.utils.dateparse import parse_date
 from django.core.paginator import Paginator
 from django.core.exceptions import ValidationError
 from django.contrib.auth.mixins import LoginRequiredMixin
@@ -16,6 +23,7 @@ from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.models import ContentType
 from weasyprint import HTML, CSS
 import csv
+import tempfile
 from decimal import Decimal, InvalidOperation
 
 from company.utils import get_user_company
@@ -57,8 +65,15 @@ from .forms import (
     DisciplinaryAppealForm,
     DisciplinaryAppealReviewForm,
 )
-from .reporting import build_financial_report
+from .exports import XLSX_CONTENT_TYPE, stream_csv, stream_xlsx
+from .reporting import (
+    build_financial_report,
+    get_account_activity_page,
+    get_account_activity_summary,
+    iter_account_activity,
+)
 from .utils import (
+    annotate_account_balances,
     get_trial_balance,
     get_trial_balance_totals,
     get_account_balance_as_of,
@@ -1056,7 +1071,9 @@ class AuditTrailListView(LoginRequiredMixin, AuditorRequiredMixin, ListView):
     paginate_by = 20
 
     def get_queryset(self):
-        queryset = AccountingAuditTrail.objects.all().order_by("-timestamp")
+        queryset = AccountingAuditTrail.objects.select_related(
+            "user", "content_type"
+        ).order_by("-timestamp")
 
         user_id = self.request.GET.get("user")
         if user_id:
@@ -1565,6 +1582,14 @@ def trial_balance_report(request):
     return render(request, "accounting/reports/trial_balance.html", context)
 
 
+def _parse_report_date(value):
+    """Parse a ``YYYY-MM-DD`` query value, ignoring blank or malformed input."""
+    try:
+        return parse_date(value or "")
+    except ValueError:
+        return None
+
+
 @login_required
 @auditor_or_accountant_required
 def account_activity_report(request):
@@ -1579,45 +1604,20 @@ def account_activity_report(request):
 
     account = get_object_or_404(Account, pk=account_id, company=company)
 
-    start_date = request.GET.get("start_date")
-    end_date = request.GET.get("end_date")
-
-    entries_qs = account.entries.select_related("journal").all()
-
-    if start_date:
-        entries_qs = entries_qs.filter(journal__date__gte=start_date)
-    if end_date:
-        entries_qs = entries_qs.filter(journal__date__lte=end_date)
-
-    entries_qs = entries_qs.order_by("journal__date", "journal__created_at", "pk")
-
-    filtered_delta = sum(
-        entry.amount if entry.entry_type == "DEBIT" else -entry.amount
-        for entry in entries_qs
+    start_date = _parse_report_date(request.GET.get("start_date"))
+    end_date = _parse_report_date(request.GET.get("end_date"))
+    activity = get_account_activity_page(
+        account,
+        start_date=start_date,
+        end_date=end_date,
+        after=request.GET.get("after"),
     )
-    opening_balance = account.get_balance() - filtered_delta
-
-    running_balance = opening_balance
-    entries = list(entries_qs)
-    total_debits = Decimal("0.00")
-    total_credits = Decimal("0.00")
-    for entry in entries:
-        if entry.entry_type == "DEBIT":
-            total_debits += entry.amount
-            running_balance += entry.amount
-        else:
-            total_credits += entry.amount
-            running_balance -= entry.amount
-        entry.running_balance = running_balance
 
     context = {
         "account": account,
-        "entries": entries,
         "start_date": start_date,
         "end_date": end_date,
-        "opening_balance": opening_balance,
-        "total_debits": total_debits,
-        "total_credits": total_credits,
+        **activity,
         "accounts": Account.objects.filter(company=company).order_by("account_number", "name"),
     }
 
@@ -1751,7 +1751,7 @@ def account_balance_report(request):
 def export_reports(request):
     """
     Export account balances.
-    format=excel returns CSV for spreadsheet use.
+    format=csv streams CSV, format=excel/xlsx streams an XLSX workbook.
     format=pdf redirects to trial balance PDF.
     """
     export_format = (request.GET.get("format") or "").lower()
@@ -1767,38 +1767,48 @@ def export_reports(request):
         query = f"?{'&'.join(query_parts)}" if query_parts else ""
         return redirect(f"{reverse_lazy('accounting:trial_balance_pdf')}{query}")
 
-    if export_format in {"excel", "csv"}:
+    if export_format in {"csv", "excel", "xlsx"}:
         company = get_user_company(request.user)
         as_of_date = request.GET.get("as_of_date")
-        response = HttpResponse(content_type="text/csv")
-        response["Content-Disposition"] = (
-            f'attachment; filename="account_balances_{timezone.now().date()}.csv"'
-        )
+        date_obj = None
+        if as_of_date:
+            try:
+                from datetime import datetime
 
-        writer = csv.writer(response)
-        writer.writerow(["Account Number", "Account Name", "Type", "Balance"])
+                date_obj = datetime.strptime(as_of_date, "%Y-%m-%d").date()
+            except ValueError:
+                messages.error(request, "Invalid date format")
+                return redirect("accounting:reports")
 
-        accounts = Account.objects.filter(company=company).order_by(
-            "account_number", "name"
+        type_labels = dict(Account.AccountType.choices)
+        accounts = (
+            annotate_account_balances(
+                Account.objects.filter(company=company), as_of_date=date_obj
+            )
+            .order_by("account_number", "name")
+            .values_list("account_number", "name", "type", "ledger_balance")
         )
-        for account in accounts:
-            balance = account.get_balance()
-            if as_of_date:
-                try:
-                    from datetime import datetime
-
-                    date_obj = datetime.strptime(as_of_date, "%Y-%m-%d").date()
-                    balance = get_account_balance_as_of(account, date_obj)
-                except ValueError:
-                    messages.error(request, "Invalid date format")
-                    return redirect("accounting:reports")
-            writer.writerow(
-                [
-                    account.account_number,
-                    account.name,
-                    account.get_type_display(),
-                    balance,
-                ]
+        rows = (
+            [number, name, type_labels.get(account_type, account_type), balance]
+            for number, name, account_type, balance in accounts.iterator(
+                chunk_size=2000
+            )
+        )
+        header = ["Account Number", "Account Name", "Type", "Balance"]
+        filename = f"account_balances_{timezone.now().date()}"
+
+        if export_format == "csv":
+            response = StreamingHttpResponse(
+                stream_csv(header, rows), content_type="text/csv"
+            )
+            response["Content-Disposition"] = f'attachment; filename="{filename}.csv"'
+        else:
+            response = StreamingHttpResponse(
+                stream_xlsx(header, rows, sheet_name="Account Balances"),
+                content_type=XLSX_CONTENT_TYPE,
+            )
+            response["Content-Disposition"] = (
+                f'attachment; filename="{filename}.xlsx"'
             )
         return response
 
@@ -1883,79 +1893,48 @@ def account_activity_pdf(request):
     """
     Generate PDF version of account activity report
     """
+    company = get_user_company(request.user)
     account_id = request.GET.get("account")
-    start_date = request.GET.get("start_date")
-    end_date = request.GET.get("end_date")
+    start_date = _parse_report_date(request.GET.get("start_date"))
+    end_date = _parse_report_date(request.GET.get("end_date"))
 
     if not account_id:
         messages.error(request, "Please select an account")
         return redirect("accounting:account_activity")
 
-    account = get_object_or_404(Account, pk=account_id)
-
-    entries_qs = account.entries.select_related("journal").all()
-
-    if start_date:
-        entries_qs = entries_qs.filter(journal__date__gte=start_date)
-    if end_date:
-        entries_qs = entries_qs.filter(journal__date__lte=end_date)
-
-    entries_qs = entries_qs.order_by("journal__date", "journal__created_at", "pk")
+    account = get_object_or_404(Account, pk=account_id, company=company)
 
-    filtered_delta = sum(
-        entry.amount if entry.entry_type == "DEBIT" else -entry.amount
-        for entry in entries_qs
+    summary = get_account_activity_summary(
+        account, start_date=start_date, end_date=end_date
     )
-    opening_balance = account.get_balance() - filtered_delta
-
-    running_balance = opening_balance
-    entries = list(entries_qs)
-    total_debits = Decimal("0.00")
-    total_credits = Decimal("0.00")
-    for entry in entries:
-        if entry.entry_type == "DEBIT":
-            total_debits += entry.amount
-            running_balance += entry.amount
-        else:
-            total_credits += entry.amount
-            running_balance -= entry.amount
-        entry.running_balance = running_balance
-
     context = {
         "account": account,
-        "entries": entries,
+        "entries": iter_account_activity(
+            account,
+            start_date=start_date,
+            end_date=end_date,
+            opening_balance=summary["opening_balance"],
+        ),
         "start_date": start_date,
         "end_date": end_date,
-        "opening_balance": opening_balance,
-        "total_debits": total_debits,
-        "total_credits": total_credits,
+        **summary,
     }
 
     html_string = render_to_string(
         "accounting/reports/pdf/account_activity_pdf.html", context
     )
-    html = HTML(string=html_string)
-    css = CSS(
-        string="""
-        @page { size: A4 landscape; margin: 1cm; }
-        table { border-collapse: collapse; width: 100%; }
-        th, td { border: 1px solid 
-        th { background-color: 
-        .text-right { text-align: right; }
-        .text-center { text-align: center; }
-        .font-bold { font-weight: bold; }
-        .text-danger { color: 
-        .text-success { color: 
-    """
+    # Spool the rendered PDF so large reports are sent in chunks rather than
+    # held in memory as one bytes object.
+    pdf_file = tempfile.SpooledTemporaryFile(max_size=5 * 1024 * 1024)
+    HTML(string=html_string).write_pdf(pdf_file)
+    pdf_file.seek(0)
+    return FileResponse(
+        pdf_file,
+        as_attachment=True,
+        filename=f"account_activity_{account.name}_{timezone.now().date()}.pdf",
+        content_type="application/pdf",
     )
 
-    pdf = html.write_pdf()
-    response = HttpResponse(pdf, content_type="application/pdf")
-    response["Content-Disposition"] = (
-        f'attachment; filename="account_activity_{account.name}_{timezone.now().date()}.pdf"'
-    )
-    return response
-
 
 @login_required
 @auditor_or_accountant_required
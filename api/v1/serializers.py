@@ -619,6 +619,9 @@ class InventoryItemSerializer(serializers.ModelSerializer):
     def get_stock_on_hand(self, obj):
         from inventory.services import get_stock_on_hand
 
+        total = getattr(obj, "stock_on_hand_total", None)
+        if total is not None:
+            return str(total)
         return str(get_stock_on_hand(obj))
 
 
@@ -842,6 +845,22 @@ class StockMovementSerializer(serializers.ModelSerializer):
         read_only_fields = fields
 
 
+class StockMovementCompactSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = StockMovement
+        fields = [
+            "id",
+            "document",
+            "item",
+            "location",
+            "movement_type",
+            "quantity",
+            "total_cost",
+            "movement_date",
+        ]
+        read_only_fields = fields
+
+
 class OpeningStockSerializer(serializers.Serializer):
     item = serializers.PrimaryKeyRelatedField(queryset=InventoryItem.objects.all())
     location = serializers.PrimaryKeyRelatedField(queryset=StockLocation.objects.all())
@@ -852,6 +871,22 @@ class OpeningStockSerializer(serializers.Serializer):
     reason = serializers.CharField(required=False, allow_blank=True, max_length=255)
 
 
+
+class InventoryImportSerializer(serializers.Serializer):
+    file = serializers.FileField()
+
+
+class PartyImportSerializer(InventoryImportSerializer):
+    default_account = serializers.PrimaryKeyRelatedField(
+        queryset=Account.objects.all(), required=False, allow_null=True
+    )
+
+
+class OpeningStockImportSerializer(InventoryImportSerializer):
+    posting_date = serializers.DateField(required=False)
+    reference = serializers.CharField(required=False, allow_blank=True, max_length=80)
+    reason = serializers.CharField(required=False, allow_blank=True, max_length=255)
+
 class PurchaseReceiptSerializer(serializers.Serializer):
     supplier = serializers.PrimaryKeyRelatedField(queryset=Supplier.objects.all())
     item = serializers.PrimaryKeyRelatedField(queryset=InventoryItem.objects.all())
@@ -969,6 +1004,23 @@ class PurchaseOrderReceiveSerializer(serializers.Serializer):
     reason = serializers.CharField(required=False, allow_blank=True, max_length=255)
 
 
+class PurchaseOrderBulkReceiveLineSerializer(serializers.Serializer):
+    # Plain ids: the service loads every order line and location in one query each.
+    purchase_order_line = serializers.IntegerField(min_value=1)
+    quantity = serializers.DecimalField(max_digits=14, decimal_places=4)
+    location = serializers.IntegerField(min_value=1, required=False)
+
+
+class PurchaseOrderBulkReceiveSerializer(serializers.Serializer):
+    location = serializers.PrimaryKeyRelatedField(
+        queryset=StockLocation.objects.all(), required=False, allow_null=True
+    )
+    lines = PurchaseOrderBulkReceiveLineSerializer(many=True, allow_empty=False)
+    posting_date = serializers.DateField(required=False)
+    reference = serializers.CharField(required=False, allow_blank=True, max_length=80)
+    reason = serializers.CharField(required=False, allow_blank=True, max_length=255)
+
+
 class InventoryAdjustmentSerializer(serializers.Serializer):
     item = serializers.PrimaryKeyRelatedField(queryset=InventoryItem.objects.all())
     location = serializers.PrimaryKeyRelatedField(queryset=StockLocation.objects.all())
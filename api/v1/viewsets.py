@@ -11,6 +11,7 @@ from django.utils.text import slugify
 from rest_framework import mixins, status, viewsets
 from rest_framework.decorators import action
 from rest_framework.exceptions import PermissionDenied, ValidationError as DRFValidationError
+from rest_framework.filters import SearchFilter
 from rest_framework.permissions import DjangoModelPermissions, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
@@ -33,6 +34,12 @@ from inventory.models import (
     Warehouse,
 )
 from inventory.services import (
+    annotate_stock_on_hand,
+    filter_stock_movements,
+    import_customers,
+    import_inventory_items,
+    import_opening_stock,
+    import_suppliers,
     post_customer_payment,
     post_customer_return,
     post_inventory_adjustment,
@@ -44,6 +51,7 @@ from inventory.services import (
     post_tax_remittance,
     post_stock_transfer,
     receive_purchase_order,
+    receive_purchase_orders,
 )
 from payroll.models import (
     CompanyChatMessage,
@@ -69,6 +77,7 @@ from standup.models import (
     StandupTeamMember,
 )
 
+from api.v1.pagination import StockMovementCursorPagination
 from api.v1.permissions import CanMutateAccounting, IsAccountingRole, IsTenantMember
 from api.v1.serializers import (
     AccountSerializer,
@@ -94,9 +103,13 @@ from api.v1.serializers import (
     InventoryAdjustmentSerializer,
     InventoryCategorySerializer,
     InventoryDocumentSerializer,
+    InventoryImportSerializer,
     InventoryItemSerializer,
+    OpeningStockImportSerializer,
     OpeningStockSerializer,
     PayrollEntrySerializer,
+    PartyImportSerializer,
+    PurchaseOrderBulkReceiveSerializer,
     PurchaseOrderReceiveSerializer,
     PurchaseOrderSerializer,
     PayrollRunEntrySerializer,
@@ -108,6 +121,7 @@ from api.v1.serializers import (
     StandupTeamMemberSerializer,
     StandupTeamSerializer,
     StockLocationSerializer,
+    StockMovementCompactSerializer,
     StockMovementSerializer,
     StockTransferSerializer,
     SupplierSerializer,
@@ -714,13 +728,25 @@ class InventoryCategoryViewSet(TenantScopedModelViewSet):
 
 
 class InventoryItemViewSet(TenantScopedModelViewSet):
-    queryset = InventoryItem.objects.select_related(
-        "company", "category", "base_unit"
-    ).all().order_by("sku", "name")
+    queryset = annotate_stock_on_hand(
+        InventoryItem.objects.select_related("company", "category", "base_unit")
+    ).order_by("sku", "name")
     serializer_class = InventoryItemSerializer
     search_fields = ["sku", "name", "barcode"]
     ordering_fields = ["sku", "name", "created_at", "reorder_point"]
 
+    @action(detail=False, methods=["post"], url_path="import")
+    def bulk_import(self, request):
+        serializer = InventoryImportSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        try:
+            items = import_inventory_items(
+                company=self.get_company(), upload=serializer.validated_data["file"]
+            )
+        except ValueError as exc:
+            raise DRFValidationError({"detail": str(exc)})
+        return Response({"created": len(items)}, status=status.HTTP_201_CREATED)
+
 
 class WarehouseViewSet(TenantScopedModelViewSet):
     queryset = Warehouse.objects.select_related("company").all().order_by("code")
@@ -744,6 +770,21 @@ class SupplierViewSet(TenantScopedModelViewSet):
     search_fields = ["name", "contact_name", "email", "phone"]
     ordering_fields = ["name", "created_at"]
 
+    @action(detail=False, methods=["post"], url_path="import")
+    def bulk_import(self, request):
+        serializer = PartyImportSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+        try:
+            suppliers = import_suppliers(
+                company=self.get_company(),
+                upload=data["file"],
+                payable_account=data.get("default_account"),
+            )
+        except ValueError as exc:
+            raise DRFValidationError({"detail": str(exc)})
+        return Response({"created": len(suppliers)}, status=status.HTTP_201_CREATED)
+
 
 class CustomerViewSet(TenantScopedModelViewSet):
     queryset = Customer.objects.select_related(
@@ -753,6 +794,21 @@ class CustomerViewSet(TenantScopedModelViewSet):
     search_fields = ["name", "contact_name", "email", "phone"]
     ordering_fields = ["name", "created_at"]
 
+    @action(detail=False, methods=["post"], url_path="import")
+    def bulk_import(self, request):
+        serializer = PartyImportSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+        try:
+            customers = import_customers(
+                company=self.get_company(),
+                upload=data["file"],
+                receivable_account=data.get("default_account"),
+            )
+        except ValueError as exc:
+            raise DRFValidationError({"detail": str(exc)})
+        return Response({"created": len(customers)}, status=status.HTTP_201_CREATED)
+
 
 class PurchaseOrderViewSet(TenantScopedModelViewSet):
     queryset = (
@@ -788,6 +844,38 @@ class PurchaseOrderViewSet(TenantScopedModelViewSet):
             status=status.HTTP_201_CREATED,
         )
 
+    @action(detail=False, methods=["post"], url_path="receive")
+    def receive_many(self, request):
+        serializer = PurchaseOrderBulkReceiveSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        company = self.get_company()
+        data = serializer.validated_data
+        locations = StockLocation.objects.filter(company=company).in_bulk(
+            {line["location"] for line in data["lines"] if line.get("location")}
+        )
+        lines = []
+        for number, line in enumerate(data["lines"], start=1):
+            if line.get("location") and line["location"] not in locations:
+                raise DRFValidationError({"detail": f"Line {number}: Stock location does not exist"})
+            lines.append({**line, "location": locations.get(line.get("location"))})
+        try:
+            documents = receive_purchase_orders(
+                company=company,
+                location=data.get("location"),
+                lines=lines,
+                posting_date=data.get("posting_date"),
+                reference=data.get("reference", ""),
+                reason=data.get("reason") or "Purchase order receipt",
+            )
+        except ValueError as exc:
+            raise DRFValidationError({"detail": str(exc)})
+        return Response(
+            InventoryDocumentSerializer(
+                documents, many=True, context=self.get_serializer_context()
+            ).data,
+            status=status.HTTP_201_CREATED,
+        )
+
 
 class InventoryDocumentViewSet(TenantScopedModelViewSet):
     queryset = InventoryDocument.objects.select_related("company", "journal").all().order_by(
@@ -821,6 +909,26 @@ class InventoryDocumentViewSet(TenantScopedModelViewSet):
             status=status.HTTP_201_CREATED,
         )
 
+    @action(detail=False, methods=["post"], url_path="opening-stock-import")
+    def opening_stock_import(self, request):
+        serializer = OpeningStockImportSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+        try:
+            document = import_opening_stock(
+                company=self.get_company(),
+                upload=data["file"],
+                posting_date=data.get("posting_date"),
+                reference=data.get("reference", ""),
+                reason=data.get("reason") or "Opening stock",
+            )
+        except ValueError as exc:
+            raise DRFValidationError({"detail": str(exc)})
+        return Response(
+            self.get_serializer(document).data,
+            status=status.HTTP_201_CREATED,
+        )
+
     @action(detail=False, methods=["post"], url_path="purchase-receipt")
     def purchase_receipt(self, request):
         serializer = PurchaseReceiptSerializer(data=request.data)
@@ -1062,25 +1170,60 @@ class StockMovementViewSet(
     mixins.RetrieveModelMixin,
     viewsets.GenericViewSet,
 ):
+    """
+    Stock movements in ``(movement_date, id)`` order, paged by cursor.
+
+    Filters: ``item``, ``location``, ``type``, ``start_date`` and ``end_date``.
+    Pass ``compact=true`` for the id-only representation used by sync jobs.
+    """
+
     permission_classes = [IsAuthenticated, IsTenantMember]
     serializer_class = StockMovementSerializer
+    pagination_class = StockMovementCursorPagination
+    # Cursor pages need a fixed ordering, so OrderingFilter is left out.
+    filter_backends = [SearchFilter]
     search_fields = ["item__sku", "item__name", "location__code", "memo"]
-    ordering_fields = ["movement_date", "created_at", "quantity", "total_cost"]
+
+    def get_serializer_class(self):
+        if self.request.query_params.get("compact") in ("1", "true"):
+            return StockMovementCompactSerializer
+        return StockMovementSerializer
+
+    def _id_param(self, name):
+        value = self.request.query_params.get(name)
+        if not value:
+            return None
+        if not value.isdigit():
+            raise DRFValidationError({name: "Must be an integer id."})
+        return int(value)
+
+    def _date_param(self, name):
+        value = self.request.query_params.get(name)
+        if not value:
+            return None
+        try:
+            parsed = parse_date(value)
+        except ValueError:
+            parsed = None
+        if parsed is None:
+            raise DRFValidationError({name: "Must be a valid ISO date (YYYY-MM-DD)."})
+        return parsed
 
     def get_queryset(self):
         company = get_user_company(self.request.user)
         if company is None:
             return StockMovement.objects.none()
-        queryset = StockMovement.objects.select_related(
-            "company", "document", "item", "location", "location__warehouse"
-        ).filter(company=company)
-        item_id = self.request.query_params.get("item")
-        location_id = self.request.query_params.get("location")
-        if item_id:
-            queryset = queryset.filter(item_id=item_id)
-        if location_id:
-            queryset = queryset.filter(location_id=location_id)
-        return queryset.order_by("-movement_date", "-created_at")
+        movement_type = self.request.query_params.get("type")
+        if movement_type and movement_type not in StockMovement.MovementType.values:
+            raise DRFValidationError({"type": "Unknown movement type."})
+        return filter_stock_movements(
+            company,
+            item=self._id_param("item"),
+            location=self._id_param("location"),
+            movement_type=movement_type,
+            start_date=self._date_param("start_date"),
+            end_date=self._date_param("end_date"),
+        )
 
 
 class StandupTeamViewSet(TenantScopedModelViewSet):
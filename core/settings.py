@@ -309,6 +309,13 @@ ACCOUNTING_SUPERUSER_ONLY_UNTIL_TENANT_SCOPED = env_bool(
     not DEBUG,
 )
 
+# Audit trail rows older than the retention window are moved to compressed
+# monthly archive segments by `manage.py audit_trail_management archive`.
+AUDIT_TRAIL_RETENTION_DAYS = int(os.getenv("AUDIT_TRAIL_RETENTION_DAYS", "365"))
+AUDIT_TRAIL_ARCHIVE_DIR = os.getenv(
+    "AUDIT_TRAIL_ARCHIVE_DIR", os.path.join(BASE_DIR, "audit_archive")
+)
+
 SESSION_COOKIE_SECURE = env_bool("SESSION_COOKIE_SECURE", not DEBUG)
 CSRF_COOKIE_SECURE = env_bool("CSRF_COOKIE_SECURE", not DEBUG)
 SECURE_SSL_REDIRECT = env_bool("SECURE_SSL_REDIRECT", not DEBUG)
@@ -342,6 +349,15 @@ NOTIFICATION_AGGREGATION_TIME_WINDOW = int(
     os.getenv("NOTIFICATION_AGGREGATION_TIME_WINDOW", "3600")
 )
 
+# Per-process preference cache in front of Redis (size 0 disables it)
+NOTIFICATION_PREFERENCE_LOCAL_CACHE_SIZE = int(
+    os.getenv("NOTIFICATION_PREFERENCE_LOCAL_CACHE_SIZE", "1024")
+)
+
+NOTIFICATION_PREFERENCE_LOCAL_CACHE_TTL = int(
+    os.getenv("NOTIFICATION_PREFERENCE_LOCAL_CACHE_TTL", "30")
+)
+
 # Notification email settings
 EMAIL_NOTIFICATION_FROM_EMAIL = os.getenv(
     "EMAIL_NOTIFICATION_FROM_EMAIL", DEFAULT_FROM_EMAIL
@@ -432,6 +448,10 @@ CELERY_TASK_ROUTES = {
         "queue": "notifications_normal",
         "routing_key": "notifications.normal",
     },
+    "payroll.deliver_notification_batch": {
+        "queue": "notifications_normal",
+        "routing_key": "notifications.normal",
+    },
     "payroll.send_in_app_notification": {
         "queue": "notifications_normal",
         "routing_key": "notifications.normal",
@@ -460,6 +480,14 @@ CELERY_TASK_ROUTES = {
         "queue": "notifications_low",
         "routing_key": "notifications.low",
     },
+    "payroll.release_scheduled_notifications": {
+        "queue": "notifications_normal",
+        "routing_key": "notifications.normal",
+    },
+    "payroll.reconcile_unread_counts": {
+        "queue": "notifications_low",
+        "routing_key": "notifications.low",
+    },
     "payroll.send_daily_digest": {
         "queue": "notifications_low",
         "routing_key": "notifications.low",
@@ -468,6 +496,14 @@ CELERY_TASK_ROUTES = {
         "queue": "notifications_low",
         "routing_key": "notifications.low",
     },
+    "inventory.snapshot_month_end_valuations": {
+        "queue": "notifications_low",
+        "routing_key": "notifications.low",
+    },
+    "inventory.check_reorder_points": {
+        "queue": "notifications_normal",
+        "routing_key": "notifications.normal",
+    },
 }
 
 # Celery task rate limiting
@@ -492,6 +528,14 @@ CELERY_BEAT_SCHEDULE = {
         "task": "payroll.archive_old_notifications",
         "schedule": crontab(hour=2, minute=0),
     },
+    "release-scheduled-notifications": {
+        "task": "payroll.release_scheduled_notifications",
+        "schedule": crontab(minute="*/5"),
+    },
+    "reconcile-unread-counts": {
+        "task": "payroll.reconcile_unread_counts",
+        "schedule": crontab(minute=20),
+    },
     "send-daily-digests": {
         "task": "payroll.send_daily_digest",
         "schedule": crontab(hour=8, minute=0),
@@ -500,6 +544,14 @@ CELERY_BEAT_SCHEDULE = {
         "task": "payroll.send_weekly_digest",
         "schedule": crontab(hour=8, minute=0, day_of_week=1),
     },
+    "inventory-month-end-valuation-snapshots": {
+        "task": "inventory.snapshot_month_end_valuations",
+        "schedule": crontab(hour=1, minute=30, day_of_month=1),
+    },
+    "inventory-reorder-point-check": {
+        "task": "inventory.check_reorder_points",
+        "schedule": crontab(minute="*/15"),
+    },
 }
 
 # Celery Beat scheduler
@@ -48,6 +48,9 @@ ALLOWED_HOSTS = ["testserver", "localhost", "127.0.0.1"]
 # Keep tests deterministic and quiet by disabling notification side effects.
 NOTIFICATION_SIGNALS_ENABLED = False
 
+# Test databases reuse employee ids, so never keep preferences in process memory.
+NOTIFICATION_PREFERENCE_LOCAL_CACHE_SIZE = 0
+
 
 def _is_installed(module_name: str) -> bool:
     return importlib.util.find_spec(module_name) is not None
@@ -6,12 +6,14 @@ from inventory.models import (
     InventoryDocument,
     InventoryItem,
     InventoryValuationLayer,
+    ItemCost,
     PurchaseOrder,
     PurchaseOrderLine,
     PurchaseReceipt,
     PurchaseReceiptLine,
     SalesInvoice,
     SalesInvoiceLine,
+    StockBalance,
     StockCount,
     StockCountLine,
     StockLocation,
@@ -221,10 +223,54 @@ class StockMovementAdmin(admin.ModelAdmin):
 
 @admin.register(InventoryValuationLayer)
 class InventoryValuationLayerAdmin(admin.ModelAdmin):
-    list_display = ("company", "item", "quantity", "unit_cost", "total_cost")
+    list_display = (
+        "company",
+        "item",
+        "quantity",
+        "unit_cost",
+        "total_cost",
+        "remaining_quantity",
+    )
     list_filter = ("company",)
     search_fields = ("item__sku", "item__name", "company__name")
-    readonly_fields = ("company", "movement", "item", "quantity", "unit_cost", "total_cost")
+    readonly_fields = (
+        "company",
+        "movement",
+        "item",
+        "quantity",
+        "unit_cost",
+        "total_cost",
+        "remaining_quantity",
+        "remaining_value",
+    )
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(StockBalance)
+class StockBalanceAdmin(admin.ModelAdmin):
+    list_display = ("company", "item", "location", "quantity", "value", "updated_at")
+    list_filter = ("company",)
+    search_fields = ("item__sku", "item__name", "location__code")
+    readonly_fields = ("company", "item", "location", "quantity", "value")
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(ItemCost)
+class ItemCostAdmin(admin.ModelAdmin):
+    list_display = ("company", "item", "quantity", "value", "unit_cost", "updated_at")
+    list_filter = ("company",)
+    search_fields = ("item__sku", "item__name")
+    readonly_fields = ("company", "item", "quantity", "value", "unit_cost")
 
     def has_add_permission(self, request):
         return False
@@ -236,6 +282,7 @@ class InventoryValuationLayerAdmin(admin.ModelAdmin):
 class StockCountLineInline(admin.TabularInline):
     model = StockCountLine
     extra = 0
+    readonly_fields = ("system_quantity",)
 
 
 @admin.register(StockCount)
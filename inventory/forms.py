@@ -9,6 +9,7 @@ from inventory.models import (
     InventoryItem,
     PurchaseOrderLine,
     StockLocation,
+    StockMovement,
     Supplier,
     UnitOfMeasure,
     Warehouse,
@@ -218,6 +219,25 @@ class CustomerForm(CompanyScopedModelForm):
         return self.cleaned_data.get("default_wht_rate") or Decimal("0")
 
 
+class StockMovementFilterForm(forms.Form):
+    item = forms.ModelChoiceField(queryset=InventoryItem.objects.none(), required=False)
+    location = forms.ModelChoiceField(queryset=StockLocation.objects.none(), required=False)
+    movement_type = forms.ChoiceField(
+        choices=[("", "All types"), *StockMovement.MovementType.choices], required=False
+    )
+    start_date = forms.DateField(required=False, widget=forms.DateInput(attrs={"type": "date"}))
+    end_date = forms.DateField(required=False, widget=forms.DateInput(attrs={"type": "date"}))
+
+    def __init__(self, *args, company=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if company is not None:
+            self.fields["item"].queryset = InventoryItem.objects.filter(company=company)
+            self.fields["location"].queryset = StockLocation.objects.filter(
+                company=company
+            ).select_related("warehouse")
+        _style_fields(self.fields)
+
+
 class InventoryActionForm(forms.Form):
     posting_date = forms.DateField(required=False, widget=forms.DateInput(attrs={"type": "date"}))
     reference = forms.CharField(required=False, max_length=80)
@@ -466,3 +486,61 @@ class StockTransferForm(InventoryActionForm):
         if cleaned_data.get("from_location") == cleaned_data.get("to_location"):
             raise forms.ValidationError("Transfer locations must be different.")
         return cleaned_data
+
+
+class StockCountUploadForm(InventoryActionForm):
+    location = forms.ModelChoiceField(queryset=StockLocation.objects.none())
+    count_file = forms.FileField(
+        label="Count sheet (CSV or XLSX)",
+        help_text="Columns: sku, counted_quantity. Items left out of the sheet are not adjusted.",
+    )
+
+    def __init__(self, *args, company=None, **kwargs):
+        super().__init__(*args, company=company, **kwargs)
+        if company is not None:
+            self.fields["location"].queryset = StockLocation.objects.filter(
+                company=company, is_active=True
+            ).select_related("warehouse")
+
+
+class BulkImportForm(InventoryActionForm):
+    ITEMS = "items"
+    SUPPLIERS = "suppliers"
+    CUSTOMERS = "customers"
+    OPENING_STOCK = "opening_stock"
+    DATASET_CHOICES = [
+        (ITEMS, "Items"),
+        (SUPPLIERS, "Suppliers"),
+        (CUSTOMERS, "Customers"),
+        (OPENING_STOCK, "Opening stock"),
+    ]
+
+    dataset = forms.ChoiceField(choices=DATASET_CHOICES)
+    import_file = forms.FileField(
+        label="File (CSV or XLSX)",
+        help_text=(
+            "Items: sku, name, category. Suppliers and customers: name. "
+            "Opening stock: sku, location, quantity, unit_cost. "
+            "Posting date and reference apply to opening stock only."
+        ),
+    )
+    payable_account = forms.ModelChoiceField(
+        queryset=Account.objects.none(),
+        required=False,
+        help_text="Used for suppliers without a payable_account column value.",
+    )
+    receivable_account = forms.ModelChoiceField(
+        queryset=Account.objects.none(),
+        required=False,
+        help_text="Used for customers without a receivable_account column value.",
+    )
+
+    def __init__(self, *args, company=None, **kwargs):
+        super().__init__(*args, company=company, **kwargs)
+        if company is not None:
+            self.fields["payable_account"].queryset = _accounts_for(
+                company, Account.AccountType.LIABILITY
+            )
+            self.fields["receivable_account"].queryset = _accounts_for(
+                company, Account.AccountType.ASSET
+            )
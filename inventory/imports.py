@@ -0,0 +1,135 @@
+"""
+Streaming readers for bulk inventory imports.
+
+``read_rows`` takes an uploaded CSV or XLSX file and yields one dict per data
+row, keyed by the lower-cased header. CSV files are decoded line by line and
+worksheets are parsed with ``iterparse``, so memory use does not grow with the
+number of rows.
+"""
+
+import csv
+import zipfile
+from xml.etree.ElementTree import ParseError, iterparse
+
+_SHEET_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+
+
+def _is_xlsx(upload):
+    name = (getattr(upload, "name", "") or "").lower()
+    return name.endswith(".xlsx")
+
+
+def _csv_lines(upload):
+    for line in upload:
+        if isinstance(line, bytes):
+            try:
+                line = line.decode("utf-8-sig")
+            except UnicodeDecodeError:
+                raise ValueError("Could not read CSV file. Use UTF-8 CSV format.")
+        yield line
+
+
+def _column_index(reference):
+    index = 0
+    for char in reference:
+        if not char.isalpha():
+            break
+        index = index * 26 + ord(char.upper()) - ord("A") + 1
+    return index - 1
+
+
+def _text(element):
+    return "".join(node.text or "" for node in element.iter(f"{_SHEET_NS}t"))
+
+
+def _shared_strings(archive):
+    if "xl/sharedStrings.xml" not in archive.namelist():
+        return []
+    strings = []
+    with archive.open("xl/sharedStrings.xml") as source:
+        for _, element in iterparse(source):
+            if element.tag == f"{_SHEET_NS}si":
+                strings.append(_text(element))
+                element.clear()
+    return strings
+
+
+def _cell_value(cell, strings):
+    cell_type = cell.get("t")
+    if cell_type == "inlineStr":
+        return _text(cell)
+    value = cell.find(f"{_SHEET_NS}v")
+    if value is None or value.text is None:
+        return ""
+    if cell_type == "s":
+        return strings[int(value.text)]
+    if cell_type == "b":
+        return "TRUE" if value.text == "1" else "FALSE"
+    return value.text
+
+
+def _xlsx_rows(upload):
+    """Yield the first worksheet's rows as lists, with empty lists for gaps."""
+    try:
+        archive = zipfile.ZipFile(upload)
+    except zipfile.BadZipFile:
+        raise ValueError("Could not read XLSX file.")
+    with archive:
+        sheets = sorted(
+            name
+            for name in archive.namelist()
+            if name.startswith("xl/worksheets/") and name.endswith(".xml")
+        )
+        if not sheets:
+            raise ValueError("XLSX file has no worksheet.")
+        sheet = "xl/worksheets/sheet1.xml" if "xl/worksheets/sheet1.xml" in sheets else sheets[0]
+        strings = _shared_strings(archive)
+        expected = 1
+        with archive.open(sheet) as source:
+            try:
+                for _, element in iterparse(source):
+                    if element.tag != f"{_SHEET_NS}row":
+                        continue
+                    number = int(element.get("r") or expected)
+                    while expected < number:
+                        yield []
+                        expected += 1
+                    values = []
+                    for position, cell in enumerate(element.iter(f"{_SHEET_NS}c")):
+                        reference = cell.get("r")
+                        index = _column_index(reference) if reference else position
+                        values.extend([""] * (index - len(values)))
+                        values.append(_cell_value(cell, strings))
+                    element.clear()
+                    yield values
+                    expected += 1
+            except ParseError:
+                raise ValueError("Could not read XLSX file.")
+
+
+def read_rows(upload):
+    """
+    Return ``(columns, rows)`` for an uploaded CSV or XLSX file.
+
+    ``columns`` is the stripped, lower-cased header. ``rows`` lazily yields
+    ``(row_number, values)`` pairs, where ``row_number`` is the spreadsheet row
+    and ``values`` maps each column to its stripped text. Blank rows are
+    skipped.
+    """
+    source = _xlsx_rows(upload) if _is_xlsx(upload) else csv.reader(_csv_lines(upload))
+    source = iter(source)
+    header = next(source, None) or []
+    columns = [str(name or "").strip().lower() for name in header]
+
+    def rows():
+        for row_number, values in enumerate(source, start=2):
+            values = [str(value or "").strip() for value in values]
+            if not any(values):
+                continue
+            yield row_number, {
+                column: values[index] if index < len(values) else ""
+                for index, column in enumerate(columns)
+                if column
+            }
+
+    return columns, rows()
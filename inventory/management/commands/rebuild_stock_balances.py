@@ -0,0 +1,44 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from company.models import Company
+from inventory.services import rebuild_stock_balances, verify_stock_balances
+
+
+class Command(BaseCommand):
+    help = "Verify or rebuild the stock balance table from stock movements."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--company-id",
+            type=int,
+            help="Limit the run to one company.",
+        )
+        parser.add_argument(
+            "--verify",
+            action="store_true",
+            help="Report mismatched balances without changing them.",
+        )
+
+    def handle(self, *args, **options):
+        company = None
+        if options["company_id"]:
+            company = Company.objects.filter(pk=options["company_id"]).first()
+            if company is None:
+                raise CommandError(f"Company {options['company_id']} does not exist.")
+
+        if options["verify"]:
+            mismatches = verify_stock_balances(company)
+            for row in mismatches:
+                self.stdout.write(
+                    f"company={row['company_id']} item={row['item_id']} "
+                    f"location={row['location_id']}: "
+                    f"quantity {row['quantity']} != {row['expected_quantity']}, "
+                    f"value {row['value']} != {row['expected_value']}"
+                )
+            if mismatches:
+                raise CommandError(f"{len(mismatches)} stock balance(s) out of sync.")
+            self.stdout.write(self.style.SUCCESS("Stock balances match movements."))
+            return
+
+        count = rebuild_stock_balances(company)
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {count} stock balance(s)."))
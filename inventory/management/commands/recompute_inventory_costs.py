@@ -0,0 +1,53 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from company.models import Company
+from inventory.models import InventoryItem
+from inventory.services import recompute_item_costs
+
+
+class Command(BaseCommand):
+    help = "Replay stock movements to recompute item costs after back-dated postings."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--company-id",
+            type=int,
+            help="Limit the run to one company.",
+        )
+        parser.add_argument(
+            "--sku",
+            action="append",
+            default=[],
+            help="Limit the run to an item SKU (repeatable; requires --company-id).",
+        )
+
+    def handle(self, *args, **options):
+        companies = Company.objects.order_by("pk")
+        if options["company_id"]:
+            companies = companies.filter(pk=options["company_id"])
+            if not companies.exists():
+                raise CommandError(f"Company {options['company_id']} does not exist.")
+        elif options["sku"]:
+            raise CommandError("--sku requires --company-id.")
+
+        for company in companies:
+            items = None
+            if options["sku"]:
+                items = InventoryItem.objects.filter(
+                    company=company, sku__in=options["sku"]
+                ).select_related("category")
+                missing = set(options["sku"]) - set(items.values_list("sku", flat=True))
+                if missing:
+                    raise CommandError(f"Unknown SKU(s): {', '.join(sorted(missing))}")
+            summary = recompute_item_costs(company, items)
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"{company}: recomputed {summary['items']} item(s), "
+                    f"{summary['movements']} movement cost(s) changed."
+                )
+            )
+            if summary["documents"]:
+                self.stdout.write(
+                    "Documents to review: "
+                    + ", ".join(str(pk) for pk in summary["documents"])
+                )
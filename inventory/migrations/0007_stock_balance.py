@@ -0,0 +1,102 @@
+# Generated by Django 5.2.18 on 2026-10-18 21:24
+
+import django.db.models.deletion
+from decimal import Decimal
+from django.db import migrations, models
+from django.db.models import Sum
+
+
+def backfill_stock_balances(apps, schema_editor):
+    StockMovement = apps.get_model("inventory", "StockMovement")
+    StockBalance = apps.get_model("inventory", "StockBalance")
+    totals = (
+        StockMovement.objects.values("company_id", "item_id", "location_id")
+        .annotate(quantity=Sum("quantity"), value=Sum("total_cost"))
+        .order_by()
+    )
+    StockBalance.objects.bulk_create(
+        (
+            StockBalance(
+                company_id=row["company_id"],
+                item_id=row["item_id"],
+                location_id=row["location_id"],
+                quantity=row["quantity"] or Decimal("0"),
+                value=row["value"] or Decimal("0"),
+            )
+            for row in totals.iterator()
+        ),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("company", "0003_backfill_memberships"),
+        ("inventory", "0006_alter_inventorydocument_document_type_and_more"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="StockBalance",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "quantity",
+                    models.DecimalField(
+                        decimal_places=4, default=Decimal("0.0000"), max_digits=14
+                    ),
+                ),
+                (
+                    "value",
+                    models.DecimalField(
+                        decimal_places=2, default=Decimal("0.00"), max_digits=14
+                    ),
+                ),
+                (
+                    "company",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="stock_balances",
+                        to="company.company",
+                    ),
+                ),
+                (
+                    "item",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="stock_balances",
+                        to="inventory.inventoryitem",
+                    ),
+                ),
+                (
+                    "location",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="stock_balances",
+                        to="inventory.stocklocation",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["item__sku", "location__code"],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("company", "item", "location"),
+                        name="uniq_stock_balance_company_item_location",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(backfill_stock_balances, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,149 @@
+# Generated by Django 5.2.18 on 2026-10-18 21:34
+
+import django.db.models.deletion
+from decimal import Decimal
+from django.db import migrations, models
+from django.db.models import Sum
+
+TRANSFER_TYPES = ("TRANSFER_IN", "TRANSFER_OUT")
+
+
+def backfill_item_costs(apps, schema_editor):
+    StockMovement = apps.get_model("inventory", "StockMovement")
+    InventoryValuationLayer = apps.get_model("inventory", "InventoryValuationLayer")
+    ItemCost = apps.get_model("inventory", "ItemCost")
+    InventoryItem = apps.get_model("inventory", "InventoryItem")
+    totals = (
+        StockMovement.objects.values("company_id", "item_id")
+        .annotate(quantity=Sum("quantity"), value=Sum("total_cost"))
+        .order_by()
+    )
+    costs = []
+    for row in totals.iterator():
+        quantity = row["quantity"] or Decimal("0")
+        value = row["value"] or Decimal("0")
+        unit_cost = Decimal("0")
+        if quantity > 0:
+            unit_cost = (value / quantity).quantize(Decimal("0.0001"))
+        costs.append(
+            ItemCost(
+                company_id=row["company_id"],
+                item_id=row["item_id"],
+                quantity=quantity,
+                value=value,
+                unit_cost=unit_cost,
+            )
+        )
+    ItemCost.objects.bulk_create(costs, batch_size=1000)
+
+    # Under FIFO the stock on hand comes from the newest receipts, so open the
+    # most recent receipt layers until they cover the current quantity.
+    fifo_items = InventoryItem.objects.filter(category__costing_method="FIFO")
+    for cost in ItemCost.objects.filter(item__in=fifo_items, quantity__gt=0):
+        needed = cost.quantity
+        layers = (
+            InventoryValuationLayer.objects.filter(item_id=cost.item_id, quantity__gt=0)
+            .exclude(movement__movement_type__in=TRANSFER_TYPES)
+            .order_by("-movement__movement_date", "-created_at", "-id")
+        )
+        for layer in layers.iterator():
+            if needed <= 0:
+                break
+            remaining = min(layer.quantity, needed)
+            layer.remaining_quantity = remaining
+            layer.remaining_value = (layer.total_cost * remaining / layer.quantity).quantize(
+                Decimal("0.01")
+            )
+            layer.save(update_fields=["remaining_quantity", "remaining_value"])
+            needed -= remaining
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("company", "0003_backfill_memberships"),
+        ("inventory", "0007_stock_balance"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ItemCost",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "quantity",
+                    models.DecimalField(
+                        decimal_places=4, default=Decimal("0.0000"), max_digits=14
+                    ),
+                ),
+                (
+                    "value",
+                    models.DecimalField(
+                        decimal_places=2, default=Decimal("0.00"), max_digits=14
+                    ),
+                ),
+                (
+                    "unit_cost",
+                    models.DecimalField(
+                        decimal_places=4, default=Decimal("0.0000"), max_digits=14
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["item__sku"],
+            },
+        ),
+        migrations.AddField(
+            model_name="inventoryvaluationlayer",
+            name="remaining_quantity",
+            field=models.DecimalField(
+                decimal_places=4,
+                default=Decimal("0.0000"),
+                help_text="Quantity of a FIFO receipt layer not yet consumed by issues.",
+                max_digits=14,
+            ),
+        ),
+        migrations.AddField(
+            model_name="inventoryvaluationlayer",
+            name="remaining_value",
+            field=models.DecimalField(
+                decimal_places=2, default=Decimal("0.00"), max_digits=14
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="inventoryvaluationlayer",
+            index=models.Index(
+                fields=["item", "remaining_quantity"],
+                name="inventory_i_item_id_2cd910_idx",
+            ),
+        ),
+        migrations.AddField(
+            model_name="itemcost",
+            name="company",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="item_costs",
+                to="company.company",
+            ),
+        ),
+        migrations.AddField(
+            model_name="itemcost",
+            name="item",
+            field=models.OneToOneField(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="cost_state",
+                to="inventory.inventoryitem",
+            ),
+        ),
+        migrations.RunPython(backfill_item_costs, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.18 on 2026-10-18 21:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("inventory", "0008_item_cost"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="stockcountline",
+            name="system_quantity",
+            field=models.DecimalField(
+                blank=True,
+                decimal_places=4,
+                help_text="Stock on hand at the count location when the count was posted.",
+                max_digits=14,
+                null=True,
+            ),
+        ),
+    ]
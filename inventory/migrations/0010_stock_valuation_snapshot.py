@@ -0,0 +1,78 @@
+# Generated by Django 5.2.18 on 2026-10-18 21:43
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("company", "0003_backfill_memberships"),
+        ("inventory", "0009_stockcountline_system_quantity"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="StockValuationSnapshot",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("as_of_date", models.DateField()),
+                ("quantity", models.DecimalField(decimal_places=4, max_digits=14)),
+                ("value", models.DecimalField(decimal_places=2, max_digits=14)),
+            ],
+            options={
+                "ordering": ["-as_of_date", "item__sku", "location__code"],
+            },
+        ),
+        migrations.AddIndex(
+            model_name="stockmovement",
+            index=models.Index(
+                fields=["company", "item", "movement_date"],
+                name="inventory_s_company_9b9a62_idx",
+            ),
+        ),
+        migrations.AddField(
+            model_name="stockvaluationsnapshot",
+            name="company",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="stock_valuation_snapshots",
+                to="company.company",
+            ),
+        ),
+        migrations.AddField(
+            model_name="stockvaluationsnapshot",
+            name="item",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="valuation_snapshots",
+                to="inventory.inventoryitem",
+            ),
+        ),
+        migrations.AddField(
+            model_name="stockvaluationsnapshot",
+            name="location",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="valuation_snapshots",
+                to="inventory.stocklocation",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="stockvaluationsnapshot",
+            constraint=models.UniqueConstraint(
+                fields=("company", "as_of_date", "item", "location"),
+                name="uniq_stock_valuation_snapshot_date_item_location",
+            ),
+        ),
+    ]
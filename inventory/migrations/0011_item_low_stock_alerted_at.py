@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 21:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("inventory", "0010_stock_valuation_snapshot"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="inventoryitem",
+            name="low_stock_alerted_at",
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-18 22:04
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("inventory", "0011_item_low_stock_alerted_at"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="purchasereceiptline",
+            name="purchase_order_line",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="receipt_lines",
+                to="inventory.purchaseorderline",
+            ),
+        ),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 5.2.18 on 2026-10-18 22:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("company", "0003_backfill_memberships"),
+        ("inventory", "0012_receipt_line_purchase_order_line"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="stockmovement",
+            name="inventory_s_company_07d153_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="stockmovement",
+            name="inventory_s_company_9b9a62_idx",
+        ),
+        migrations.AddIndex(
+            model_name="stockmovement",
+            index=models.Index(
+                fields=["company", "movement_date", "id"],
+                name="inventory_s_company_de7848_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="stockmovement",
+            index=models.Index(
+                fields=["company", "item", "movement_date", "id"],
+                name="inventory_s_company_15210c_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="stockmovement",
+            index=models.Index(
+                fields=["company", "location", "movement_date", "id"],
+                name="inventory_s_company_fb935a_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="stockmovement",
+            index=models.Index(
+                fields=["company", "movement_type", "movement_date", "id"],
+                name="inventory_s_company_2c746e_idx",
+            ),
+        ),
+    ]
@@ -150,6 +150,7 @@ class InventoryItem(BaseModel):
         max_digits=7, decimal_places=4, default=Decimal("0.0000")
     )
     is_active = models.BooleanField(default=True)
+    low_stock_alerted_at = models.DateTimeField(null=True, blank=True, editable=False)
 
     class Meta:
         ordering = ["sku", "name"]
@@ -162,6 +163,20 @@ class InventoryItem(BaseModel):
     def __str__(self):
         return f"{self.sku} - {self.name}"
 
+    def save(self, *args, **kwargs):
+        from inventory.services import invalidate_low_stock_cache
+
+        super().save(*args, **kwargs)
+        invalidate_low_stock_cache(self.company_id)
+
+    def delete(self, *args, **kwargs):
+        from inventory.services import invalidate_low_stock_cache
+
+        company_id = self.company_id
+        result = super().delete(*args, **kwargs)
+        invalidate_low_stock_cache(company_id)
+        return result
+
     def clean(self):
         if self.category_id and self.category.company_id != self.company_id:
             raise ValidationError("Item category must belong to the same company.")
@@ -440,7 +455,11 @@ class StockMovement(BaseModel):
         ordering = ["movement_date", "created_at", "id"]
         indexes = [
             models.Index(fields=["company", "item", "location"]),
-            models.Index(fields=["company", "movement_date"]),
+            # Keyset pagination walks (movement_date, id) within each filter.
+            models.Index(fields=["company", "movement_date", "id"]),
+            models.Index(fields=["company", "item", "movement_date", "id"]),
+            models.Index(fields=["company", "location", "movement_date", "id"]),
+            models.Index(fields=["company", "movement_type", "movement_date", "id"]),
         ]
 
     def __str__(self):
@@ -455,6 +474,110 @@ class StockMovement(BaseModel):
             raise ValidationError("Movement location must belong to the same company.")
 
 
+class StockBalance(BaseModel):
+    """
+    Running stock quantity and value per item and location.
+
+    Maintained by ``inventory.services._create_movements`` alongside every
+    ``StockMovement``; ``rebuild_stock_balances`` recomputes it from the
+    movement history.
+    """
+
+    company = models.ForeignKey(
+        "company.Company", on_delete=models.CASCADE, related_name="stock_balances"
+    )
+    item = models.ForeignKey(
+        InventoryItem, on_delete=models.CASCADE, related_name="stock_balances"
+    )
+    location = models.ForeignKey(
+        StockLocation, on_delete=models.CASCADE, related_name="stock_balances"
+    )
+    quantity = models.DecimalField(
+        max_digits=14, decimal_places=4, default=Decimal("0.0000")
+    )
+    value = models.DecimalField(max_digits=14, decimal_places=2, default=Decimal("0.00"))
+
+    class Meta:
+        ordering = ["item__sku", "location__code"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["company", "item", "location"],
+                name="uniq_stock_balance_company_item_location",
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.item.sku} {self.quantity} @ {self.location}"
+
+
+class ItemCost(BaseModel):
+    """
+    Running cost state per item across all locations.
+
+    ``unit_cost`` is the current weighted-average cost; it keeps the last known
+    cost while the item is out of stock so issues can still be costed. Updated
+    with every costed ``StockMovement``; ``recompute_item_costs`` replays the
+    movement history after back-dated postings.
+    """
+
+    company = models.ForeignKey(
+        "company.Company", on_delete=models.CASCADE, related_name="item_costs"
+    )
+    item = models.OneToOneField(
+        InventoryItem, on_delete=models.CASCADE, related_name="cost_state"
+    )
+    quantity = models.DecimalField(
+        max_digits=14, decimal_places=4, default=Decimal("0.0000")
+    )
+    value = models.DecimalField(max_digits=14, decimal_places=2, default=Decimal("0.00"))
+    unit_cost = models.DecimalField(
+        max_digits=14, decimal_places=4, default=Decimal("0.0000")
+    )
+
+    class Meta:
+        ordering = ["item__sku"]
+
+    def __str__(self):
+        return f"{self.item.sku} @ {self.unit_cost}"
+
+
+class StockValuationSnapshot(BaseModel):
+    """
+    Stock quantity and value per item and location as of a closing date.
+
+    Written at month-end by ``inventory.services.snapshot_inventory_valuation``
+    so point-in-time valuation only sums the movements after the latest
+    snapshot. Postings dated on or before a snapshot delete it.
+    """
+
+    company = models.ForeignKey(
+        "company.Company",
+        on_delete=models.CASCADE,
+        related_name="stock_valuation_snapshots",
+    )
+    as_of_date = models.DateField()
+    item = models.ForeignKey(
+        InventoryItem, on_delete=models.CASCADE, related_name="valuation_snapshots"
+    )
+    location = models.ForeignKey(
+        StockLocation, on_delete=models.CASCADE, related_name="valuation_snapshots"
+    )
+    quantity = models.DecimalField(max_digits=14, decimal_places=4)
+    value = models.DecimalField(max_digits=14, decimal_places=2)
+
+    class Meta:
+        ordering = ["-as_of_date", "item__sku", "location__code"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["company", "as_of_date", "item", "location"],
+                name="uniq_stock_valuation_snapshot_date_item_location",
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.item.sku} @ {self.location} on {self.as_of_date}"
+
+
 class PurchaseReceipt(BaseModel):
     company = models.ForeignKey(
         "company.Company", on_delete=models.CASCADE, related_name="purchase_receipts"
@@ -504,6 +627,13 @@ class PurchaseReceiptLine(BaseModel):
         null=True,
         blank=True,
     )
+    purchase_order_line = models.ForeignKey(
+        PurchaseOrderLine,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="receipt_lines",
+    )
 
     class Meta:
         ordering = ["id"]
@@ -710,10 +840,22 @@ class InventoryValuationLayer(BaseModel):
     quantity = models.DecimalField(max_digits=14, decimal_places=4)
     unit_cost = models.DecimalField(max_digits=14, decimal_places=4)
     total_cost = models.DecimalField(max_digits=14, decimal_places=2)
+    remaining_quantity = models.DecimalField(
+        max_digits=14,
+        decimal_places=4,
+        default=Decimal("0.0000"),
+        help_text="Quantity of a FIFO receipt layer not yet consumed by issues.",
+    )
+    remaining_value = models.DecimalField(
+        max_digits=14, decimal_places=2, default=Decimal("0.00")
+    )
 
     class Meta:
         ordering = ["created_at", "id"]
-        indexes = [models.Index(fields=["company", "item"])]
+        indexes = [
+            models.Index(fields=["company", "item"]),
+            models.Index(fields=["item", "remaining_quantity"]),
+        ]
 
 
 class StockCount(BaseModel):
@@ -749,6 +891,13 @@ class StockCountLine(BaseModel):
     )
     item = models.ForeignKey(InventoryItem, on_delete=models.PROTECT)
     counted_quantity = models.DecimalField(max_digits=14, decimal_places=4)
+    system_quantity = models.DecimalField(
+        max_digits=14,
+        decimal_places=4,
+        null=True,
+        blank=True,
+        help_text="Stock on hand at the count location when the count was posted.",
+    )
 
     class Meta:
         constraints = [
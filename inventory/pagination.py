@@ -0,0 +1,96 @@
+"""
+Keyset (cursor) pagination over a fixed, unique ordering.
+
+A page starts after the ordering values of the last row the client saw rather
+than at an OFFSET, and no COUNT is issued, so every page is the same index
+range scan however deep the client has read, and rows inserted meanwhile do
+not shift later pages.
+"""
+
+import base64
+import binascii
+import json
+
+from django.db.models import Q
+
+
+def _fields(queryset, ordering):
+    return [
+        (queryset.model._meta.get_field(name.lstrip("-")), name.startswith("-"))
+        for name in ordering
+    ]
+
+
+def encode_cursor(values, reverse=False):
+    payload = json.dumps({"v": values, "r": int(reverse)}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor):
+    """Return ``(values, reverse)`` for ``cursor``, raising ``ValueError`` if it is malformed."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        values, reverse = payload["v"], bool(payload.get("r"))
+    except (binascii.Error, UnicodeError, TypeError, KeyError, ValueError):
+        raise ValueError("Invalid cursor")
+    if not isinstance(values, list):
+        raise ValueError("Invalid cursor")
+    return values, reverse
+
+
+def _position(fields, row):
+    return [field.value_to_string(row) for field, _ in fields]
+
+
+def _after(fields, values, reverse):
+    """Q for rows strictly after ``values`` in the ordering, or before it if ``reverse``."""
+    condition = Q()
+    for index, (field, descending) in enumerate(fields):
+        lookup = "lt" if descending != reverse else "gt"
+        term = Q(**{f"{field.name}__{lookup}": values[index]})
+        for position, (earlier, _) in enumerate(fields[:index]):
+            term &= Q(**{earlier.name: values[position]})
+        condition |= term
+    # Bound the leading column too so the database can range-scan the index.
+    field, descending = fields[0]
+    lookup = "lte" if descending != reverse else "gte"
+    return Q(**{f"{field.name}__{lookup}": values[0]}) & condition
+
+
+def keyset_page(queryset, ordering, cursor=None, page_size=50):
+    """
+    Return ``(rows, next_cursor, previous_cursor)`` for one page of ``queryset``.
+
+    ``ordering`` must end in a unique field such as ``"id"`` so every row has
+    a distinct position; prefix a field with ``-`` to sort it descending. The
+    cursors are opaque strings, or ``None`` at either end of the results.
+    Raises ``ValueError`` for a malformed cursor.
+    """
+    fields = _fields(queryset, ordering)
+    reverse = False
+    if cursor:
+        values, reverse = decode_cursor(cursor)
+        if len(values) != len(fields):
+            raise ValueError("Invalid cursor")
+        try:
+            values = [field.to_python(value) for (field, _), value in zip(fields, values)]
+        except Exception:
+            raise ValueError("Invalid cursor")
+        queryset = queryset.filter(_after(fields, values, reverse))
+    if reverse:
+        ordering = [name[1:] if name.startswith("-") else f"-{name}" for name in ordering]
+
+    rows = list(queryset.order_by(*ordering)[: page_size + 1])
+    has_more = len(rows) > page_size
+    rows = rows[:page_size]
+    if reverse:
+        rows.reverse()
+        next_cursor = encode_cursor(_position(fields, rows[-1])) if rows else None
+        previous_cursor = encode_cursor(_position(fields, rows[0]), reverse=True) if has_more else None
+    else:
+        next_cursor = encode_cursor(_position(fields, rows[-1])) if has_more else None
+        previous_cursor = (
+            encode_cursor(_position(fields, rows[0]), reverse=True) if cursor and rows else None
+        )
+    return rows, next_cursor, previous_cursor
@@ -1,19 +1,27 @@
-from decimal import Decimal, ROUND_HALF_UP
+from collections import deque
+from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
 
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.core.validators import validate_email
 from django.db import transaction
-from django.db.models import Sum
+from django.db.models import Count, DecimalField, F, Max, Q, Sum, Value
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 
 from accounting.models import Account
 from accounting.utils import create_journal_with_entries
+from inventory.imports import read_rows
 from inventory.models import (
     Customer,
     CustomerPayment,
     CustomerReturn,
     CustomerReturnLine,
+    InventoryCategory,
     InventoryDocument,
     InventoryItem,
     InventoryValuationLayer,
+    ItemCost,
     PurchaseOrder,
     PurchaseOrderLine,
     PurchaseReceipt,
@@ -25,14 +33,32 @@ from inventory.models import (
     SupplierReturn,
     SupplierReturnLine,
     TaxRemittance,
+    StockBalance,
+    StockCount,
+    StockCountLine,
     StockLocation,
     StockMovement,
+    StockValuationSnapshot,
+    UnitOfMeasure,
 )
 
 
 QTY = Decimal("0.0001")
 MONEY = Decimal("0.01")
 
+# Transfers move stock between locations at the running cost without changing
+# it; supplier returns leave at the purchase price rather than the item cost.
+COST_NEUTRAL_MOVEMENTS = (
+    StockMovement.MovementType.TRANSFER_OUT,
+    StockMovement.MovementType.TRANSFER_IN,
+)
+EXPLICIT_COST_ISSUES = (StockMovement.MovementType.SUPPLIER_RETURN,)
+
+# The reorder-point task runs every 15 minutes; the cache outlives one missed run.
+LOW_STOCK_CACHE_TIMEOUT = 60 * 30
+# (item, location) pairs locked per query; each pair is one OR term.
+STOCK_BALANCE_LOCK_BATCH = 500
+
 
 DEFAULT_POSTING_ACCOUNTS = [
     {
@@ -162,27 +188,674 @@ def _assert_positive_money(amount, label="Amount"):
 
 
 def get_stock_on_hand(item: InventoryItem, location: StockLocation | None = None):
-    filters = {"company": item.company, "item": item}
+    balances = StockBalance.objects.filter(company_id=item.company_id, item=item)
     if location is not None:
-        filters["location"] = location
-    total = StockMovement.objects.filter(**filters).aggregate(total=Sum("quantity"))[
-        "total"
-    ]
+        total = balances.filter(location=location).values_list("quantity", flat=True).first()
+    else:
+        total = balances.aggregate(total=Sum("quantity"))["total"]
     return _q_qty(total or Decimal("0"))
 
 
 def get_inventory_value(item: InventoryItem):
-    total = StockMovement.objects.filter(company=item.company, item=item).aggregate(
-        total=Sum("total_cost")
+    total = StockBalance.objects.filter(company_id=item.company_id, item=item).aggregate(
+        total=Sum("value")
     )["total"]
     return _q_money(total or Decimal("0"))
 
 
 def get_average_unit_cost(item: InventoryItem):
-    quantity = get_stock_on_hand(item)
-    if quantity <= 0:
-        return Decimal("0.0000")
-    return (get_inventory_value(item) / quantity).quantize(QTY, rounding=ROUND_HALF_UP)
+    """Current weighted-average unit cost; the last known cost while out of stock."""
+    unit_cost = (
+        ItemCost.objects.filter(item=item).values_list("unit_cost", flat=True).first()
+    )
+    return _q_qty(unit_cost or Decimal("0"))
+
+
+def annotate_stock_on_hand(items):
+    """Annotate ``stock_on_hand_total`` (all locations) on an item queryset."""
+    return items.annotate(
+        stock_on_hand_total=Coalesce(
+            Sum("stock_balances__quantity"),
+            Value(Decimal("0.0000")),
+            output_field=DecimalField(max_digits=14, decimal_places=4),
+        )
+    )
+
+
+def filter_stock_movements(
+    company,
+    *,
+    item=None,
+    location=None,
+    movement_type=None,
+    start_date=None,
+    end_date=None,
+):
+    """
+    A company's stock movements narrowed by the given filters.
+
+    ``item`` and ``location`` may be instances or ids. Each filter matches a
+    ``(company, <filter>, movement_date, id)`` index, so paging in
+    ``(movement_date, id)`` order stays an index range scan.
+    """
+    movements = StockMovement.objects.filter(company=company)
+    if item is not None:
+        movements = movements.filter(item=item)
+    if location is not None:
+        movements = movements.filter(location=location)
+    if movement_type:
+        movements = movements.filter(movement_type=movement_type)
+    if start_date is not None:
+        movements = movements.filter(movement_date__gte=start_date)
+    if end_date is not None:
+        movements = movements.filter(movement_date__lte=end_date)
+    return movements
+
+
+def get_low_stock_items(company):
+    """Active items at or below their reorder point, in one query."""
+    return (
+        annotate_stock_on_hand(
+            InventoryItem.objects.filter(
+                company=company, is_active=True, reorder_point__gt=0
+            )
+        )
+        .filter(stock_on_hand_total__lte=F("reorder_point"))
+        .order_by("sku", "name")
+    )
+
+
+def _low_stock_cache_key(company_id):
+    return f"inventory:low_stock:{company_id}"
+
+
+def invalidate_low_stock_cache(*company_ids):
+    """
+    Drop the companies' cached low-stock lists once the transaction commits.
+
+    Called wherever stock balances, items or reorder points change, so the
+    dashboard recomputes the list on its next read instead of showing one
+    cached before the change.
+    """
+    keys = [_low_stock_cache_key(company_id) for company_id in company_ids]
+    if keys:
+        transaction.on_commit(lambda: cache.delete_many(keys))
+
+
+def refresh_low_stock_cache(company):
+    """
+    Cache the company's low-stock items as plain dicts and return them.
+
+    The reorder-point task refreshes this on its schedule so the dashboard
+    reads a cached list instead of aggregating stock balances per request.
+    Postings and item changes drop it with ``invalidate_low_stock_cache``.
+    """
+    rows = [
+        {
+            "pk": item.pk,
+            "sku": item.sku,
+            "name": item.name,
+            "reorder_point": item.reorder_point,
+            "stock_on_hand": item.stock_on_hand_total,
+        }
+        for item in get_low_stock_items(company).only("sku", "name", "reorder_point")
+    ]
+    cache.set(_low_stock_cache_key(company.pk), rows, LOW_STOCK_CACHE_TIMEOUT)
+    return rows
+
+
+def get_cached_low_stock_items(company):
+    """Low-stock rows from the cache, computing and caching them on a miss."""
+    rows = cache.get(_low_stock_cache_key(company.pk))
+    if rows is None:
+        rows = refresh_low_stock_cache(company)
+    return rows
+
+
+@transaction.atomic
+def claim_low_stock_alerts(company, low_stock):
+    """
+    Return the rows of ``low_stock`` that have not been alerted yet.
+
+    Newly low items are stamped with ``low_stock_alerted_at`` and items that
+    are no longer low have the stamp cleared, so each item alerts once per
+    dip below its reorder point however often the check runs.
+    """
+    low_ids = [row["pk"] for row in low_stock]
+    InventoryItem.objects.filter(company=company, low_stock_alerted_at__isnull=False).exclude(
+        pk__in=low_ids
+    ).update(low_stock_alerted_at=None)
+    new_ids = set(
+        InventoryItem.objects.select_for_update()
+        .filter(company=company, pk__in=low_ids, low_stock_alerted_at__isnull=True)
+        .values_list("pk", flat=True)
+    )
+    if new_ids:
+        InventoryItem.objects.filter(pk__in=new_ids).update(low_stock_alerted_at=timezone.now())
+    return [row for row in low_stock if row["pk"] in new_ids]
+
+
+def lock_stock_balances(company, keys):
+    """
+    Lock the stock balance rows for ``(item, location)`` pairs.
+
+    Missing rows are created first so there is always a row to lock. Rows are
+    locked with ``SELECT ... FOR UPDATE`` in ``(item_id, location_id)`` order,
+    so documents touching overlapping items cannot deadlock and documents on
+    different items do not block each other. Large documents are locked in
+    ascending chunks of ``STOCK_BALANCE_LOCK_BATCH`` pairs, which keeps that
+    order while bounding the size of each query. Must run inside the posting
+    transaction.
+
+    Returns a dict of locked ``StockBalance`` rows keyed by
+    ``(item_id, location_id)``.
+    """
+    key_ids = sorted({(item.id, location.id) for item, location in keys})
+    return _lock_stock_balance_rows(company, key_ids)
+
+
+def _lock_stock_balance_rows(company, key_ids):
+    """Create and lock the stock balances for sorted ``(item_id, location_id)`` pairs."""
+    if not key_ids:
+        return {}
+    StockBalance.objects.bulk_create(
+        [
+            StockBalance(company=company, item_id=item_id, location_id=location_id)
+            for item_id, location_id in key_ids
+        ],
+        ignore_conflicts=True,
+    )
+    locked = {}
+    for batch in _batches(key_ids, STOCK_BALANCE_LOCK_BATCH):
+        condition = Q()
+        for item_id, location_id in batch:
+            condition |= Q(item_id=item_id, location_id=location_id)
+        rows = (
+            StockBalance.objects.select_for_update()
+            .filter(condition, company=company)
+            .order_by("item_id", "location_id")
+        )
+        locked.update({(row.item_id, row.location_id): row for row in rows})
+    return locked
+
+
+def _is_fifo(item):
+    return item.category.costing_method == InventoryCategory.CostingMethod.FIFO
+
+
+def lock_item_costs(company, items):
+    """
+    Lock the running cost rows for ``items``, creating missing ones.
+
+    Rows are locked in ``item_id`` order after the stock balances, matching the
+    order every posting service takes its locks in. FIFO items also get their
+    open receipt layers locked and attached as ``open_layers``, oldest first.
+
+    Returns a dict of ``ItemCost`` rows keyed by item id.
+    """
+    items = {item.id: item for item in items}
+    if not items:
+        return {}
+    item_ids = sorted(items)
+    ItemCost.objects.bulk_create(
+        [ItemCost(company=company, item_id=item_id) for item_id in item_ids],
+        ignore_conflicts=True,
+    )
+    costs = {}
+    rows = (
+        ItemCost.objects.select_for_update()
+        .filter(company=company, item_id__in=item_ids)
+        .order_by("item_id")
+    )
+    for cost in rows:
+        cost.item = items[cost.item_id]
+        cost.open_layers = deque()
+        cost.consumed_layers = []
+        costs[cost.item_id] = cost
+    fifo_ids = [item_id for item_id, item in items.items() if _is_fifo(item)]
+    if fifo_ids:
+        layers = (
+            InventoryValuationLayer.objects.select_for_update(of=("self",))
+            .filter(company=company, item_id__in=fifo_ids, remaining_quantity__gt=0)
+            .order_by("movement__movement_date", "created_at", "id")
+        )
+        for layer in layers:
+            costs[layer.item_id].open_layers.append(layer)
+    return costs
+
+
+def _fallback_unit_cost(cost):
+    return cost.unit_cost or _q_qty(cost.item.standard_cost)
+
+
+def _refresh_unit_cost(cost):
+    if cost.quantity > 0:
+        cost.unit_cost = (cost.value / cost.quantity).quantize(QTY, rounding=ROUND_HALF_UP)
+
+
+def issue_stock_cost(costs, item, quantity, total_cost=None):
+    """
+    Relieve ``quantity`` of ``item`` from a locked cost row and return its cost.
+
+    Weighted-average items issue at the running unit cost; FIFO items consume
+    their open layers oldest first. Anything issued beyond the stock on hand is
+    costed at the last known unit cost, or the item's standard cost.
+    ``total_cost`` overrides the value relieved, as supplier returns go back at
+    the purchase price; FIFO layers are still consumed for the quantity.
+    """
+    cost = costs[item.id]
+    quantity = _q_qty(quantity)
+    if _is_fifo(item):
+        amount = Decimal("0.00")
+        remaining = quantity
+        while remaining > 0 and cost.open_layers:
+            layer = cost.open_layers[0]
+            taken = min(layer.remaining_quantity, remaining)
+            if taken == layer.remaining_quantity:
+                value = layer.remaining_value
+                cost.open_layers.popleft()
+            else:
+                value = _q_money(taken * layer.unit_cost)
+            layer.remaining_quantity -= taken
+            layer.remaining_value -= value
+            cost.consumed_layers.append(layer)
+            amount += value
+            remaining -= taken
+        amount += _q_money(remaining * _fallback_unit_cost(cost))
+    elif cost.quantity > 0 and quantity >= cost.quantity:
+        amount = cost.value + _q_money((quantity - cost.quantity) * _fallback_unit_cost(cost))
+    else:
+        amount = _q_money(quantity * _fallback_unit_cost(cost))
+    if total_cost is not None:
+        amount = total_cost
+    amount = _q_money(amount)
+    cost.quantity -= quantity
+    cost.value -= amount
+    _refresh_unit_cost(cost)
+    return amount
+
+
+def receive_stock_cost(costs, item, quantity, total_cost, layer=None):
+    """
+    Add received stock to a locked cost row.
+
+    For FIFO items ``layer`` is opened for the part of the receipt that is not
+    absorbed by stock issued while the item was negative.
+    """
+    cost = costs[item.id]
+    if layer is not None and _is_fifo(item):
+        shortfall = max(-cost.quantity, Decimal("0"))
+        layer.remaining_quantity = max(quantity - shortfall, Decimal("0"))
+        if shortfall:
+            layer.remaining_value = _q_money(layer.remaining_quantity * layer.unit_cost)
+        else:
+            layer.remaining_value = total_cost
+        if layer.remaining_quantity > 0:
+            cost.open_layers.append(layer)
+    cost.quantity += quantity
+    cost.value += total_cost
+    _refresh_unit_cost(cost)
+
+
+def _save_item_costs(costs):
+    now = timezone.now()
+    rows = list(costs.values())
+    layers = {}
+    for cost in rows:
+        cost.updated_at = now
+        for layer in cost.consumed_layers:
+            if layer.pk:
+                layer.updated_at = now
+                layers[layer.pk] = layer
+        cost.consumed_layers = []
+    ItemCost.objects.bulk_update(rows, ["quantity", "value", "unit_cost", "updated_at"])
+    if layers:
+        InventoryValuationLayer.objects.bulk_update(
+            list(layers.values()), ["remaining_quantity", "remaining_value", "updated_at"]
+        )
+
+
+def _line_stock_keys(lines, location=None):
+    return [
+        (line["item"], line.get("location") or location)
+        for line in lines
+        if line.get("location") or location
+    ]
+
+
+def reserve_stock(balances, item, location, quantity, message):
+    """
+    Take ``quantity`` from a locked balance returned by ``lock_stock_balances``.
+
+    The amount is tracked on ``balance.reserved_quantity`` so later lines of the
+    same document for the same item and location see what earlier lines already
+    took, while ``balance.quantity`` stays the stored value that
+    ``_create_movements`` adds the movement deltas to.
+    """
+    balance = balances[(item.id, location.id)]
+    reserved = getattr(balance, "reserved_quantity", Decimal("0")) + quantity
+    if not item.allow_negative_stock and balance.quantity - reserved < 0:
+        raise ValueError(message)
+    balance.reserved_quantity = reserved
+    return balance
+
+
+def _load_line_items(company, lines, label):
+    """
+    Resolve the line items of a document with their posting accounts.
+
+    Every distinct item is fetched once with its category accounts, and each
+    line's ``item`` is swapped for the loaded instance so per-line account
+    lookups do not query.
+    """
+    item_ids = set()
+    for line in lines:
+        item = line["item"]
+        _assert_same_company(company, item)
+        item_ids.add(item.id)
+    items = InventoryItem.objects.select_related(
+        "category__inventory_account",
+        "category__sales_revenue_account",
+        "category__cogs_account",
+    ).in_bulk(item_ids)
+    if len(items) != len(item_ids):
+        raise ValueError(f"{label} line item does not exist")
+    return [{**line, "item": items[line["item"].id]} for line in lines]
+
+
+def _consolidate_entries(entries, description):
+    """
+    Merge journal lines that hit the same account on the same side.
+
+    Keeps a document's journal at one entry per account and side however many
+    lines it has. A merged entry's memo names the document and line count;
+    entries that were not merged keep their own memo.
+    """
+    merged = {}
+    for entry in entries:
+        key = (entry["account"].pk, entry["entry_type"])
+        if key in merged:
+            merged[key]["amount"] += entry["amount"]
+            merged[key]["lines"] += 1
+        else:
+            merged[key] = {**entry, "lines": 1}
+    consolidated = []
+    for entry in merged.values():
+        lines = entry.pop("lines")
+        if lines > 1:
+            entry["memo"] = f"{description} ({lines} lines)"[:255]
+        entry["amount"] = _q_money(entry["amount"])
+        consolidated.append(entry)
+    return consolidated
+
+
+def _movement_totals(company=None):
+    movements = StockMovement.objects.all()
+    if company is not None:
+        movements = movements.filter(company=company)
+    return (
+        movements.values("company_id", "item_id", "location_id")
+        .annotate(quantity=Sum("quantity"), value=Sum("total_cost"))
+        .order_by()
+    )
+
+
+def verify_stock_balances(company=None):
+    """
+    Compare stored stock balances with totals recomputed from movements.
+
+    Returns a list of ``{"company_id", "item_id", "location_id", "expected_quantity",
+    "expected_value", "quantity", "value"}`` dictionaries for every mismatch.
+    """
+    balances = StockBalance.objects.all()
+    if company is not None:
+        balances = balances.filter(company=company)
+    stored = {
+        (row["company_id"], row["item_id"], row["location_id"]): row
+        for row in balances.values(
+            "company_id", "item_id", "location_id", "quantity", "value"
+        )
+    }
+    mismatches = []
+    for row in _movement_totals(company).iterator():
+        key = (row["company_id"], row["item_id"], row["location_id"])
+        expected_quantity = _q_qty(row["quantity"] or Decimal("0"))
+        expected_value = _q_money(row["value"] or Decimal("0"))
+        balance = stored.pop(key, None)
+        quantity = balance["quantity"] if balance else Decimal("0.0000")
+        value = balance["value"] if balance else Decimal("0.00")
+        if quantity != expected_quantity or value != expected_value:
+            mismatches.append(
+                {
+                    "company_id": key[0],
+                    "item_id": key[1],
+                    "location_id": key[2],
+                    "expected_quantity": expected_quantity,
+                    "expected_value": expected_value,
+                    "quantity": quantity,
+                    "value": value,
+                }
+            )
+    for key, balance in stored.items():
+        if balance["quantity"] or balance["value"]:
+            mismatches.append(
+                {
+                    "company_id": key[0],
+                    "item_id": key[1],
+                    "location_id": key[2],
+                    "expected_quantity": Decimal("0.0000"),
+                    "expected_value": Decimal("0.00"),
+                    "quantity": balance["quantity"],
+                    "value": balance["value"],
+                }
+            )
+    return mismatches
+
+
+@transaction.atomic
+def rebuild_stock_balances(company=None):
+    """
+    Recompute stock balances from the movement history.
+
+    Returns the number of balance rows written.
+    """
+    balances = StockBalance.objects.all()
+    if company is not None:
+        balances = balances.filter(company=company)
+    company_ids = set(balances.values_list("company_id", flat=True).distinct())
+    balances.delete()
+    created = StockBalance.objects.bulk_create(
+        [
+            StockBalance(
+                company_id=row["company_id"],
+                item_id=row["item_id"],
+                location_id=row["location_id"],
+                quantity=_q_qty(row["quantity"] or Decimal("0")),
+                value=_q_money(row["value"] or Decimal("0")),
+            )
+            for row in _movement_totals(company).iterator()
+        ],
+        batch_size=1000,
+    )
+    invalidate_low_stock_cache(*company_ids, *{balance.company_id for balance in created})
+    return len(created)
+
+
+@transaction.atomic
+def recompute_item_costs(company, items=None):
+    """
+    Replay the movement history to rebuild item costs after back-dated postings.
+
+    Movements are re-costed in ``movement_date`` order with each item's costing
+    method: receipts keep their cost, issues are costed again, and FIFO layers
+    are reopened and consumed again. Stock balance values are then rebuilt.
+    The company's stock balances are locked before the item costs, as in
+    every posting service.
+    Posted journals and document lines are not restated, so the ids of the
+    documents whose cost changed are returned for review.
+
+    Returns ``{"items": <count>, "movements": <changed count>, "documents": [ids]}``.
+    """
+    if items is None:
+        items = InventoryItem.objects.filter(company=company).select_related("category")
+    # Balances before costs, the order postings lock in. The rebuild below
+    # rewrites every balance of the company, so all of them are locked.
+    key_ids = set(
+        StockMovement.objects.filter(company=company)
+        .values_list("item_id", "location_id")
+        .distinct()
+    )
+    key_ids.update(
+        StockBalance.objects.filter(company=company).values_list("item_id", "location_id")
+    )
+    _lock_stock_balance_rows(company, sorted(key_ids))
+    costs = lock_item_costs(company, list(items))
+    for cost in costs.values():
+        cost.quantity = Decimal("0.0000")
+        cost.value = Decimal("0.00")
+        cost.unit_cost = Decimal("0.0000")
+        cost.open_layers = deque()
+
+    movements = (
+        StockMovement.objects.filter(company=company, item_id__in=list(costs))
+        .select_related("valuation_layer")
+        .order_by("movement_date", "created_at", "id")
+    )
+    changed = []
+    layers = []
+    document_ids = set()
+    for movement in movements.iterator(chunk_size=2000):
+        cost = costs[movement.item_id]
+        layer = movement.valuation_layer
+        layer.remaining_quantity = Decimal("0.0000")
+        layer.remaining_value = Decimal("0.00")
+        if movement.movement_type in COST_NEUTRAL_MOVEMENTS:
+            unit_cost = _fallback_unit_cost(cost)
+            total_cost = _q_money(movement.quantity * unit_cost)
+        elif movement.quantity < 0:
+            explicit = None
+            if movement.movement_type in EXPLICIT_COST_ISSUES:
+                explicit = -movement.total_cost
+            total_cost = -issue_stock_cost(
+                costs, cost.item, -movement.quantity, total_cost=explicit
+            )
+            unit_cost = _q_qty(total_cost / movement.quantity)
+        else:
+            unit_cost = movement.unit_cost
+            total_cost = movement.total_cost
+            receive_stock_cost(costs, cost.item, movement.quantity, total_cost, layer)
+        if unit_cost != movement.unit_cost or total_cost != movement.total_cost:
+            movement.unit_cost = layer.unit_cost = unit_cost
+            movement.total_cost = layer.total_cost = total_cost
+            changed.append(movement)
+            document_ids.add(movement.document_id)
+        layers.append(layer)
+
+    for cost in costs.values():
+        cost.consumed_layers = []
+    _save_item_costs(costs)
+    InventoryValuationLayer.objects.bulk_update(
+        layers,
+        ["unit_cost", "total_cost", "remaining_quantity", "remaining_value"],
+        batch_size=1000,
+    )
+    if changed:
+        StockMovement.objects.bulk_update(
+            changed, ["unit_cost", "total_cost"], batch_size=1000
+        )
+        rebuild_stock_balances(company)
+        StockValuationSnapshot.objects.filter(company=company).delete()
+    return {
+        "items": len(costs),
+        "movements": len(changed),
+        "documents": sorted(document_ids),
+    }
+
+
+def inventory_valuation(company, as_of_date):
+    """
+    Stock quantity, value and average cost per item and location as of a date.
+
+    Starts from the latest valuation snapshot on or before ``as_of_date`` and
+    adds the movements after it with one grouped query, so the work depends on
+    the activity since the last month-end rather than the whole history.
+    Returns dicts ordered by SKU and location code, without empty positions.
+    """
+    snapshot_date = StockValuationSnapshot.objects.filter(
+        company=company, as_of_date__lte=as_of_date
+    ).aggregate(latest=Max("as_of_date"))["latest"]
+    totals = {}
+    if snapshot_date is not None:
+        snapshot = StockValuationSnapshot.objects.filter(
+            company=company, as_of_date=snapshot_date
+        ).order_by().values_list("item_id", "location_id", "quantity", "value")
+        for item_id, location_id, quantity, value in snapshot:
+            totals[(item_id, location_id)] = [quantity, value]
+
+    movements = StockMovement.objects.filter(company=company, movement_date__lte=as_of_date)
+    if snapshot_date is not None:
+        movements = movements.filter(movement_date__gt=snapshot_date)
+    grouped = (
+        movements.values("item_id", "location_id")
+        .annotate(quantity=Sum("quantity"), value=Sum("total_cost"))
+        .order_by()
+    )
+    for row in grouped:
+        position = totals.setdefault((row["item_id"], row["location_id"]), [0, 0])
+        position[0] += row["quantity"] or 0
+        position[1] += row["value"] or 0
+
+    totals = {key: position for key, position in totals.items() if any(position)}
+    items = InventoryItem.objects.order_by().only("sku", "name").in_bulk({key[0] for key in totals})
+    locations = (
+        StockLocation.objects.order_by().only("code", "name").in_bulk({key[1] for key in totals})
+    )
+    rows = []
+    for (item_id, location_id), (quantity, value) in totals.items():
+        quantity = _q_qty(quantity)
+        value = _q_money(value)
+        average_cost = Decimal("0.0000")
+        if quantity > 0:
+            average_cost = (value / quantity).quantize(QTY, rounding=ROUND_HALF_UP)
+        rows.append(
+            {
+                "item_id": item_id,
+                "sku": items[item_id].sku,
+                "item_name": items[item_id].name,
+                "location_id": location_id,
+                "location_code": locations[location_id].code,
+                "quantity": quantity,
+                "value": value,
+                "average_cost": average_cost,
+            }
+        )
+    rows.sort(key=lambda row: (row["sku"], row["location_code"]))
+    return rows
+
+
+@transaction.atomic
+def snapshot_inventory_valuation(company, as_of_date):
+    """
+    Store the valuation as of ``as_of_date``, replacing any earlier snapshot
+    for that date. Returns the number of positions written.
+    """
+    rows = inventory_valuation(company, as_of_date)
+    StockValuationSnapshot.objects.filter(company=company, as_of_date=as_of_date).delete()
+    created = StockValuationSnapshot.objects.bulk_create(
+        [
+            StockValuationSnapshot(
+                company=company,
+                as_of_date=as_of_date,
+                item_id=row["item_id"],
+                location_id=row["location_id"],
+                quantity=row["quantity"],
+                value=row["value"],
+            )
+            for row in rows
+        ],
+        batch_size=1000,
+    )
+    return len(created)
 
 
 def _posting_accounts(item):
@@ -227,18 +900,132 @@ def _sales_accounts(item):
     return required
 
 
-def _update_purchase_order_status(purchase_order):
-    lines = list(PurchaseOrderLine.objects.filter(purchase_order=purchase_order))
-    if not lines:
-        purchase_order.status = PurchaseOrder.Status.ORDERED
-    elif all(line.received_quantity >= line.quantity for line in lines):
-        purchase_order.status = PurchaseOrder.Status.RECEIVED
-    elif any(line.received_quantity > 0 for line in lines):
-        purchase_order.status = PurchaseOrder.Status.PARTIALLY_RECEIVED
-    else:
-        purchase_order.status = PurchaseOrder.Status.ORDERED
-    purchase_order.save(update_fields=["status", "updated_at"])
-    return purchase_order
+def _update_purchase_order_statuses(purchase_orders):
+    """
+    Set each order's status from its lines' received quantities.
+
+    Line progress for all orders comes from one grouped query and the
+    statuses are written with one bulk update.
+    """
+    purchase_orders = {purchase_order.pk: purchase_order for purchase_order in purchase_orders}
+    progress = {
+        row["purchase_order_id"]: row
+        for row in PurchaseOrderLine.objects.filter(purchase_order_id__in=list(purchase_orders))
+        .values("purchase_order_id")
+        .annotate(
+            lines=Count("id"),
+            received=Count("id", filter=Q(received_quantity__gte=F("quantity"))),
+            started=Count("id", filter=Q(received_quantity__gt=0)),
+        )
+        .order_by()
+    }
+    now = timezone.now()
+    for pk, purchase_order in purchase_orders.items():
+        row = progress.get(pk)
+        if row is None:
+            purchase_order.status = PurchaseOrder.Status.ORDERED
+        elif row["received"] == row["lines"]:
+            purchase_order.status = PurchaseOrder.Status.RECEIVED
+        elif row["started"]:
+            purchase_order.status = PurchaseOrder.Status.PARTIALLY_RECEIVED
+        else:
+            purchase_order.status = PurchaseOrder.Status.ORDERED
+        purchase_order.updated_at = now
+    PurchaseOrder.objects.bulk_update(list(purchase_orders.values()), ["status", "updated_at"])
+
+
+def _create_movements(document, movements, balances=None, costs=None):
+    """
+    Write stock movements, valuation layers, balance and cost deltas in bulk.
+
+    ``movements`` is a list of dicts with ``item``, ``location``,
+    ``movement_type``, ``quantity``, ``unit_cost``, ``movement_date`` and
+    ``memo``. Issues (negative quantities) are costed by the costing engine
+    unless they carry a signed ``total_cost`` from a caller that already took
+    it with ``issue_stock_cost``; transfers move stock at the running unit cost
+    without touching it. ``balances`` and ``costs`` are rows already locked by
+    ``lock_stock_balances`` and ``lock_item_costs``; any that are missing are
+    locked here. Returns the saved movements in input order.
+    """
+    company = document.company
+    balances = dict(balances or {})
+    missing = [
+        (spec["item"], spec["location"])
+        for spec in movements
+        if (spec["item"].id, spec["location"].id) not in balances
+    ]
+    if missing:
+        balances.update(lock_stock_balances(company, missing))
+    costs = dict(costs or {})
+    missing = [spec["item"] for spec in movements if spec["item"].id not in costs]
+    if missing:
+        costs.update(lock_item_costs(company, missing))
+
+    stock_movements = []
+    layers = []
+    for spec in movements:
+        item = spec["item"]
+        quantity = _q_qty(spec["quantity"])
+        if spec["movement_type"] in COST_NEUTRAL_MOVEMENTS:
+            unit_cost = spec.get("unit_cost")
+            if unit_cost is None:
+                unit_cost = _fallback_unit_cost(costs[item.id])
+            unit_cost = _q_qty(unit_cost)
+            total_cost = _q_money(quantity * unit_cost)
+        elif quantity < 0:
+            total_cost = spec.get("total_cost")
+            if total_cost is None:
+                total_cost = -issue_stock_cost(costs, item, -quantity)
+            total_cost = _q_money(total_cost)
+            unit_cost = _q_qty(total_cost / quantity)
+        else:
+            unit_cost = _q_qty(spec["unit_cost"])
+            total_cost = _q_money(quantity * unit_cost)
+        movement = StockMovement(
+            company=company,
+            document=document,
+            item=item,
+            location=spec["location"],
+            movement_type=spec["movement_type"],
+            quantity=quantity,
+            unit_cost=unit_cost,
+            total_cost=total_cost,
+            movement_date=spec["movement_date"],
+            memo=spec.get("memo", ""),
+        )
+        layer = InventoryValuationLayer(
+            company=company,
+            movement=movement,
+            item=item,
+            quantity=quantity,
+            unit_cost=unit_cost,
+            total_cost=total_cost,
+        )
+        if quantity > 0 and spec["movement_type"] not in COST_NEUTRAL_MOVEMENTS:
+            receive_stock_cost(costs, item, quantity, total_cost, layer)
+        stock_movements.append(movement)
+        layers.append(layer)
+    StockMovement.objects.bulk_create(stock_movements)
+    InventoryValuationLayer.objects.bulk_create(layers)
+
+    now = timezone.now()
+    touched = {}
+    for movement in stock_movements:
+        balance = balances[(movement.item_id, movement.location_id)]
+        balance.quantity = _q_qty(balance.quantity + movement.quantity)
+        balance.value = _q_money(balance.value + movement.total_cost)
+        balance.updated_at = now
+        touched[balance.pk] = balance
+    StockBalance.objects.bulk_update(
+        list(touched.values()), ["quantity", "value", "updated_at"]
+    )
+    _save_item_costs(costs)
+    StockValuationSnapshot.objects.filter(
+        company=company,
+        as_of_date__gte=min(movement.movement_date for movement in stock_movements),
+    ).delete()
+    invalidate_low_stock_cache(company.pk)
+    return stock_movements
 
 
 def _create_movement(
@@ -248,34 +1035,24 @@ def _create_movement(
     location,
     movement_type,
     quantity,
-    unit_cost,
+    unit_cost=None,
     movement_date,
     memo="",
 ):
-    quantity = _q_qty(quantity)
-    unit_cost = _q_qty(unit_cost)
-    total_cost = _q_money(quantity * unit_cost)
-    movement = StockMovement.objects.create(
-        company=document.company,
-        document=document,
-        item=item,
-        location=location,
-        movement_type=movement_type,
-        quantity=quantity,
-        unit_cost=unit_cost,
-        total_cost=total_cost,
-        movement_date=movement_date,
-        memo=memo,
-    )
-    InventoryValuationLayer.objects.create(
-        company=document.company,
-        movement=movement,
-        item=item,
-        quantity=quantity,
-        unit_cost=unit_cost,
-        total_cost=total_cost,
-    )
-    return movement
+    return _create_movements(
+        document,
+        [
+            {
+                "item": item,
+                "location": location,
+                "movement_type": movement_type,
+                "quantity": quantity,
+                "unit_cost": unit_cost,
+                "movement_date": movement_date,
+                "memo": memo,
+            }
+        ],
+    )[0]
 
 
 @transaction.atomic
@@ -368,7 +1145,7 @@ def post_purchase_receipt(
     total_vat = Decimal("0.00")
     total_wht = Decimal("0.00")
     journal_entries = []
-    for line in lines:
+    for line in _load_line_items(company, lines, "Purchase receipt"):
         item = line["item"]
         line_location = line.get("location") or location
         if line_location is None:
@@ -398,6 +1175,7 @@ def post_purchase_receipt(
                 "vat_amount": vat_amount,
                 "wht_rate": wht_rate,
                 "wht_amount": wht_amount,
+                "purchase_order_line": line.get("purchase_order_line"),
             }
         )
         journal_entries.append(
@@ -444,30 +1222,40 @@ def post_purchase_receipt(
         supplier=supplier,
         purchase_order=purchase_order,
     )
-    for line in prepared_lines:
-        movement = _create_movement(
-            document=document,
-            item=line["item"],
-            location=line["location"],
-            movement_type=StockMovement.MovementType.PURCHASE_RECEIPT,
-            quantity=line["quantity"],
-            unit_cost=line["unit_cost"],
-            movement_date=posting_date,
-            memo=reason,
-        )
-        PurchaseReceiptLine.objects.create(
-            receipt=receipt,
-            item=line["item"],
-            location=line["location"],
-            quantity=line["quantity"],
-            unit_cost=line["unit_cost"],
-            vat_rate=line["vat_rate"],
-            vat_amount=line["vat_amount"],
-            wht_rate=line["wht_rate"],
-            wht_amount=line["wht_amount"],
-            total_cost=line["total_cost"],
-            movement=movement,
-        )
+    movements = _create_movements(
+        document,
+        [
+            {
+                "item": line["item"],
+                "location": line["location"],
+                "movement_type": StockMovement.MovementType.PURCHASE_RECEIPT,
+                "quantity": line["quantity"],
+                "unit_cost": line["unit_cost"],
+                "movement_date": posting_date,
+                "memo": reason,
+            }
+            for line in prepared_lines
+        ],
+    )
+    PurchaseReceiptLine.objects.bulk_create(
+        [
+            PurchaseReceiptLine(
+                receipt=receipt,
+                item=line["item"],
+                location=line["location"],
+                quantity=line["quantity"],
+                unit_cost=line["unit_cost"],
+                vat_rate=line["vat_rate"],
+                vat_amount=line["vat_amount"],
+                wht_rate=line["wht_rate"],
+                wht_amount=line["wht_amount"],
+                total_cost=line["total_cost"],
+                movement=movement,
+                purchase_order_line=line["purchase_order_line"],
+            )
+            for line, movement in zip(prepared_lines, movements)
+        ]
+    )
 
     journal_entries.append(
         {
@@ -481,7 +1269,7 @@ def post_purchase_receipt(
         company=company,
         date=posting_date,
         description=f"Purchase receipt: {supplier.name}",
-        entries=journal_entries,
+        entries=_consolidate_entries(journal_entries, f"Purchase receipt: {supplier.name}"),
         auto_post=True,
         source_object=document,
         validate_balances=False,
@@ -515,6 +1303,9 @@ def post_sales_invoice(
     total_receivable = Decimal("0.00")
     total_wht = Decimal("0.00")
     total_vat = Decimal("0.00")
+    lines = _load_line_items(company, lines, "Sales invoice")
+    balances = lock_stock_balances(company, _line_stock_keys(lines, location))
+    costs = lock_item_costs(company, [line["item"] for line in lines])
     for line in lines:
         item = line["item"]
         line_location = line.get("location") or location
@@ -525,12 +1316,10 @@ def post_sales_invoice(
         unit_price = _q_qty(line.get("unit_price") or item.default_sales_price)
         if quantity <= 0 or unit_price < 0:
             raise ValueError("Sales quantity must be positive and price cannot be negative")
-        available = get_stock_on_hand(item, line_location)
-        if not item.allow_negative_stock and available - quantity < 0:
-            raise ValueError("Sale would make stock negative")
-        unit_cost = get_average_unit_cost(item) or item.standard_cost
+        reserve_stock(balances, item, line_location, quantity, "Sale would make stock negative")
+        cogs_amount = issue_stock_cost(costs, item, quantity)
+        unit_cost = _q_qty(cogs_amount / quantity)
         revenue_amount = _q_money(quantity * unit_price)
-        cogs_amount = _q_money(quantity * unit_cost)
         vat_rate = Decimal(line.get("vat_rate", item.default_vat_rate) or 0)
         wht_rate = Decimal(line.get("wht_rate", customer.default_wht_rate) or 0)
         vat_amount = _rate_amount(revenue_amount, vat_rate)
@@ -620,37 +1409,48 @@ def post_sales_invoice(
         document=document,
         customer=customer,
     )
-    for line in prepared_lines:
-        movement = _create_movement(
-            document=document,
-            item=line["item"],
-            location=line["location"],
-            movement_type=StockMovement.MovementType.SALE,
-            quantity=-line["quantity"],
-            unit_cost=line["unit_cost"],
-            movement_date=posting_date,
-            memo=reason,
-        )
-        SalesInvoiceLine.objects.create(
-            invoice=invoice,
-            item=line["item"],
-            location=line["location"],
-            quantity=line["quantity"],
-            unit_price=line["unit_price"],
-            unit_cost=line["unit_cost"],
-            revenue_amount=line["revenue_amount"],
-            cogs_amount=line["cogs_amount"],
-            vat_rate=line["vat_rate"],
-            vat_amount=line["vat_amount"],
-            wht_rate=line["wht_rate"],
-            wht_amount=line["wht_amount"],
-            movement=movement,
-        )
+    movements = _create_movements(
+        document,
+        [
+            {
+                "item": line["item"],
+                "location": line["location"],
+                "movement_type": StockMovement.MovementType.SALE,
+                "quantity": -line["quantity"],
+                "total_cost": -line["cogs_amount"],
+                "movement_date": posting_date,
+                "memo": reason,
+            }
+            for line in prepared_lines
+        ],
+        balances=balances,
+        costs=costs,
+    )
+    SalesInvoiceLine.objects.bulk_create(
+        [
+            SalesInvoiceLine(
+                invoice=invoice,
+                item=line["item"],
+                location=line["location"],
+                quantity=line["quantity"],
+                unit_price=line["unit_price"],
+                unit_cost=line["unit_cost"],
+                revenue_amount=line["revenue_amount"],
+                cogs_amount=line["cogs_amount"],
+                vat_rate=line["vat_rate"],
+                vat_amount=line["vat_amount"],
+                wht_rate=line["wht_rate"],
+                wht_amount=line["wht_amount"],
+                movement=movement,
+            )
+            for line, movement in zip(prepared_lines, movements)
+        ]
+    )
     journal = create_journal_with_entries(
         company=company,
         date=posting_date,
         description=f"Sales invoice: {customer.name}",
-        entries=journal_entries,
+        entries=_consolidate_entries(journal_entries, f"Sales invoice: {customer.name}"),
         auto_post=True,
         source_object=document,
         validate_balances=False,
@@ -904,6 +1704,9 @@ def post_customer_return(
     total_receivable_reduction = Decimal("0.00")
     total_vat = Decimal("0.00")
     total_wht = Decimal("0.00")
+    lines = _load_line_items(company, lines, "Customer return")
+    balances = lock_stock_balances(company, _line_stock_keys(lines, location))
+    costs = lock_item_costs(company, [line["item"] for line in lines])
     for line in lines:
         item = line["item"]
         line_location = line.get("location") or location
@@ -912,7 +1715,7 @@ def post_customer_return(
         _assert_same_company(company, item, line_location)
         quantity = _q_qty(line["quantity"])
         unit_price = _q_qty(line.get("unit_price") or item.default_sales_price)
-        unit_cost = _q_qty(line.get("unit_cost") or get_average_unit_cost(item) or item.standard_cost)
+        unit_cost = _q_qty(line.get("unit_cost") or _fallback_unit_cost(costs[item.id]))
         if quantity <= 0 or unit_price < 0 or unit_cost < 0:
             raise ValueError("Return quantity must be positive and amounts cannot be negative")
         accounts = _sales_accounts(item)
@@ -1006,37 +1809,48 @@ def post_customer_return(
         document=document,
         customer=customer,
     )
-    for line in prepared_lines:
-        movement = _create_movement(
-            document=document,
-            item=line["item"],
-            location=line["location"],
-            movement_type=StockMovement.MovementType.CUSTOMER_RETURN,
-            quantity=line["quantity"],
-            unit_cost=line["unit_cost"],
-            movement_date=posting_date,
-            memo=reason,
-        )
-        CustomerReturnLine.objects.create(
-            customer_return=customer_return,
-            item=line["item"],
-            location=line["location"],
-            quantity=line["quantity"],
-            unit_price=line["unit_price"],
-            unit_cost=line["unit_cost"],
-            revenue_amount=line["revenue_amount"],
-            cogs_amount=line["cogs_amount"],
-            vat_rate=line["vat_rate"],
-            vat_amount=line["vat_amount"],
-            wht_rate=line["wht_rate"],
-            wht_amount=line["wht_amount"],
-            movement=movement,
-        )
+    movements = _create_movements(
+        document,
+        [
+            {
+                "item": line["item"],
+                "location": line["location"],
+                "movement_type": StockMovement.MovementType.CUSTOMER_RETURN,
+                "quantity": line["quantity"],
+                "unit_cost": line["unit_cost"],
+                "movement_date": posting_date,
+                "memo": reason,
+            }
+            for line in prepared_lines
+        ],
+        balances=balances,
+        costs=costs,
+    )
+    CustomerReturnLine.objects.bulk_create(
+        [
+            CustomerReturnLine(
+                customer_return=customer_return,
+                item=line["item"],
+                location=line["location"],
+                quantity=line["quantity"],
+                unit_price=line["unit_price"],
+                unit_cost=line["unit_cost"],
+                revenue_amount=line["revenue_amount"],
+                cogs_amount=line["cogs_amount"],
+                vat_rate=line["vat_rate"],
+                vat_amount=line["vat_amount"],
+                wht_rate=line["wht_rate"],
+                wht_amount=line["wht_amount"],
+                movement=movement,
+            )
+            for line, movement in zip(prepared_lines, movements)
+        ]
+    )
     journal = create_journal_with_entries(
         company=company,
         date=posting_date,
         description=f"Customer return: {customer.name}",
-        entries=entries,
+        entries=_consolidate_entries(entries, f"Customer return: {customer.name}"),
         auto_post=True,
         source_object=document,
         validate_balances=False,
@@ -1068,6 +1882,9 @@ def post_supplier_return(
     total_payable_reduction = Decimal("0.00")
     total_vat = Decimal("0.00")
     total_wht = Decimal("0.00")
+    lines = _load_line_items(company, lines, "Supplier return")
+    balances = lock_stock_balances(company, _line_stock_keys(lines, location))
+    costs = lock_item_costs(company, [line["item"] for line in lines])
     for line in lines:
         item = line["item"]
         line_location = line.get("location") or location
@@ -1078,10 +1895,8 @@ def post_supplier_return(
         unit_cost = _q_qty(line["unit_cost"])
         if quantity <= 0 or unit_cost < 0:
             raise ValueError("Supplier return quantity must be positive and cost cannot be negative")
-        available = get_stock_on_hand(item, line_location)
-        if not item.allow_negative_stock and available - quantity < 0:
-            raise ValueError("Supplier return would make stock negative")
-        total_cost = _q_money(quantity * unit_cost)
+        reserve_stock(balances, item, line_location, quantity, "Supplier return would make stock negative")
+        total_cost = issue_stock_cost(costs, item, quantity, total_cost=_q_money(quantity * unit_cost))
         vat_rate = Decimal(line.get("vat_rate", item.default_vat_rate) or 0)
         wht_rate = Decimal(line.get("wht_rate", supplier.default_wht_rate) or 0)
         vat_amount = _rate_amount(total_cost, vat_rate)
@@ -1154,35 +1969,46 @@ def post_supplier_return(
         document=document,
         supplier=supplier,
     )
-    for line in prepared_lines:
-        movement = _create_movement(
-            document=document,
-            item=line["item"],
-            location=line["location"],
-            movement_type=StockMovement.MovementType.SUPPLIER_RETURN,
-            quantity=-line["quantity"],
-            unit_cost=line["unit_cost"],
-            movement_date=posting_date,
-            memo=reason,
-        )
-        SupplierReturnLine.objects.create(
-            supplier_return=supplier_return,
-            item=line["item"],
-            location=line["location"],
-            quantity=line["quantity"],
-            unit_cost=line["unit_cost"],
-            vat_rate=line["vat_rate"],
-            vat_amount=line["vat_amount"],
-            wht_rate=line["wht_rate"],
-            wht_amount=line["wht_amount"],
-            total_cost=line["total_cost"],
-            movement=movement,
-        )
+    movements = _create_movements(
+        document,
+        [
+            {
+                "item": line["item"],
+                "location": line["location"],
+                "movement_type": StockMovement.MovementType.SUPPLIER_RETURN,
+                "quantity": -line["quantity"],
+                "total_cost": -line["total_cost"],
+                "movement_date": posting_date,
+                "memo": reason,
+            }
+            for line in prepared_lines
+        ],
+        balances=balances,
+        costs=costs,
+    )
+    SupplierReturnLine.objects.bulk_create(
+        [
+            SupplierReturnLine(
+                supplier_return=supplier_return,
+                item=line["item"],
+                location=line["location"],
+                quantity=line["quantity"],
+                unit_cost=line["unit_cost"],
+                vat_rate=line["vat_rate"],
+                vat_amount=line["vat_amount"],
+                wht_rate=line["wht_rate"],
+                wht_amount=line["wht_amount"],
+                total_cost=line["total_cost"],
+                movement=movement,
+            )
+            for line, movement in zip(prepared_lines, movements)
+        ]
+    )
     journal = create_journal_with_entries(
         company=company,
         date=posting_date,
         description=f"Supplier return: {supplier.name}",
-        entries=entries,
+        entries=_consolidate_entries(entries, f"Supplier return: {supplier.name}"),
         auto_post=True,
         source_object=document,
         validate_balances=False,
@@ -1248,45 +2074,121 @@ def receive_purchase_order(
     if not lines:
         raise ValueError("Purchase order receipt requires at least one line")
     _assert_same_company(company, purchase_order, purchase_order.supplier, location)
-    if purchase_order.status == PurchaseOrder.Status.CANCELLED:
-        raise ValueError("Cannot receive a cancelled purchase order")
-
-    receipt_lines = []
-    po_lines_to_update = []
     for line in lines:
-        po_line = line["purchase_order_line"]
-        if po_line.purchase_order_id != purchase_order.id:
+        if line["purchase_order_line"].purchase_order_id != purchase_order.id:
             raise ValueError("Purchase order line does not belong to this purchase order")
+    return receive_purchase_orders(
+        company=company,
+        location=location,
+        lines=lines,
+        posting_date=posting_date,
+        reference=reference,
+        reason=reason,
+    )[0]
+
+
+@transaction.atomic
+def receive_purchase_orders(
+    *,
+    company,
+    lines,
+    location: StockLocation | None = None,
+    posting_date=None,
+    reference="",
+    reason="Purchase order receipt",
+):
+    """
+    Receive lines from many purchase orders at once, such as a delivery manifest.
+
+    ``lines`` are dicts with ``purchase_order_line`` (an instance or id),
+    ``quantity`` and an optional ``location`` overriding ``location``. The
+    order lines are locked with one query and every line is checked before
+    anything posts, with all problems reported together. Each supplier gets
+    one receipt document and journal, then received quantities and order
+    statuses are saved with one bulk update each. Returns the receipt
+    documents in supplier order.
+    """
+    if not lines:
+        raise ValueError("Purchase order receipt requires at least one line")
+    _assert_same_company(company, location)
+    line_ids = [getattr(line["purchase_order_line"], "pk", line["purchase_order_line"]) for line in lines]
+    po_lines = {
+        po_line.pk: po_line
+        for po_line in PurchaseOrderLine.objects.select_for_update(of=("self",))
+        .select_related("item", "purchase_order__supplier__payable_account")
+        .filter(pk__in=set(line_ids), purchase_order__company=company)
+        .order_by("pk")
+    }
+
+    errors = []
+    received = {}
+    receipts = {}
+    for number, (line_id, line) in enumerate(zip(line_ids, lines), start=1):
+        po_line = po_lines.get(line_id)
+        if po_line is None:
+            errors.append((number, "Purchase order line does not exist"))
+            continue
+        purchase_order = po_line.purchase_order
+        if purchase_order.status == PurchaseOrder.Status.CANCELLED:
+            errors.append((number, "Cannot receive a cancelled purchase order"))
+            continue
+        line_location = line.get("location") or location
+        if line_location is None:
+            errors.append((number, "Purchase receipt line requires a stock location"))
+            continue
         quantity = _q_qty(line["quantity"])
         if quantity <= 0:
-            raise ValueError("Received quantity must be positive")
-        if po_line.received_quantity + quantity > po_line.quantity:
-            raise ValueError("Received quantity exceeds purchase order balance")
-        receipt_lines.append(
+            errors.append((number, "Received quantity must be positive"))
+            continue
+        total = received.get(po_line.pk, po_line.received_quantity) + quantity
+        if total > po_line.quantity:
+            errors.append((number, "Received quantity exceeds purchase order balance"))
+            continue
+        received[po_line.pk] = total
+        receipt = receipts.setdefault(
+            purchase_order.supplier_id,
+            {"supplier": purchase_order.supplier, "orders": {}, "lines": []},
+        )
+        receipt["orders"][purchase_order.pk] = purchase_order
+        receipt["lines"].append(
             {
                 "item": po_line.item,
-                "location": line.get("location") or location,
+                "location": line_location,
                 "quantity": quantity,
                 "unit_cost": po_line.unit_cost,
+                "purchase_order_line": po_line,
             }
         )
-        po_lines_to_update.append((po_line, quantity))
-
-    document = post_purchase_receipt(
-        company=company,
-        supplier=purchase_order.supplier,
-        location=location,
-        lines=receipt_lines,
-        purchase_order=purchase_order,
-        posting_date=posting_date,
-        reference=reference,
-        reason=reason,
+    if errors:
+        raise ValueError(_row_errors_message(errors, label="Line"))
+
+    documents = []
+    purchase_orders = []
+    for supplier_id in sorted(receipts):
+        receipt = receipts[supplier_id]
+        orders = list(receipt["orders"].values())
+        purchase_orders.extend(orders)
+        documents.append(
+            post_purchase_receipt(
+                company=company,
+                supplier=receipt["supplier"],
+                location=location,
+                lines=receipt["lines"],
+                purchase_order=orders[0] if len(orders) == 1 else None,
+                posting_date=posting_date,
+                reference=reference,
+                reason=reason,
+            )
+        )
+    now = timezone.now()
+    for pk, quantity in received.items():
+        po_lines[pk].received_quantity = _q_qty(quantity)
+        po_lines[pk].updated_at = now
+    PurchaseOrderLine.objects.bulk_update(
+        [po_lines[pk] for pk in received], ["received_quantity", "updated_at"]
     )
-    for po_line, quantity in po_lines_to_update:
-        po_line.received_quantity = _q_qty(po_line.received_quantity + quantity)
-        po_line.save(update_fields=["received_quantity", "updated_at"])
-    _update_purchase_order_status(purchase_order)
-    return document
+    _update_purchase_order_statuses(purchase_orders)
+    return documents
 
 
 @transaction.atomic
@@ -1306,25 +2208,28 @@ def post_inventory_adjustment(
     if quantity_delta == 0:
         raise ValueError("Adjustment quantity cannot be zero")
     _assert_same_company(company, item, location)
-    available = get_stock_on_hand(item, location)
-    if quantity_delta < 0 and not item.allow_negative_stock and available + quantity_delta < 0:
-        raise ValueError("Adjustment would make stock negative")
+    balances = lock_stock_balances(company, [(item, location)])
+    if quantity_delta < 0:
+        reserve_stock(balances, item, location, -quantity_delta, "Adjustment would make stock negative")
+
+    costs = lock_item_costs(company, [item])
 
     accounts = _posting_accounts(item)
     if quantity_delta > 0:
-        resolved_unit_cost = _q_qty(unit_cost if unit_cost is not None else get_average_unit_cost(item))
+        if unit_cost is None:
+            unit_cost = _fallback_unit_cost(costs[item.id])
         debit_account = accounts["inventory_account"]
         credit_account = accounts["adjustment_gain_account"]
         debit_memo = f"Inventory gain for {item.name}"
         credit_memo = f"Inventory adjustment gain for {item.name}"
     else:
-        resolved_unit_cost = get_average_unit_cost(item)
+        # Shrinkage is costed by the costing engine, not by the caller.
+        unit_cost = None
         debit_account = accounts["shrinkage_expense_account"]
         credit_account = accounts["inventory_account"]
         debit_memo = f"Inventory shrinkage for {item.name}"
         credit_memo = f"Inventory reduction for {item.name}"
 
-    total_cost = _q_money(abs(quantity_delta) * resolved_unit_cost)
     document = InventoryDocument.objects.create(
         company=company,
         document_type=InventoryDocument.DocumentType.ADJUSTMENT,
@@ -1332,16 +2237,23 @@ def post_inventory_adjustment(
         reference=reference,
         reason=reason,
     )
-    _create_movement(
-        document=document,
-        item=item,
-        location=location,
-        movement_type=StockMovement.MovementType.ADJUSTMENT,
-        quantity=quantity_delta,
-        unit_cost=resolved_unit_cost,
-        movement_date=posting_date,
-        memo=reason,
-    )
+    movement = _create_movements(
+        document,
+        [
+            {
+                "item": item,
+                "location": location,
+                "movement_type": StockMovement.MovementType.ADJUSTMENT,
+                "quantity": quantity_delta,
+                "unit_cost": unit_cost,
+                "movement_date": posting_date,
+                "memo": reason,
+            }
+        ],
+        balances=balances,
+        costs=costs,
+    )[0]
+    total_cost = abs(movement.total_cost)
     journal = create_journal_with_entries(
         company=company,
         date=posting_date,
@@ -1388,11 +2300,9 @@ def post_stock_transfer(
     if from_location.pk == to_location.pk:
         raise ValueError("Transfer locations must be different")
     _assert_same_company(company, item, from_location, to_location)
-    available = get_stock_on_hand(item, from_location)
-    if not item.allow_negative_stock and available - quantity < 0:
-        raise ValueError("Transfer would make source stock negative")
+    balances = lock_stock_balances(company, [(item, from_location), (item, to_location)])
+    reserve_stock(balances, item, from_location, quantity, "Transfer would make source stock negative")
 
-    unit_cost = get_average_unit_cost(item)
     document = InventoryDocument.objects.create(
         company=company,
         document_type=InventoryDocument.DocumentType.TRANSFER,
@@ -1400,24 +2310,622 @@ def post_stock_transfer(
         reference=reference,
         reason=reason,
     )
-    _create_movement(
-        document=document,
-        item=item,
-        location=from_location,
-        movement_type=StockMovement.MovementType.TRANSFER_OUT,
-        quantity=-quantity,
-        unit_cost=unit_cost,
-        movement_date=posting_date,
-        memo=reason,
+    _create_movements(
+        document,
+        [
+            {
+                "item": item,
+                "location": from_location,
+                "movement_type": StockMovement.MovementType.TRANSFER_OUT,
+                "quantity": -quantity,
+                "movement_date": posting_date,
+                "memo": reason,
+            },
+            {
+                "item": item,
+                "location": to_location,
+                "movement_type": StockMovement.MovementType.TRANSFER_IN,
+                "quantity": quantity,
+                "movement_date": posting_date,
+                "memo": reason,
+            },
+        ],
+        balances=balances,
     )
-    _create_movement(
-        document=document,
-        item=item,
-        location=to_location,
-        movement_type=StockMovement.MovementType.TRANSFER_IN,
-        quantity=quantity,
-        unit_cost=unit_cost,
-        movement_date=posting_date,
-        memo=reason,
+    return document
+
+
+@transaction.atomic
+def post_stock_count(
+    *,
+    company,
+    stock_count: StockCount,
+    posting_date=None,
+    reference="",
+    reason="",
+):
+    """
+    Post the differences between a stock count and the system quantities.
+
+    Every line is compared with the locked stock balance at the count location
+    in one pass. Differences become adjustment movements on a single stock
+    count document with one consolidated journal. Lines keep the system
+    quantity they were compared with, and the count is marked posted.
+    """
+    _assert_same_company(company, stock_count)
+    stock_count = (
+        StockCount.objects.select_for_update()
+        .select_related("location")
+        .get(pk=stock_count.pk)
+    )
+    if stock_count.status == StockCount.Status.POSTED:
+        raise ValueError("Stock count has already been posted")
+    location = stock_count.location
+    posting_date = posting_date or stock_count.count_date
+    reason = reason or stock_count.reason or "Stock count"
+    count_lines = list(
+        stock_count.lines.select_related(
+            "item__category__inventory_account",
+            "item__category__opening_balance_equity_account",
+            "item__category__adjustment_gain_account",
+            "item__category__shrinkage_expense_account",
+        )
     )
+    if not count_lines:
+        raise ValueError("Stock count requires at least one line")
+    for line in count_lines:
+        _assert_same_company(company, line.item)
+        if line.counted_quantity < 0:
+            raise ValueError(f"Counted quantity for {line.item.sku} cannot be negative")
+
+    balances = lock_stock_balances(company, [(line.item, location) for line in count_lines])
+    costs = lock_item_costs(company, [line.item for line in count_lines])
+    movements = []
+    for line in count_lines:
+        item = line.item
+        line.system_quantity = balances[(item.id, location.id)].quantity
+        quantity_delta = _q_qty(line.counted_quantity - line.system_quantity)
+        if quantity_delta == 0:
+            continue
+        movements.append(
+            {
+                "item": item,
+                "location": location,
+                "movement_type": StockMovement.MovementType.ADJUSTMENT,
+                "quantity": quantity_delta,
+                # Count gains come in at the running cost; shrinkage is costed
+                # by the costing engine.
+                "unit_cost": _fallback_unit_cost(costs[item.id]) if quantity_delta > 0 else None,
+                "movement_date": posting_date,
+                "memo": reason,
+            }
+        )
+
+    document = InventoryDocument.objects.create(
+        company=company,
+        document_type=InventoryDocument.DocumentType.STOCK_COUNT,
+        document_date=posting_date,
+        reference=reference,
+        reason=reason,
+    )
+    entries = []
+    if movements:
+        for movement in _create_movements(document, movements, balances=balances, costs=costs):
+            amount = abs(movement.total_cost)
+            if not amount:
+                continue
+            accounts = _posting_accounts(movement.item)
+            if movement.quantity > 0:
+                debit_account = accounts["inventory_account"]
+                credit_account = accounts["adjustment_gain_account"]
+                memo = f"Stock count gain for {movement.item.name}"
+            else:
+                debit_account = accounts["shrinkage_expense_account"]
+                credit_account = accounts["inventory_account"]
+                memo = f"Stock count shrinkage for {movement.item.name}"
+            entries.extend(
+                [
+                    {"account": debit_account, "entry_type": "DEBIT", "amount": amount, "memo": memo},
+                    {"account": credit_account, "entry_type": "CREDIT", "amount": amount, "memo": memo},
+                ]
+            )
+    if entries:
+        description = f"Stock count: {location.code}"
+        document.journal = create_journal_with_entries(
+            company=company,
+            date=posting_date,
+            description=description,
+            entries=_consolidate_entries(entries, description),
+            auto_post=True,
+            source_object=document,
+            validate_balances=False,
+        )
+        document.save(update_fields=["journal", "updated_at"])
+
+    now = timezone.now()
+    for line in count_lines:
+        line.updated_at = now
+    StockCountLine.objects.bulk_update(count_lines, ["system_quantity", "updated_at"], batch_size=1000)
+    stock_count.status = StockCount.Status.POSTED
+    stock_count.document = document
+    stock_count.save(update_fields=["status", "document", "updated_at"])
+    return document
+
+
+STOCK_COUNT_CSV_COLUMNS = ("sku", "counted_quantity")
+ITEM_IMPORT_COLUMNS = ("sku", "name", "category")
+SUPPLIER_IMPORT_COLUMNS = ("name",)
+CUSTOMER_IMPORT_COLUMNS = ("name",)
+OPENING_STOCK_IMPORT_COLUMNS = ("sku", "location", "quantity", "unit_cost")
+MAX_REPORTED_ROW_ERRORS = 20
+IMPORT_BATCH_SIZE = 1000
+# Opening stock lines costed and written per ``_create_movements`` call.
+OPENING_STOCK_POSTING_BATCH = 500
+
+
+def _row_errors_message(errors, label="Row"):
+    """Format ``(row_number, message)`` pairs for a ``ValueError``, first rows first."""
+    errors = [f"{label} {row}: {message}" for row, message in sorted(errors, key=lambda error: error[0])]
+    message = "\n".join(errors[:MAX_REPORTED_ROW_ERRORS])
+    if len(errors) > MAX_REPORTED_ROW_ERRORS:
+        message += f"\n...and {len(errors) - MAX_REPORTED_ROW_ERRORS} more"
+    return message
+
+
+def _import_rows(upload, required_columns, label):
+    columns, rows = read_rows(upload)
+    missing = [column for column in required_columns if column not in columns]
+    if missing:
+        raise ValueError(f"{label} is missing columns: {', '.join(missing)}")
+    return rows
+
+
+def _batches(values, size=IMPORT_BATCH_SIZE):
+    values = list(values)
+    for start in range(0, len(values), size):
+        yield values[start : start + size]
+
+
+def _existing_values(queryset, field, values):
+    """Return which of ``values`` already exist in ``field``, in batched queries."""
+    existing = set()
+    for batch in _batches(values):
+        existing.update(queryset.filter(**{f"{field}__in": batch}).values_list(field, flat=True))
+    return existing
+
+
+def _import_decimal(value, default=None):
+    """Parse a spreadsheet number; blank cells give ``default``."""
+    value = (value or "").replace(",", "")
+    if not value:
+        if default is None:
+            raise InvalidOperation("blank")
+        return default
+    number = Decimal(value)
+    if not number.is_finite():
+        raise InvalidOperation("not finite")
+    return number
+
+
+@transaction.atomic
+def import_stock_count_csv(*, company, location, csv_file, count_date=None, reason=""):
+    """
+    Create a draft stock count from a CSV or XLSX with ``sku`` and ``counted_quantity``.
+
+    SKUs are resolved in one query and the lines are bulk-created. Every bad
+    row is reported in the ``ValueError`` message rather than only the first.
+    """
+    _assert_same_company(company, location)
+    rows = _import_rows(csv_file, STOCK_COUNT_CSV_COLUMNS, "Stock count CSV")
+
+    errors = []
+    counts = {}
+    row_numbers = {}
+    for row_number, row in rows:
+        sku = row["sku"]
+        if not sku:
+            errors.append((row_number, "SKU is required"))
+            continue
+        if sku in counts:
+            errors.append((row_number, f"SKU {sku} is listed more than once"))
+            continue
+        try:
+            quantity = _q_qty(_import_decimal(row["counted_quantity"]))
+        except InvalidOperation:
+            errors.append((row_number, f"counted quantity for {sku} is not a number"))
+            continue
+        if quantity < 0:
+            errors.append((row_number, f"counted quantity for {sku} cannot be negative"))
+            continue
+        counts[sku] = quantity
+        row_numbers[sku] = row_number
+    if not counts and not errors:
+        raise ValueError("Stock count CSV has no rows")
+
+    items = {}
+    for batch in _batches(counts):
+        items.update(
+            (item.sku, item) for item in InventoryItem.objects.filter(company=company, sku__in=batch)
+        )
+    for sku, row_number in row_numbers.items():
+        if sku not in items:
+            errors.append((row_number, f"unknown SKU {sku}"))
+    if errors:
+        raise ValueError(_row_errors_message(errors))
+
+    stock_count = StockCount.objects.create(
+        company=company,
+        location=location,
+        count_date=count_date or timezone.now().date(),
+        reason=reason,
+    )
+    StockCountLine.objects.bulk_create(
+        [
+            StockCountLine(stock_count=stock_count, item=items[sku], counted_quantity=quantity)
+            for sku, quantity in counts.items()
+        ],
+        batch_size=IMPORT_BATCH_SIZE,
+    )
+    return stock_count
+
+
+@transaction.atomic
+def import_inventory_items(*, company, upload):
+    """
+    Create inventory items from a CSV or XLSX file.
+
+    Required columns are ``sku``, ``name`` and ``category`` (the category
+    name). Optional columns are ``item_type``, ``unit`` (abbreviation or
+    name), ``barcode``, ``reorder_point``, ``standard_cost``,
+    ``default_sales_price``, ``default_vat_rate`` and ``default_wht_rate``.
+    Every row is validated before anything is written; if any row is bad the
+    ``ValueError`` lists them all and nothing is created. Returns the created
+    items.
+    """
+    rows = _import_rows(upload, ITEM_IMPORT_COLUMNS, "Item file")
+    categories = {
+        category.name.lower(): category
+        for category in InventoryCategory.objects.filter(company=company)
+    }
+    units = {}
+    for unit in UnitOfMeasure.objects.filter(company=company):
+        units[unit.name.lower()] = unit
+        units[unit.abbreviation.lower()] = unit
+    item_types = {}
+    for value, label in InventoryItem.ItemType.choices:
+        item_types[value.lower()] = value
+        item_types[label.lower()] = value
+    decimal_columns = (
+        "reorder_point",
+        "standard_cost",
+        "default_sales_price",
+        "default_vat_rate",
+        "default_wht_rate",
+    )
+
+    errors = []
+    items = []
+    row_numbers = {}
+    for row_number, row in rows:
+        sku = row["sku"]
+        if not sku or not row["name"]:
+            errors.append((row_number, "SKU and name are required"))
+            continue
+        if len(sku) > 80 or len(row["name"]) > 160:
+            errors.append((row_number, f"SKU or name for {sku} is too long"))
+            continue
+        if sku in row_numbers:
+            errors.append((row_number, f"SKU {sku} is listed more than once"))
+            continue
+        row_numbers[sku] = row_number
+        category = categories.get(row["category"].lower())
+        if category is None:
+            errors.append((row_number, f"unknown category {row['category'] or '(blank)'}"))
+            continue
+        unit = None
+        if row.get("unit"):
+            unit = units.get(row["unit"].lower())
+            if unit is None:
+                errors.append((row_number, f"unknown unit {row['unit']}"))
+                continue
+        item_type = InventoryItem.ItemType.STOCK
+        if row.get("item_type"):
+            item_type = item_types.get(row["item_type"].lower())
+            if item_type is None:
+                errors.append((row_number, f"unknown item type {row['item_type']}"))
+                continue
+        values = {}
+        for column in decimal_columns:
+            try:
+                values[column] = _q_qty(_import_decimal(row.get(column), Decimal("0")))
+            except InvalidOperation:
+                errors.append((row_number, f"{column.replace('_', ' ')} for {sku} is not a number"))
+                break
+            if values[column] < 0:
+                errors.append((row_number, f"{column.replace('_', ' ')} for {sku} cannot be negative"))
+                break
+        else:
+            items.append(
+                InventoryItem(
+                    company=company,
+                    category=category,
+                    sku=sku,
+                    name=row["name"],
+                    item_type=item_type,
+                    base_unit=unit,
+                    barcode=row.get("barcode", "")[:120],
+                    **values,
+                )
+            )
+    if not row_numbers and not errors:
+        raise ValueError("Item file has no rows")
+
+    existing = _existing_values(InventoryItem.objects.filter(company=company), "sku", row_numbers)
+    for sku in existing:
+        errors.append((row_numbers[sku], f"SKU {sku} already exists"))
+    if errors:
+        raise ValueError(_row_errors_message(errors))
+    created = InventoryItem.objects.bulk_create(items, batch_size=IMPORT_BATCH_SIZE)
+    invalidate_low_stock_cache(company.pk)
+    return created
+
+
+def _import_parties(
+    model, *, company, upload, columns, account_field, account_type, default_account, label
+):
+    """
+    Shared validation and bulk insert for supplier and customer imports.
+
+    ``account_field`` is the control account column, matched by account
+    number and falling back to ``default_account`` when blank;
+    ``wht_<account_field>`` is the optional withholding-tax account.
+    """
+    if default_account is not None:
+        _assert_same_company(company, default_account)
+    rows = _import_rows(upload, columns, f"{label} file")
+    accounts = {
+        account.account_number: account
+        for account in Account.objects.filter(company=company, type=account_type)
+    }
+    wht_field = f"wht_{account_field}"
+    column_label = account_field.replace("_", " ")
+
+    errors = []
+    parties = []
+    row_numbers = {}
+    for row_number, row in rows:
+        name = row["name"]
+        if not name:
+            errors.append((row_number, "name is required"))
+            continue
+        if len(name) > 160:
+            errors.append((row_number, f"name {name[:40]}... is too long"))
+            continue
+        if name in row_numbers:
+            errors.append((row_number, f"{name} is listed more than once"))
+            continue
+        row_numbers[name] = row_number
+        account = default_account
+        if row.get(account_field):
+            account = accounts.get(row[account_field])
+            if account is None:
+                errors.append((row_number, f"unknown {column_label} {row[account_field]}"))
+                continue
+        if account is None:
+            errors.append((row_number, f"{column_label} is required for {name}"))
+            continue
+        wht_account = None
+        if row.get(wht_field):
+            wht_account = accounts.get(row[wht_field])
+            if wht_account is None:
+                errors.append((row_number, f"unknown WHT account {row[wht_field]}"))
+                continue
+        email = row.get("email", "")
+        if email:
+            try:
+                validate_email(email)
+            except ValidationError:
+                errors.append((row_number, f"invalid email {email}"))
+                continue
+        try:
+            wht_rate = _import_decimal(row.get("default_wht_rate"), Decimal("0"))
+        except InvalidOperation:
+            errors.append((row_number, f"WHT rate for {name} is not a number"))
+            continue
+        if not Decimal("0") <= wht_rate <= Decimal("100"):
+            errors.append((row_number, f"WHT rate for {name} must be between 0 and 100"))
+            continue
+        parties.append(
+            model(
+                company=company,
+                name=name,
+                contact_name=row.get("contact_name", "")[:120],
+                email=email,
+                phone=row.get("phone", "")[:40],
+                default_wht_rate=wht_rate,
+                **{account_field: account, wht_field: wht_account},
+            )
+        )
+    if not row_numbers and not errors:
+        raise ValueError(f"{label} file has no rows")
+
+    existing = _existing_values(model.objects.filter(company=company), "name", row_numbers)
+    for name in existing:
+        errors.append((row_numbers[name], f"{name} already exists"))
+    if errors:
+        raise ValueError(_row_errors_message(errors))
+    return model.objects.bulk_create(parties, batch_size=IMPORT_BATCH_SIZE)
+
+
+@transaction.atomic
+def import_suppliers(*, company, upload, payable_account=None):
+    """
+    Create suppliers from a CSV or XLSX file.
+
+    Required column: ``name``. Optional columns are ``contact_name``,
+    ``email``, ``phone``, ``payable_account`` and ``wht_payable_account``
+    (liability account numbers) and ``default_wht_rate``. Rows without a
+    payable account use ``payable_account``. Returns the created suppliers.
+    """
+    return _import_parties(
+        Supplier,
+        company=company,
+        upload=upload,
+        columns=SUPPLIER_IMPORT_COLUMNS,
+        account_field="payable_account",
+        account_type=Account.AccountType.LIABILITY,
+        default_account=payable_account,
+        label="Supplier",
+    )
+
+
+@transaction.atomic
+def import_customers(*, company, upload, receivable_account=None):
+    """
+    Create customers from a CSV or XLSX file.
+
+    Same layout as ``import_suppliers`` with ``receivable_account`` and
+    ``wht_receivable_account`` (asset account numbers). Returns the created
+    customers.
+    """
+    return _import_parties(
+        Customer,
+        company=company,
+        upload=upload,
+        columns=CUSTOMER_IMPORT_COLUMNS,
+        account_field="receivable_account",
+        account_type=Account.AccountType.ASSET,
+        default_account=receivable_account,
+        label="Customer",
+    )
+
+
+@transaction.atomic
+def import_opening_stock(*, company, upload, posting_date=None, reference="", reason="Opening stock"):
+    """
+    Post opening stock for many items from a CSV or XLSX file.
+
+    Columns are ``sku``, ``location`` (location code), ``quantity`` and
+    ``unit_cost``, with an optional ``warehouse`` code for location codes used
+    in more than one warehouse. All rows are validated first, then posted as
+    one OPENING_STOCK document whose journal has one debit and one credit per
+    posting account. Returns the document.
+    """
+    posting_date = posting_date or timezone.now().date()
+    rows = _import_rows(upload, OPENING_STOCK_IMPORT_COLUMNS, "Opening stock file")
+    locations = {}
+    for location in StockLocation.objects.filter(company=company).select_related("warehouse"):
+        locations.setdefault(location.code.lower(), []).append(location)
+        locations[(location.warehouse.code.lower(), location.code.lower())] = [location]
+
+    errors = []
+    pending = []
+    for row_number, row in rows:
+        sku = row["sku"]
+        if not sku:
+            errors.append((row_number, "SKU is required"))
+            continue
+        key = row["location"].lower()
+        if row.get("warehouse"):
+            key = (row["warehouse"].lower(), key)
+        matches = locations.get(key, [])
+        if len(matches) != 1:
+            problem = "is in more than one warehouse" if matches else "is unknown"
+            errors.append((row_number, f"location {row['location'] or '(blank)'} {problem}"))
+            continue
+        try:
+            quantity = _q_qty(_import_decimal(row["quantity"]))
+            unit_cost = _q_qty(_import_decimal(row["unit_cost"]))
+        except InvalidOperation:
+            errors.append((row_number, f"quantity or unit cost for {sku} is not a number"))
+            continue
+        if quantity <= 0 or unit_cost < 0:
+            errors.append(
+                (row_number, f"quantity for {sku} must be positive and cost cannot be negative")
+            )
+            continue
+        pending.append((row_number, sku, matches[0], quantity, unit_cost))
+    if not pending and not errors:
+        raise ValueError("Opening stock file has no rows")
+
+    items = {}
+    loader = InventoryItem.objects.filter(company=company).select_related(
+        "category__inventory_account",
+        "category__opening_balance_equity_account",
+        "category__adjustment_gain_account",
+        "category__shrinkage_expense_account",
+    )
+    for batch in _batches({sku for _, sku, *_ in pending}):
+        items.update((item.sku, item) for item in loader.filter(sku__in=batch))
+    movements = []
+    entries = []
+    for row_number, sku, location, quantity, unit_cost in pending:
+        item = items.get(sku)
+        if item is None:
+            errors.append((row_number, f"unknown SKU {sku}"))
+            continue
+        try:
+            accounts = _posting_accounts(item)
+        except ValueError as exc:
+            errors.append((row_number, f"{sku}: {exc}"))
+            continue
+        total_cost = _q_money(quantity * unit_cost)
+        movements.append(
+            {
+                "item": item,
+                "location": location,
+                "movement_type": StockMovement.MovementType.OPENING,
+                "quantity": quantity,
+                "unit_cost": unit_cost,
+                "movement_date": posting_date,
+                "memo": reason,
+            }
+        )
+        entries.append(
+            {
+                "account": accounts["inventory_account"],
+                "entry_type": "DEBIT",
+                "amount": total_cost,
+                "memo": f"Opening stock for {item.name}",
+            }
+        )
+        entries.append(
+            {
+                "account": accounts["opening_balance_equity_account"],
+                "entry_type": "CREDIT",
+                "amount": total_cost,
+                "memo": f"Opening stock offset for {item.name}",
+            }
+        )
+    if errors:
+        raise ValueError(_row_errors_message(errors))
+
+    document = InventoryDocument.objects.create(
+        company=company,
+        document_type=InventoryDocument.DocumentType.OPENING_STOCK,
+        document_date=posting_date,
+        reference=reference,
+        reason=reason,
+    )
+    # Every balance, then every cost, before the first batch, so the import
+    # takes its locks in the same order as a single posting.
+    balances = lock_stock_balances(
+        company, [(spec["item"], spec["location"]) for spec in movements]
+    )
+    costs = lock_item_costs(company, [spec["item"] for spec in movements])
+    for batch in _batches(movements, OPENING_STOCK_POSTING_BATCH):
+        _create_movements(document, batch, balances=balances, costs=costs)
+    description = f"Opening stock import: {len(movements)} lines"
+    entries = [entry for entry in _consolidate_entries(entries, description) if entry["amount"]]
+    if entries:
+        document.journal = create_journal_with_entries(
+            company=company,
+            date=posting_date,
+            description=description,
+            entries=entries,
+            auto_post=True,
+            source_object=document,
+            validate_balances=False,
+        )
+        document.save(update_fields=["journal", "updated_at"])
     return document
@@ -0,0 +1,112 @@
+"""
+Celery tasks for inventory reporting and stock alerts.
+"""
+
+import logging
+from datetime import date, timedelta
+
+from celery import shared_task
+from django.db.models import Q
+from django.urls import reverse
+from django.utils import timezone
+
+from company.models import Company
+from inventory.services import (
+    claim_low_stock_alerts,
+    refresh_low_stock_cache,
+    snapshot_inventory_valuation,
+)
+from payroll.models import EmployeeProfile
+from payroll.services.notification_service import NotificationService
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(name="inventory.snapshot_month_end_valuations")
+def snapshot_month_end_valuations_task(as_of_date=None):
+    """
+    Snapshot every company's inventory valuation as of the last month-end.
+
+    ``as_of_date`` (ISO date) overrides the default of the day before the
+    first of the current month.
+    """
+    if as_of_date:
+        as_of_date = date.fromisoformat(as_of_date)
+    else:
+        as_of_date = timezone.localdate().replace(day=1) - timedelta(days=1)
+
+    written = {}
+    companies = Company.objects.filter(stock_movements__isnull=False).distinct()
+    for company in companies:
+        written[company.pk] = snapshot_inventory_valuation(company, as_of_date)
+    logger.info(
+        "Inventory valuation snapshots for %s: %s companies, %s positions",
+        as_of_date,
+        len(written),
+        sum(written.values()),
+    )
+    return {"as_of_date": as_of_date.isoformat(), "companies": written}
+
+
+LOW_STOCK_SKUS_IN_MESSAGE = 10
+
+
+def _reorder_alert_recipients(company):
+    """Active employees of ``company`` who can raise purchase orders."""
+    can_order = Q(
+        user__user_permissions__codename="add_purchaseorder",
+        user__user_permissions__content_type__app_label="inventory",
+    ) | Q(
+        user__groups__permissions__codename="add_purchaseorder",
+        user__groups__permissions__content_type__app_label="inventory",
+    )
+    return list(
+        EmployeeProfile.objects.filter(company=company, user__is_active=True)
+        .filter(can_order)
+        .distinct()
+    )
+
+
+@shared_task(name="inventory.check_reorder_points")
+def check_reorder_points_task():
+    """
+    Refresh every company's cached low-stock list and alert buyers.
+
+    Each item is reported once when it first drops to its reorder point, in a
+    single notification per buyer listing all newly low items.
+    """
+    service = NotificationService()
+    summary = {}
+    companies = Company.objects.filter(
+        inventory_items__is_active=True, inventory_items__reorder_point__gt=0
+    ).distinct()
+    for company in companies:
+        low_stock = refresh_low_stock_cache(company)
+        newly_low = claim_low_stock_alerts(company, low_stock)
+        notified = 0
+        recipients = _reorder_alert_recipients(company) if newly_low else []
+        if recipients:
+            skus = ", ".join(row["sku"] for row in newly_low[:LOW_STOCK_SKUS_IN_MESSAGE])
+            if len(newly_low) > LOW_STOCK_SKUS_IN_MESSAGE:
+                skus += f" and {len(newly_low) - LOW_STOCK_SKUS_IN_MESSAGE} more"
+            notifications = service.send_bulk_notification(
+                recipients,
+                notification_type="LOW_STOCK",
+                title=f"{len(newly_low)} item(s) at or below reorder point",
+                message=f"Reorder needed for {skus}.",
+                priority="HIGH",
+                action_url=reverse("inventory:dashboard"),
+                action_label="View inventory",
+                metadata={
+                    "company_id": company.pk,
+                    "item_ids": [row["pk"] for row in newly_low],
+                },
+            )
+            notified = len(notifications)
+        summary[company.pk] = {
+            "low_stock": len(low_stock),
+            "newly_low": len(newly_low),
+            "notified": notified,
+        }
+    logger.info("Reorder point check: %s", summary)
+    return summary
@@ -1,34 +1,67 @@
 from datetime import date
 from decimal import Decimal
+from io import BytesIO, StringIO
+from unittest.mock import Mock, patch
 
-from django.db import IntegrityError
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Permission
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import IntegrityError, connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 
+from accounting.exports import stream_xlsx
 from accounting.models import Account, Journal
 from company.models import Company
 from inventory.models import (
     Customer,
     InventoryCategory,
     InventoryItem,
+    InventoryValuationLayer,
+    ItemCost,
     PurchaseOrder,
+    StockBalance,
+    StockCount,
     StockMovement,
+    StockValuationSnapshot,
     Supplier,
 )
+from inventory import services
+from inventory.pagination import keyset_page
 from inventory.services import (
     create_purchase_order,
+    filter_stock_movements,
+    get_average_unit_cost,
+    get_cached_low_stock_items,
+    get_inventory_value,
+    get_low_stock_items,
     get_stock_on_hand,
+    import_inventory_items,
+    import_opening_stock,
+    import_stock_count_csv,
+    import_suppliers,
+    inventory_valuation,
+    lock_stock_balances,
     post_inventory_adjustment,
     post_opening_stock,
     post_purchase_receipt,
     post_customer_payment,
     post_customer_return,
     post_sales_invoice,
+    post_stock_count,
     post_supplier_payment,
     post_supplier_return,
     post_tax_remittance,
     receive_purchase_order,
+    receive_purchase_orders,
+    recompute_item_costs,
     post_stock_transfer,
+    snapshot_inventory_valuation,
+    verify_stock_balances,
 )
+from inventory.tasks import check_reorder_points_task
+from payroll.models import Notification
 
 
 class InventoryCoreTests(TestCase):
@@ -186,6 +219,48 @@ class InventoryCoreTests(TestCase):
             Decimal("250.00"),
         )
 
+    def test_stock_movements_page_by_keyset_cursor(self):
+        postings = [(2, self.main_location), (1, self.branch_location)] * 3
+        for day, location in postings + [(1, self.main_location)] * 2:
+            post_opening_stock(
+                company=self.company_a,
+                item=self.item,
+                location=location,
+                quantity=Decimal("1"),
+                unit_cost=Decimal("5.00"),
+                posting_date=date(2026, 5, day),
+            )
+        movements = filter_stock_movements(self.company_a, location=self.main_location.pk)
+        expected = list(movements.order_by("movement_date", "id").values_list("id", flat=True))
+        self.assertEqual(len(expected), 5)
+
+        seen, cursor, pages = [], None, []
+        while True:
+            with self.assertNumQueries(1):
+                rows, cursor, previous = keyset_page(
+                    movements, ("movement_date", "id"), cursor=cursor, page_size=2
+                )
+            seen.extend(row.id for row in rows)
+            pages.append((rows, previous))
+            if cursor is None:
+                break
+        self.assertEqual(seen, expected)
+        self.assertEqual(len(pages), 3)
+        self.assertIsNone(pages[0][1])
+
+        rows, _, _ = keyset_page(movements, ("movement_date", "id"), cursor=pages[-1][1], page_size=2)
+        self.assertEqual([row.id for row in rows], expected[2:4])
+
+        newest_first, _, _ = keyset_page(
+            filter_stock_movements(self.company_a, start_date=date(2026, 5, 2)),
+            ("-movement_date", "-id"),
+            page_size=10,
+        )
+        self.assertEqual(len(newest_first), 3)
+        self.assertEqual([row.id for row in newest_first], sorted((row.id for row in newest_first), reverse=True))
+        with self.assertRaisesMessage(ValueError, "Invalid cursor"):
+            keyset_page(movements, ("movement_date", "id"), cursor="not-a-cursor")
+
     def test_negative_adjustment_cannot_exceed_available_stock(self):
         post_opening_stock(
             company=self.company_a,
@@ -385,6 +460,92 @@ class InventoryCoreTests(TestCase):
         self.assertEqual(purchase_order.lines.get().received_quantity, Decimal("10.0000"))
         self.assertEqual(get_stock_on_hand(self.item, self.main_location), Decimal("10.0000"))
 
+    def test_receive_purchase_orders_posts_one_receipt_per_supplier(self):
+        suppliers = [
+            Supplier.objects.create(
+                company=self.company_a,
+                name=f"Manifest Supplier {index}",
+                payable_account=self.accounts["payable"],
+            )
+            for index in range(2)
+        ]
+
+        def order(supplier, reference):
+            return create_purchase_order(
+                company=self.company_a,
+                supplier=supplier,
+                lines=[{"item": self.item, "quantity": Decimal("10"), "unit_cost": Decimal("2.00")}],
+                order_date=date(2026, 5, 3),
+                reference=reference,
+            )
+
+        orders = [order(suppliers[0], "PO-M1"), order(suppliers[0], "PO-M2"), order(suppliers[1], "PO-M3")]
+        po_lines = [purchase_order.lines.get() for purchase_order in orders]
+
+        with self.assertRaisesMessage(
+            ValueError,
+            "Line 2: Received quantity must be positive\n"
+            "Line 3: Received quantity exceeds purchase order balance",
+        ):
+            receive_purchase_orders(
+                company=self.company_a,
+                location=self.main_location,
+                lines=[
+                    {"purchase_order_line": po_lines[0], "quantity": Decimal("6")},
+                    {"purchase_order_line": po_lines[1], "quantity": Decimal("0")},
+                    {"purchase_order_line": po_lines[0], "quantity": Decimal("5")},
+                ],
+            )
+
+        with CaptureQueriesContext(connection) as queries:
+            documents = receive_purchase_orders(
+                company=self.company_a,
+                location=self.main_location,
+                lines=[
+                    {"purchase_order_line": po_lines[0].pk, "quantity": Decimal("10")},
+                    {"purchase_order_line": po_lines[1].pk, "quantity": Decimal("4")},
+                    {
+                        "purchase_order_line": po_lines[2].pk,
+                        "quantity": Decimal("10"),
+                        "location": self.branch_location,
+                    },
+                ],
+                posting_date=date(2026, 5, 4),
+                reference="MANIFEST-1",
+            )
+        receive_queries = len(queries)
+
+        self.assertEqual([document.purchase_receipt.supplier for document in documents], suppliers)
+        self.assertIsNone(documents[0].purchase_receipt.purchase_order)
+        self.assertEqual(documents[1].purchase_receipt.purchase_order, orders[2])
+        self.assertEqual(Journal.objects.filter(company=self.company_a).count(), 2)
+        self.assertEqual(
+            list(
+                PurchaseOrder.objects.filter(pk__in=[o.pk for o in orders])
+                .order_by("reference")
+                .values_list("status", flat=True)
+            ),
+            [
+                PurchaseOrder.Status.RECEIVED,
+                PurchaseOrder.Status.PARTIALLY_RECEIVED,
+                PurchaseOrder.Status.RECEIVED,
+            ],
+        )
+        self.assertEqual(po_lines[2].receipt_lines.get().location, self.branch_location)
+        self.assertEqual(get_stock_on_hand(self.item, self.main_location), Decimal("14.0000"))
+
+        more = [order(suppliers[index % 2], f"PO-N{index}") for index in range(6)]
+        with CaptureQueriesContext(connection) as queries:
+            receive_purchase_orders(
+                company=self.company_a,
+                location=self.main_location,
+                lines=[
+                    {"purchase_order_line": purchase_order.lines.get().pk, "quantity": Decimal("1")}
+                    for purchase_order in more
+                ],
+            )
+        self.assertLessEqual(len(queries), receive_queries)
+
     def test_sales_invoice_posts_revenue_tax_cogs_and_reduces_stock(self):
         self.category.sales_revenue_account = self.accounts["sales"]
         self.category.cogs_account = self.accounts["cogs"]
@@ -619,3 +780,619 @@ class InventoryCoreTests(TestCase):
         self.assertEqual(entries.get(account=self.accounts["vat_input"]).amount, Decimal("7.50"))
         self.assertEqual(entries.get(account=self.accounts["wht_payable"]).entry_type, "DEBIT")
         self.assertEqual(entries.get(account=self.accounts["wht_payable"]).amount, Decimal("5.00"))
+
+    def test_stock_balance_tracks_movements_per_location(self):
+        post_opening_stock(
+            company=self.company_a,
+            item=self.item,
+            location=self.main_location,
+            quantity=Decimal("10"),
+            unit_cost=Decimal("15.00"),
+        )
+        post_stock_transfer(
+            company=self.company_a,
+            item=self.item,
+            from_location=self.main_location,
+            to_location=self.branch_location,
+            quantity=Decimal("4"),
+        )
+
+        balances = {
+            balance.location_id: (balance.quantity, balance.value)
+            for balance in StockBalance.objects.filter(item=self.item)
+        }
+        self.assertEqual(
+            balances,
+            {
+                self.main_location.id: (Decimal("6.0000"), Decimal("90.00")),
+                self.branch_location.id: (Decimal("4.0000"), Decimal("60.00")),
+            },
+        )
+        self.assertEqual(get_inventory_value(self.item), Decimal("150.00"))
+        with self.assertNumQueries(1):
+            self.assertEqual(
+                get_stock_on_hand(self.item, self.branch_location), Decimal("4.0000")
+            )
+        self.assertEqual(verify_stock_balances(self.company_a), [])
+
+    def test_rebuild_repairs_drifted_stock_balances(self):
+        post_opening_stock(
+            company=self.company_a,
+            item=self.item,
+            location=self.main_location,
+            quantity=Decimal("10"),
+            unit_cost=Decimal("15.00"),
+        )
+        StockBalance.objects.filter(item=self.item).update(quantity=Decimal("3"))
+
+        mismatches = verify_stock_balances(self.company_a)
+        self.assertEqual(len(mismatches), 1)
+        self.assertEqual(mismatches[0]["expected_quantity"], Decimal("10.0000"))
+
+        call_command(
+            "rebuild_stock_balances",
+            "--company-id",
+            self.company_a.id,
+            stdout=StringIO(),
+        )
+
+        self.assertEqual(verify_stock_balances(self.company_a), [])
+        self.assertEqual(get_stock_on_hand(self.item), Decimal("10.0000"))
+
+    def test_low_stock_items_use_balance_totals(self):
+        self.item.reorder_point = Decimal("5")
+        self.item.save(update_fields=["reorder_point"])
+        stocked = InventoryItem.objects.create(
+            company=self.company_a,
+            category=self.category,
+            sku="MED-002",
+            name="Ibuprofen Carton",
+            reorder_point=Decimal("5"),
+        )
+        post_opening_stock(
+            company=self.company_a,
+            item=self.item,
+            location=self.main_location,
+            quantity=Decimal("3"),
+            unit_cost=Decimal("10.00"),
+        )
+        post_opening_stock(
+            company=self.company_a,
+            item=stocked,
+            location=self.main_location,
+            quantity=Decimal("8"),
+            unit_cost=Decimal("10.00"),
+        )
+
+        with self.assertNumQueries(1):
+            low_stock = list(get_low_stock_items(self.company_a))
+
+        self.assertEqual(low_stock, [self.item])
+        self.assertEqual(low_stock[0].stock_on_hand_total, Decimal("3.0000"))
+
+    def test_sales_invoice_checks_stock_across_lines_of_same_item(self):
+        self.category.sales_revenue_account = self.accounts["sales"]
+        self.category.cogs_account = self.accounts["cogs"]
+        self.category.save()
+        customer = Customer.objects.create(
+            company=self.company_a,
+            name="Split Line Customer",
+            receivable_account=self.accounts["receivable"],
+        )
+        post_opening_stock(
+            company=self.company_a,
+            item=self.item,
+            location=self.main_location,
+            quantity=Decimal("5"),
+            unit_cost=Decimal("10.00"),
+        )
+
+        with self.assertRaisesMessage(ValueError, "Sale would make stock negative"):
+            post_sales_invoice(
+                company=self.company_a,
+                customer=customer,
+                location=self.main_location,
+                lines=[
+                    {"item": self.item, "quantity": Decimal("3"), "unit_price": Decimal("20")},
+                    {"item": self.item, "quantity": Decimal("3"), "unit_price": Decimal("20")},
+                ],
+            )
+
+        self.assertEqual(get_stock_on_hand(self.item, self.main_location), Decimal("5.0000"))
+
+    def test_lock_stock_balances_creates_missing_rows(self):
+        balances = lock_stock_balances(
+            self.company_a,
+            [
+                (self.item, self.branch_location),
+                (self.item, self.main_location),
+                (self.item, self.branch_location),
+            ],
+        )
+
+        self.assertEqual(
+            sorted(balances),
+            sorted(
+                [
+                    (self.item.id, self.main_location.id),
+                    (self.item.id, self.branch_location.id),
+                ]
+            ),
+        )
+        self.assertEqual(StockBalance.objects.filter(item=self.item).count(), 2)
+
+    def test_sales_invoice_posts_in_constant_queries_regardless_of_line_count(self):
+        self.category.sales_revenue_account = self.accounts["sales"]
+        self.category.cogs_account = self.accounts["cogs"]
+        self.category.save()
+        customer = Customer.objects.create(
+            company=self.company_a,
+            name="Bulk Customer",
+            receivable_account=self.accounts["receivable"],
+        )
+        items = []
+        for index in range(12):
+            item = InventoryItem.objects.create(
+                company=self.company_a,
+                category=self.category,
+                sku=f"BULK-{index:03d}",
+                name=f"Bulk Item {index}",
+            )
+            post_opening_stock(
+                company=self.company_a,
+                item=item,
+                location=self.main_location,
+                quantity=Decimal("10"),
+                unit_cost=Decimal("5.00"),
+            )
+            items.append(item)
+
+        def post(line_items):
+            with CaptureQueriesContext(connection) as queries:
+                document = post_sales_invoice(
+                    company=self.company_a,
+                    customer=customer,
+                    location=self.main_location,
+                    lines=[
+                        {"item": item, "quantity": Decimal("2"), "unit_price": Decimal("8")}
+                        for item in line_items
+                    ],
+                )
+            return document, len(queries)
+
+        _, small_count = post(items[:2])
+        document, large_count = post(items[2:])
+
+        self.assertEqual(large_count, small_count)
+        self.assertEqual(document.movements.count(), 10)
+        self.assertEqual(document.journal.entries.count(), 4)
+        self.assertEqual(
+            document.journal.entries.get(account=self.accounts["sales"]).amount,
+            Decimal("160.00"),
+        )
+        self.assertEqual(get_stock_on_hand(items[5], self.main_location), Decimal("8.0000"))
+        self.assertEqual(verify_stock_balances(self.company_a), [])
+
+    def _costing_fixture(self):
+        self.category.sales_revenue_account = self.accounts["sales"]
+        self.category.cogs_account = self.accounts["cogs"]
+        self.category.save()
+        supplier = Supplier.objects.create(
+            company=self.company_a,
+            name="Costing Supplier",
+            payable_account=self.accounts["payable"],
+        )
+        customer = Customer.objects.create(
+            company=self.company_a,
+            name="Costing Customer",
+            receivable_account=self.accounts["receivable"],
+        )
+        return supplier, customer
+
+    def _receive(self, supplier, quantity, unit_cost, posting_date):
+        return post_purchase_receipt(
+            company=self.company_a,
+            supplier=supplier,
+            location=self.main_location,
+            lines=[{"item": self.item, "quantity": quantity, "unit_cost": unit_cost}],
+            posting_date=posting_date,
+        )
+
+    def _sell(self, customer, quantity, posting_date):
+        return post_sales_invoice(
+            company=self.company_a,
+            customer=customer,
+            location=self.main_location,
+            lines=[{"item": self.item, "quantity": quantity, "unit_price": Decimal("20")}],
+            posting_date=posting_date,
+        )
+
+    def test_weighted_average_cost_is_kept_per_item(self):
+        supplier, customer = self._costing_fixture()
+        self._receive(supplier, Decimal("10"), Decimal("5.00"), date(2026, 5, 1))
+        self._receive(supplier, Decimal("10"), Decimal("8.00"), date(2026, 5, 2))
+
+        invoice = self._sell(customer, Decimal("4"), date(2026, 5, 3))
+
+        self.assertEqual(invoice.movements.get().total_cost, Decimal("-26.00"))
+        self.assertEqual(get_average_unit_cost(self.item), Decimal("6.5000"))
+        cost = ItemCost.objects.get(item=self.item)
+        self.assertEqual((cost.quantity, cost.value), (Decimal("16.0000"), Decimal("104.00")))
+
+    def test_fifo_issues_consume_oldest_layers_first(self):
+        self.category.costing_method = InventoryCategory.CostingMethod.FIFO
+        supplier, customer = self._costing_fixture()
+        first = self._receive(supplier, Decimal("10"), Decimal("5.00"), date(2026, 5, 1))
+        second = self._receive(supplier, Decimal("10"), Decimal("8.00"), date(2026, 5, 2))
+
+        invoice = self._sell(customer, Decimal("15"), date(2026, 5, 3))
+
+        self.assertEqual(
+            invoice.journal.entries.get(account=self.accounts["cogs"]).amount,
+            Decimal("90.00"),
+        )
+        first_layer = InventoryValuationLayer.objects.get(movement__document=first)
+        second_layer = InventoryValuationLayer.objects.get(movement__document=second)
+        self.assertEqual(first_layer.remaining_quantity, Decimal("0.0000"))
+        self.assertEqual(
+            (second_layer.remaining_quantity, second_layer.remaining_value),
+            (Decimal("5.0000"), Decimal("40.00")),
+        )
+        self.assertEqual(get_inventory_value(self.item), Decimal("40.00"))
+
+    def test_recompute_recosts_issues_after_back_dated_receipt(self):
+        supplier, customer = self._costing_fixture()
+        self._receive(supplier, Decimal("10"), Decimal("5.00"), date(2026, 1, 10))
+        invoice = self._sell(customer, Decimal("5"), date(2026, 2, 1))
+        self._receive(supplier, Decimal("10"), Decimal("8.00"), date(2026, 1, 20))
+        self.assertEqual(invoice.movements.get().total_cost, Decimal("-25.00"))
+
+        out = StringIO()
+        call_command(
+            "recompute_inventory_costs",
+            "--company-id",
+            str(self.company_a.pk),
+            stdout=out,
+        )
+
+        self.assertEqual(invoice.movements.get().total_cost, Decimal("-32.50"))
+        self.assertIn(f"Documents to review: {invoice.pk}", out.getvalue())
+        self.assertEqual(ItemCost.objects.get(item=self.item).value, Decimal("97.50"))
+        self.assertEqual(verify_stock_balances(self.company_a), [])
+
+    def test_recompute_locks_stock_balances_before_item_costs(self):
+        supplier, _customer = self._costing_fixture()
+        self._receive(supplier, Decimal("10"), Decimal("5.00"), date(2026, 1, 10))
+        locks = Mock()
+
+        with patch(
+            "inventory.services._lock_stock_balance_rows",
+            wraps=services._lock_stock_balance_rows,
+        ) as balances, patch(
+            "inventory.services.lock_item_costs", wraps=services.lock_item_costs
+        ) as costs:
+            locks.attach_mock(balances, "balances")
+            locks.attach_mock(costs, "costs")
+            recompute_item_costs(self.company_a)
+
+        self.assertEqual([call[0] for call in locks.mock_calls], ["balances", "costs"])
+        self.assertEqual(
+            list(locks.mock_calls[0].args[1]), [(self.item.id, self.main_location.id)]
+        )
+
+    def test_stock_count_posts_all_differences_in_one_document(self):
+        gloves = InventoryItem.objects.create(
+            company=self.company_a, category=self.category, sku="MED-002", name="Gloves"
+        )
+        masks = InventoryItem.objects.create(
+            company=self.company_a, category=self.category, sku="MED-003", name="Masks"
+        )
+        for item, quantity in ((self.item, "10"), (gloves, "5"), (masks, "8")):
+            post_opening_stock(
+                company=self.company_a,
+                item=item,
+                location=self.main_location,
+                quantity=Decimal(quantity),
+                unit_cost=Decimal("2.00"),
+            )
+        stock_count = import_stock_count_csv(
+            company=self.company_a,
+            location=self.main_location,
+            csv_file=StringIO("SKU,Counted_Quantity\nMED-001,7\nMED-002,5\nMED-003,9.5\n"),
+            count_date=date(2026, 6, 30),
+        )
+
+        document = post_stock_count(company=self.company_a, stock_count=stock_count)
+
+        stock_count.refresh_from_db()
+        self.assertEqual(stock_count.status, StockCount.Status.POSTED)
+        self.assertEqual(stock_count.document, document)
+        self.assertEqual(document.movements.count(), 2)
+        self.assertEqual(get_stock_on_hand(self.item, self.main_location), Decimal("7.0000"))
+        self.assertEqual(get_stock_on_hand(masks, self.main_location), Decimal("9.5000"))
+        entries = document.journal.entries
+        self.assertEqual(entries.get(account=self.accounts["shrinkage"]).amount, Decimal("6.00"))
+        self.assertEqual(entries.get(account=self.accounts["adjustment_gain"]).amount, Decimal("3.00"))
+        self.assertEqual(
+            stock_count.lines.get(item=gloves).system_quantity, Decimal("5.0000")
+        )
+        with self.assertRaisesMessage(ValueError, "already been posted"):
+            post_stock_count(company=self.company_a, stock_count=stock_count)
+
+    def test_lock_stock_balances_locks_large_documents_in_chunks(self):
+        items = InventoryItem.objects.bulk_create(
+            [
+                InventoryItem(
+                    company=self.company_a,
+                    category=self.category,
+                    sku=f"BULK-{index:04d}",
+                    name=f"Bulk Item {index}",
+                )
+                for index in range(1500)
+            ]
+        )
+        keys = [(item, self.main_location) for item in items]
+
+        balances = lock_stock_balances(self.company_a, keys)
+
+        self.assertEqual(len(balances), 1500)
+        self.assertEqual(
+            set(balances), {(item.id, self.main_location.id) for item in items}
+        )
+
+    def test_stock_count_csv_reports_every_bad_row(self):
+        with self.assertRaises(ValueError) as raised:
+            import_stock_count_csv(
+                company=self.company_a,
+                location=self.main_location,
+                csv_file=StringIO(
+                    "sku,counted_quantity\nMED-001,abc\nNOPE-1,3\nMED-001,-1\n,2\n"
+                ),
+            )
+
+        self.assertEqual(
+            str(raised.exception).splitlines(),
+            [
+                "Row 2: counted quantity for MED-001 is not a number",
+                "Row 3: unknown SKU NOPE-1",
+                "Row 4: counted quantity for MED-001 cannot be negative",
+                "Row 5: SKU is required",
+            ],
+        )
+        self.assertFalse(StockCount.objects.exists())
+
+    def test_valuation_as_of_date_uses_snapshot_and_later_movements(self):
+        supplier, customer = self._costing_fixture()
+        self._receive(supplier, Decimal("10"), Decimal("5.00"), date(2026, 1, 10))
+        self._sell(customer, Decimal("4"), date(2026, 2, 5))
+
+        self.assertEqual(snapshot_inventory_valuation(self.company_a, date(2026, 1, 31)), 1)
+        self.assertEqual(
+            inventory_valuation(self.company_a, date(2026, 1, 31))[0]["value"],
+            Decimal("50.00"),
+        )
+        with self.assertNumQueries(5):
+            rows = inventory_valuation(self.company_a, date(2026, 2, 28))
+        self.assertEqual(
+            [(row["sku"], row["quantity"], row["value"], row["average_cost"]) for row in rows],
+            [("MED-001", Decimal("6.0000"), Decimal("30.00"), Decimal("5.0000"))],
+        )
+
+        self._receive(supplier, Decimal("2"), Decimal("5.00"), date(2026, 1, 20))
+
+        self.assertFalse(StockValuationSnapshot.objects.exists())
+        self.assertEqual(
+            inventory_valuation(self.company_a, date(2026, 1, 31))[0]["quantity"],
+            Decimal("12.0000"),
+        )
+
+    def test_item_import_reads_xlsx_and_reports_every_bad_row(self):
+        header = ["SKU", "Name", "Category", "Standard_Cost"]
+        bad = BytesIO(
+            b"".join(
+                stream_xlsx(
+                    header,
+                    [
+                        ["MED-001", "Duplicate", "Wholesale Goods", 1],
+                        ["MED-010", "Syrup", "Nope", 1],
+                        ["MED-011", "Drops", "Wholesale Goods", "abc"],
+                    ],
+                )
+            )
+        )
+        bad.name = "items.xlsx"
+        with self.assertRaises(ValueError) as raised:
+            import_inventory_items(company=self.company_a, upload=bad)
+        self.assertEqual(
+            str(raised.exception).splitlines(),
+            [
+                "Row 2: SKU MED-001 already exists",
+                "Row 3: unknown category Nope",
+                "Row 4: standard cost for MED-011 is not a number",
+            ],
+        )
+        self.assertEqual(InventoryItem.objects.filter(company=self.company_a).count(), 1)
+
+        good = BytesIO(
+            b"".join(
+                stream_xlsx(
+                    header,
+                    [
+                        ["MED-010", "Syrup", "wholesale goods", Decimal("2.5")],
+                        ["MED-011", "Drops", "Wholesale Goods", None],
+                    ],
+                )
+            )
+        )
+        good.name = "items.xlsx"
+        created = import_inventory_items(company=self.company_a, upload=good)
+
+        self.assertEqual([item.sku for item in created], ["MED-010", "MED-011"])
+        syrup = InventoryItem.objects.get(company=self.company_a, sku="MED-010")
+        self.assertEqual((syrup.category, syrup.standard_cost), (self.category, Decimal("2.5000")))
+
+    def test_supplier_import_uses_default_payable_account(self):
+        suppliers = import_suppliers(
+            company=self.company_a,
+            upload=StringIO(
+                "name,email,payable_account,wht_payable_account,default_wht_rate\n"
+                "Acme Pharma,orders@acme.test,,,\n"
+                "Beta Labs,,2300,2300,5\n"
+            ),
+            payable_account=self.accounts["payable"],
+        )
+
+        self.assertEqual(
+            [(supplier.name, supplier.payable_account) for supplier in suppliers],
+            [("Acme Pharma", self.accounts["payable"]), ("Beta Labs", self.accounts["wht_payable"])],
+        )
+        self.assertEqual(Supplier.objects.get(name="Beta Labs").default_wht_rate, Decimal("5.0000"))
+        with self.assertRaisesMessage(ValueError, "Row 2: Acme Pharma already exists"):
+            import_suppliers(
+                company=self.company_a,
+                upload=StringIO("name\nAcme Pharma\n"),
+                payable_account=self.accounts["payable"],
+            )
+
+    def test_opening_stock_import_posts_one_document_and_journal(self):
+        gloves = InventoryItem.objects.create(
+            company=self.company_a, category=self.category, sku="MED-002", name="Gloves"
+        )
+
+        document = import_opening_stock(
+            company=self.company_a,
+            upload=StringIO(
+                "sku,location,quantity,unit_cost\n"
+                "MED-001,MAIN-BIN,10,2.00\n"
+                "MED-002,main-bin,4,1.50\n"
+                "MED-001,BRANCH-BIN,3,2.00\n"
+            ),
+            posting_date=date(2026, 1, 1),
+        )
+
+        self.assertEqual(document.document_type, "OPENING_STOCK")
+        self.assertEqual(document.movements.count(), 3)
+        self.assertEqual(get_stock_on_hand(self.item), Decimal("13.0000"))
+        self.assertEqual(get_stock_on_hand(gloves, self.main_location), Decimal("4.0000"))
+        entries = document.journal.entries
+        self.assertEqual(entries.count(), 2)
+        self.assertEqual(entries.get(account=self.accounts["inventory"]).amount, Decimal("32.00"))
+        self.assertEqual(entries.get(account=self.accounts["opening_equity"]).amount, Decimal("32.00"))
+        self.assertEqual(verify_stock_balances(self.company_a), [])
+
+        with self.assertRaises(ValueError) as raised:
+            import_opening_stock(
+                company=self.company_a,
+                upload=StringIO("sku,location,quantity,unit_cost\nMED-404,MAIN-BIN,1,1\nMED-001,NOPE,1,1\n"),
+            )
+        self.assertEqual(
+            str(raised.exception).splitlines(),
+            ["Row 2: unknown SKU MED-404", "Row 3: location NOPE is unknown"],
+        )
+
+    def test_opening_stock_import_locks_all_balances_before_costs(self):
+        gloves = InventoryItem.objects.create(
+            company=self.company_a, category=self.category, sku="MED-002", name="Gloves"
+        )
+        locks = Mock()
+
+        with patch("inventory.services.OPENING_STOCK_POSTING_BATCH", 1), patch(
+            "inventory.services.lock_stock_balances", wraps=services.lock_stock_balances
+        ) as balances, patch(
+            "inventory.services.lock_item_costs", wraps=services.lock_item_costs
+        ) as costs:
+            locks.attach_mock(balances, "balances")
+            locks.attach_mock(costs, "costs")
+            import_opening_stock(
+                company=self.company_a,
+                upload=StringIO(
+                    "sku,location,quantity,unit_cost\n"
+                    "MED-001,MAIN-BIN,10,2.00\n"
+                    "MED-002,MAIN-BIN,4,1.50\n"
+                ),
+                posting_date=date(2026, 1, 1),
+            )
+
+        self.assertEqual([call[0] for call in locks.mock_calls], ["balances", "costs"])
+        self.assertEqual(get_stock_on_hand(gloves, self.main_location), Decimal("4.0000"))
+        self.assertEqual(verify_stock_balances(self.company_a), [])
+
+    @patch("payroll.services.notification_service.NotificationService._queue_notifications")
+    def test_reorder_point_task_alerts_buyers_once_per_dip(self, queue_notifications):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        buyer = get_user_model().objects.create_user(
+            email="buyer@example.com",
+            password="password123",
+            company=self.company_a,
+            active_company=self.company_a,
+        )
+        buyer.user_permissions.add(
+            Permission.objects.get(content_type__app_label="inventory", codename="add_purchaseorder")
+        )
+        get_user_model().objects.create_user(
+            email="clerk@example.com",
+            password="password123",
+            company=self.company_a,
+            active_company=self.company_a,
+        )
+        self.item.reorder_point = Decimal("5")
+        self.item.save(update_fields=["reorder_point"])
+        post_opening_stock(
+            company=self.company_a,
+            item=self.item,
+            location=self.main_location,
+            quantity=Decimal("3"),
+            unit_cost=Decimal("10.00"),
+        )
+
+        summary = check_reorder_points_task()
+
+        self.assertEqual(summary[self.company_a.pk], {"low_stock": 1, "newly_low": 1, "notified": 1})
+        notification = Notification.objects.get(notification_type="LOW_STOCK")
+        self.assertEqual(notification.recipient, buyer.employee_user)
+        self.assertIn("MED-001", notification.message)
+        queue_notifications.assert_called_once()
+        self.assertEqual(queue_notifications.call_args.args[0], [notification])
+        with self.assertNumQueries(0):
+            low_stock = get_cached_low_stock_items(self.company_a)
+        self.assertEqual(
+            [(row["sku"], row["stock_on_hand"]) for row in low_stock],
+            [("MED-001", Decimal("3.0000"))],
+        )
+
+        check_reorder_points_task()
+        self.assertEqual(Notification.objects.filter(notification_type="LOW_STOCK").count(), 1)
+
+        for quantity_delta in (Decimal("10"), Decimal("-10")):
+            post_inventory_adjustment(
+                company=self.company_a,
+                item=self.item,
+                location=self.main_location,
+                quantity_delta=quantity_delta,
+                unit_cost=Decimal("10.00"),
+            )
+            check_reorder_points_task()
+        self.assertEqual(Notification.objects.filter(notification_type="LOW_STOCK").count(), 2)
+
+    def test_stock_and_item_changes_invalidate_cached_low_stock_list(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.assertEqual(get_cached_low_stock_items(self.company_a), [])
+
+        self.item.reorder_point = Decimal("5")
+        with self.captureOnCommitCallbacks(execute=True):
+            self.item.save(update_fields=["reorder_point"])
+        self.assertEqual(
+            [row["sku"] for row in get_cached_low_stock_items(self.company_a)], ["MED-001"]
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            post_opening_stock(
+                company=self.company_a,
+                item=self.item,
+                location=self.main_location,
+                quantity=Decimal("10"),
+                unit_cost=Decimal("10.00"),
+            )
+        self.assertEqual(get_cached_low_stock_items(self.company_a), [])
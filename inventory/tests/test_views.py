@@ -1,8 +1,10 @@
 from decimal import Decimal
 
 from django.contrib.auth import get_user_model
+from django.contrib.messages import get_messages
 from django.test import TestCase
 from django.urls import reverse
+from django.utils import timezone
 
 from accounting.models import Account
 from company.models import Company, CompanyMembership
@@ -412,3 +414,19 @@ class InventoryViewTests(TestCase):
         self.assertEqual(transfer_response.status_code, 302)
         self.assertEqual(movement_response.status_code, 200)
         self.assertContains(movement_response, "Movement Item")
+
+    def test_valuation_report_falls_back_to_today_for_impossible_dates(self):
+        response = self.client.get(
+            reverse("inventory:valuation_report"),
+            {"as_of": "2024-02-30", "format": "csv"},
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(
+            f"inventory_valuation_{timezone.localdate().isoformat()}",
+            response["Content-Disposition"],
+        )
+        self.assertEqual(
+            [str(message) for message in get_messages(response.wsgi_request)],
+            ["Invalid date format"],
+        )
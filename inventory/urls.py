@@ -30,6 +30,7 @@ urlpatterns = [
     path("purchase-orders/<int:pk>/receive/", views.PurchaseOrderReceiveView.as_view(), name="purchase_order_receive"),
     path("movements/", views.StockMovementListView.as_view(), name="movement_list"),
     path("documents/", views.InventoryDocumentListView.as_view(), name="document_list"),
+    path("reports/valuation/", views.InventoryValuationView.as_view(), name="valuation_report"),
     path("opening-stock/", views.OpeningStockView.as_view(), name="opening_stock"),
     path("purchase-receipts/new/", views.PurchaseReceiptView.as_view(), name="purchase_receipt"),
     path("sales-invoices/new/", views.SalesInvoiceView.as_view(), name="sales_invoice"),
@@ -40,4 +41,6 @@ urlpatterns = [
     path("tax-remittances/new/", views.TaxRemittanceView.as_view(), name="tax_remittance"),
     path("adjustments/new/", views.InventoryAdjustmentView.as_view(), name="adjustment"),
     path("transfers/new/", views.StockTransferView.as_view(), name="transfer"),
+    path("stock-counts/upload/", views.StockCountUploadView.as_view(), name="stock_count_upload"),
+    path("imports/", views.BulkImportView.as_view(), name="bulk_import"),
 ]
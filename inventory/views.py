@@ -1,13 +1,21 @@
+from decimal import Decimal
+
 from django.contrib import messages
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.http import Http404
+from django.db import transaction
+from django.http import Http404, StreamingHttpResponse
 from django.shortcuts import redirect
 from django.urls import reverse_lazy
+from django.utils import timezone
+from django.utils.dateparse import parse_date
 from django.views.generic import CreateView, DetailView, FormView, ListView, TemplateView
 
+from accounting.exports import XLSX_CONTENT_TYPE, stream_csv, stream_xlsx
 from accounting.models import Account
+from accounting.utils import annotate_account_balances
 from company.utils import get_user_company
 from inventory.forms import (
+    BulkImportForm,
     CustomerForm,
     CustomerPaymentForm,
     CustomerReturnForm,
@@ -19,7 +27,9 @@ from inventory.forms import (
     PurchaseOrderReceiveForm,
     PurchaseReceiptForm,
     SalesInvoiceForm,
+    StockCountUploadForm,
     StockLocationForm,
+    StockMovementFilterForm,
     StockTransferForm,
     SupplierForm,
     SupplierPaymentForm,
@@ -40,19 +50,29 @@ from inventory.models import (
     Warehouse,
 )
 from inventory.models import UnitOfMeasure
+from inventory.pagination import keyset_page
 from inventory.services import (
     create_purchase_order,
     DEFAULT_POSTING_ACCOUNTS,
     ensure_default_posting_accounts,
+    filter_stock_movements,
     get_average_unit_cost,
+    get_cached_low_stock_items,
     get_inventory_value,
     get_stock_on_hand,
+    import_customers,
+    import_inventory_items,
+    import_opening_stock,
+    import_stock_count_csv,
+    import_suppliers,
+    inventory_valuation,
     post_inventory_adjustment,
     post_customer_payment,
     post_customer_return,
     post_opening_stock,
     post_purchase_receipt,
     post_sales_invoice,
+    post_stock_count,
     post_supplier_payment,
     post_supplier_return,
     post_tax_remittance,
@@ -96,17 +116,9 @@ class InventoryDashboardView(InventoryCompanyMixin, TemplateView):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        items = list(
-            InventoryItem.objects.filter(company=self.company, is_active=True).select_related(
-                "category", "base_unit"
-            )
-        )
-        low_stock_items = [
-            item for item in items if item.reorder_point and get_stock_on_hand(item) <= item.reorder_point
-        ]
         context.update(
             {
-                "item_count": len(items),
+                "item_count": InventoryItem.objects.filter(company=self.company, is_active=True).count(),
                 "warehouse_count": Warehouse.objects.filter(company=self.company, is_active=True).count(),
                 "location_count": StockLocation.objects.filter(company=self.company, is_active=True).count(),
                 "document_count": InventoryDocument.objects.filter(company=self.company).count(),
@@ -119,7 +131,7 @@ class InventoryDashboardView(InventoryCompanyMixin, TemplateView):
                 ).count(),
                 "supplier_count": Supplier.objects.filter(company=self.company, is_active=True).count(),
                 "customer_count": Customer.objects.filter(company=self.company, is_active=True).count(),
-                "low_stock_items": low_stock_items[:8],
+                "low_stock_items": get_cached_low_stock_items(self.company)[:8],
                 "recent_movements": StockMovement.objects.filter(company=self.company)
                 .select_related("item", "location", "location__warehouse")
                 .order_by("-movement_date", "-created_at")[:8],
@@ -445,16 +457,43 @@ class StockMovementListView(InventoryCompanyMixin, ListView):
     model = StockMovement
     template_name = "inventory/movement_list.html"
     context_object_name = "movements"
-    paginate_by = 50
+    page_size = 50
     page_title = "Stock Movements"
 
     def get_queryset(self):
-        return (
-            super()
-            .get_queryset()
-            .select_related("item", "location", "location__warehouse", "document")
-            .order_by("-movement_date", "-created_at")
+        self.filter_form = StockMovementFilterForm(self.request.GET, company=self.company)
+        filters = self.filter_form.cleaned_data if self.filter_form.is_valid() else {}
+        return filter_stock_movements(self.company, **filters).select_related(
+            "item", "location", "location__warehouse"
+        )
+
+    def _cursor_url(self, cursor):
+        if cursor is None:
+            return None
+        params = self.request.GET.copy()
+        params["cursor"] = cursor
+        return f"?{params.urlencode()}"
+
+    def get_context_data(self, **kwargs):
+        # Keyset pages avoid the COUNT and deep OFFSET of ``paginate_by``.
+        try:
+            movements, next_cursor, previous_cursor = keyset_page(
+                self.object_list,
+                ("-movement_date", "-id"),
+                cursor=self.request.GET.get("cursor"),
+                page_size=self.page_size,
+            )
+        except ValueError:
+            raise Http404("Invalid cursor")
+        context = super().get_context_data(object_list=movements, **kwargs)
+        context.update(
+            {
+                "filter_form": self.filter_form,
+                "next_url": self._cursor_url(next_cursor),
+                "previous_url": self._cursor_url(previous_cursor),
+            }
         )
+        return context
 
 
 class InventoryDocumentListView(InventoryCompanyMixin, ListView):
@@ -703,3 +742,148 @@ class StockTransferView(InventoryActionView):
             reference=cleaned_data.get("reference", ""),
             reason=cleaned_data.get("reason") or "Stock transfer",
         )
+
+
+class StockCountUploadView(InventoryActionView):
+    form_class = StockCountUploadForm
+    page_title = "Stock Count"
+    action_label = "Post Count"
+
+    def post_document(self, cleaned_data):
+        with transaction.atomic():
+            stock_count = import_stock_count_csv(
+                company=self.company,
+                location=cleaned_data["location"],
+                csv_file=cleaned_data["count_file"],
+                count_date=cleaned_data.get("posting_date"),
+                reason=cleaned_data.get("reason") or "Stock count",
+            )
+            return post_stock_count(
+                company=self.company,
+                stock_count=stock_count,
+                reference=cleaned_data.get("reference", ""),
+            )
+
+
+class BulkImportView(InventoryActionView):
+    form_class = BulkImportForm
+    page_title = "Bulk Import"
+    action_label = "Import"
+    success_urls = {
+        BulkImportForm.ITEMS: reverse_lazy("inventory:item_list"),
+        BulkImportForm.SUPPLIERS: reverse_lazy("inventory:supplier_list"),
+        BulkImportForm.CUSTOMERS: reverse_lazy("inventory:customer_list"),
+        BulkImportForm.OPENING_STOCK: reverse_lazy("inventory:movement_list"),
+    }
+
+    def form_valid(self, form):
+        data = form.cleaned_data
+        dataset = data["dataset"]
+        upload = data["import_file"]
+        try:
+            if dataset == BulkImportForm.OPENING_STOCK:
+                document = import_opening_stock(
+                    company=self.company,
+                    upload=upload,
+                    posting_date=data.get("posting_date"),
+                    reference=data.get("reference", ""),
+                    reason=data.get("reason") or "Opening stock",
+                )
+                message = f"Opening stock posted for {document.movements.count()} lines."
+            elif dataset == BulkImportForm.SUPPLIERS:
+                created = import_suppliers(
+                    company=self.company,
+                    upload=upload,
+                    payable_account=data.get("payable_account"),
+                )
+                message = f"Imported {len(created)} suppliers."
+            elif dataset == BulkImportForm.CUSTOMERS:
+                created = import_customers(
+                    company=self.company,
+                    upload=upload,
+                    receivable_account=data.get("receivable_account"),
+                )
+                message = f"Imported {len(created)} customers."
+            else:
+                created = import_inventory_items(company=self.company, upload=upload)
+                message = f"Imported {len(created)} items."
+        except ValueError as exc:
+            form.add_error(None, str(exc))
+            return self.form_invalid(form)
+        messages.success(self.request, message)
+        return redirect(self.success_urls[dataset])
+
+
+class InventoryValuationView(InventoryCompanyMixin, TemplateView):
+    template_name = "inventory/valuation_report.html"
+    page_title = "Inventory Valuation"
+    export_header = ["SKU", "Item", "Location", "Quantity", "Average Cost", "Value"]
+
+    def get(self, request, *args, **kwargs):
+        as_of = request.GET.get("as_of") or ""
+        try:
+            self.as_of_date = parse_date(as_of)
+        except ValueError:
+            # Well formed but impossible, such as 2024-02-30
+            self.as_of_date = None
+        if self.as_of_date is None:
+            if as_of:
+                messages.error(request, "Invalid date format")
+            self.as_of_date = timezone.localdate()
+        self.rows = inventory_valuation(self.company, self.as_of_date)
+        export_format = request.GET.get("format")
+        if export_format in ("csv", "xlsx"):
+            return self.export(export_format)
+        return super().get(request, *args, **kwargs)
+
+    def export(self, export_format):
+        rows = (
+            [
+                row["sku"],
+                row["item_name"],
+                row["location_code"],
+                row["quantity"],
+                row["average_cost"],
+                row["value"],
+            ]
+            for row in self.rows
+        )
+        filename = f"inventory_valuation_{self.as_of_date.isoformat()}"
+        if export_format == "csv":
+            response = StreamingHttpResponse(
+                stream_csv(self.export_header, rows), content_type="text/csv"
+            )
+        else:
+            response = StreamingHttpResponse(
+                stream_xlsx(self.export_header, rows, sheet_name="Inventory Valuation"),
+                content_type=XLSX_CONTENT_TYPE,
+            )
+        response["Content-Disposition"] = f'attachment; filename="{filename}.{export_format}"'
+        return response
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        inventory_accounts = annotate_account_balances(
+            Account.objects.filter(
+                company=self.company,
+                pk__in=InventoryCategory.objects.filter(company=self.company).values(
+                    "inventory_account_id"
+                ),
+            ),
+            self.as_of_date,
+        )
+        total_value = sum((row["value"] for row in self.rows), Decimal("0.00"))
+        ledger_value = sum(
+            (account.ledger_balance for account in inventory_accounts), Decimal("0.00")
+        )
+        context.update(
+            {
+                "as_of_date": self.as_of_date,
+                "rows": self.rows,
+                "total_value": total_value,
+                "inventory_accounts": inventory_accounts,
+                "ledger_value": ledger_value,
+                "difference": total_value - ledger_value,
+            }
+        )
+        return context
@@ -21,6 +21,7 @@ from payroll.models.notification import (
     NotificationDeliveryLog,
     NotificationTemplate,
 )
+from payroll.services.notification_service import UnreadCountService
 
 
 @admin.register(Notification)
@@ -231,23 +232,39 @@ class NotificationAdmin(admin.ModelAdmin):
 
     delivery_status_summary.short_description = "Delivery Status"
 
+    @staticmethod
+    def _count_by_recipient(queryset):
+        """Count the notifications in queryset per recipient"""
+        return dict(
+            queryset.order_by()
+            .values("recipient_id")
+            .annotate(total=Count("id"))
+            .values_list("recipient_id", "total")
+        )
+
     def mark_as_read(self, request, queryset):
         """Mark selected notifications as read"""
+        unread = self._count_by_recipient(queryset.filter(is_read=False, is_deleted=False))
         count = queryset.update(is_read=True, read_at=timezone.now())
+        UnreadCountService().adjust({key: -total for key, total in unread.items()})
         self.message_user(request, f"{count} notifications marked as read.")
 
     mark_as_read.short_description = "Mark selected as read"
 
     def mark_as_unread(self, request, queryset):
         """Mark selected notifications as unread"""
+        read = self._count_by_recipient(queryset.filter(is_read=True, is_deleted=False))
         count = queryset.update(is_read=False, read_at=None)
+        UnreadCountService().adjust(read)
         self.message_user(request, f"{count} notifications marked as unread.")
 
     mark_as_unread.short_description = "Mark selected as unread"
 
     def soft_delete(self, request, queryset):
         """Soft delete selected notifications"""
+        unread = self._count_by_recipient(queryset.filter(is_read=False, is_deleted=False))
         count = queryset.update(is_deleted=True, deleted_at=timezone.now())
+        UnreadCountService().adjust({key: -total for key, total in unread.items()})
         self.message_user(request, f"{count} notifications deleted.")
 
     soft_delete.short_description = "Soft delete selected"
@@ -171,30 +171,24 @@ def log_payt_closure(sender, instance, **kwargs):
     """
     Log payroll period closure with enhanced audit details.
     """
-    if not instance.pk:
+    if not instance.is_being_closed(kwargs.get("update_fields")):
         return
 
-    try:
-        old_instance = PayrollRun.objects.get(pk=instance.pk)
-        # Check if payroll is being closed
-        if not old_instance.closed and instance.closed:
-            # Log the closure with detailed information
-            changes = {
-                "status_change": {"old": "open", "new": "closed"},
-                "closure_date": timezone.now().isoformat(),
-                "payroll_period": str(instance.paydays),
-                "employee_count": instance.payroll_payday.count(),
-            }
+    # Log the closure with detailed information
+    changes = {
+        "status_change": {"old": "open", "new": "closed"},
+        "closure_date": timezone.now().isoformat(),
+        "payroll_period": str(instance.paydays),
+        "employee_count": instance.payroll_payday.count(),
+    }
 
-            log_audit(
-                None,  # System action
-                "Closed Payroll Period",
-                instance,
-                changes=changes,
-                reason=f"Payroll period {instance.save_month_str} closed",
-            )
-    except PayrollRun.DoesNotExist:
-        pass
+    log_audit(
+        None,  # System action
+        "Closed Payroll Period",
+        instance,
+        changes=changes,
+        reason=f"Payroll period {instance.save_month_str} closed",
+    )
 
 
 @receiver(post_save, sender=PayrollRun)
@@ -7,10 +7,12 @@ It allows clients to receive notifications instantly without polling.
 Architecture Reference: plans/NOTIFICATION_SYSTEM_ARCHITECTURE.md (Section 12)
 """
 
+import asyncio
 import json
 import logging
 from channels.generic.websocket import AsyncWebsocketConsumer
 from channels.db import database_sync_to_async
+from django.core.serializers.json import DjangoJSONEncoder
 from django.utils import timezone
 
 logger = logging.getLogger(__name__)
@@ -26,8 +28,12 @@ class NotificationConsumer(AsyncWebsocketConsumer):
     - Real-time notification broadcasting
     - Bidirectional communication (client can send actions)
     - Unread count updates
+    - Bursts of notifications coalesced into one frame
     """
 
+    # Notifications arriving within this many seconds go out in one frame
+    COALESCE_WINDOW = 0.05
+
     async def connect(self):
         """
         Handle WebSocket connection.
@@ -54,7 +60,11 @@ class NotificationConsumer(AsyncWebsocketConsumer):
             return
 
         # Create notification group for this user
-        self.group_name = f"notifications_{self.employee.id}"
+        from payroll.handlers.delivery_handlers import notification_group_name
+
+        self.group_name = notification_group_name(self.employee.id)
+        self.pending_payloads = []
+        self.flush_task = None
 
         # Join the notification group
         await self.channel_layer.group_add(self.group_name, self.channel_name)
@@ -86,6 +96,10 @@ class NotificationConsumer(AsyncWebsocketConsumer):
 
         Leaves the notification group and cleans up resources.
         """
+        flush_task = getattr(self, "flush_task", None)
+        if flush_task is not None:
+            flush_task.cancel()
+
         # Leave the notification group
         try:
             await self.channel_layer.group_discard(self.group_name, self.channel_name)
@@ -172,19 +186,57 @@ class NotificationConsumer(AsyncWebsocketConsumer):
         """
         Handle new notification message from channel layer.
 
-        This method is called when a notification is broadcast to the user's group.
+        This method is called when a single notification is broadcast to the
+        user's group. It is sent along with any others in the same burst.
         """
-        notification = event.get("notification")
+        self.queue_payloads(
+            [json.dumps(event.get("notification"), cls=DjangoJSONEncoder)]
+        )
 
-        # Send notification to client
-        await self.send(
-            text_data=json.dumps(
-                {
-                    "type": "notification",
-                    "notification": notification,
-                }
+    async def notification_batch(self, event):
+        """
+        Handle pre-serialized notifications from channel layer.
+
+        ``WebSocketBroadcaster`` sends every notification for this user from
+        one delivery batch in a single message, already JSON-encoded.
+        """
+        self.queue_payloads(event.get("payloads", []))
+
+    def queue_payloads(self, payloads):
+        """
+        Hold payloads until the coalescing window closes.
+
+        Args:
+            payloads: JSON-encoded notifications
+        """
+        self.pending_payloads.extend(payloads)
+        if self.flush_task is None:
+            self.flush_task = asyncio.ensure_future(self.flush_payloads())
+
+    async def flush_payloads(self):
+        """
+        Send every held notification in one frame, then the unread count.
+
+        A single notification keeps the ``notification`` frame; a burst is
+        sent as one ``notifications`` frame. Payloads are spliced in as
+        received, without decoding them again.
+        """
+        await asyncio.sleep(self.COALESCE_WINDOW)
+        payloads = self.pending_payloads
+        self.pending_payloads = []
+        self.flush_task = None
+        if not payloads:
+            return
+
+        if len(payloads) == 1:
+            frame = '{"type": "notification", "notification": ' + payloads[0] + "}"
+        else:
+            frame = (
+                '{"type": "notifications", "notifications": ['
+                + ", ".join(payloads)
+                + "]}"
             )
-        )
+        await self.send(text_data=frame)
 
         # Update unread count
         await self.send_unread_count()
@@ -216,16 +268,14 @@ class NotificationConsumer(AsyncWebsocketConsumer):
         """
         Send unread notification count to client.
 
-        Queries the database for the current unread count and sends it to the client.
+        Reads the maintained unread counter and sends it to the client.
         """
         try:
-            from payroll.models.notification import Notification
+            from payroll.services.notification_service import UnreadCountService
 
-            count = await database_sync_to_async(
-                lambda: Notification.objects.filter(
-                    recipient=self.employee, is_read=False, is_deleted=False
-                ).count()
-            )()
+            count = await database_sync_to_async(UnreadCountService().get_count)(
+                str(self.employee.id)
+            )
 
             await self.send(
                 text_data=json.dumps(
@@ -300,14 +350,11 @@ class NotificationConsumer(AsyncWebsocketConsumer):
         Mark all notifications as read for the current user.
         """
         try:
-            from payroll.models.notification import Notification
-            from django.utils import timezone
+            from payroll.services.notification_service import NotificationService
 
-            count = await database_sync_to_async(
-                Notification.objects.filter(
-                    recipient=self.employee, is_read=False
-                ).update
-            )(is_read=True, read_at=timezone.now())
+            count = await database_sync_to_async(NotificationService().mark_all_as_read)(
+                self.employee
+            )
 
             logger.info(f"Marked {count} notifications as read for user {self.user.id}")
 
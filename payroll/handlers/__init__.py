@@ -6,6 +6,8 @@ through various channels: in-app (WebSocket), email, push (FCM), and SMS (Twilio
 """
 
 from payroll.handlers.delivery_handlers import (
+    DeliveryLogBuffer,
+    WebSocketBroadcaster,
     BaseHandler,
     InAppHandler,
     EmailHandler,
@@ -14,6 +16,8 @@ from payroll.handlers.delivery_handlers import (
 )
 
 __all__ = [
+    "DeliveryLogBuffer",
+    "WebSocketBroadcaster",
     "BaseHandler",
     "InAppHandler",
     "EmailHandler",
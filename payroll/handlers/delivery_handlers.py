@@ -15,6 +15,7 @@ from typing import Dict, Any, Optional, List
 from django.conf import settings
 from django.core.cache import cache
 from django.core.mail import EmailMultiAlternatives, get_connection
+from django.core.serializers.json import DjangoJSONEncoder
 from django.template import TemplateDoesNotExist
 from django.template.loader import render_to_string
 from django.utils import timezone
@@ -31,6 +32,189 @@ from payroll.models.notification import (
 logger = logging.getLogger(__name__)
 
 
+class DeliveryLogBuffer:
+    """
+    Collects delivery log writes and saves them in one statement.
+
+    Entries are keyed by (notification, channel, recipient), the unique key of
+    NotificationDeliveryLog, so the last outcome recorded for a delivery wins.
+    ``flush`` upserts every pending entry with a single ``bulk_create`` that
+    updates rows already present, instead of reading each log before writing,
+    and then reads back the ids of the rows it wrote.
+    """
+
+    UPDATE_FIELDS = [
+        "status",
+        "error_message",
+        "metadata",
+        "retry_count",
+        "delivered_at",
+        "failed_at",
+    ]
+
+    def __init__(self):
+        self._entries: Dict[tuple, NotificationDeliveryLog] = {}
+
+    def __len__(self):
+        return len(self._entries)
+
+    def add(
+        self,
+        notification: Notification,
+        recipient_id: str,
+        channel: str,
+        status: str,
+        message: str = "",
+        metadata: Optional[Dict[str, Any]] = None,
+        retry_count: int = 0,
+    ) -> NotificationDeliveryLog:
+        """
+        Record the outcome of one delivery attempt.
+
+        Args:
+            notification: The notification being delivered
+            recipient_id: ID of the recipient
+            channel: Delivery channel
+            status: Delivery status
+            message: Optional message, stored as the error for failures
+            metadata: Optional metadata
+            retry_count: Attempts made before this one
+
+        Returns:
+            The unsaved NotificationDeliveryLog
+        """
+        now = timezone.now()
+        delivery_log = NotificationDeliveryLog(
+            notification=notification,
+            channel=channel,
+            recipient_id=recipient_id,
+            status=status,
+            error_message=message if status == DeliveryStatus.FAILED else None,
+            metadata=metadata or {},
+            retry_count=retry_count,
+            delivered_at=now if status == DeliveryStatus.DELIVERED else None,
+            failed_at=now if status == DeliveryStatus.FAILED else None,
+        )
+        self._entries[(notification.pk, channel, str(recipient_id))] = delivery_log
+        return delivery_log
+
+    def flush(self) -> List[NotificationDeliveryLog]:
+        """
+        Save every pending entry and empty the buffer.
+
+        Returns:
+            List of the delivery logs written, carrying their stored ids
+        """
+        if not self._entries:
+            return []
+        entries = list(self._entries.values())
+        self._entries.clear()
+        NotificationDeliveryLog.objects.bulk_create(
+            entries,
+            update_conflicts=True,
+            unique_fields=["notification", "channel", "recipient"],
+            update_fields=self.UPDATE_FIELDS,
+        )
+        # A row that already existed keeps its id, not the new one generated
+        # for the entry, so read the ids back.
+        stored = NotificationDeliveryLog.objects.filter(
+            notification_id__in={entry.notification_id for entry in entries},
+            channel__in={entry.channel for entry in entries},
+        ).values_list("notification_id", "channel", "recipient_id", "id")
+        ids = {
+            (notification_id, channel, str(recipient_id)): log_id
+            for notification_id, channel, recipient_id, log_id in stored
+        }
+        for entry in entries:
+            entry.id = ids.get(
+                (entry.notification_id, entry.channel, str(entry.recipient_id)), entry.id
+            )
+        return entries
+
+
+def notification_group_name(recipient_id) -> str:
+    """Channel layer group that a recipient's notification sockets join."""
+    return f"notifications_{recipient_id}"
+
+
+class WebSocketBroadcaster:
+    """
+    Collects in-app payloads and broadcasts them from one event loop.
+
+    Each payload is serialized to JSON once, when it is added, and payloads
+    are grouped by the recipient's channel layer group. ``flush`` sends one
+    ``notification.batch`` message per group, concurrently, from a single
+    ``async_to_sync`` call, instead of entering a new event loop and sending
+    one message per notification.
+    """
+
+    # Group sends in flight at once, to bound channel layer connections
+    MAX_CONCURRENT_SENDS = 50
+
+    def __init__(self):
+        self._groups: Dict[str, List[str]] = {}
+
+    def __len__(self):
+        return sum(len(payloads) for payloads in self._groups.values())
+
+    def add(self, recipient_id: str, notification_data: Dict[str, Any]) -> None:
+        """
+        Queue a notification payload for a recipient.
+
+        Args:
+            recipient_id: ID of the recipient
+            notification_data: JSON-serializable notification payload
+        """
+        payload = json.dumps(notification_data, cls=DjangoJSONEncoder)
+        self._groups.setdefault(notification_group_name(recipient_id), []).append(payload)
+
+    def flush(self) -> int:
+        """
+        Broadcast every queued payload and empty the broadcaster.
+
+        Returns:
+            Number of channel layer messages sent
+
+        Raises:
+            Exception: If a group send fails
+        """
+        if not self._groups:
+            return 0
+        groups = self._groups
+        self._groups = {}
+
+        try:
+            from asgiref.sync import async_to_sync
+            from channels.layers import get_channel_layer
+        except ImportError:
+            logger.warning("Django Channels not installed, skipping WebSocket broadcast")
+            return 0
+
+        channel_layer = get_channel_layer()
+        if channel_layer is None:
+            logger.warning("Channel layer not configured, skipping WebSocket broadcast")
+            return 0
+
+        async_to_sync(self._send_all)(channel_layer, groups)
+        logger.debug(f"Broadcast notifications to {len(groups)} WebSocket groups")
+        return len(groups)
+
+    async def _send_all(self, channel_layer, groups: Dict[str, List[str]]) -> None:
+        import asyncio
+
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_SENDS)
+
+        async def send(group: str, payloads: List[str]) -> None:
+            async with semaphore:
+                await channel_layer.group_send(
+                    group, {"type": "notification.batch", "payloads": payloads}
+                )
+
+        await asyncio.gather(
+            *(send(group, payloads) for group, payloads in groups.items())
+        )
+
+
 class BaseHandler:
     """
     Base class for notification delivery handlers.
@@ -39,9 +223,21 @@ class BaseHandler:
     logging, and result formatting.
     """
 
-    def __init__(self):
-        """Initialize the handler."""
+    def __init__(
+        self, log_buffer: Optional[DeliveryLogBuffer] = None, retry_count: int = 0
+    ):
+        """
+        Initialize the handler.
+
+        Args:
+            log_buffer: Buffer collecting delivery logs for the caller to
+                flush; each log is written immediately when omitted
+            retry_count: Attempts made before this one, recorded on every
+                delivery log the handler writes
+        """
         self.logger = logger
+        self.log_buffer = log_buffer
+        self.retry_count = retry_count
 
     def _get_result(self, success: bool, message: str = "", **kwargs) -> Dict[str, Any]:
         """
@@ -72,6 +268,9 @@ class BaseHandler:
         """
         Log delivery attempt to the database.
 
+        The log goes to the handler's buffer when it has one, otherwise it is
+        upserted straight away.
+
         Args:
             notification: The notification being delivered
             recipient_id: ID of the recipient
@@ -84,29 +283,18 @@ class BaseHandler:
             Created or updated NotificationDeliveryLog
         """
         try:
-            delivery_log, created = NotificationDeliveryLog.objects.get_or_create(
+            buffer = self.log_buffer if self.log_buffer is not None else DeliveryLogBuffer()
+            delivery_log = buffer.add(
                 notification=notification,
-                channel=channel,
                 recipient_id=recipient_id,
-                defaults={
-                    "status": status,
-                    "metadata": metadata or {},
-                },
+                channel=channel,
+                status=status,
+                message=message,
+                metadata=metadata,
+                retry_count=self.retry_count,
             )
-
-            if not created:
-                delivery_log.status = status
-                delivery_log.last_attempt_at = timezone.now()
-                if metadata:
-                    delivery_log.metadata.update(metadata)
-
-            if status == "DELIVERED":
-                delivery_log.delivered_at = timezone.now()
-
-            if message:
-                delivery_log.error_message = message
-
-            delivery_log.save()
+            if buffer is not self.log_buffer:
+                buffer.flush()
             return delivery_log
 
         except Exception as e:
@@ -121,21 +309,34 @@ class InAppHandler(BaseHandler):
     Handler for in-app notifications via WebSocket.
 
     Delivers notifications in real-time using Django Channels for WebSocket
-    communication. Also updates cache for quick access to unread counts.
+    communication. Unread counts are maintained when notifications are created,
+    not on delivery.
     """
 
-    def __init__(self):
-        """Initialize the in-app handler."""
-        super().__init__()
-        self.cache_prefix = "notification:unread:"
-        self.cache_timeout = 3600  # 1 hour
+    def __init__(
+        self,
+        log_buffer: Optional[DeliveryLogBuffer] = None,
+        broadcaster: Optional[WebSocketBroadcaster] = None,
+        retry_count: int = 0,
+    ):
+        """
+        Initialize the in-app handler.
+
+        Args:
+            log_buffer: Buffer collecting delivery logs, flushed by the caller
+            broadcaster: Broadcaster collecting payloads, flushed by the
+                caller; each notification is broadcast on its own when omitted
+            retry_count: Attempts made before this one
+        """
+        super().__init__(log_buffer, retry_count)
+        self.broadcaster = broadcaster
 
     def deliver(self, notification: Notification, recipient_id: str) -> Dict[str, Any]:
         """
         Deliver an in-app notification.
 
         This method broadcasts the notification via WebSocket to the recipient's
-        user channel and updates the cache for unread count tracking.
+        user channel.
 
         Args:
             notification: The notification to deliver
@@ -169,10 +370,10 @@ class InAppHandler(BaseHandler):
             }
 
             # Broadcast via WebSocket
-            self.broadcast_via_websocket(recipient_id, notification_data)
-
-            # Update cache for unread count
-            self.update_cache(recipient_id)
+            if self.broadcaster is not None:
+                self.broadcaster.add(recipient_id, notification_data)
+            else:
+                self.broadcast_via_websocket(recipient_id, notification_data)
 
             # Log delivery
             self._log_delivery(
@@ -201,79 +402,23 @@ class InAppHandler(BaseHandler):
         Broadcast notification via WebSocket to user's channel.
 
         This method uses Django Channels to send the notification to the
-        recipient's personal channel (e.g., 'user_123').
+        recipient's notification group (e.g., 'notifications_123').
 
         Args:
             recipient_id: ID of the recipient user
             notification_data: Notification data to broadcast
 
         Raises:
-            ImportError: If channels is not installed
             Exception: If broadcast fails
         """
+        broadcaster = WebSocketBroadcaster()
+        broadcaster.add(recipient_id, notification_data)
         try:
-            from channels.layers import get_channel_layer
-            from asgiref.sync import async_to_sync
-
-            channel_layer = get_channel_layer()
-            if channel_layer is None:
-                self.logger.warning(
-                    "Channel layer not configured, skipping WebSocket broadcast"
-                )
-                return
-
-            # Send to user's personal channel
-            channel_name = f"user_{recipient_id}"
-            async_to_sync(channel_layer.group_send)(
-                channel_name,
-                {
-                    "type": "notification_message",
-                    "notification": notification_data,
-                },
-            )
-
-            self.logger.debug(f"Notification broadcasted to channel {channel_name}")
-
-        except ImportError:
-            self.logger.warning(
-                "Django Channels not installed, skipping WebSocket broadcast"
-            )
+            broadcaster.flush()
         except Exception as e:
             self.logger.error(f"Error broadcasting via WebSocket: {e}")
             raise
 
-    def update_cache(self, recipient_id: str) -> None:
-        """
-        Update cache with unread notification count.
-
-        Increments the cached unread count for the recipient. This provides
-        fast access to unread counts without querying the database.
-
-        Args:
-            recipient_id: ID of the recipient user
-        """
-        try:
-            cache_key = f"{self.cache_prefix}{recipient_id}"
-
-            # Get current count or query database
-            current_count = cache.get(cache_key)
-            if current_count is None:
-                # Query database for unread count
-                current_count = Notification.objects.filter(
-                    recipient_id=recipient_id, is_read=False
-                ).count()
-
-            # Increment count
-            new_count = current_count + 1
-            cache.set(cache_key, new_count, self.cache_timeout)
-
-            self.logger.debug(
-                f"Updated unread count cache for user {recipient_id}: {new_count}"
-            )
-
-        except Exception as e:
-            self.logger.error(f"Error updating cache for user {recipient_id}: {e}")
-
 
 class EmailHandler(BaseHandler):
     """
@@ -283,9 +428,23 @@ class EmailHandler(BaseHandler):
     rendering for email content. Tracks delivery status and handles bounces.
     """
 
-    def __init__(self):
-        """Initialize the email handler."""
-        super().__init__()
+    def __init__(
+        self,
+        log_buffer: Optional[DeliveryLogBuffer] = None,
+        connection=None,
+        retry_count: int = 0,
+    ):
+        """
+        Initialize the email handler.
+
+        Args:
+            log_buffer: Buffer collecting delivery logs, flushed by the caller
+            connection: Open mail connection reused for every email sent by
+                this handler; a new connection per email when omitted
+            retry_count: Attempts made before this one
+        """
+        super().__init__(log_buffer, retry_count)
+        self.connection = connection
         self.default_from_email = getattr(
             settings, "DEFAULT_FROM_EMAIL", "noreply@example.com"
         )
@@ -319,7 +478,7 @@ class EmailHandler(BaseHandler):
 
         try:
             # Get recipient email
-            recipient_email = self._get_recipient_email(recipient_id)
+            recipient_email = self._get_recipient_email(recipient_id, notification)
             if not recipient_email:
                 return self._get_result(
                     success=False, message="Recipient email not found"
@@ -355,16 +514,28 @@ class EmailHandler(BaseHandler):
             self.logger.exception(f"Error delivering email notification: {e}")
             return self._get_result(success=False, message=str(e))
 
-    def _get_recipient_email(self, recipient_id: str) -> Optional[str]:
+    def _get_recipient_email(
+        self, recipient_id: str, notification: Optional[Notification] = None
+    ) -> Optional[str]:
         """
         Get recipient's email address.
 
+        The notification's recipient profile is used when it is the same
+        recipient, so batches loaded with ``select_related("recipient__user")``
+        need no query per email.
+
         Args:
             recipient_id: ID of the recipient user
+            notification: The notification being delivered
 
         Returns:
             Email address or None if not found
         """
+        if notification is not None and str(notification.recipient_id) == str(recipient_id):
+            user = notification.recipient.user
+            if user is not None:
+                return user.email
+
         try:
             from django.contrib.auth import get_user_model
 
@@ -462,6 +633,7 @@ class EmailHandler(BaseHandler):
             from_email=self.default_from_email,
             to=[to_email],
             reply_to=[self.reply_to_email] if self.reply_to_email else None,
+            connection=self.connection,
         )
 
         # Attach HTML version
@@ -509,9 +681,11 @@ class PushHandler(BaseHandler):
     token management and tracks delivery status.
     """
 
-    def __init__(self):
+    def __init__(
+        self, log_buffer: Optional[DeliveryLogBuffer] = None, retry_count: int = 0
+    ):
         """Initialize the push handler."""
-        super().__init__()
+        super().__init__(log_buffer, retry_count)
         self.fcm_api_key = getattr(settings, "FCM_API_KEY", None)
         self.fcm_endpoint = getattr(
             settings, "FCM_ENDPOINT", "https://fcm.googleapis.com/fcm/send"
@@ -793,9 +967,11 @@ class SMSHandler(BaseHandler):
     and handles rate limiting.
     """
 
-    def __init__(self):
+    def __init__(
+        self, log_buffer: Optional[DeliveryLogBuffer] = None, retry_count: int = 0
+    ):
         """Initialize the SMS handler."""
-        super().__init__()
+        super().__init__(log_buffer, retry_count)
         self.twilio_account_sid = getattr(settings, "TWILIO_ACCOUNT_SID", None)
         self.twilio_auth_token = getattr(settings, "TWILIO_AUTH_TOKEN", None)
         self.twilio_phone_number = getattr(settings, "TWILIO_PHONE_NUMBER", None)
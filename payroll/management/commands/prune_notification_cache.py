@@ -0,0 +1,87 @@
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError
+
+from payroll.services.notification_service import NotificationCacheService
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete notification cache entries left behind in old namespace versions. "
+        "Walks the keyspace with SCAN, so Redis keeps serving other clients."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Delete every namespaced notification entry, not only stale ones.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Keys requested per SCAN call and deleted per round trip.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Count the entries that would be deleted without deleting them.",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            from django_redis import get_redis_connection
+
+            redis = get_redis_connection("default")
+        except (ImportError, NotImplementedError):
+            raise CommandError("The default cache is not Redis; nothing to scan.")
+
+        batch_size = options["batch_size"]
+        delete_all = options["all"]
+        dry_run = options["dry_run"]
+
+        prefix = cache.make_key(f"{NotificationCacheService.CACHE_PREFIX}:")
+        scanned = deleted = 0
+        batch = []
+        for key in redis.scan_iter(match=f"{prefix}*", count=batch_size):
+            scanned += 1
+            parsed = self._parse(key.decode() if isinstance(key, bytes) else key, prefix)
+            if parsed is not None:
+                batch.append((key, *parsed))
+            if len(batch) >= batch_size:
+                deleted += self._prune(redis, batch, delete_all, dry_run)
+                batch = []
+        if batch:
+            deleted += self._prune(redis, batch, delete_all, dry_run)
+
+        verb = "Would delete" if dry_run else "Deleted"
+        self.stdout.write(
+            self.style.SUCCESS(f"{verb} {deleted} of {scanned} notification cache key(s).")
+        )
+
+    @staticmethod
+    def _parse(key, prefix):
+        """Return ``(recipient_id, version)`` for a namespaced entry, else None."""
+        parts = key[len(prefix):].split(":")
+        if len(parts) < 3 or not parts[1].startswith("v") or not parts[1][1:].isdigit():
+            return None
+        return parts[0], int(parts[1][1:])
+
+    def _prune(self, redis, batch, delete_all, dry_run):
+        if delete_all:
+            stale = [key for key, _, _ in batch]
+        else:
+            service = NotificationCacheService()
+            recipient_ids = sorted({recipient_id for _, recipient_id, _ in batch})
+            values = redis.mget(
+                [cache.make_key(service.get_version_key(recipient_id)) for recipient_id in recipient_ids]
+            )
+            current = {
+                recipient_id: int(value or 0) for recipient_id, value in zip(recipient_ids, values)
+            }
+            stale = [
+                key for key, recipient_id, version in batch if version != current[recipient_id]
+            ]
+        if stale and not dry_run:
+            redis.delete(*stale)
+        return len(stale)
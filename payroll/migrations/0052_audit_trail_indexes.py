@@ -0,0 +1,32 @@
+# Generated by Django 5.2.18 on 2026-10-18 21:10
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('payroll', '0051_leave_allowance_email_job'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='audittrail',
+            index=models.Index(fields=['-timestamp'], name='payroll_aud_timesta_9dd193_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='audittrail',
+            index=models.Index(fields=['user', '-timestamp'], name='payroll_aud_user_id_87a3aa_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='audittrail',
+            index=models.Index(fields=['action', '-timestamp'], name='payroll_aud_action_84182a_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='audittrail',
+            index=models.Index(fields=['content_type', 'object_id'], name='payroll_aud_content_4f78d5_idx'),
+        ),
+    ]
@@ -0,0 +1,76 @@
+# Generated by Django 5.2.18 on 2026-10-18 21:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("payroll", "0052_audit_trail_indexes"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="notification",
+            name="notification_type",
+            field=models.CharField(
+                choices=[
+                    ("LEAVE_APPROVED", "Leave Approved"),
+                    ("LEAVE_REJECTED", "Leave Rejected"),
+                    ("LEAVE_PENDING", "Leave Pending"),
+                    ("LEAVE_CANCELLED", "Leave Cancelled"),
+                    ("LEAVE_REMINDER", "Leave Reminder"),
+                    ("IOU_APPROVED", "IOU Approved"),
+                    ("IOU_REJECTED", "IOU Rejected"),
+                    ("IOU_PENDING", "IOU Pending"),
+                    ("IOU_DUE", "IOU Payment Due"),
+                    ("PAYSLIP_AVAILABLE", "Payslip Available"),
+                    ("PAYROLL_PROCESSED", "Payroll Processed"),
+                    ("PAYROLL_FAILED", "Payroll Processing Failed"),
+                    ("SALARY_DISBURSED", "Salary Disbursed"),
+                    ("APPRAISAL_ASSIGNED", "Appraisal Assigned"),
+                    ("APPRAISAL_COMPLETED", "Appraisal Completed"),
+                    ("APPRAISAL_REMINDER", "Appraisal Reminder"),
+                    ("PROFILE_UPDATED", "Profile Updated"),
+                    ("PASSWORD_CHANGED", "Password Changed"),
+                    ("LOW_STOCK", "Low Stock"),
+                    ("INFO", "Information"),
+                    ("WARNING", "Warning"),
+                    ("ERROR", "Error"),
+                ],
+                db_index=True,
+                max_length=50,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="notificationtypepreference",
+            name="notification_type",
+            field=models.CharField(
+                choices=[
+                    ("LEAVE_APPROVED", "Leave Approved"),
+                    ("LEAVE_REJECTED", "Leave Rejected"),
+                    ("LEAVE_PENDING", "Leave Pending"),
+                    ("LEAVE_CANCELLED", "Leave Cancelled"),
+                    ("LEAVE_REMINDER", "Leave Reminder"),
+                    ("IOU_APPROVED", "IOU Approved"),
+                    ("IOU_REJECTED", "IOU Rejected"),
+                    ("IOU_PENDING", "IOU Pending"),
+                    ("IOU_DUE", "IOU Payment Due"),
+                    ("PAYSLIP_AVAILABLE", "Payslip Available"),
+                    ("PAYROLL_PROCESSED", "Payroll Processed"),
+                    ("PAYROLL_FAILED", "Payroll Processing Failed"),
+                    ("SALARY_DISBURSED", "Salary Disbursed"),
+                    ("APPRAISAL_ASSIGNED", "Appraisal Assigned"),
+                    ("APPRAISAL_COMPLETED", "Appraisal Completed"),
+                    ("APPRAISAL_REMINDER", "Appraisal Reminder"),
+                    ("PROFILE_UPDATED", "Profile Updated"),
+                    ("PASSWORD_CHANGED", "Password Changed"),
+                    ("LOW_STOCK", "Low Stock"),
+                    ("INFO", "Information"),
+                    ("WARNING", "Warning"),
+                    ("ERROR", "Error"),
+                ],
+                max_length=50,
+            ),
+        ),
+    ]
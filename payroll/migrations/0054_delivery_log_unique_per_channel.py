@@ -0,0 +1,55 @@
+# Generated by Django 5.2.18 on 2026-10-18 22:38
+
+from django.db import migrations, models
+from django.db.models import Case, Count, IntegerField, Value, When
+
+
+def remove_duplicate_delivery_logs(apps, schema_editor):
+    NotificationDeliveryLog = apps.get_model("payroll", "NotificationDeliveryLog")
+
+    duplicates = (
+        NotificationDeliveryLog.objects.values("notification_id", "channel", "recipient_id")
+        .annotate(rows=Count("id"))
+        .filter(rows__gt=1)
+    )
+    for group in duplicates.iterator():
+        # Keep a delivered row if there is one, otherwise the latest attempt.
+        ids = list(
+            NotificationDeliveryLog.objects.filter(
+                notification_id=group["notification_id"],
+                channel=group["channel"],
+                recipient_id=group["recipient_id"],
+            )
+            .annotate(
+                delivered=Case(
+                    When(status="DELIVERED", then=Value(1)),
+                    default=Value(0),
+                    output_field=IntegerField(),
+                )
+            )
+            .order_by("-delivered", "-queued_at")
+            .values_list("id", flat=True)
+        )
+        NotificationDeliveryLog.objects.filter(id__in=ids[1:]).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("payroll", "0053_low_stock_notification_type"),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_duplicate_delivery_logs, migrations.RunPython.noop),
+        migrations.RemoveIndex(
+            model_name="notificationdeliverylog",
+            name="payroll_not_notific_7114b5_idx",
+        ),
+        migrations.AddConstraint(
+            model_name="notificationdeliverylog",
+            constraint=models.UniqueConstraint(
+                fields=("notification", "channel", "recipient"),
+                name="unique_delivery_log_per_channel",
+            ),
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 5.2.18 on 2026-10-18 22:45
+
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("payroll", "0054_delivery_log_unique_per_channel"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="NotificationArchiveRun",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("cutoff", models.DateTimeField()),
+                ("last_created_at", models.DateTimeField(blank=True, null=True)),
+                ("last_notification_id", models.UUIDField(blank=True, null=True)),
+                ("archived_count", models.IntegerField(default=0)),
+                ("started_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "finished_at",
+                    models.DateTimeField(blank=True, db_index=True, null=True),
+                ),
+            ],
+            options={
+                "verbose_name": "Notification Archive Run",
+                "verbose_name_plural": "Notification Archive Runs",
+                "ordering": ["-started_at"],
+            },
+        ),
+    ]
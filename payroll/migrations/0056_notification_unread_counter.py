@@ -0,0 +1,35 @@
+# Generated by Django 5.2.18 on 2026-10-18 22:54
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("payroll", "0055_notification_archive_run"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="NotificationUnreadCounter",
+            fields=[
+                (
+                    "employee",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="notification_unread_counter",
+                        serialize=False,
+                        to="payroll.employeeprofile",
+                    ),
+                ),
+                ("unread_count", models.IntegerField(default=0)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "verbose_name": "Notification Unread Counter",
+                "verbose_name_plural": "Notification Unread Counters",
+            },
+        ),
+    ]
@@ -0,0 +1,71 @@
+# Generated by Django 5.2.18 on 2026-10-18 23:03
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("payroll", "0056_notification_unread_counter"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="NotificationAggregationBucket",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("aggregation_key", models.CharField(max_length=255)),
+                ("window_start", models.DateTimeField(db_index=True)),
+                ("notification_count", models.IntegerField(default=0)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "aggregated_notification",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to="payroll.notification",
+                    ),
+                ),
+                (
+                    "first_notification",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to="payroll.notification",
+                    ),
+                ),
+                (
+                    "recipient",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="notification_aggregation_buckets",
+                        to="payroll.employeeprofile",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Notification Aggregation Bucket",
+                "verbose_name_plural": "Notification Aggregation Buckets",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("recipient", "aggregation_key", "window_start"),
+                        name="unique_aggregation_bucket",
+                    )
+                ],
+            },
+        ),
+    ]
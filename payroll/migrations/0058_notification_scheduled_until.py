@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 23:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("payroll", "0057_notification_aggregation_bucket"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="notification",
+            name="scheduled_until",
+            field=models.DateTimeField(blank=True, db_index=True, null=True),
+        ),
+    ]
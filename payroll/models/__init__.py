@@ -31,6 +31,9 @@ from .notification import (
     NotificationTypePreference,
     NotificationDeliveryLog,
     ArchivedNotification,
+    NotificationArchiveRun,
+    NotificationUnreadCounter,
+    NotificationAggregationBucket,
     NotificationTemplate,
     NotificationChannel,
     DeliveryStatus,
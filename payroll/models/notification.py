@@ -2,9 +2,10 @@ from django.db import models
 from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
-from django.core.cache import cache
 from django.utils import timezone
 import uuid
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
 
 from payroll.models.employee_profile import EmployeeProfile
 
@@ -58,6 +59,8 @@ class NotificationType(models.TextChoices):
     # Profile Notifications
     PROFILE_UPDATED = "PROFILE_UPDATED", "Profile Updated"
     PASSWORD_CHANGED = "PASSWORD_CHANGED", "Password Changed"
+    # Inventory Notifications
+    LOW_STOCK = "LOW_STOCK", "Low Stock"
     # System Notifications
     INFO = "INFO", "Information"
     WARNING = "WARNING", "Warning"
@@ -103,6 +106,8 @@ class Notification(models.Model):
         # Profile Notifications
         ("PROFILE_UPDATED", "Profile Updated"),
         ("PASSWORD_CHANGED", "Password Changed"),
+        # Inventory Notifications
+        ("LOW_STOCK", "Low Stock"),
         # System Notifications
         ("INFO", "Information"),
         ("WARNING", "Warning"),
@@ -142,6 +147,9 @@ class Notification(models.Model):
     #   "sms": {"status": "PENDING"}
     # }
 
+    # End of quiet hours for channels held as SCHEDULED in delivery_status
+    scheduled_until = models.DateTimeField(null=True, blank=True, db_index=True)
+
     # Aggregation
     is_aggregated = models.BooleanField(default=False)
     aggregated_with = models.ManyToManyField(
@@ -245,6 +253,12 @@ class Notification(models.Model):
     def __str__(self):
         return f"{self.recipient} - {self.title}"
 
+    def save(self, *args, **kwargs):
+        adding = self._state.adding
+        super().save(*args, **kwargs)
+        if adding and not self.is_read and not self.is_deleted:
+            self._adjust_unread_count(1)
+
     def mark_as_read(self):
         """
         Mark notification as read and update cache.
@@ -253,15 +267,20 @@ class Notification(models.Model):
             self.is_read = True
             self.read_at = timezone.now()
             self.save(update_fields=["is_read", "read_at"])
+            if not self.is_deleted:
+                self._adjust_unread_count(-1)
             self._invalidate_cache()
 
     def mark_as_unread(self):
         """
         Mark notification as unread and update cache.
         """
+        was_read = self.is_read
         self.is_read = False
         self.read_at = None
         self.save(update_fields=["is_read", "read_at"])
+        if was_read and not self.is_deleted:
+            self._adjust_unread_count(1)
         self._invalidate_cache()
 
     def mark_as_delivered(self, channel="in_app"):
@@ -277,9 +296,12 @@ class Notification(models.Model):
         """
         Soft delete notification without removing from database.
         """
+        was_unread = not self.is_read and not self.is_deleted
         self.is_deleted = True
         self.deleted_at = timezone.now()
         self.save(update_fields=["is_deleted", "deleted_at"])
+        if was_unread:
+            self._adjust_unread_count(-1)
         self._invalidate_cache()
 
     def update_delivery_status(self, channel, status, **metadata):
@@ -316,12 +338,17 @@ class Notification(models.Model):
         """
         Invalidate related cache entries.
         """
-        cache_key_patterns = [
-            f"notifications:{self.recipient.id}:unread_count",
-            f"notifications:{self.recipient.id}:recent",
-        ]
-        for pattern in cache_key_patterns:
-            cache.delete(pattern)
+        from payroll.services.notification_service import NotificationCacheService
+
+        NotificationCacheService().invalidate_user_cache(str(self.recipient_id))
+
+    def _adjust_unread_count(self, delta):
+        """
+        Move the recipient's unread counter by ``delta``.
+        """
+        from payroll.services.notification_service import UnreadCountService
+
+        UnreadCountService().adjust({str(self.recipient_id): delta})
 
     @property
     def icon_class(self):
@@ -462,7 +489,24 @@ class NotificationPreference(models.Model):
     def __str__(self):
         return f"Preferences for {self.employee}"
 
-    def should_send(self, notification_type, channel, priority):
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        self._invalidate_cache()
+
+    def delete(self, *args, **kwargs):
+        result = super().delete(*args, **kwargs)
+        self._invalidate_cache()
+        return result
+
+    def _invalidate_cache(self):
+        """
+        Drop cached copies of these preferences.
+        """
+        from payroll.services.notification_service import PreferenceService
+
+        PreferenceService.invalidate_cached_preferences(self.employee_id)
+
+    def should_send(self, notification_type, channel, priority, ignore_quiet_hours=False):
         """
         Determine if a notification should be sent via a specific channel.
 
@@ -470,6 +514,8 @@ class NotificationPreference(models.Model):
             notification_type: str - Type of notification
             channel: str - Channel name (in_app, email, push, sms)
             priority: str - Priority level (CRITICAL, HIGH, MEDIUM, LOW)
+            ignore_quiet_hours: bool - Skip the quiet hours check, for callers
+                that defer delivery instead of dropping it
 
         Returns:
             bool - True if should send, False otherwise
@@ -496,18 +542,45 @@ class NotificationPreference(models.Model):
                 return False
 
         # Check quiet hours
-        if self.quiet_hours_enabled and self.quiet_hours_start and self.quiet_hours_end:
-            from pytz import timezone as tz
+        if not ignore_quiet_hours and self.quiet_hours_until() is not None:
+            # Only allow critical notifications during quiet hours
+            if priority != "CRITICAL":
+                return False
 
-            user_tz = tz(self.quiet_hours_timezone)
-            current_time = timezone.now().astimezone(user_tz).time()
+        return True
 
-            if self.quiet_hours_start <= current_time <= self.quiet_hours_end:
-                # Only allow critical notifications during quiet hours
-                if priority != "CRITICAL":
-                    return False
+    def quiet_hours_until(self, now=None):
+        """
+        Get when the current quiet hours end.
 
-        return True
+        Windows that cross midnight, such as 22:00 to 07:00, are supported.
+
+        Args:
+            now: datetime - Time to check, defaults to the current time
+
+        Returns:
+            datetime - End of the current quiet hours, or None outside them
+        """
+        if not (self.quiet_hours_enabled and self.quiet_hours_start and self.quiet_hours_end):
+            return None
+
+        user_tz = ZoneInfo(self.quiet_hours_timezone)
+        local_now = (now or timezone.now()).astimezone(user_tz)
+        current_time = local_now.time()
+        start, end = self.quiet_hours_start, self.quiet_hours_end
+
+        if start <= end:
+            if not start <= current_time <= end:
+                return None
+            end_date = local_now.date()
+        else:
+            if end < current_time < start:
+                return None
+            end_date = local_now.date()
+            if current_time > end:
+                end_date += timedelta(days=1)
+
+        return datetime.combine(end_date, end, tzinfo=user_tz)
 
     def get_digest_frequency(self, channel):
         """
@@ -671,8 +744,13 @@ class NotificationDeliveryLog(models.Model):
 
     class Meta:
         ordering = ["-queued_at"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["notification", "channel", "recipient"],
+                name="unique_delivery_log_per_channel",
+            ),
+        ]
         indexes = [
-            models.Index(fields=["notification", "channel"]),
             models.Index(fields=["status", "queued_at"]),
             models.Index(fields=["recipient", "queued_at"]),
             models.Index(fields=["channel", "status"]),
@@ -775,6 +853,116 @@ class ArchivedNotification(models.Model):
         return f"Archived: {self.recipient} - {self.title}"
 
 
+class NotificationUnreadCounter(models.Model):
+    """
+    Unread notification count per recipient.
+
+    Adjusted by delta whenever a notification is created, read, unread or
+    deleted, alongside the cached counter at
+    ``notifications:<employee>:unread_count``. Readers fall back to this row
+    when the cached counter is missing, and the periodic reconciler repairs
+    any drift from the notifications table.
+    """
+
+    employee = models.OneToOneField(
+        EmployeeProfile,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="notification_unread_counter",
+    )
+    unread_count = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Notification Unread Counter"
+        verbose_name_plural = "Notification Unread Counters"
+
+    def __str__(self):
+        return f"{self.employee} - {self.unread_count} unread"
+
+
+class NotificationArchiveRun(models.Model):
+    """
+    Progress of one archival pass over notifications older than ``cutoff``.
+
+    The cursor is the ``(created_at, id)`` of the last archived row. A run
+    that stops before ``finished_at`` is set is picked up again by the next
+    archival job from its cursor.
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    cutoff = models.DateTimeField()
+
+    last_created_at = models.DateTimeField(null=True, blank=True)
+    last_notification_id = models.UUIDField(null=True, blank=True)
+    archived_count = models.IntegerField(default=0)
+
+    started_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    finished_at = models.DateTimeField(null=True, blank=True, db_index=True)
+
+    class Meta:
+        ordering = ["-started_at"]
+        verbose_name = "Notification Archive Run"
+        verbose_name_plural = "Notification Archive Runs"
+
+    def __str__(self):
+        state = "finished" if self.finished_at else "in progress"
+        return f"Archive before {self.cutoff:%Y-%m-%d} ({state}, {self.archived_count} rows)"
+
+
+class NotificationAggregationBucket(models.Model):
+    """
+    Count of aggregatable notifications per recipient, key and time window.
+
+    Each new notification of an aggregatable type increments its bucket in
+    place. The first one in a window is delivered on its own; from the second
+    on they are absorbed into ``aggregated_notification``, which is kept in
+    step with the bucket instead of being rebuilt from a search of recent
+    notifications.
+    """
+
+    recipient = models.ForeignKey(
+        EmployeeProfile,
+        on_delete=models.CASCADE,
+        related_name="notification_aggregation_buckets",
+    )
+    aggregation_key = models.CharField(max_length=255)
+    window_start = models.DateTimeField(db_index=True)
+    notification_count = models.IntegerField(default=0)
+
+    first_notification = models.ForeignKey(
+        Notification,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+",
+    )
+    aggregated_notification = models.ForeignKey(
+        Notification,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+",
+    )
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Notification Aggregation Bucket"
+        verbose_name_plural = "Notification Aggregation Buckets"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["recipient", "aggregation_key", "window_start"],
+                name="unique_aggregation_bucket",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.aggregation_key} from {self.window_start:%Y-%m-%d %H:%M} ({self.notification_count})"
+
+
 class NotificationTemplate(models.Model):
     """
     Templates for notification messages with support for multiple languages and channels.
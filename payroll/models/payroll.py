@@ -23,6 +23,7 @@ logger = logging.getLogger(__name__)
 from payroll import utils
 from payroll import choices
 
+from accounting.tracking import FieldTrackerMixin, ensure_field_snapshot
 from monthyear.models import MonthField
 from payroll.models.employee_profile import EmployeeProfile
 from payroll.models.utils import SoftDeleteModel
@@ -761,7 +762,7 @@ class PayManager(models.Manager):
         return super().get_queryset().filter(is_active=True)
 
 
-class PayrollRun(models.Model):
+class PayrollRun(FieldTrackerMixin, models.Model):
     company = models.ForeignKey(
         "company.Company",
         on_delete=models.CASCADE,
@@ -809,6 +810,16 @@ class PayrollRun(models.Model):
 
         return utils.convert_month_to_word(str(self.paydays))
 
+    def is_being_closed(self, update_fields=None):
+        """Return True when the pending save flips ``closed`` from False to True."""
+        if not self.pk or not self.closed:
+            return False
+        if update_fields is not None and "closed" not in update_fields:
+            return False
+        if not ensure_field_snapshot(self):
+            return False
+        return not self.get_loaded_value("closed")
+
     def save(self, *args, **kwargs):
         from django.utils.text import slugify
 
@@ -61,6 +61,14 @@ class AuditTrail(models.Model):
         help_text="Stores a dictionary of changes (old_value, new_value)",
     )
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["-timestamp"]),
+            models.Index(fields=["user", "-timestamp"]),
+            models.Index(fields=["action", "-timestamp"]),
+            models.Index(fields=["content_type", "object_id"]),
+        ]
+
     def __str__(self):
         return f"{self.user} performed {self.action} on {self.content_object}"
 
@@ -383,7 +383,9 @@ def _dispatch_payroll_processed_event(payroll):
     in this payroll, and notifies HR that payroll is processed.
     """
     # Get all employees who have payslips in this payroll
-    payday_records = PayrollRunEntry.objects.filter(payroll_run=payroll)
+    payday_records = PayrollRunEntry.objects.filter(
+        payroll_run=payroll
+    ).select_related("payroll_entry__pays")
 
     # Create event
     event = PayrollEvent(
@@ -399,46 +401,47 @@ def _dispatch_payroll_processed_event(payroll):
 
     # Create notifications using service
     service = NotificationService()
-
-    # Notify employees
+    action_url = _safe_reverse("payroll:pay_period_detail", args=[payroll.slug])
+
+    # Notify employees in one bulk send
+    payday_records = list(payday_records)
+    service.send_notifications(
+        [
+            {
+                "recipient": payday.payroll_entry.pays,
+                "notification_type": "PAYSLIP_AVAILABLE",
+                "title": "Payslip Available",
+                "message": (
+                    f"Your payslip for {payroll.paydays} is now available. "
+                    f"Net pay: ₦{payday.payroll_entry.netpay:,.2f}"
+                ),
+                "payroll": payroll,
+                "action_url": action_url,
+                "priority": "HIGH",
+            }
+            for payday in payday_records
+        ]
+    )
     for payday in payday_records:
-        employee = payday.payroll_entry.pays
-        service.send_notification(
-            recipient=employee,
-            notification_type="PAYSLIP_AVAILABLE",
-            title="Payslip Available",
-            message=(
-                f"Your payslip for {payroll.paydays} is now available. "
-                f"Net pay: ₦{payday.payroll_entry.netpay:,.2f}"
-            ),
-            payroll=payroll,
-            action_url=_safe_reverse("payroll:pay_period_detail", args=[payroll.slug]),
-            priority="HIGH",
-        )
         _send_salary_created_email(payroll, payday)
 
     # Notify HR
-    hr_users = User.objects.filter(
-        user_permissions__codename="view_employeeprofile"
+    hr_profiles = EmployeeProfile.objects.filter(
+        user__user_permissions__codename="view_employeeprofile"
     ).distinct()
 
-    for user in hr_users:
-        try:
-            employee_profile = user.employee_user
-            service.send_notification(
-                recipient=employee_profile,
-                notification_type="PAYROLL_PROCESSED",
-                title="Payroll Processed",
-                message=(
-                    f"Payroll for {payroll.paydays} has been processed "
-                    f"for {payday_records.count()} employees."
-                ),
-                payroll=payroll,
-                action_url=_safe_reverse("payroll:pay_period_detail", args=[payroll.slug]),
-                priority="MEDIUM",
-            )
-        except EmployeeProfile.DoesNotExist:
-            continue
+    service.send_bulk_notification(
+        recipients=list(hr_profiles),
+        notification_type="PAYROLL_PROCESSED",
+        title="Payroll Processed",
+        message=(
+            f"Payroll for {payroll.paydays} has been processed "
+            f"for {len(payday_records)} employees."
+        ),
+        payroll=payroll,
+        action_url=action_url,
+        priority="MEDIUM",
+    )
 
 
 @receiver(post_save, sender=AppraisalAssignment)
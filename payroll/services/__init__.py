@@ -9,8 +9,10 @@ Services:
 - EventDispatcher: Dispatches notification events to appropriate handlers
 - AggregationService: Aggregates similar notifications to reduce fatigue
 - DigestService: Creates daily and weekly notification digests
+- ArchiveService: Moves old notifications into the archive table
 - PreferenceService: Manages user notification preferences
 - NotificationCacheService: Handles caching of notification data
+- UnreadCountService: Maintains per-user unread notification counters
 
 Usage:
     from payroll.services import (
@@ -65,8 +67,10 @@ from payroll.services.notification_service import (
     EventDispatcher,
     AggregationService,
     DigestService,
+    ArchiveService,
     PreferenceService,
     NotificationCacheService,
+    UnreadCountService,
 )
 
 __all__ = [
@@ -74,6 +78,8 @@ __all__ = [
     "EventDispatcher",
     "AggregationService",
     "DigestService",
+    "ArchiveService",
     "PreferenceService",
     "NotificationCacheService",
+    "UnreadCountService",
 ]
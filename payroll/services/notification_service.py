@@ -14,15 +14,27 @@ Based on the architecture design in plans/NOTIFICATION_SYSTEM_ARCHITECTURE.md
 """
 
 import logging
-from typing import List, Dict, Optional, Any, Tuple
-from datetime import timedelta
+import threading
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, fields
+from itertools import groupby
+from operator import itemgetter
+from time import monotonic
+from types import MappingProxyType
+from typing import List, Dict, Optional, Any, Tuple, Mapping
+from datetime import time, timedelta
 from django.core.cache import cache
 from django.utils import timezone
-from django.db.models import Q, Count
+from django.db import IntegrityError, transaction
+from django.db.models import Q, Count, F
 from django.conf import settings
 
 from payroll.models.notification import (
+    ArchivedNotification,
     Notification,
+    NotificationAggregationBucket,
+    NotificationArchiveRun,
+    NotificationUnreadCounter,
     NotificationPreference,
     NotificationDeliveryLog,
     NotificationTemplate,
@@ -38,11 +50,24 @@ class NotificationCacheService:
 
     Provides methods for caching notifications, unread counts, and preferences
     to reduce database load and improve performance.
+
+    Notification lists live in a per-recipient namespace,
+    ``notifications:<recipient>:v<version>:...``. Invalidating a recipient
+    increments their version counter, so older entries are never read again
+    and expire through their TTL instead of being looked up and deleted.
     """
 
     CACHE_PREFIX = "notifications"
     DEFAULT_TIMEOUT = 300  # 5 minutes
 
+    # INCRBY that leaves a missing key missing instead of starting it at 0
+    INCR_IF_EXISTS_SCRIPT = """
+        if redis.call("EXISTS", KEYS[1]) == 1 then
+            return redis.call("INCRBY", KEYS[1], ARGV[1])
+        end
+        return nil
+    """
+
     def __init__(self):
         """Initialize the cache service."""
         self.prefix = self.CACHE_PREFIX
@@ -59,6 +84,53 @@ class NotificationCacheService:
         """
         return f"{self.prefix}:{':'.join(str(p) for p in parts)}"
 
+    def get_version_key(self, recipient_id: str) -> str:
+        """Key of the counter holding a recipient's namespace version."""
+        return self._get_cache_key(recipient_id, "version")
+
+    def _get_namespaced_key(self, recipient_id: str, *parts: str) -> str:
+        """
+        Generate a cache key inside the recipient's current namespace.
+
+        Args:
+            recipient_id: UUID of the recipient
+            *parts: Strings identifying the entry within the namespace
+
+        Returns:
+            str - Generated cache key
+        """
+        version = cache.get(self.get_version_key(recipient_id)) or 0
+        return self._get_cache_key(recipient_id, f"v{version}", *parts)
+
+    def _bump_versions(self, recipient_ids: List[str]) -> None:
+        """
+        Increment the namespace version of each recipient.
+
+        On Redis the INCRs go out in one pipeline; other backends fall back
+        to ``cache.incr`` per recipient.
+        """
+        keys = [self.get_version_key(recipient_id) for recipient_id in recipient_ids]
+        try:
+            from django_redis import get_redis_connection
+
+            redis = get_redis_connection("default")
+        except (ImportError, NotImplementedError):
+            redis = None
+
+        if redis is not None:
+            pipeline = redis.pipeline(transaction=False)
+            for key in keys:
+                pipeline.incr(cache.make_key(key))
+            pipeline.execute()
+            return
+
+        for key in keys:
+            try:
+                cache.incr(key)
+            except ValueError:
+                if not cache.add(key, 1, None):
+                    cache.incr(key)
+
     @staticmethod
     def _normalize_read_status(
         unread_only: bool = False, read_status: Optional[str] = None
@@ -93,7 +165,7 @@ class NotificationCacheService:
             List of Notification objects or None if not cached
         """
         try:
-            cache_key = self._get_cache_key(
+            cache_key = self._get_namespaced_key(
                 recipient_id,
                 self._normalize_read_status(unread_only, read_status),
                 notification_type or "all",
@@ -144,7 +216,7 @@ class NotificationCacheService:
             bool - True if cached successfully, False otherwise
         """
         try:
-            cache_key = self._get_cache_key(
+            cache_key = self._get_namespaced_key(
                 recipient_id,
                 self._normalize_read_status(unread_only, read_status),
                 notification_type or "all",
@@ -217,6 +289,41 @@ class NotificationCacheService:
             logger.error(f"Error caching unread count: {e}")
             return False
 
+    def incr_unread_counts(self, deltas: Mapping[str, int]) -> None:
+        """
+        Add each delta to the recipient's cached unread count, if cached.
+
+        Missing counters are left missing so the next read loads the stored
+        count. On Redis the updates go out in one pipeline.
+
+        Args:
+            deltas: Mapping of recipient UUID to the change in unread count
+        """
+        try:
+            from django_redis import get_redis_connection
+
+            redis = get_redis_connection("default")
+        except (ImportError, NotImplementedError):
+            redis = None
+
+        if redis is not None:
+            incr_if_cached = redis.register_script(self.INCR_IF_EXISTS_SCRIPT)
+            pipeline = redis.pipeline(transaction=False)
+            for recipient_id, delta in deltas.items():
+                incr_if_cached(
+                    keys=[cache.make_key(self._get_cache_key(recipient_id, "unread_count"))],
+                    args=[delta],
+                    client=pipeline,
+                )
+            pipeline.execute()
+            return
+
+        for recipient_id, delta in deltas.items():
+            try:
+                cache.incr(self._get_cache_key(recipient_id, "unread_count"), delta)
+            except ValueError:
+                pass
+
     def get_preferences(self, recipient_id: str) -> Optional[Dict]:
         """
         Get cached notification preferences for a recipient.
@@ -270,52 +377,110 @@ class NotificationCacheService:
             logger.error(f"Error caching preferences: {e}")
             return False
 
+    def get_preferences_many(self, recipient_ids: List[str]) -> Dict[str, Dict]:
+        """
+        Get cached notification preferences for many recipients in one call.
+
+        Args:
+            recipient_ids: UUIDs of the recipients
+
+        Returns:
+            Dictionary mapping recipient id to cached preferences
+        """
+        try:
+            keys = {
+                self._get_cache_key(recipient_id, "preferences"): recipient_id
+                for recipient_id in recipient_ids
+            }
+            return {keys[key]: value for key, value in cache.get_many(list(keys)).items()}
+
+        except Exception as e:
+            logger.error(f"Error getting cached preferences: {e}")
+            return {}
+
+    def set_preferences_many(
+        self, preferences: Dict[str, Dict], timeout: Optional[int] = None
+    ) -> bool:
+        """
+        Cache notification preferences for many recipients in one call.
+
+        Args:
+            preferences: Dictionary mapping recipient id to preferences
+            timeout: Cache timeout in seconds (1 hour if None)
+
+        Returns:
+            bool - True if cached successfully, False otherwise
+        """
+        try:
+            if timeout is None:
+                timeout = 3600  # 1 hour for preferences
+
+            cache.set_many(
+                {
+                    self._get_cache_key(recipient_id, "preferences"): value
+                    for recipient_id, value in preferences.items()
+                },
+                timeout,
+            )
+            return True
+
+        except Exception as e:
+            logger.error(f"Error caching preferences: {e}")
+            return False
+
+    def delete_preferences(self, recipient_id: str) -> bool:
+        """
+        Remove cached notification preferences for a recipient.
+
+        Args:
+            recipient_id: UUID of the recipient
+
+        Returns:
+            bool - True if deleted successfully, False otherwise
+        """
+        return self.delete(self._get_cache_key(recipient_id, "preferences"))
+
     def invalidate_user_cache(self, recipient_id: str) -> bool:
         """
         Invalidate all cache entries for a specific user.
 
+        Moves the user to a new cache namespace. The unread counter is kept;
+        it is adjusted by ``UnreadCountService`` rather than invalidated.
+        Preferences are invalidated separately when they are saved.
+
         Args:
             recipient_id: UUID of the recipient
 
         Returns:
             bool - True if invalidated successfully, False otherwise
         """
-        try:
-            # Try to use Redis pattern deletion if available
-            try:
-                from django_redis import get_redis_connection
+        return self.invalidate_users_cache([recipient_id])
 
-                redis = get_redis_connection("default")
-                pattern = f"{self.prefix}:{recipient_id}:*"
-                keys = redis.keys(pattern)
+    def invalidate_users_cache(self, recipient_ids: List[str]) -> bool:
+        """
+        Invalidate the per-user cache entries for many recipients at once.
 
-                if keys:
-                    redis.delete(*keys)
-                    logger.debug(
-                        f"Invalidated {len(keys)} cache entries for user {recipient_id}"
-                    )
-                    return True
-
-            except Exception:
-                # Fallback to simple key deletion
-                patterns = [
-                    self._get_cache_key(recipient_id, "unread_count"),
-                    self._get_cache_key(recipient_id, "preferences"),
-                    self._get_cache_key(recipient_id, "recent"),
-                ]
+        Costs one pipelined INCR per recipient, however many entries the
+        users have cached.
 
-                for key in patterns:
-                    cache.delete(key)
+        Args:
+            recipient_ids: UUIDs of the recipients
 
-                logger.debug(f"Invalidated cache entries for user {recipient_id}")
-                return True
+        Returns:
+            bool - True if invalidated successfully, False otherwise
+        """
+        if not recipient_ids:
+            return True
+
+        try:
+            self._bump_versions(recipient_ids)
+            logger.debug(f"Invalidated cache entries for {len(recipient_ids)} users")
+            return True
 
         except Exception as e:
-            logger.error(f"Error invalidating user cache: {e}")
+            logger.error(f"Error invalidating user caches: {e}")
             return False
 
-        return False
-
     def delete(self, key: str) -> bool:
         """
         Delete a specific cache entry.
@@ -336,6 +501,293 @@ class NotificationCacheService:
             return False
 
 
+class UnreadCountService:
+    """
+    Service for the per-recipient unread notification counters.
+
+    Each recipient's count is kept in the cache under
+    ``notifications:<recipient>:unread_count`` and in a
+    ``NotificationUnreadCounter`` row. Writers move both by a delta rather
+    than invalidating them, so a read is one cache lookup, falling back to
+    the row. A COUNT only runs for a recipient who has no row yet, and in
+    ``reconcile``, which repairs drift on a schedule.
+    """
+
+    # Cached counters are refilled from the counter row on a miss
+    CACHE_TIMEOUT = 60 * 60 * 24
+
+    # Counter rows checked per grouped COUNT while reconciling
+    RECONCILE_BATCH_SIZE = 1000
+
+    def __init__(self):
+        """Initialize the unread count service."""
+        self.cache_service = NotificationCacheService()
+
+    @staticmethod
+    def _count_unread(recipient_ids: List[Any]) -> Dict[Any, int]:
+        """Count unread notifications of many recipients with one grouped query."""
+        return dict(
+            Notification.objects.filter(
+                recipient_id__in=recipient_ids, is_read=False, is_deleted=False
+            )
+            .order_by()
+            .values("recipient_id")
+            .annotate(unread=Count("id"))
+            .values_list("recipient_id", "unread")
+        )
+
+    def get_count(self, recipient_id: str) -> int:
+        """
+        Get the unread notification count of a recipient.
+
+        Args:
+            recipient_id: UUID of the recipient
+
+        Returns:
+            int - Unread notification count
+        """
+        cached = self.cache_service.get_unread_count(str(recipient_id))
+        if cached is not None:
+            return max(cached, 0)
+
+        count = (
+            NotificationUnreadCounter.objects.filter(employee_id=recipient_id)
+            .values_list("unread_count", flat=True)
+            .first()
+        )
+        if count is None:
+            count = sum(self._count_unread([recipient_id]).values())
+            NotificationUnreadCounter.objects.bulk_create(
+                [NotificationUnreadCounter(employee_id=recipient_id, unread_count=count)],
+                ignore_conflicts=True,
+            )
+
+        count = max(count, 0)
+        self.cache_service.set_unread_count(str(recipient_id), count, self.CACHE_TIMEOUT)
+        return count
+
+    def adjust(self, deltas: Mapping[str, int]) -> None:
+        """
+        Move the unread counters of many recipients.
+
+        Counter rows are updated with one ``F()`` expression per distinct
+        delta, and cached counters with one pipelined increment per
+        recipient. Recipients without a row are skipped; their first read
+        counts them.
+
+        Args:
+            deltas: Mapping of recipient UUID to the change in unread count
+        """
+        deltas = {str(recipient_id): delta for recipient_id, delta in deltas.items() if delta}
+        if not deltas:
+            return
+
+        try:
+            by_delta: Dict[int, List[str]] = {}
+            for recipient_id, delta in deltas.items():
+                by_delta.setdefault(delta, []).append(recipient_id)
+            now = timezone.now()
+            for delta, recipient_ids in by_delta.items():
+                NotificationUnreadCounter.objects.filter(employee_id__in=recipient_ids).update(
+                    unread_count=F("unread_count") + delta, updated_at=now
+                )
+            self.cache_service.incr_unread_counts(deltas)
+
+        except Exception as e:
+            logger.error(f"Error adjusting unread counts: {e}")
+
+    def reset(self, recipient_id: str, count: int = 0) -> None:
+        """
+        Set a recipient's unread counter to a known value.
+
+        Args:
+            recipient_id: UUID of the recipient
+            count: The recipient's unread count
+        """
+        NotificationUnreadCounter.objects.update_or_create(
+            employee_id=recipient_id, defaults={"unread_count": count}
+        )
+        self.cache_service.set_unread_count(str(recipient_id), count, self.CACHE_TIMEOUT)
+
+    def reconcile(self, batch_size: Optional[int] = None) -> int:
+        """
+        Repair counters that drifted from the notifications table.
+
+        Counter rows are walked in primary-key order. Each chunk costs one
+        grouped COUNT; only drifted rows are written, and only if they were
+        not adjusted since they were read. Drifted cached counters are
+        dropped so the next read loads the repaired row.
+
+        Args:
+            batch_size: Counter rows checked per grouped COUNT
+
+        Returns:
+            int - Number of counters repaired
+        """
+        batch_size = batch_size or self.RECONCILE_BATCH_SIZE
+        repaired = 0
+        last_id = None
+        while True:
+            counters = NotificationUnreadCounter.objects.order_by("employee_id")
+            if last_id is not None:
+                counters = counters.filter(employee_id__gt=last_id)
+            stored = dict(counters.values_list("employee_id", "unread_count")[:batch_size])
+            if not stored:
+                return repaired
+            last_id = max(stored)
+
+            actual = self._count_unread(list(stored))
+            cache_keys = {
+                self.cache_service._get_cache_key(str(recipient_id), "unread_count"): recipient_id
+                for recipient_id in stored
+            }
+            cached = cache.get_many(list(cache_keys))
+            stale_keys = [
+                key
+                for key, value in cached.items()
+                if value != actual.get(cache_keys[key], 0)
+            ]
+
+            now = timezone.now()
+            for recipient_id, count in stored.items():
+                expected = actual.get(recipient_id, 0)
+                if count == expected:
+                    continue
+                # Skip the row if a writer moved it since it was read
+                repaired += NotificationUnreadCounter.objects.filter(
+                    employee_id=recipient_id, unread_count=count
+                ).update(unread_count=expected, updated_at=now)
+                stale_keys.append(
+                    self.cache_service._get_cache_key(str(recipient_id), "unread_count")
+                )
+
+            if stale_keys:
+                cache.delete_many(stale_keys)
+
+
+@dataclass(frozen=True, slots=True)
+class PreferenceSnapshot:
+    """
+    Immutable copy of an employee's NotificationPreference.
+
+    Built from the cached preference dict so checks on the delivery path
+    need no database access. The delivery checks are the model's own, so a
+    snapshot answers exactly as the saved preferences would.
+    """
+
+    employee_id: Any
+    notifications_enabled: bool
+    in_app_enabled: bool
+    email_enabled: bool
+    push_enabled: bool
+    sms_enabled: bool
+    in_app_priority_threshold: str
+    email_priority_threshold: str
+    push_priority_threshold: str
+    sms_priority_threshold: str
+    email_digest_frequency: str
+    push_digest_frequency: str
+    quiet_hours_enabled: bool
+    quiet_hours_start: Optional[time]
+    quiet_hours_end: Optional[time]
+    quiet_hours_timezone: str
+    max_notifications_per_hour: int
+    type_preferences: Mapping[str, Mapping[str, bool]]
+
+    should_send = NotificationPreference.should_send
+    quiet_hours_until = NotificationPreference.quiet_hours_until
+    get_digest_frequency = NotificationPreference.get_digest_frequency
+
+    @classmethod
+    def from_instance(cls, preference: NotificationPreference) -> "PreferenceSnapshot":
+        """Build a snapshot from a NotificationPreference instance."""
+        values = {field.name: getattr(preference, field.name) for field in fields(cls)}
+        values["type_preferences"] = cls._freeze(values["type_preferences"])
+        return cls(**values)
+
+    @classmethod
+    def from_cache(cls, data: Dict[str, Any]) -> "PreferenceSnapshot":
+        """Build a snapshot from the dict produced by ``to_cache``."""
+        values = {field.name: data[field.name] for field in fields(cls)}
+        for name in ("quiet_hours_start", "quiet_hours_end"):
+            if values[name]:
+                values[name] = time.fromisoformat(values[name])
+        values["type_preferences"] = cls._freeze(values["type_preferences"])
+        return cls(**values)
+
+    @staticmethod
+    def _freeze(type_preferences: Optional[Dict]) -> Mapping[str, Mapping[str, bool]]:
+        return MappingProxyType(
+            {
+                notification_type: MappingProxyType(dict(channels))
+                for notification_type, channels in (type_preferences or {}).items()
+            }
+        )
+
+    def to_cache(self) -> Dict[str, Any]:
+        """Serialize the snapshot to a plain dict for the shared cache."""
+        data = {field.name: getattr(self, field.name) for field in fields(self)}
+        for name in ("quiet_hours_start", "quiet_hours_end"):
+            if data[name]:
+                data[name] = data[name].isoformat()
+        data["type_preferences"] = {
+            notification_type: dict(channels)
+            for notification_type, channels in self.type_preferences.items()
+        }
+        return data
+
+
+class LocalPreferenceCache:
+    """
+    Per-process LRU cache of preference snapshots in front of the shared cache.
+
+    Entries live for ``NOTIFICATION_PREFERENCE_LOCAL_CACHE_TTL`` seconds, so
+    a change saved in another process is seen here within that time. A size
+    of zero disables the tier.
+    """
+
+    def __init__(self):
+        self._entries: "OrderedDict[str, Tuple[float, PreferenceSnapshot]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def max_size(self) -> int:
+        return getattr(settings, "NOTIFICATION_PREFERENCE_LOCAL_CACHE_SIZE", 1024)
+
+    @property
+    def ttl(self) -> float:
+        return getattr(settings, "NOTIFICATION_PREFERENCE_LOCAL_CACHE_TTL", 30)
+
+    def get(self, employee_id: str) -> Optional[PreferenceSnapshot]:
+        with self._lock:
+            entry = self._entries.get(employee_id)
+            if entry is None:
+                return None
+            if entry[0] < monotonic():
+                del self._entries[employee_id]
+                return None
+            self._entries.move_to_end(employee_id)
+            return entry[1]
+
+    def set(self, employee_id: str, snapshot: PreferenceSnapshot) -> None:
+        max_size = self.max_size
+        if max_size <= 0:
+            return
+        with self._lock:
+            self._entries[employee_id] = (monotonic() + self.ttl, snapshot)
+            self._entries.move_to_end(employee_id)
+            while len(self._entries) > max_size:
+                self._entries.popitem(last=False)
+
+    def delete(self, employee_id: str) -> None:
+        with self._lock:
+            self._entries.pop(employee_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
 class PreferenceService:
     """
     Service for managing notification preferences.
@@ -348,71 +800,122 @@ class PreferenceService:
         """Initialize the preference service."""
         self.cache_service = NotificationCacheService()
 
-    def get_preferences(self, employee: EmployeeProfile) -> NotificationPreference:
+    # Shared by every PreferenceService in the process
+    local_cache = LocalPreferenceCache()
+
+    def get_preferences(self, employee: EmployeeProfile) -> PreferenceSnapshot:
         """
         Get or create notification preferences for an employee.
 
+        Reads through the per-process cache, then the shared cache, and only
+        then the database, so repeated checks cost no queries.
+
         Args:
             employee: EmployeeProfile instance
 
         Returns:
-            NotificationPreference instance
+            PreferenceSnapshot of the employee's preferences
         """
+        employee_id = str(employee.id)
         try:
-            # Try cache first
-            cached = self.cache_service.get_preferences(str(employee.id))
+            snapshot = self.local_cache.get(employee_id)
+            if snapshot is not None:
+                return snapshot
+
+            cached = self.cache_service.get_preferences(employee_id)
             if cached:
-                # Convert cached dict back to model-like object
-                preference, _ = NotificationPreference.objects.get_or_create(
+                try:
+                    snapshot = PreferenceSnapshot.from_cache(cached)
+                except (KeyError, TypeError, ValueError):
+                    logger.warning(f"Discarding stale cached preferences for {employee_id}")
+
+            if snapshot is None:
+                # Get from database
+                preference, created = NotificationPreference.objects.get_or_create(
                     employee=employee
                 )
-                return preference
 
-            # Get from database
-            preference, created = NotificationPreference.objects.get_or_create(
-                employee=employee
-            )
+                if created:
+                    logger.info(f"Created default preferences for employee {employee.id}")
 
-            if created:
-                logger.info(f"Created default preferences for employee {employee.id}")
+                snapshot = PreferenceSnapshot.from_instance(preference)
+                self.cache_service.set_preferences(employee_id, snapshot.to_cache())
 
-            # Cache the preferences
-            self.cache_service.set_preferences(
-                str(employee.id),
-                {
-                    "notifications_enabled": preference.notifications_enabled,
-                    "in_app_enabled": preference.in_app_enabled,
-                    "email_enabled": preference.email_enabled,
-                    "push_enabled": preference.push_enabled,
-                    "sms_enabled": preference.sms_enabled,
-                    "in_app_priority_threshold": preference.in_app_priority_threshold,
-                    "email_priority_threshold": preference.email_priority_threshold,
-                    "push_priority_threshold": preference.push_priority_threshold,
-                    "sms_priority_threshold": preference.sms_priority_threshold,
-                    "email_digest_frequency": preference.email_digest_frequency,
-                    "push_digest_frequency": preference.push_digest_frequency,
-                    "quiet_hours_enabled": preference.quiet_hours_enabled,
-                    "quiet_hours_start": (
-                        preference.quiet_hours_start.isoformat()
-                        if preference.quiet_hours_start
-                        else None
-                    ),
-                    "quiet_hours_end": (
-                        preference.quiet_hours_end.isoformat()
-                        if preference.quiet_hours_end
-                        else None
-                    ),
-                    "quiet_hours_timezone": preference.quiet_hours_timezone,
-                    "type_preferences": preference.type_preferences,
-                },
-            )
-
-            return preference
+            self.local_cache.set(employee_id, snapshot)
+            return snapshot
 
         except Exception as e:
             logger.error(f"Error getting preferences for employee {employee.id}: {e}")
             # Return default preferences on error
-            return NotificationPreference(employee=employee)
+            return PreferenceSnapshot.from_instance(NotificationPreference(employee=employee))
+
+    @classmethod
+    def invalidate_cached_preferences(cls, employee_id: Any) -> None:
+        """
+        Drop cached preferences for an employee from both cache tiers.
+
+        Args:
+            employee_id: ID of the employee
+        """
+        cls.local_cache.delete(str(employee_id))
+        NotificationCacheService().delete_preferences(str(employee_id))
+
+    def get_preferences_for(
+        self, employees: List[EmployeeProfile]
+    ) -> Dict[Any, PreferenceSnapshot]:
+        """
+        Get or create notification preferences for many employees at once.
+
+        Cached preferences are read with one ``get_many``, the rest with one
+        query, and missing ones are created with one bulk insert.
+
+        Args:
+            employees: EmployeeProfile instances
+
+        Returns:
+            Dictionary mapping employee id to PreferenceSnapshot
+        """
+        employee_ids = {employee.id for employee in employees}
+        snapshots = {}
+        cached = self.cache_service.get_preferences_many(
+            [str(employee_id) for employee_id in employee_ids]
+        )
+        for employee_id in employee_ids:
+            data = cached.get(str(employee_id))
+            if data:
+                try:
+                    snapshots[employee_id] = PreferenceSnapshot.from_cache(data)
+                except (KeyError, TypeError, ValueError):
+                    pass
+
+        missing_ids = employee_ids - snapshots.keys()
+        if not missing_ids:
+            return snapshots
+
+        loaded = {
+            preference.employee_id: preference
+            for preference in NotificationPreference.objects.filter(
+                employee_id__in=missing_ids
+            )
+        }
+        missing = [
+            NotificationPreference(employee_id=employee_id)
+            for employee_id in missing_ids - loaded.keys()
+        ]
+        if missing:
+            NotificationPreference.objects.bulk_create(missing, ignore_conflicts=True)
+            logger.info(f"Created default preferences for {len(missing)} employees")
+            loaded.update((preference.employee_id, preference) for preference in missing)
+
+        fresh = {
+            employee_id: PreferenceSnapshot.from_instance(preference)
+            for employee_id, preference in loaded.items()
+        }
+        self.cache_service.set_preferences_many(
+            {str(employee_id): snapshot.to_cache() for employee_id, snapshot in fresh.items()}
+        )
+        snapshots.update(fresh)
+        return snapshots
 
     def update_preferences(
         self, employee: EmployeeProfile, updates: Dict[str, Any]
@@ -431,7 +934,7 @@ class PreferenceService:
             ValueError: If invalid preference field is provided
         """
         try:
-            preference = self.get_preferences(employee)
+            preference, _ = NotificationPreference.objects.get_or_create(employee=employee)
 
             # Update allowed fields
             allowed_fields = [
@@ -461,6 +964,7 @@ class PreferenceService:
 
                 setattr(preference, field, value)
 
+            # Saving drops the cached preferences
             preference.save()
             logger.info(f"Updated preferences for employee {employee.id}")
 
@@ -491,7 +995,7 @@ class PreferenceService:
 
             # Check if type-specific preference exists
             if notification_type in preference.type_preferences:
-                return preference.type_preferences[notification_type]
+                return dict(preference.type_preferences[notification_type])
 
             # Return default preferences
             return {
@@ -534,6 +1038,57 @@ class PreferenceService:
             # Default to sending on error
             return True
 
+    def route_channels(
+        self,
+        preference: NotificationPreference,
+        notification_type: str,
+        priority: str,
+        channels: List[str],
+    ) -> Dict[str, Any]:
+        """
+        Decide how each channel should deliver a notification.
+
+        Channels the employee has turned off for this type or priority are
+        dropped. Non-critical email goes to the digest when the employee
+        has chosen a daily or weekly email digest, and the remaining
+        non-critical channels are scheduled for the end of quiet hours.
+
+        Args:
+            preference: NotificationPreference instance
+            notification_type: Type of notification
+            priority: Priority level (CRITICAL, HIGH, MEDIUM, LOW)
+            channels: Channel names to consider
+
+        Returns:
+            Dictionary with ``send``, ``digest`` and ``scheduled`` channel
+            lists and ``scheduled_until``, the end of quiet hours or None
+        """
+        routes = {"send": [], "digest": [], "scheduled": [], "scheduled_until": None}
+        critical = priority == "CRITICAL"
+        quiet_until = None if critical else preference.quiet_hours_until()
+
+        for channel in channels:
+            if not preference.should_send(
+                notification_type, channel, priority, ignore_quiet_hours=True
+            ):
+                continue
+            # Only the daily and weekly email digests have a job that sends
+            # them; other digest settings are delivered as they happen
+            if (
+                not critical
+                and channel == "email"
+                and preference.get_digest_frequency(channel) in DigestService.DIGEST_WINDOWS
+            ):
+                routes["digest"].append(channel)
+            elif quiet_until is not None:
+                routes["scheduled"].append(channel)
+            else:
+                routes["send"].append(channel)
+
+        if routes["scheduled"]:
+            routes["scheduled_until"] = quiet_until
+        return routes
+
     def _is_quiet_hours(self, employee: EmployeeProfile) -> bool:
         """
         Check if current time is within quiet hours for an employee.
@@ -547,22 +1102,7 @@ class PreferenceService:
         try:
             preference = self.get_preferences(employee)
 
-            if not preference.quiet_hours_enabled:
-                return False
-
-            if not preference.quiet_hours_start or not preference.quiet_hours_end:
-                return False
-
-            from pytz import timezone as tz
-
-            user_tz = tz(preference.quiet_hours_timezone)
-            current_time = timezone.now().astimezone(user_tz).time()
-
-            return (
-                preference.quiet_hours_start
-                <= current_time
-                <= preference.quiet_hours_end
-            )
+            return preference.quiet_hours_until() is not None
 
         except Exception as e:
             logger.error(f"Error checking quiet hours: {e}")
@@ -582,13 +1122,13 @@ class AggregationService:
         "LEAVE_PENDING": {
             "enabled": True,
             "time_window": 3600,  # 1 hour
-            "group_by": ["recipient"],
+            "group_by": ["recipient", "notification_type"],
             "max_count": 10,
         },
         "IOU_PENDING": {
             "enabled": True,
             "time_window": 3600,  # 1 hour
-            "group_by": ["recipient"],
+            "group_by": ["recipient", "notification_type"],
             "max_count": 10,
         },
         "INFO": {
@@ -635,7 +1175,7 @@ class AggregationService:
             key_parts = []
             for field in group_by:
                 if field == "recipient":
-                    key_parts.append(str(notification.recipient.id))
+                    key_parts.append(str(notification.recipient_id))
                 elif field == "notification_type":
                     key_parts.append(notification.notification_type)
                 elif hasattr(notification, field):
@@ -645,82 +1185,358 @@ class AggregationService:
 
         except Exception as e:
             logger.error(f"Error generating aggregation key: {e}")
-            return f"{notification.recipient.id}:{notification.notification_type}"
+            return f"{notification.recipient_id}:{notification.notification_type}"
 
-    def should_aggregate_notification(self, notification: Notification) -> bool:
+    # Fields of an existing aggregated notification that folding changes
+    FOLDED_FIELDS = [
+        "title",
+        "message",
+        "aggregation_count",
+        "template_context",
+        "is_read",
+        "read_at",
+        "updated_at",
+    ]
+
+    def get_window_start(self, time_window: int) -> Any:
         """
-        Determine if a notification should be aggregated with existing ones.
+        Get the start of the current aggregation window.
+
+        Windows are fixed, back to back intervals of ``time_window`` seconds,
+        so every notification in the same interval lands in the same bucket.
 
         Args:
-            notification: Notification instance
+            time_window: Window length in seconds
 
         Returns:
-            bool - True if should aggregate, False otherwise
+            datetime - Start of the window containing now
+        """
+        now = timezone.now()
+        return now - timedelta(
+            seconds=int(now.timestamp()) % time_window, microseconds=now.microsecond
+        )
+
+    def aggregate(self, notification: Notification) -> Optional[Notification]:
+        """
+        Count a new notification in its aggregation bucket.
+
+        The bucket for the recipient, aggregation key and time window is
+        incremented with one ``UPDATE``, or created by the first notification
+        of the window. That first notification is delivered on its own; the
+        following ones, up to the rule's ``max_count``, are folded into the
+        bucket's aggregated notification.
+
+        Args:
+            notification: Newly created Notification instance
+
+        Returns:
+            Aggregated Notification instance, or None if the notification
+            should be delivered on its own
         """
         if not self.should_aggregate(notification.notification_type):
-            return False
+            return None
 
         rule = self.AGGREGATION_RULES[notification.notification_type]
-        time_window = timedelta(seconds=rule["time_window"])
-        cutoff_time = timezone.now() - time_window
+        bucket_filter = {
+            "recipient_id": notification.recipient_id,
+            "aggregation_key": self.get_aggregation_key(notification),
+            "window_start": self.get_window_start(rule["time_window"]),
+        }
 
         try:
-            # Check for existing aggregatable notifications
-            existing_count = (
-                Notification.objects.filter(
-                    recipient=notification.recipient,
-                    notification_type=notification.notification_type,
-                    is_aggregated=False,
-                    is_deleted=False,
-                    created_at__gte=cutoff_time,
-                )
-                .exclude(id=notification.id)
-                .count()
-            )
+            with transaction.atomic():
+                # The increment locks the bucket row until commit, so
+                # notifications landing in the same bucket take turns
+                if not self._increment_bucket(bucket_filter, notification):
+                    return None
 
-            return existing_count > 0 and existing_count < rule["max_count"]
+                bucket = NotificationAggregationBucket.objects.select_related(
+                    "aggregated_notification"
+                ).get(**bucket_filter)
+                if bucket.notification_count > rule["max_count"]:
+                    return None
+
+                return self._absorb(bucket, notification)
 
         except Exception as e:
-            logger.error(f"Error checking if notification should aggregate: {e}")
+            logger.error(f"Error aggregating notification: {e}")
+            return None
+
+    def _increment_bucket(
+        self, bucket_filter: Dict[str, Any], notification: Notification
+    ) -> bool:
+        """
+        Increment a bucket, or create it for the window's first notification.
+
+        Returns:
+            bool - False if this notification created the bucket
+        """
+        buckets = NotificationAggregationBucket.objects.filter(**bucket_filter)
+        increment = {
+            "notification_count": F("notification_count") + 1,
+            "updated_at": timezone.now(),
+        }
+        if buckets.update(**increment):
+            return True
+
+        try:
+            with transaction.atomic():
+                NotificationAggregationBucket.objects.create(
+                    **bucket_filter,
+                    notification_count=1,
+                    first_notification=notification,
+                )
             return False
+        except IntegrityError:
+            # A concurrent notification created the bucket first
+            buckets.update(**increment)
+            return True
 
-    def find_aggregatable_notifications(
-        self, notification: Notification
-    ) -> List[Notification]:
+    def aggregate_many(
+        self, notifications: List[Notification]
+    ) -> Dict[Any, Notification]:
         """
-        Find existing notifications that can be aggregated with this one.
+        Count many new notifications in their aggregation buckets at once.
+
+        Notifications are grouped by bucket and each bucket is moved on by
+        its group's size, with the same rules as ``aggregate``. Buckets are
+        created and locked, and aggregated notifications, links, flags and
+        counters written, with a fixed number of queries however many
+        buckets the notifications touch.
 
         Args:
-            notification: Notification instance
+            notifications: Newly created Notification instances
 
         Returns:
-            List of aggregatable Notification instances
+            Dictionary of aggregated Notification instances keyed by the id
+            of each notification they absorbed
         """
-        if not self.should_aggregate(notification.notification_type):
-            return []
-
-        try:
+        groups: Dict[Tuple[Any, str, Any], List[Notification]] = {}
+        for notification in notifications:
+            if not self.should_aggregate(notification.notification_type):
+                continue
             rule = self.AGGREGATION_RULES[notification.notification_type]
-            time_window = timedelta(seconds=rule["time_window"])
-            cutoff_time = timezone.now() - time_window
+            key = (
+                notification.recipient_id,
+                self.get_aggregation_key(notification),
+                self.get_window_start(rule["time_window"]),
+            )
+            groups.setdefault(key, []).append(notification)
+        if not groups:
+            return {}
 
-            notifications = list(
-                Notification.objects.filter(
-                    recipient=notification.recipient,
-                    notification_type=notification.notification_type,
-                    is_aggregated=False,
-                    is_deleted=False,
-                    created_at__gte=cutoff_time,
+        try:
+            with transaction.atomic():
+                NotificationAggregationBucket.objects.bulk_create(
+                    [
+                        NotificationAggregationBucket(
+                            recipient_id=recipient_id,
+                            aggregation_key=aggregation_key,
+                            window_start=window_start,
+                        )
+                        for recipient_id, aggregation_key, window_start in groups
+                    ],
+                    ignore_conflicts=True,
                 )
-                .exclude(id=notification.id)
-                .order_by("-created_at")[: rule["max_count"]]
+                buckets = {
+                    (bucket.recipient_id, bucket.aggregation_key, bucket.window_start): bucket
+                    for bucket in NotificationAggregationBucket.objects.select_for_update(
+                        of=("self",)
+                    )
+                    .select_related("aggregated_notification")
+                    .filter(
+                        recipient_id__in={key[0] for key in groups},
+                        aggregation_key__in={key[1] for key in groups},
+                        window_start__in={key[2] for key in groups},
+                    )
+                    .order_by("id")
+                }
+
+                now = timezone.now()
+                absorbed_by = {}
+                created = []
+                changed = []
+                links = []
+                reopened = Counter()
+                for key, group in groups.items():
+                    bucket = buckets[key]
+                    rule = self.AGGREGATION_RULES[group[0].notification_type]
+                    start = bucket.notification_count
+                    bucket.notification_count = start + len(group)
+                    bucket.updated_at = now
+                    if start == 0:
+                        bucket.first_notification = group[0]
+                    absorbed = [
+                        notification
+                        for count, notification in enumerate(group, start=start + 1)
+                        if 2 <= count <= rule["max_count"]
+                    ]
+                    if not absorbed:
+                        continue
+
+                    absorbed_ids = [notification.id for notification in absorbed]
+                    # The window's first notification joins the aggregate
+                    # that the second one starts
+                    if start <= 1 and bucket.first_notification_id:
+                        absorbed_ids.insert(0, bucket.first_notification_id)
+                    aggregated, is_new, was_read = self._fold(
+                        bucket, group[0], absorbed_ids
+                    )
+                    aggregated.updated_at = now
+                    if is_new:
+                        created.append(aggregated)
+                    else:
+                        changed.append(aggregated)
+                    if was_read:
+                        reopened[str(aggregated.recipient_id)] += 1
+                    links.extend((aggregated.id, pk) for pk in absorbed_ids)
+                    for notification in absorbed:
+                        notification.is_aggregated = True
+                        absorbed_by[notification.id] = aggregated
+
+                if links:
+                    Notification.objects.bulk_create(created)
+                    Notification.objects.bulk_update(changed, self.FOLDED_FIELDS)
+                    Link = Notification.aggregated_with.through
+                    Link.objects.bulk_create(
+                        [
+                            Link(from_notification_id=aggregated_id, to_notification_id=pk)
+                            for aggregated_id, pk in links
+                        ],
+                        ignore_conflicts=True,
+                    )
+                    Notification.objects.filter(
+                        id__in={pk for _, pk in links}
+                    ).update(is_aggregated=True)
+                NotificationAggregationBucket.objects.bulk_update(
+                    list(buckets.values()),
+                    [
+                        "notification_count",
+                        "first_notification",
+                        "aggregated_notification",
+                        "updated_at",
+                    ],
+                )
+
+        except Exception as e:
+            logger.error(f"Error aggregating notifications: {e}")
+            return {}
+
+        # bulk_create skips Notification.save, which counts single creates
+        reopened.update(str(aggregated.recipient_id) for aggregated in created)
+        UnreadCountService().adjust(reopened)
+
+        return absorbed_by
+
+    def _absorb(
+        self, bucket: NotificationAggregationBucket, notification: Notification
+    ) -> Notification:
+        """
+        Fold a notification into its bucket's aggregated notification.
+
+        The aggregated notification is created with the window's first
+        notification when the second one arrives, then updated in place.
+        """
+        absorbed_ids = [notification.id]
+        if bucket.first_notification_id and bucket.notification_count == 2:
+            absorbed_ids.insert(0, bucket.first_notification_id)
+
+        aggregated, is_new, was_read = self._fold(bucket, notification, absorbed_ids)
+        if is_new:
+            aggregated.save()
+            bucket.save(update_fields=["aggregated_notification", "updated_at"])
+        else:
+            aggregated.save(update_fields=self.FOLDED_FIELDS)
+            if was_read:
+                UnreadCountService().adjust({str(aggregated.recipient_id): 1})
+
+        aggregated.aggregated_with.add(*absorbed_ids)
+        Notification.objects.filter(id__in=absorbed_ids).update(is_aggregated=True)
+        notification.is_aggregated = True
+
+        logger.info(
+            f"Aggregated notification {notification.id} into {aggregated.id} "
+            f"({aggregated.aggregation_count} total)"
+        )
+
+        return aggregated
+
+    def _fold(
+        self,
+        bucket: NotificationAggregationBucket,
+        notification: Notification,
+        absorbed_ids: List[Any],
+    ) -> Tuple[Notification, bool, bool]:
+        """
+        Fold notification ids into a bucket's aggregated notification in memory.
+
+        Starts a new aggregated notification when the bucket has none, or
+        its last one was deleted. New activity brings a read aggregated
+        notification back as unread. Nothing is saved.
+
+        Returns:
+            Tuple of the aggregated notification, whether it is new and
+            whether it was read before
+        """
+        ids = [str(pk) for pk in absorbed_ids]
+        aggregated = bucket.aggregated_notification
+        if aggregated is None or aggregated.is_deleted:
+            count = len(ids)
+            aggregated = Notification(
+                recipient_id=notification.recipient_id,
+                notification_type=notification.notification_type,
+                priority=notification.priority,
+                is_aggregated=True,
+                aggregation_key=bucket.aggregation_key,
+                aggregation_count=count,
+                template_context={"count": count, "notification_ids": ids},
+                **self._summary(notification.notification_type, count),
             )
+            bucket.aggregated_notification = aggregated
+            return aggregated, True, False
+
+        count = aggregated.aggregation_count + len(ids)
+        summary = self._summary(notification.notification_type, count)
+        aggregated.title = summary["title"]
+        aggregated.message = summary["message"]
+        aggregated.aggregation_count = count
+        aggregated.template_context = {
+            **aggregated.template_context,
+            "count": count,
+            "notification_ids": [
+                *aggregated.template_context.get("notification_ids", []),
+                *ids,
+            ],
+        }
+        was_read = aggregated.is_read
+        aggregated.is_read = False
+        aggregated.read_at = None
+        return aggregated, False, was_read
 
-            return notifications
+    @staticmethod
+    def _summary(notification_type: str, count: int) -> Dict[str, str]:
+        """Title and message of an aggregated notification."""
+        label = notification_type.replace("_", " ")
+        return {
+            "title": f"{count} {label.title()}",
+            "message": f"You have {count} pending {label.lower()}.",
+        }
 
-        except Exception as e:
-            logger.error(f"Error finding aggregatable notifications: {e}")
-            return []
+    def purge_expired_buckets(self) -> int:
+        """
+        Delete aggregation buckets whose windows have closed.
+
+        Returns:
+            int - Number of buckets deleted
+        """
+        longest_window = max(
+            rule["time_window"] for rule in self.AGGREGATION_RULES.values()
+        )
+        cutoff = timezone.now() - timedelta(seconds=longest_window)
+        deleted, _ = NotificationAggregationBucket.objects.filter(
+            window_start__lt=cutoff
+        ).delete()
+        return deleted
 
     def aggregate_notifications(
         self, notifications: List[Notification]
@@ -746,8 +1562,6 @@ class AggregationService:
                 recipient=primary.recipient,
                 notification_type=primary.notification_type,
                 priority=primary.priority,
-                title=f"{len(notifications)} {primary.notification_type.replace('_', ' ').title()}",
-                message=f"You have {len(notifications)} pending {primary.notification_type.lower().replace('_', ' ')}.",
                 is_aggregated=True,
                 aggregation_key=self.get_aggregation_key(primary),
                 aggregation_count=len(notifications),
@@ -755,50 +1569,27 @@ class AggregationService:
                     "count": len(notifications),
                     "notification_ids": [str(n.id) for n in notifications],
                 },
+                **self._summary(primary.notification_type, len(notifications)),
             )
 
             # Link aggregated notifications
             aggregated.aggregated_with.add(*notifications)
 
-            # Mark original notifications as aggregated
-            for notification in notifications:
-                notification.is_aggregated = True
-                notification.save(update_fields=["is_aggregated"])
-
-            logger.info(
-                f"Aggregated {len(notifications)} notifications into {aggregated.id}"
-            )
-
-            return aggregated
-
-        except Exception as e:
-            logger.error(f"Error aggregating notifications: {e}")
-            return None
-
-    def create_aggregated_notification(
-        self, notification: Notification
-    ) -> Optional[Notification]:
-        """
-        Create an aggregated notification from a single notification
-        by finding and aggregating with similar notifications.
-
-        Args:
-            notification: Notification instance
-
-        Returns:
-            Aggregated Notification instance or None
-        """
-        try:
-            aggregatable = self.find_aggregatable_notifications(notification)
+            # Mark original notifications as aggregated
+            Notification.objects.filter(id__in=[n.id for n in notifications]).update(
+                is_aggregated=True
+            )
+            for notification in notifications:
+                notification.is_aggregated = True
 
-            if aggregatable:
-                all_notifications = [notification] + aggregatable
-                return self.aggregate_notifications(all_notifications)
+            logger.info(
+                f"Aggregated {len(notifications)} notifications into {aggregated.id}"
+            )
 
-            return None
+            return aggregated
 
         except Exception as e:
-            logger.error(f"Error creating aggregated notification: {e}")
+            logger.error(f"Error aggregating notifications: {e}")
             return None
 
 
@@ -810,30 +1601,19 @@ class DigestService:
     to batch multiple notifications into a single message.
     """
 
-    def __init__(self):
-        """Initialize the digest service."""
-        self.cache_service = NotificationCacheService()
-
-    def _group_by_type(
-        self, notifications: List[Notification]
-    ) -> Dict[str, List[Notification]]:
-        """
-        Group notifications by type.
+    # Look-back window of each digest frequency
+    DIGEST_WINDOWS = {"daily": timedelta(days=1), "weekly": timedelta(weeks=1)}
 
-        Args:
-            notifications: List of Notification instances
+    # Recipients whose digests are written per transaction
+    DIGEST_BATCH_SIZE = 500
 
-        Returns:
-            Dictionary mapping notification types to lists of notifications
-        """
-        grouped = {}
-        for notification in notifications:
-            ntype = notification.notification_type
-            if ntype not in grouped:
-                grouped[ntype] = []
-            grouped[ntype].append(notification)
+    # Digests sent per email delivery task
+    EMAIL_BATCH_SIZE = 100
 
-        return grouped
+    def __init__(self):
+        """Initialize the digest service."""
+        self.cache_service = NotificationCacheService()
+        self.unread_count_service = UnreadCountService()
 
     def create_daily_digest(self, recipient: EmployeeProfile) -> Optional[Notification]:
         """
@@ -874,73 +1654,172 @@ class DigestService:
         Returns:
             Digest Notification instance or None
         """
+        digests = self.create_digests(frequency, recipient_ids=[recipient.id])
+        if not digests:
+            logger.info(f"No notifications for {frequency} digest for {recipient.id}")
+            return None
+        return digests[0]
+
+    def create_digests(
+        self, frequency: str, recipient_ids: Optional[List[Any]] = None
+    ) -> List[Notification]:
+        """
+        Create digest notifications for many recipients at once.
+
+        Candidate notifications for every recipient are read in one query
+        ordered by recipient and grouped in a single streaming pass. Every
+        ``DIGEST_BATCH_SIZE`` recipients, the digests, their links and the
+        ``is_aggregated`` flag of the digested notifications are written in
+        bulk.
+
+        Args:
+            frequency: str (daily, weekly)
+            recipient_ids: Limit to these recipients; defaults to everyone
+                whose email digest frequency is ``frequency``
+
+        Returns:
+            List of created digest Notification instances
+        """
+        window = self.DIGEST_WINDOWS.get(frequency)
+        if window is None:
+            logger.error(f"Invalid digest frequency: {frequency}")
+            return []
+
         try:
-            # Get time range
-            if frequency == "daily":
-                start_time = timezone.now() - timedelta(days=1)
-            elif frequency == "weekly":
-                start_time = timezone.now() - timedelta(weeks=1)
+            now = timezone.now()
+            candidates = Notification.objects.filter(
+                is_read=False,
+                is_deleted=False,
+                is_aggregated=False,
+                created_at__gte=now - window,
+            )
+            if recipient_ids is None:
+                candidates = candidates.filter(
+                    recipient__notification_preferences__email_digest_frequency=frequency
+                )
             else:
-                logger.error(f"Invalid digest frequency: {frequency}")
-                return None
-
-            # Get unread notifications in range
-            notifications = list(
-                Notification.objects.filter(
-                    recipient=recipient,
-                    is_read=False,
-                    is_deleted=False,
-                    is_aggregated=False,
-                    created_at__gte=start_time,
-                ).select_related("leave_request", "iou", "payroll", "appraisal")
+                candidates = candidates.filter(recipient_id__in=recipient_ids)
+            rows = (
+                candidates.order_by("recipient_id", "created_at")
+                .values_list("id", "recipient_id", "notification_type")
+                .iterator(chunk_size=2000)
             )
 
-            if not notifications:
-                logger.info(
-                    f"No notifications for {frequency} digest for {recipient.id}"
-                )
-                return None
+            digests = []
+            pending = []
+            for recipient_id, recipient_rows in groupby(rows, key=itemgetter(1)):
+                grouped: Dict[str, List[Any]] = {}
+                for notification_id, _, notification_type in recipient_rows:
+                    grouped.setdefault(notification_type, []).append(notification_id)
+                pending.append(self._build_digest(recipient_id, frequency, grouped, now))
+                if len(pending) >= self.DIGEST_BATCH_SIZE:
+                    digests.extend(self._save_digests(pending))
+                    pending = []
+            if pending:
+                digests.extend(self._save_digests(pending))
+
+            logger.info(f"Created {len(digests)} {frequency} digests")
+            return digests
 
-            # Group by type
-            grouped = self._group_by_type(notifications)
+        except Exception as e:
+            logger.error(f"Error creating {frequency} digests: {e}")
+            return []
 
-            # Create digest notification
-            digest_notification = Notification.objects.create(
-                recipient=recipient,
-                notification_type="INFO",
-                priority="LOW",
-                title=f"{frequency.capitalize()} Notification Digest",
-                message=f"You have {len(notifications)} new notifications.",
-                is_aggregated=True,
-                aggregation_key=f"digest:{recipient.id}:{frequency}:{timezone.now().date()}",
-                aggregation_count=len(notifications),
-                template_context={
-                    "frequency": frequency,
-                    "total_count": len(notifications),
-                    "grouped": {
-                        ntype: [str(n.id) for n in notifs]
-                        for ntype, notifs in grouped.items()
-                    },
+    @staticmethod
+    def _build_digest(
+        recipient_id: Any,
+        frequency: str,
+        grouped: Dict[str, List[Any]],
+        now,
+    ) -> Tuple[Notification, List[Any]]:
+        """
+        Build an unsaved digest for one recipient.
+
+        Returns:
+            Tuple of (digest Notification, IDs of the digested notifications)
+        """
+        notification_ids = [
+            notification_id for ids in grouped.values() for notification_id in ids
+        ]
+        total = len(notification_ids)
+        digest = Notification(
+            recipient_id=recipient_id,
+            notification_type="INFO",
+            priority="LOW",
+            title=f"{frequency.capitalize()} Notification Digest",
+            message=f"You have {total} new notifications.",
+            is_aggregated=True,
+            aggregation_key=f"digest:{recipient_id}:{frequency}:{now.date()}",
+            aggregation_count=total,
+            template_context={
+                "frequency": frequency,
+                "total_count": total,
+                "grouped": {
+                    ntype: [str(notification_id) for notification_id in ids]
+                    for ntype, ids in grouped.items()
                 },
-            )
+            },
+        )
+        return digest, notification_ids
 
-            # Link notifications to digest
-            digest_notification.aggregated_with.add(*notifications)
+    def _save_digests(
+        self, pending: List[Tuple[Notification, List[Any]]]
+    ) -> List[Notification]:
+        """
+        Write built digests, link them and flag the digested notifications.
 
-            # Mark original notifications as aggregated
-            for notification in notifications:
-                notification.is_aggregated = True
-                notification.save(update_fields=["is_aggregated"])
+        Args:
+            pending: Tuples returned by ``_build_digest``
 
-            logger.info(
-                f"Created {frequency} digest for {recipient.id} with {len(notifications)} notifications"
+        Returns:
+            List of saved digest Notification instances
+        """
+        Link = Notification.aggregated_with.through
+        digested_ids = [
+            notification_id for _, ids in pending for notification_id in ids
+        ]
+        with transaction.atomic():
+            digests = Notification.objects.bulk_create(
+                [digest for digest, _ in pending]
+            )
+            Link.objects.bulk_create(
+                [
+                    Link(from_notification_id=digest.id, to_notification_id=notification_id)
+                    for digest, ids in pending
+                    for notification_id in ids
+                ],
+                batch_size=self.DIGEST_BATCH_SIZE,
             )
+            for start in range(0, len(digested_ids), self.DIGEST_BATCH_SIZE):
+                Notification.objects.filter(
+                    id__in=digested_ids[start : start + self.DIGEST_BATCH_SIZE]
+                ).update(is_aggregated=True)
 
-            return digest_notification
+        self.unread_count_service.adjust(
+            {str(digest.recipient_id): 1 for digest in digests}
+        )
+        self.cache_service.invalidate_users_cache(
+            [str(digest.recipient_id) for digest in digests]
+        )
+        return digests
 
-        except Exception as e:
-            logger.error(f"Error creating {frequency} digest: {e}")
-            return None
+    def send_digests(self, frequency: str) -> Dict[str, int]:
+        """
+        Create every subscriber's digest and queue them for email delivery.
+
+        Args:
+            frequency: str (daily, weekly)
+
+        Returns:
+            Dict with the number of digests created, notifications digested
+            and email batches queued
+        """
+        digests = self.create_digests(frequency)
+        return {
+            "digest_count": len(digests),
+            "notification_count": sum(digest.aggregation_count for digest in digests),
+            "batch_count": self._queue_digest_delivery(digests),
+        }
 
     def send_digest(self, recipient: EmployeeProfile, frequency: str = "daily") -> bool:
         """
@@ -953,58 +1832,207 @@ class DigestService:
         Returns:
             bool - True if digest created and queued, False otherwise
         """
-        try:
-            if frequency == "daily":
-                digest = self.create_daily_digest(recipient)
-            elif frequency == "weekly":
-                digest = self.create_weekly_digest(recipient)
-            else:
-                logger.error(f"Invalid digest frequency: {frequency}")
-                return False
-
-            if not digest:
-                return False
-
-            # Queue for delivery
-            self._queue_digest_delivery(digest)
-
-            return True
-
-        except Exception as e:
-            logger.error(f"Error sending digest: {e}")
+        digest = self._create_digest(recipient, frequency)
+        if not digest:
             return False
+        return self._queue_digest_delivery([digest]) > 0
 
-    def _queue_digest_delivery(self, notification: Notification) -> bool:
+    def _queue_digest_delivery(self, notifications: List[Notification]) -> int:
         """
-        Queue digest notification for async delivery.
+        Queue digest notifications for email delivery in chunked batches.
+
+        Each ``deliver_notification_batch_task`` sends up to
+        ``EMAIL_BATCH_SIZE`` digests over one mail connection.
 
         Args:
-            notification: Notification instance
+            notifications: Digest Notification instances
 
         Returns:
-            bool - True if queued successfully, False otherwise
+            int - Number of batches queued
         """
         try:
             # Import here to avoid circular dependency
-            from payroll.tasks import deliver_notification_task
+            from payroll.tasks import deliver_notification_batch_task
+
+            notification_ids = [str(notification.id) for notification in notifications]
+            batches = 0
+            for start in range(0, len(notification_ids), self.EMAIL_BATCH_SIZE):
+                deliver_notification_batch_task.apply_async(
+                    args=[notification_ids[start : start + self.EMAIL_BATCH_SIZE], "email"],
+                    queue="notifications_low",
+                )
+                batches += 1
 
-            deliver_notification_task.apply_async(
-                args=[str(notification.id)],
-                queue="notifications_normal",
-                countdown=0,
+            logger.info(
+                f"Queued {len(notification_ids)} digest notifications in {batches} email batches"
             )
-
-            logger.info(f"Queued digest notification {notification.id} for delivery")
-            return True
-
-        except ImportError:
-            # If tasks module doesn't exist yet, log warning
-            logger.warning("Celery tasks module not available, skipping queue")
-            return False
+            return batches
 
         except Exception as e:
             logger.error(f"Error queuing digest delivery: {e}")
-            return False
+            return 0
+
+
+class ArchiveService:
+    """
+    Service for moving old notifications into ``ArchivedNotification``.
+
+    Rows are copied and deleted in chunks ordered by ``(created_at, id)``.
+    Each chunk commits together with the cursor of its
+    ``NotificationArchiveRun``, so an interrupted run resumes after the last
+    committed chunk and never archives a row twice.
+    """
+
+    # Notifications older than this are moved out of the main table
+    RETENTION_DAYS = 90
+
+    # Rows copied and deleted per transaction
+    BATCH_SIZE = 1000
+
+    # Notification columns carried over to ArchivedNotification as is
+    ARCHIVED_FIELDS = (
+        "recipient_id",
+        "notification_type",
+        "priority",
+        "title",
+        "message",
+        "is_read",
+        "read_at",
+        "delivery_status",
+        "is_aggregated",
+        "aggregation_key",
+        "aggregation_count",
+        "action_url",
+        "action_label",
+        "template_context",
+        "metadata",
+        "created_at",
+        "updated_at",
+        "leave_request_id",
+        "iou_id",
+        "payroll_id",
+        "appraisal_id",
+    )
+
+    def __init__(self):
+        """Initialize the archive service."""
+        self.cache_service = NotificationCacheService()
+        self.unread_count_service = UnreadCountService()
+
+    def get_or_start_run(self) -> NotificationArchiveRun:
+        """
+        Return the oldest unfinished archive run, or start a new one.
+
+        Returns:
+            NotificationArchiveRun instance
+        """
+        run = (
+            NotificationArchiveRun.objects.filter(finished_at__isnull=True)
+            .order_by("started_at")
+            .first()
+        )
+        if run is None:
+            run = NotificationArchiveRun.objects.create(
+                cutoff=timezone.now() - timedelta(days=self.RETENTION_DAYS)
+            )
+        return run
+
+    def archive(
+        self,
+        run: NotificationArchiveRun,
+        batch_size: Optional[int] = None,
+        max_batches: Optional[int] = None,
+    ) -> int:
+        """
+        Archive notifications older than the run's cutoff.
+
+        Args:
+            run: NotificationArchiveRun to continue
+            batch_size: Rows moved per transaction
+            max_batches: Stop after this many chunks, leaving the run open
+
+        Returns:
+            Number of notifications archived by this call
+        """
+        batch_size = batch_size or self.BATCH_SIZE
+        archived = 0
+        batches = 0
+        while max_batches is None or batches < max_batches:
+            moved = self._archive_batch(run, batch_size)
+            if not moved:
+                run.finished_at = timezone.now()
+                run.save(update_fields=["finished_at", "updated_at"])
+                break
+            archived += moved
+            batches += 1
+        return archived
+
+    def _archive_batch(self, run: NotificationArchiveRun, batch_size: int) -> int:
+        """
+        Copy and delete the next chunk after the run's cursor.
+
+        Returns:
+            Number of notifications moved, 0 once the run is exhausted
+        """
+        with transaction.atomic():
+            # Re-read the cursor under a row lock so concurrent workers
+            # continuing the same run take turns instead of overlapping.
+            locked = NotificationArchiveRun.objects.select_for_update().get(pk=run.pk)
+            pending = Notification.objects.filter(created_at__lt=locked.cutoff)
+            if locked.last_created_at is not None:
+                pending = pending.filter(
+                    Q(created_at__gt=locked.last_created_at)
+                    | Q(
+                        created_at=locked.last_created_at,
+                        id__gt=locked.last_notification_id,
+                    )
+                )
+            rows = list(
+                pending.order_by("created_at", "id").values(
+                    "id", "is_deleted", *self.ARCHIVED_FIELDS
+                )[:batch_size]
+            )
+            if not rows:
+                return 0
+
+            ArchivedNotification.objects.bulk_create(
+                [
+                    ArchivedNotification(
+                        original_notification_id=row["id"],
+                        **{field: row[field] for field in self.ARCHIVED_FIELDS},
+                    )
+                    for row in rows
+                ]
+            )
+            Notification.objects.filter(id__in=[row["id"] for row in rows]).delete()
+
+            locked.last_created_at = rows[-1]["created_at"]
+            locked.last_notification_id = rows[-1]["id"]
+            locked.archived_count += len(rows)
+            locked.save(
+                update_fields=[
+                    "last_created_at",
+                    "last_notification_id",
+                    "archived_count",
+                    "updated_at",
+                ]
+            )
+
+        run.last_created_at = locked.last_created_at
+        run.last_notification_id = locked.last_notification_id
+        run.archived_count = locked.archived_count
+        archived_unread = Counter(
+            str(row["recipient_id"])
+            for row in rows
+            if not row["is_read"] and not row["is_deleted"]
+        )
+        self.unread_count_service.adjust(
+            {recipient_id: -count for recipient_id, count in archived_unread.items()}
+        )
+        self.cache_service.invalidate_users_cache(
+            sorted({str(row["recipient_id"]) for row in rows})
+        )
+        return len(rows)
 
 
 class EventDispatcher:
@@ -1106,12 +2134,32 @@ class NotificationService:
     - Aggregating similar notifications
     """
 
+    # Celery queue for each notification priority
+    PRIORITY_QUEUES = {
+        "CRITICAL": "notifications_critical",
+        "HIGH": "notifications_high",
+        "MEDIUM": "notifications_normal",
+        "LOW": "notifications_low",
+    }
+
+    DELIVERY_CHANNELS = ["in_app", "email", "push", "sms"]
+
+    # Rows per INSERT in bulk sends
+    BULK_CREATE_BATCH_SIZE = 1000
+
+    # Notifications per batched delivery task
+    DELIVERY_BATCH_SIZE = 500
+
+    # Notifications released per transaction once quiet hours end
+    RELEASE_BATCH_SIZE = 1000
+
     def __init__(self):
         """Initialize the notification service with dependent services."""
         self.preference_service = PreferenceService()
         self.aggregation_service = AggregationService()
         self.digest_service = DigestService()
         self.cache_service = NotificationCacheService()
+        self.unread_count_service = UnreadCountService()
 
     def send_notification(
         self,
@@ -1149,6 +2197,11 @@ class NotificationService:
                 logger.info(f"Notifications disabled for employee {recipient.id}")
                 return None
 
+            # Resolve delivery channels before anything is queued
+            routes = self.preference_service.route_channels(
+                preferences, notification_type, priority, self.DELIVERY_CHANNELS
+            )
+
             # Create notification
             notification = Notification.objects.create(
                 recipient=recipient,
@@ -1156,6 +2209,8 @@ class NotificationService:
                 priority=priority,
                 title=title,
                 message=message,
+                delivery_status=self._deferred_delivery_status(routes),
+                scheduled_until=routes["scheduled_until"],
                 **kwargs,
             )
 
@@ -1163,18 +2218,15 @@ class NotificationService:
                 f"Created notification {notification.id} for {recipient.id}: {title}"
             )
 
-            # Check if should aggregate
-            if self.aggregation_service.should_aggregate_notification(notification):
-                aggregated = self.aggregation_service.create_aggregated_notification(
-                    notification
-                )
-                if aggregated:
-                    # Invalidate cache for aggregated notification
-                    self.cache_service.invalidate_user_cache(str(recipient.id))
-                    return aggregated
+            # Fold into the aggregate of this window if it is not the first
+            aggregated = self.aggregation_service.aggregate(notification)
+            if aggregated:
+                # Invalidate cache for aggregated notification
+                self.cache_service.invalidate_user_cache(str(recipient.id))
+                return aggregated
 
             # Queue for delivery
-            self._queue_notification(notification)
+            self._queue_notification(notification, routes)
 
             # Invalidate cache
             self.cache_service.invalidate_user_cache(str(recipient.id))
@@ -1208,26 +2260,103 @@ class NotificationService:
         Returns:
             List of created Notification instances
         """
-        notifications = []
-
-        for recipient in recipients:
-            try:
-                notification = self.send_notification(
-                    recipient=recipient,
-                    notification_type=notification_type,
-                    title=title,
-                    message=message,
-                    priority=priority,
+        return self.send_notifications(
+            [
+                {
+                    "recipient": recipient,
+                    "notification_type": notification_type,
+                    "title": title,
+                    "message": message,
+                    "priority": priority,
                     **kwargs,
+                }
+                for recipient in recipients
+            ]
+        )
+
+    def send_notifications(self, specs: List[Dict[str, Any]]) -> List[Notification]:
+        """
+        Create and send many notifications with a constant number of queries.
+
+        Preferences for every recipient are loaded in one query and resolved
+        to delivery channels, the notifications are inserted with
+        ``bulk_create``, aggregatable ones are counted in their buckets with
+        ``AggregationService.aggregate_many``, delivery is queued as a few
+        chunked tasks per channel and the recipients' caches are invalidated
+        in one call.
+
+        Args:
+            specs: Dictionaries of Notification fields, each with a
+                ``recipient`` and ``notification_type``, ``title`` and
+                ``message``; ``priority`` defaults to MEDIUM
+
+        Returns:
+            List of created Notification instances, with aggregated
+            notifications in place of the ones they absorbed
+        """
+        specs = [spec for spec in specs if spec.get("recipient")]
+        if not specs:
+            return []
+
+        try:
+            preferences = self.preference_service.get_preferences_for(
+                [spec["recipient"] for spec in specs]
+            )
+
+            pending = []
+            routes = {}
+            for spec in specs:
+                recipient = spec["recipient"]
+                preference = preferences[recipient.id]
+                if not preference.notifications_enabled:
+                    logger.info(f"Notifications disabled for employee {recipient.id}")
+                    continue
+                notification = Notification(**{"priority": "MEDIUM", **spec})
+                routes[notification.id] = self.preference_service.route_channels(
+                    preference,
+                    notification.notification_type,
+                    notification.priority,
+                    self.DELIVERY_CHANNELS,
                 )
-                if notification:
-                    notifications.append(notification)
+                notification.delivery_status = self._deferred_delivery_status(
+                    routes[notification.id]
+                )
+                notification.scheduled_until = routes[notification.id]["scheduled_until"]
+                pending.append(notification)
+
+            created = Notification.objects.bulk_create(
+                pending, batch_size=self.BULK_CREATE_BATCH_SIZE
+            )
+            # bulk_create skips Notification.save, which counts single creates
+            self.unread_count_service.adjust(
+                Counter(str(notification.recipient_id) for notification in created)
+            )
+
+            absorbed_by = self.aggregation_service.aggregate_many(created)
+            notifications = []
+            to_queue = []
+            aggregated_ids = set()
+            for notification in created:
+                aggregated = absorbed_by.get(notification.id)
+                if aggregated:
+                    if aggregated.id not in aggregated_ids:
+                        aggregated_ids.add(aggregated.id)
+                        notifications.append(aggregated)
+                    continue
+                notifications.append(notification)
+                to_queue.append(notification)
+
+            self._queue_notifications(to_queue, routes)
+            self.cache_service.invalidate_users_cache(
+                list({str(notification.recipient_id) for notification in created})
+            )
 
-            except Exception as e:
-                logger.error(f"Failed to send notification to {recipient.id}: {e}")
+        except Exception as e:
+            logger.error(f"Error sending bulk notification: {e}")
+            return []
 
         logger.info(
-            f"Sent bulk notification to {len(notifications)} of {len(recipients)} recipients"
+            f"Sent bulk notification to {len(created)} of {len(specs)} recipients"
         )
 
         return notifications
@@ -1255,12 +2384,40 @@ class NotificationService:
             employee, notification_type, channel, priority
         )
 
-    def _queue_notification(self, notification: Notification) -> bool:
+    def _deferred_delivery_status(self, routes: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build the initial delivery status for channels that are not sent now.
+
+        Args:
+            routes: Channel routes from ``PreferenceService.route_channels``
+
+        Returns:
+            Dictionary of delivery status entries keyed by channel
+        """
+        now = timezone.now().isoformat()
+        status = {channel: {"status": "DIGEST", "at": now} for channel in routes["digest"]}
+        for channel in routes["scheduled"]:
+            status[channel] = {
+                "status": "SCHEDULED",
+                "at": now,
+                "until": routes["scheduled_until"].isoformat(),
+            }
+        return status
+
+    def _queue_notification(
+        self, notification: Notification, routes: Optional[Dict[str, Any]] = None
+    ) -> bool:
         """
         Queue notification for async delivery.
 
+        Only channels the recipient's preferences allow get a task. Channels
+        held for quiet hours are left for ``release_scheduled_notifications``
+        and digest channels are left for the digest run.
+
         Args:
             notification: Notification instance
+            routes: Channel routes from ``PreferenceService.route_channels``,
+                resolved from the recipient's preferences when omitted
 
         Returns:
             bool - True if queued successfully, False otherwise
@@ -1269,30 +2426,26 @@ class NotificationService:
             # Import here to avoid circular dependency
             from payroll.tasks import deliver_notification_task
 
-            # Select queue based on priority
-            queue_map = {
-                "CRITICAL": "notifications_critical",
-                "HIGH": "notifications_high",
-                "MEDIUM": "notifications_normal",
-                "LOW": "notifications_low",
-            }
-
-            queue = queue_map.get(notification.priority, "notifications_normal")
+            if routes is None:
+                routes = self.preference_service.route_channels(
+                    self.preference_service.get_preferences(notification.recipient),
+                    notification.notification_type,
+                    notification.priority,
+                    self.DELIVERY_CHANNELS,
+                )
 
-            # Determine which channels to use based on preferences
-            # For now, queue for all enabled channels
-            channels = ["in_app", "email", "push", "sms"]
+            # Select queue based on priority
+            queue = self.PRIORITY_QUEUES.get(notification.priority, "notifications_normal")
 
-            # Queue task for each channel separately
-            for channel in channels:
+            # Queue task for each deliverable channel separately
+            for channel in routes["send"]:
                 deliver_notification_task.apply_async(
                     args=[
                         str(notification.id),
                         channel,
-                        str(notification.recipient.id),
+                        str(notification.recipient_id),
                     ],
                     queue=queue,
-                    countdown=0,
                 )
 
             logger.info(
@@ -1310,6 +2463,120 @@ class NotificationService:
             logger.error(f"Error queuing notification: {e}")
             return False
 
+    def _queue_notifications(
+        self,
+        notifications: List[Notification],
+        routes: Optional[Dict[Any, Dict[str, Any]]] = None,
+    ) -> int:
+        """
+        Queue many notifications for async delivery in chunked batch tasks.
+
+        Notifications are grouped by priority queue and channel, and each
+        group gets one ``deliver_notification_batch_task`` per
+        ``DELIVERY_BATCH_SIZE`` notifications, rather than one task per
+        notification and channel. Only channels the recipients' preferences
+        allow are queued; quiet hours channels are left for
+        ``release_scheduled_notifications``.
+
+        Args:
+            notifications: Notification instances
+            routes: Channel routes from ``PreferenceService.route_channels``
+                keyed by notification id, resolved from the recipients'
+                preferences when omitted
+
+        Returns:
+            int - Number of tasks queued
+        """
+        try:
+            # Import here to avoid circular dependency
+            from payroll.tasks import deliver_notification_batch_task
+
+            if routes is None:
+                preferences = self.preference_service.get_preferences_for(
+                    [notification.recipient for notification in notifications]
+                )
+                routes = {
+                    notification.id: self.preference_service.route_channels(
+                        preferences[notification.recipient_id],
+                        notification.notification_type,
+                        notification.priority,
+                        self.DELIVERY_CHANNELS,
+                    )
+                    for notification in notifications
+                }
+
+            groups: Dict[Tuple[str, str], List[str]] = {}
+            for notification in notifications:
+                queue = self.PRIORITY_QUEUES.get(notification.priority, "notifications_normal")
+                for channel in routes[notification.id]["send"]:
+                    groups.setdefault((queue, channel), []).append(str(notification.id))
+
+            queued = 0
+            for (queue, channel), notification_ids in groups.items():
+                for start in range(0, len(notification_ids), self.DELIVERY_BATCH_SIZE):
+                    deliver_notification_batch_task.apply_async(
+                        args=[notification_ids[start : start + self.DELIVERY_BATCH_SIZE], channel],
+                        queue=queue,
+                    )
+                    queued += 1
+
+            logger.info(
+                f"Queued {len(notifications)} notifications for delivery in {queued} tasks"
+            )
+
+            return queued
+
+        except ImportError:
+            logger.warning("Celery tasks module not available, skipping queue")
+            return 0
+
+        except Exception as e:
+            logger.error(f"Error queuing notifications: {e}")
+            return 0
+
+    def release_scheduled_notifications(self) -> int:
+        """
+        Queue the channels held for quiet hours once quiet hours have ended.
+
+        Held channels stay ``SCHEDULED`` in ``delivery_status`` until
+        ``scheduled_until`` instead of being queued with a broker ETA, which
+        the Redis transport would redeliver once its visibility timeout ran
+        out. Each chunk is claimed by clearing ``scheduled_until`` in the
+        transaction that selects it, so overlapping sweeps skip it.
+
+        Returns:
+            int - Number of notifications released
+        """
+        released = 0
+        while True:
+            with transaction.atomic():
+                notifications = list(
+                    Notification.objects.select_for_update(skip_locked=True)
+                    .filter(scheduled_until__lte=timezone.now(), is_deleted=False)
+                    .order_by("scheduled_until")
+                    .only("id", "recipient_id", "priority", "delivery_status")[
+                        : self.RELEASE_BATCH_SIZE
+                    ]
+                )
+                if not notifications:
+                    return released
+                Notification.objects.filter(
+                    id__in=[notification.id for notification in notifications]
+                ).update(scheduled_until=None)
+
+            routes = {
+                notification.id: {
+                    "send": [
+                        channel
+                        for channel, status in notification.delivery_status.items()
+                        if status.get("status") == "SCHEDULED"
+                    ]
+                }
+                for notification in notifications
+            }
+            self._queue_notifications(notifications, routes)
+            released += len(notifications)
+
     def mark_as_read(self, notification_id: str, recipient: EmployeeProfile) -> bool:
         """
         Mark a notification as read.
@@ -1357,10 +2624,10 @@ class NotificationService:
                 is_deleted=False,
             ).update(is_read=True, read_at=timezone.now())
 
-            # Invalidate notification lists and force the badge count to the
-            # post-update value. Pattern deletion can miss prefixed Redis keys.
+            # Lower the badge count by what was marked rather than zeroing
+            # it, so a notification created meanwhile stays counted.
+            self.unread_count_service.adjust({str(recipient.id): -updated})
             self.cache_service.invalidate_user_cache(str(recipient.id))
-            self.cache_service.set_unread_count(str(recipient.id), 0)
 
             logger.info(f"Marked {updated} notifications as read for {recipient.id}")
 
@@ -1372,7 +2639,10 @@ class NotificationService:
 
     def get_unread_count(self, recipient: EmployeeProfile) -> int:
         """
-        Get unread notification count for a recipient with caching.
+        Get unread notification count for a recipient.
+
+        Reads the maintained counter from ``UnreadCountService`` instead of
+        counting notifications.
 
         Args:
             recipient: EmployeeProfile instance
@@ -1381,22 +2651,7 @@ class NotificationService:
             int - Unread notification count
         """
         try:
-            # Try cache first
-            cached = self.cache_service.get_unread_count(str(recipient.id))
-            if cached is not None:
-                return cached
-
-            # Get from database
-            count = Notification.objects.filter(
-                recipient=recipient,
-                is_read=False,
-                is_deleted=False,
-            ).count()
-
-            # Cache the result
-            self.cache_service.set_unread_count(str(recipient.id), count)
-
-            return count
+            return self.unread_count_service.get_count(str(recipient.id))
 
         except Exception as e:
             logger.error(f"Error getting unread count: {e}")
@@ -1532,11 +2787,14 @@ class NotificationService:
             int - Number of notifications deleted
         """
         try:
-            updated = Notification.objects.filter(
-                recipient=recipient, is_deleted=False
-            ).update(is_deleted=True, deleted_at=timezone.now())
+            now = timezone.now()
+            remaining = Notification.objects.filter(recipient=recipient, is_deleted=False)
+            # Delete the unread ones first so their number adjusts the counter
+            unread = remaining.filter(is_read=False).update(is_deleted=True, deleted_at=now)
+            updated = unread + remaining.update(is_deleted=True, deleted_at=now)
 
             # Invalidate cache
+            self.unread_count_service.adjust({str(recipient.id): -unread})
             self.cache_service.invalidate_user_cache(str(recipient.id))
 
             logger.info(f"Deleted {updated} notifications for {recipient.id}")
@@ -127,16 +127,8 @@ def handle_payroll_period_closure(sender, instance, **kwargs):
     Create comprehensive journal entries when a payroll period is closed.
     Implements proper double-entry bookkeeping for all payroll transactions.
     """
-    if not instance.pk:
-        return
-
-    try:
-        old_instance = PayrollRun.objects.get(pk=instance.pk)
-    except PayrollRun.DoesNotExist:
-        return
-
     # Trigger only when 'closed' changes from False to True
-    if not old_instance.closed and instance.closed:
+    if instance.is_being_closed(kwargs.get("update_fields")):
         company = instance.company
         if source_journal_exists(instance, "Payroll for period:", company=company):
             return
@@ -7,11 +7,14 @@ background processing operations.
 
 from payroll.tasks.notification_tasks import (
     deliver_notification_task,
+    deliver_notification_batch_task,
     send_in_app_notification_task,
     send_email_notification_task,
     send_push_notification_task,
     send_sms_notification_task,
     archive_old_notifications_task,
+    release_scheduled_notifications_task,
+    reconcile_unread_counts_task,
     send_daily_digest_task,
     send_weekly_digest_task,
 )
@@ -19,11 +22,14 @@ from payroll.tasks.payslip_tasks import send_payslips_for_payroll_run_task
 
 __all__ = [
     "deliver_notification_task",
+    "deliver_notification_batch_task",
     "send_in_app_notification_task",
     "send_email_notification_task",
     "send_push_notification_task",
     "send_sms_notification_task",
     "archive_old_notifications_task",
+    "release_scheduled_notifications_task",
+    "reconcile_unread_counts_task",
     "send_daily_digest_task",
     "send_weekly_digest_task",
     "send_payslips_for_payroll_run_task",
@@ -10,26 +10,25 @@ exponential backoff for handling transient failures.
 """
 
 import logging
-from datetime import datetime, timedelta
 from typing import Optional, Dict, Any
 
 from celery import shared_task, Task
 from celery.exceptions import Retry
-from django.conf import settings
-from django.core.cache import cache
-from django.core.mail import EmailMultiAlternatives, get_connection
-from django.template.loader import render_to_string
-from django.utils import timezone
+from django.core.mail import get_connection
 
 from payroll.models.notification import (
     Notification,
     NotificationDeliveryLog,
     NotificationChannel,
     DeliveryStatus,
-    NotificationType,
-    NotificationPreference,
 )
-from payroll.services.notification_service import NotificationService
+from payroll.services.notification_service import (
+    AggregationService,
+    ArchiveService,
+    DigestService,
+    NotificationService,
+    UnreadCountService,
+)
 
 # Configure logger
 logger = logging.getLogger(__name__)
@@ -66,6 +65,24 @@ class BaseNotificationTask(Task):
         super().on_success(retval, task_id, args, kwargs)
 
 
+def _get_handler_class(channel: str):
+    """Return the delivery handler class for a channel, or None if unknown."""
+    # Import handlers dynamically to avoid circular imports
+    from payroll.handlers.delivery_handlers import (
+        InAppHandler,
+        EmailHandler,
+        PushHandler,
+        SMSHandler,
+    )
+
+    return {
+        "in_app": InAppHandler,
+        "email": EmailHandler,
+        "push": PushHandler,
+        "sms": SMSHandler,
+    }.get(channel)
+
+
 @shared_task(
     bind=True,
     base=BaseNotificationTask,
@@ -142,11 +159,18 @@ def deliver_notification_task(
             }
 
         # Check if notification is already delivered via this channel
-        existing_log = NotificationDeliveryLog.objects.filter(
-            notification=notification, channel=channel, recipient_id=recipient_id
-        ).first()
+        delivered_log_id = (
+            NotificationDeliveryLog.objects.filter(
+                notification=notification,
+                channel=channel,
+                recipient_id=recipient_id,
+                status=DeliveryStatus.DELIVERED,
+            )
+            .values_list("id", flat=True)
+            .first()
+        )
 
-        if existing_log and existing_log.status == "DELIVERED":
+        if delivered_log_id:
 
             logger.info(
                 f"Notification already delivered: notification_id={notification_id}, "
@@ -156,47 +180,26 @@ def deliver_notification_task(
                 "success": True,
                 "status": "already_delivered",
                 "message": "Notification already delivered",
-                "delivery_log_id": existing_log.id,
+                "delivery_log_id": delivered_log_id,
             }
 
-        # Create or update delivery log
-        if existing_log:
-            delivery_log = existing_log
-            delivery_log.status = "PENDING"
-            delivery_log.retry_count = retry_count
-            delivery_log.last_attempt_at = timezone.now()
-        else:
-            delivery_log = NotificationDeliveryLog.objects.create(
-                notification=notification,
-                channel=channel,
-                recipient_id=recipient_id,
-                status="PENDING",
-                retry_count=retry_count,
-            )
-
-        # Import handlers dynamically to avoid circular imports
-        from payroll.handlers.delivery_handlers import (
-            InAppHandler,
-            EmailHandler,
-            PushHandler,
-            SMSHandler,
-        )
-
-        # Route to appropriate handler
-        handler_map = {
-            "in_app": InAppHandler,
-            "email": EmailHandler,
-            "push": PushHandler,
-            "sms": SMSHandler,
-        }
+        from payroll.handlers.delivery_handlers import DeliveryLogBuffer
 
-        handler_class = handler_map.get(channel)
+        # Every log write for this attempt goes out in one upsert
+        log_buffer = DeliveryLogBuffer()
+        handler_class = _get_handler_class(channel)
         if not handler_class:
             error_msg = f"No handler found for channel: {channel}"
             logger.error(error_msg)
-            delivery_log.status = DeliveryStatus.FAILED
-            delivery_log.error_message = error_msg
-            delivery_log.save()
+            delivery_log = log_buffer.add(
+                notification=notification,
+                recipient_id=recipient_id,
+                channel=channel,
+                status=DeliveryStatus.FAILED,
+                message=error_msg,
+                retry_count=retry_count,
+            )
+            log_buffer.flush()
             return {
                 "success": False,
                 "status": "failed",
@@ -205,16 +208,21 @@ def deliver_notification_task(
             }
 
         # Deliver notification
-        handler = handler_class()
+        handler = handler_class(log_buffer=log_buffer, retry_count=retry_count)
         try:
             result = handler.deliver(notification, recipient_id)
         except Exception as e:
             logger.exception(f"Handler error for channel {channel}: {e}")
             # Update delivery log with error
-            delivery_log.status = "FAILED"
-            delivery_log.error_message = str(e)
-            delivery_log.last_attempt_at = timezone.now()
-            delivery_log.save()
+            delivery_log = log_buffer.add(
+                notification=notification,
+                recipient_id=recipient_id,
+                channel=channel,
+                status=DeliveryStatus.FAILED,
+                message=str(e),
+                retry_count=retry_count,
+            )
+            log_buffer.flush()
 
             # Retry if within limits
             if retry_count < self.retry_kwargs["max_retries"]:
@@ -231,31 +239,45 @@ def deliver_notification_task(
                 "delivery_log_id": delivery_log.id,
             }
 
-        # Update delivery log based on result
+        # Record the outcome; handlers log their own successful deliveries
         if result.get("success"):
-            delivery_log.status = "DELIVERED"
-            delivery_log.delivered_at = timezone.now()
-            delivery_log.metadata = result.get("metadata", {})
+            status = DeliveryStatus.DELIVERED
+            if not log_buffer:
+                log_buffer.add(
+                    notification=notification,
+                    recipient_id=recipient_id,
+                    channel=channel,
+                    status=status,
+                    metadata=result.get("metadata", {}),
+                    retry_count=retry_count,
+                )
             logger.info(
                 f"Notification delivered successfully: notification_id={notification_id}, "
                 f"channel={channel}, recipient_id={recipient_id}"
             )
         else:
-            delivery_log.status = "FAILED"
-            delivery_log.error_message = result.get("error", "Unknown error")
+            status = DeliveryStatus.FAILED
+            error_message = result.get("error", "Unknown error")
+            log_buffer.add(
+                notification=notification,
+                recipient_id=recipient_id,
+                channel=channel,
+                status=status,
+                message=error_message,
+                retry_count=retry_count,
+            )
             logger.warning(
                 f"Notification delivery failed: notification_id={notification_id}, "
-                f"channel={channel}, error={delivery_log.error_message}"
+                f"channel={channel}, error={error_message}"
             )
 
-        delivery_log.last_attempt_at = timezone.now()
-        delivery_log.save()
+        delivery_logs = log_buffer.flush()
 
         return {
             "success": result.get("success", False),
-            "status": delivery_log.status,
+            "status": status,
             "message": result.get("message", ""),
-            "delivery_log_id": delivery_log.id,
+            "delivery_log_id": delivery_logs[-1].id if delivery_logs else None,
         }
 
     except Retry:
@@ -271,6 +293,211 @@ def deliver_notification_task(
         }
 
 
+@shared_task(
+    bind=True,
+    base=BaseNotificationTask,
+    name="payroll.deliver_notification_batch",
+    autoretry_for=(),
+    max_retries=3,
+    default_retry_delay=60,
+)
+def deliver_notification_batch_task(
+    self, notification_ids: list, channel: str
+) -> Dict[str, Any]:
+    """
+    Deliver a chunk of notifications through one channel.
+
+    Queued by ``NotificationService.send_notifications`` so a bulk send costs
+    a few broker messages per channel instead of one per notification. The
+    notifications and their existing delivery logs are loaded with one query
+    each, and every delivery log from the batch is written in one upsert
+    when it finishes, including when it fails part way. Email batches share
+    one mail connection, and in-app batches are broadcast from one event
+    loop when the batch finishes; a failed broadcast is logged as a failed
+    delivery, as in ``InAppHandler.deliver``. A notification whose handler
+    raises is handed to ``deliver_notification_task``, which owns the
+    per-notification retry and backoff.
+
+    The task is not retried automatically, since that would resend the
+    notifications already delivered. An unexpected error retries the batch
+    with only the notifications it had not reached, after broadcasting the
+    in-app notifications it had.
+
+    Args:
+        notification_ids: IDs of the notifications to deliver
+        channel: Delivery channel (in_app, email, push, sms)
+
+    Returns:
+        Dict with counts of delivered, failed, skipped and retried
+        notifications
+    """
+    summary = {"delivered": 0, "failed": 0, "skipped": 0, "retried": 0}
+
+    from payroll.handlers.delivery_handlers import DeliveryLogBuffer, WebSocketBroadcaster
+
+    handler_class = _get_handler_class(channel)
+    if not handler_class:
+        logger.error(f"No handler found for channel: {channel}")
+        summary["failed"] = len(notification_ids)
+        return summary
+
+    notifications = list(
+        Notification.objects.filter(id__in=notification_ids).select_related(
+            "recipient__user"
+        )
+    )
+    delivered_ids = set(
+        NotificationDeliveryLog.objects.filter(
+            notification_id__in=notification_ids,
+            channel=channel,
+            status=DeliveryStatus.DELIVERED,
+        ).values_list("notification_id", flat=True)
+    )
+
+    retry_count = self.request.retries
+    log_buffer = DeliveryLogBuffer()
+    connection = None
+    broadcaster = None
+    handled = set()
+    delivered = []
+    try:
+        if channel == NotificationChannel.EMAIL:
+            # One mail connection for the whole batch instead of one per email
+            connection = get_connection()
+            connection.open()
+            handler = handler_class(
+                log_buffer=log_buffer, connection=connection, retry_count=retry_count
+            )
+        elif channel == NotificationChannel.IN_APP:
+            # One event loop and one message per recipient for the whole batch
+            broadcaster = WebSocketBroadcaster()
+            handler = handler_class(
+                log_buffer=log_buffer, broadcaster=broadcaster, retry_count=retry_count
+            )
+        else:
+            handler = handler_class(log_buffer=log_buffer, retry_count=retry_count)
+
+        _deliver_batch(
+            handler,
+            notifications,
+            channel,
+            delivered_ids,
+            log_buffer,
+            summary,
+            handled,
+            delivered,
+        )
+    except Exception as e:
+        pending_ids = [str(n.id) for n in notifications if n.id not in handled]
+        if not pending_ids:
+            raise
+        logger.warning(
+            f"Batch delivery on {channel} failed, retrying "
+            f"{len(pending_ids)} undelivered notifications: {e}"
+        )
+        raise self.retry(args=[pending_ids, channel], exc=e)
+    finally:
+        if connection is not None:
+            connection.close()
+        if broadcaster is not None:
+            # Also when the batch failed part way: the retry leaves out the
+            # in-app notifications already handled, so they go out now.
+            _flush_broadcaster(
+                broadcaster, delivered, channel, log_buffer, summary, retry_count
+            )
+        # Written before any retry runs, so delivered notifications are not resent
+        log_buffer.flush()
+
+    summary["skipped"] += len(notification_ids) - sum(summary.values())
+    logger.info(f"Batch delivery on {channel} finished: {summary}")
+    return summary
+
+
+def _flush_broadcaster(broadcaster, delivered, channel, log_buffer, summary, retry_count):
+    """
+    Broadcast a batch's in-app payloads, logging them as failed if that fails.
+
+    A failed broadcast ends like one in ``InAppHandler.deliver``: the
+    delivered notifications are logged as failed and not retried.
+    """
+    try:
+        broadcaster.flush()
+    except Exception as e:
+        logger.exception(f"Error broadcasting in-app batch: {e}")
+        for notification in delivered:
+            log_buffer.add(
+                notification=notification,
+                recipient_id=str(notification.recipient_id),
+                channel=channel,
+                status=DeliveryStatus.FAILED,
+                message=str(e),
+                retry_count=retry_count,
+            )
+        summary["delivered"] -= len(delivered)
+        summary["failed"] += len(delivered)
+
+
+def _deliver_batch(
+    handler,
+    notifications,
+    channel,
+    delivered_ids,
+    log_buffer,
+    summary,
+    handled,
+    delivered,
+):
+    """
+    Deliver each notification of a batch with ``handler``, updating ``summary``.
+
+    The id of each notification is added to ``handled`` once its outcome is
+    settled, so a batch that fails part way can retry only the rest, and the
+    notifications delivered are appended to ``delivered``.
+    """
+    for notification in notifications:
+        recipient_id = str(notification.recipient_id)
+        if notification.id in delivered_ids:
+            summary["skipped"] += 1
+            handled.add(notification.id)
+            continue
+
+        try:
+            result = handler.deliver(notification, recipient_id)
+        except Exception as e:
+            logger.warning(
+                f"Handler error for channel {channel}, retrying individually: "
+                f"notification_id={notification.id}: {e}"
+            )
+            deliver_notification_task.apply_async(
+                args=[str(notification.id), channel, recipient_id],
+                kwargs={"retry_count": 1},
+                queue=NotificationService.PRIORITY_QUEUES.get(
+                    notification.priority, "notifications_normal"
+                ),
+                countdown=60,
+            )
+            summary["retried"] += 1
+            handled.add(notification.id)
+            continue
+
+        handled.add(notification.id)
+        if result.get("success"):
+            # Handlers log their own successful deliveries
+            summary["delivered"] += 1
+            delivered.append(notification)
+            continue
+
+        summary["failed"] += 1
+        log_buffer.add(
+            notification=notification,
+            recipient_id=recipient_id,
+            channel=channel,
+            status=DeliveryStatus.FAILED,
+            message=result.get("error") or result.get("message") or "Unknown error",
+            retry_count=handler.retry_count,
+        )
+
+
 @shared_task(
     bind=True,
     base=BaseNotificationTask,
@@ -589,7 +816,9 @@ def send_sms_notification_task(
 @shared_task(
     name="payroll.archive_old_notifications",
 )
-def archive_old_notifications_task() -> Dict[str, Any]:
+def archive_old_notifications_task(
+    batch_size: Optional[int] = None, max_batches: Optional[int] = None
+) -> Dict[str, Any]:
     """
     Scheduled task to archive old notifications.
 
@@ -598,68 +827,52 @@ def archive_old_notifications_task() -> Dict[str, Any]:
     the main table to maintain database performance.
 
     The task:
-    1. Finds notifications older than 90 days
-    2. Creates archive records
-    3. Deletes from main table
-    4. Logs archival results
+    1. Continues the unfinished archive run, or starts one with a new cutoff
+    2. Copies each chunk into ArchivedNotification with one bulk insert
+    3. Deletes the chunk from the main table in the same transaction
+    4. Records the run's cursor so an interrupted run resumes where it stopped
+    5. Deletes aggregation buckets whose windows have closed
+
+    Args:
+        batch_size: Notifications moved per transaction
+        max_batches: Stop after this many chunks; the next run continues
 
     Returns:
         Dict containing archival statistics with keys:
         - success: bool - Whether archival succeeded
         - archived_count: int - Number of notifications archived
         - error_count: int - Number of errors encountered
+        - finished: bool - Whether the run reached its cutoff
+        - purged_buckets: int - Number of expired aggregation buckets deleted
         - message: str - Result message
 
     Example:
         >>> result = archive_old_notifications_task.delay()
         >>> result.get()
-        {'success': True, 'archived_count': 150, 'error_count': 0, 'message': 'Archived 150 notifications'}
+        {'success': True, 'archived_count': 150, 'error_count': 0, 'finished': True, 'purged_buckets': 12, 'message': 'Archived 150 notifications'}
     """
     logger.info("Starting archival of old notifications")
 
     try:
-        # Calculate cutoff date (90 days ago)
-        cutoff_date = timezone.now() - timedelta(days=90)
-
-        # Find old notifications
-        old_notifications = Notification.objects.filter(
-            created_at__lt=cutoff_date, is_archived=False
+        service = ArchiveService()
+        run = service.get_or_start_run()
+        archived_count = service.archive(
+            run, batch_size=batch_size, max_batches=max_batches
         )
-
-        count = old_notifications.count()
-        logger.info(f"Found {count} notifications to archive")
-
-        if count == 0:
-            return {
-                "success": True,
-                "archived_count": 0,
-                "error_count": 0,
-                "message": "No notifications to archive",
-            }
-
-        # Archive notifications
-        archived_count = 0
-        error_count = 0
-
-        for notification in old_notifications.iterator(chunk_size=100):
-            try:
-                # Mark as archived
-                notification.is_archived = True
-                notification.archived_at = timezone.now()
-                notification.save(update_fields=["is_archived", "archived_at"])
-                archived_count += 1
-            except Exception as e:
-                logger.error(f"Error archiving notification {notification.id}: {e}")
-                error_count += 1
+        finished = run.finished_at is not None
+        purged_buckets = AggregationService().purge_expired_buckets()
 
         logger.info(
-            f"Archival completed: {archived_count} archived, {error_count} errors"
+            f"Archival {'completed' if finished else 'paused'}: "
+            f"{archived_count} archived, {run.archived_count} in run {run.id}"
         )
 
         return {
             "success": True,
             "archived_count": archived_count,
-            "error_count": error_count,
+            "error_count": 0,
+            "finished": finished,
+            "purged_buckets": purged_buckets,
             "message": f"Archived {archived_count} notifications",
         }
 
@@ -669,6 +882,90 @@ def archive_old_notifications_task() -> Dict[str, Any]:
             "success": False,
             "archived_count": 0,
             "error_count": 1,
+            "finished": False,
+            "purged_buckets": 0,
+            "message": str(e),
+        }
+
+
+@shared_task(
+    name="payroll.release_scheduled_notifications",
+)
+def release_scheduled_notifications_task() -> Dict[str, Any]:
+    """
+    Scheduled task to deliver channels held back for quiet hours.
+
+    Notifications created during a recipient's quiet hours keep their
+    non-critical channels as ``SCHEDULED`` until ``scheduled_until``. This
+    task runs every five minutes and queues batched delivery tasks for the
+    ones whose quiet hours have ended.
+
+    Returns:
+        Dict containing release statistics with keys:
+        - success: bool - Whether the release succeeded
+        - released_count: int - Number of notifications released
+        - message: str - Result message
+    """
+    try:
+        released = NotificationService().release_scheduled_notifications()
+
+        if released:
+            logger.info(f"Released {released} notifications held for quiet hours")
+
+        return {
+            "success": True,
+            "released_count": released,
+            "message": f"Released {released} notifications",
+        }
+
+    except Exception as e:
+        logger.exception(f"Error in release_scheduled_notifications_task: {e}")
+        return {
+            "success": False,
+            "released_count": 0,
+            "message": str(e),
+        }
+
+
+@shared_task(
+    name="payroll.reconcile_unread_counts",
+)
+def reconcile_unread_counts_task(batch_size: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Scheduled task to repair drifted unread notification counters.
+
+    Unread counters are adjusted by delta on every write, so bulk updates
+    that bypass the notification services, hard deletes and lost cache
+    writes can leave them off. This task runs hourly and recounts them in
+    chunks with one grouped query each.
+
+    Args:
+        batch_size: Counter rows checked per grouped COUNT
+
+    Returns:
+        Dict containing reconciliation statistics with keys:
+        - success: bool - Whether reconciliation succeeded
+        - repaired_count: int - Number of counters repaired
+        - message: str - Result message
+    """
+    logger.info("Starting unread counter reconciliation")
+
+    try:
+        repaired = UnreadCountService().reconcile(batch_size=batch_size)
+
+        logger.info(f"Unread counter reconciliation completed: {repaired} repaired")
+
+        return {
+            "success": True,
+            "repaired_count": repaired,
+            "message": f"Repaired {repaired} unread counters",
+        }
+
+    except Exception as e:
+        logger.exception(f"Error in reconcile_unread_counts_task: {e}")
+        return {
+            "success": False,
+            "repaired_count": 0,
             "message": str(e),
         }
 
@@ -685,100 +982,25 @@ def send_daily_digest_task() -> Dict[str, Any]:
     from the past 24 hours and sends them as a single notification.
 
     The task:
-    1. Finds users with daily digest preference enabled
-    2. Aggregates their unread notifications from the past 24 hours
-    3. Creates a digest notification
-    4. Queues the digest for delivery
+    1. Reads every daily subscriber's unread notifications in one query
+    2. Groups them per recipient in a single pass
+    3. Bulk-creates the digest notifications
+    4. Queues the digests for email delivery in chunked batches
 
     Returns:
         Dict containing digest statistics with keys:
         - success: bool - Whether task succeeded
         - digest_count: int - Number of digests created
+        - batch_count: int - Number of email batches queued
         - error_count: int - Number of errors encountered
         - message: str - Result message
 
     Example:
         >>> result = send_daily_digest_task.delay()
         >>> result.get()
-        {'success': True, 'digest_count': 25, 'error_count': 0, 'message': 'Created 25 daily digests'}
+        {'success': True, 'digest_count': 25, 'batch_count': 1, 'error_count': 0, 'message': 'Created 25 daily digests'}
     """
-    logger.info("Starting daily digest generation")
-
-    try:
-        # Calculate date range (past 24 hours)
-        start_date = timezone.now() - timedelta(days=1)
-
-        # Find users with daily digest preference
-        digest_users = NotificationPreference.objects.filter(
-            email_digest_frequency="daily"
-        ).select_related("employee")
-
-        digest_count = 0
-        error_count = 0
-
-        for preference in digest_users.iterator():
-            try:
-                user = preference.employee
-                user_id = user.id
-
-                # Find unread notifications for this user
-                unread_notifications = Notification.objects.filter(
-                    recipient_id=user_id, is_read=False, created_at__gte=start_date
-                ).exclude(notification_type="DIGEST")
-
-                count = unread_notifications.count()
-
-                if count == 0:
-                    logger.debug(f"No unread notifications for user {user_id}")
-                    continue
-
-                # Create digest notification
-                notification_service = NotificationService()
-                digest = notification_service.create_notification(
-                    recipient_id=user_id,
-                    notification_type="DIGEST",
-                    title=f"Daily Digest - {count} New Notifications",
-                    message=f"You have {count} unread notifications from the past 24 hours.",
-                    priority="low",
-                    channels=["in_app", "email"],
-                    metadata={
-                        "digest_type": "daily",
-                        "notification_count": count,
-                        "start_date": start_date.isoformat(),
-                    },
-                    send_async=True,
-                )
-
-                digest_count += 1
-                logger.info(
-                    f"Created daily digest for user {user_id} with {count} notifications"
-                )
-
-            except Exception as e:
-                logger.error(
-                    f"Error creating daily digest for user {preference.user_id}: {e}"
-                )
-                error_count += 1
-
-        logger.info(
-            f"Daily digest completed: {digest_count} digests created, {error_count} errors"
-        )
-
-        return {
-            "success": True,
-            "digest_count": digest_count,
-            "error_count": error_count,
-            "message": f"Created {digest_count} daily digests",
-        }
-
-    except Exception as e:
-        logger.exception(f"Error in send_daily_digest_task: {e}")
-        return {
-            "success": False,
-            "digest_count": 0,
-            "error_count": 1,
-            "message": str(e),
-        }
+    return _send_digests("daily")
 
 
 @shared_task(
@@ -793,97 +1015,54 @@ def send_weekly_digest_task() -> Dict[str, Any]:
     from the past 7 days and sends them as a single notification.
 
     The task:
-    1. Finds users with weekly digest preference enabled
-    2. Aggregates their unread notifications from the past 7 days
-    3. Creates a digest notification
-    4. Queues the digest for delivery
+    1. Reads every weekly subscriber's unread notifications in one query
+    2. Groups them per recipient in a single pass
+    3. Bulk-creates the digest notifications
+    4. Queues the digests for email delivery in chunked batches
 
     Returns:
         Dict containing digest statistics with keys:
         - success: bool - Whether task succeeded
         - digest_count: int - Number of digests created
+        - batch_count: int - Number of email batches queued
         - error_count: int - Number of errors encountered
         - message: str - Result message
 
     Example:
         >>> result = send_weekly_digest_task.delay()
         >>> result.get()
-        {'success': True, 'digest_count': 25, 'error_count': 0, 'message': 'Created 25 weekly digests'}
+        {'success': True, 'digest_count': 25, 'batch_count': 1, 'error_count': 0, 'message': 'Created 25 weekly digests'}
     """
-    logger.info("Starting weekly digest generation")
+    return _send_digests("weekly")
 
-    try:
-        # Calculate date range (past 7 days)
-        start_date = timezone.now() - timedelta(days=7)
-
-        # Find users with weekly digest preference
-        digest_users = NotificationPreference.objects.filter(
-            email_digest_frequency="weekly"
-        ).select_related("employee")
-
-        digest_count = 0
-        error_count = 0
-
-        for preference in digest_users.iterator():
-            try:
-                user = preference.employee
-                user_id = user.id
-
-                # Find unread notifications for this user
-                unread_notifications = Notification.objects.filter(
-                    recipient_id=user_id, is_read=False, created_at__gte=start_date
-                ).exclude(notification_type="DIGEST")
-
-                count = unread_notifications.count()
-
-                if count == 0:
-                    logger.debug(f"No unread notifications for user {user_id}")
-                    continue
-
-                # Create digest notification
-                notification_service = NotificationService()
-                digest = notification_service.create_notification(
-                    recipient_id=user_id,
-                    notification_type="DIGEST",
-                    title=f"Weekly Digest - {count} New Notifications",
-                    message=f"You have {count} unread notifications from the past week.",
-                    priority="low",
-                    channels=["in_app", "email"],
-                    metadata={
-                        "digest_type": "weekly",
-                        "notification_count": count,
-                        "start_date": start_date.isoformat(),
-                    },
-                    send_async=True,
-                )
 
-                digest_count += 1
-                logger.info(
-                    f"Created weekly digest for user {user_id} with {count} notifications"
-                )
+def _send_digests(frequency: str) -> Dict[str, Any]:
+    """Run one digest pass for ``frequency`` and summarize it for the task result."""
+    logger.info(f"Starting {frequency} digest generation")
 
-            except Exception as e:
-                logger.error(
-                    f"Error creating weekly digest for user {preference.user_id}: {e}"
-                )
-                error_count += 1
+    try:
+        summary = DigestService().send_digests(frequency)
 
         logger.info(
-            f"Weekly digest completed: {digest_count} digests created, {error_count} errors"
+            f"{frequency.capitalize()} digest completed: {summary['digest_count']} digests "
+            f"covering {summary['notification_count']} notifications, "
+            f"{summary['batch_count']} email batches queued"
         )
 
         return {
             "success": True,
-            "digest_count": digest_count,
-            "error_count": error_count,
-            "message": f"Created {digest_count} weekly digests",
+            "digest_count": summary["digest_count"],
+            "batch_count": summary["batch_count"],
+            "error_count": 0,
+            "message": f"Created {summary['digest_count']} {frequency} digests",
         }
 
     except Exception as e:
-        logger.exception(f"Error in send_weekly_digest_task: {e}")
+        logger.exception(f"Error in send_{frequency}_digest_task: {e}")
         return {
             "success": False,
             "digest_count": 0,
+            "batch_count": 0,
             "error_count": 1,
             "message": str(e),
         }
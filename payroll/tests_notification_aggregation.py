@@ -0,0 +1,193 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from company.models import Company
+from payroll.models import Notification, NotificationAggregationBucket
+from payroll.services.notification_service import AggregationService, NotificationService
+
+
+User = get_user_model()
+
+
+@patch("payroll.tasks.deliver_notification_task.apply_async")
+class NotificationAggregationTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        company = Company.objects.create(name="Aggregate Co")
+        user = User.objects.create_user(
+            email="aggregate@test.com",
+            password="password123",
+            company=company,
+            active_company=company,
+        )
+        self.employee = user.employee_user
+        self.service = NotificationService()
+
+    def _send(self, notification_type="LEAVE_PENDING"):
+        return self.service.send_notification(
+            recipient=self.employee,
+            notification_type=notification_type,
+            title="Leave request",
+            message="A leave request needs review.",
+        )
+
+    def test_window_notifications_fold_into_one_aggregate(self, apply_async):
+        first = self._send()
+        self.assertFalse(first.is_aggregated)
+        queued = apply_async.call_count
+
+        aggregated = self._send()
+        self.assertTrue(aggregated.is_aggregated)
+        self.assertEqual(aggregated.aggregation_count, 2)
+
+        again = self._send()
+
+        self.assertEqual(again.id, aggregated.id)
+        self.assertEqual(apply_async.call_count, queued)
+        again.refresh_from_db()
+        self.assertEqual(again.aggregation_count, 3)
+        self.assertEqual(again.title, "3 Leave Pending")
+        self.assertEqual(again.aggregated_with.count(), 3)
+        self.assertEqual(len(again.template_context["notification_ids"]), 3)
+        self.assertIn(str(first.id), again.template_context["notification_ids"])
+        self.assertFalse(Notification.objects.filter(is_aggregated=False).exists())
+        bucket = NotificationAggregationBucket.objects.get()
+        self.assertEqual(bucket.notification_count, 3)
+        self.assertEqual(bucket.first_notification, first)
+        self.assertEqual(bucket.aggregated_notification, again)
+
+    def test_absorbing_into_aggregate_is_a_fixed_number_of_queries(self, apply_async):
+        self._send()
+        self._send()
+        notification = Notification.objects.create(
+            recipient=self.employee,
+            notification_type="LEAVE_PENDING",
+            title="Leave request",
+            message="A leave request needs review.",
+        )
+
+        # Savepoint, bucket increment and read, aggregate update, link, flag, release
+        with self.assertNumQueries(7):
+            AggregationService().aggregate(notification)
+
+    def test_read_aggregate_is_reopened_by_new_activity(self, apply_async):
+        self._send()
+        aggregated = self._send()
+        aggregated.mark_as_read()
+        unread = self.service.get_unread_count(self.employee)
+
+        self._send()
+
+        aggregated.refresh_from_db()
+        self.assertFalse(aggregated.is_read)
+        # The new notification and the reopened aggregate
+        self.assertEqual(self.service.get_unread_count(self.employee), unread + 2)
+
+    def test_types_and_windows_have_separate_buckets(self, apply_async):
+        self._send("LEAVE_PENDING")
+        self.assertFalse(self._send("IOU_PENDING").is_aggregated)
+
+        later = timezone.now() + timedelta(hours=1)
+        with patch("django.utils.timezone.now", return_value=later):
+            self.assertFalse(self._send("LEAVE_PENDING").is_aggregated)
+
+        self.assertEqual(NotificationAggregationBucket.objects.count(), 3)
+
+    def test_notifications_past_max_count_are_delivered_on_their_own(self, apply_async):
+        with patch.dict(
+            AggregationService.AGGREGATION_RULES["LEAVE_PENDING"], {"max_count": 2}
+        ):
+            self._send()
+            self.assertTrue(self._send().is_aggregated)
+            self.assertFalse(self._send().is_aggregated)
+
+    def test_expired_buckets_are_purged(self, apply_async):
+        self._send()
+        NotificationAggregationBucket.objects.update(
+            window_start=timezone.now() - timedelta(hours=3)
+        )
+
+        self.assertEqual(AggregationService().purge_expired_buckets(), 1)
+        self.assertFalse(NotificationAggregationBucket.objects.exists())
+
+
+@patch("payroll.tasks.deliver_notification_batch_task.apply_async")
+class BulkNotificationAggregationTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        company = Company.objects.create(name="Bulk Aggregate Co")
+        self.employees = [
+            User.objects.create_user(
+                email=f"bulk-aggregate{index}@test.com",
+                password="password123",
+                company=company,
+                active_company=company,
+            ).employee_user
+            for index in range(6)
+        ]
+        self.service = NotificationService()
+
+    def _send_bulk(self, recipients):
+        return self.service.send_bulk_notification(
+            recipients=recipients,
+            notification_type="INFO",
+            title="Heads up",
+            message="Message",
+        )
+
+    def test_bulk_aggregation_is_a_fixed_number_of_queries(self, apply_async):
+        counts = []
+        for recipients in (self.employees[:2], self.employees[2:]):
+            with CaptureQueriesContext(connection) as queries:
+                self._send_bulk(recipients)
+            counts.append(len(queries))
+        self.assertEqual(counts[0], counts[1])
+
+        self._send_bulk(self.employees)
+        # Notifications, unread counters, savepoint, buckets insert and lock,
+        # aggregates, links, flags, buckets update, release
+        with self.assertNumQueries(10):
+            notifications = self._send_bulk(self.employees)
+
+        self.assertEqual(len(notifications), 6)
+        for aggregated in notifications:
+            self.assertTrue(aggregated.is_aggregated)
+            self.assertEqual(aggregated.aggregation_count, 3)
+            self.assertEqual(aggregated.aggregated_with.count(), 3)
+
+    def test_bulk_send_returns_aggregate_with_every_absorbed_notification(self, apply_async):
+        recipient = self.employees[0]
+        notifications = self.service.send_notifications(
+            [
+                {
+                    "recipient": recipient,
+                    "notification_type": "INFO",
+                    "title": f"Heads up {index}",
+                    "message": "Message",
+                }
+                for index in range(5)
+            ]
+        )
+
+        first, aggregated = notifications
+        self.assertEqual(aggregated.aggregation_count, 5)
+        self.assertEqual(aggregated.title, "5 Info")
+        aggregated.refresh_from_db()
+        self.assertEqual(aggregated.aggregation_count, 5)
+        self.assertIn(str(first.id), aggregated.template_context["notification_ids"])
+        self.assertEqual(aggregated.aggregated_with.count(), 5)
+        bucket = NotificationAggregationBucket.objects.get()
+        self.assertEqual(bucket.notification_count, 5)
+        self.assertEqual(bucket.first_notification, first)
+        self.assertEqual(bucket.aggregated_notification, aggregated)
+        # The first notification is delivered on its own
+        self.assertEqual(apply_async.call_args.kwargs["args"][0], [str(first.id)])
+        # The five notifications and the aggregate
+        self.assertEqual(self.service.get_unread_count(recipient), 6)
@@ -0,0 +1,94 @@
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from django.utils import timezone
+
+from company.models import Company
+from payroll.models import ArchivedNotification, Notification, NotificationArchiveRun
+from payroll.models.notification import NotificationDeliveryLog
+from payroll.services.notification_service import UnreadCountService
+from payroll.tasks import archive_old_notifications_task
+
+
+User = get_user_model()
+
+
+class NotificationArchiveTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        company = Company.objects.create(name="Archive Co")
+        user = User.objects.create_user(
+            email="archive@test.com",
+            password="password123",
+            company=company,
+            active_company=company,
+        )
+        self.employee = user.employee_user
+
+    def _notification(self, age_days, **kwargs):
+        notification = Notification.objects.create(
+            recipient=self.employee,
+            notification_type="INFO",
+            title=f"{age_days} days old",
+            message="Message",
+            **kwargs,
+        )
+        Notification.objects.filter(pk=notification.pk).update(
+            created_at=timezone.now() - timedelta(days=age_days)
+        )
+        return notification
+
+    def test_archives_in_chunks_and_resumes_from_recorded_cursor(self):
+        old = [self._notification(age, is_read=True) for age in (200, 150, 120)]
+        recent = self._notification(10)
+        NotificationDeliveryLog.objects.create(
+            notification=old[0], channel="email", recipient=self.employee, status="DELIVERED"
+        )
+
+        first = archive_old_notifications_task(batch_size=2, max_batches=1)
+
+        self.assertEqual(first["archived_count"], 2)
+        self.assertFalse(first["finished"])
+        run = NotificationArchiveRun.objects.get()
+        self.assertIsNone(run.finished_at)
+        self.assertEqual(run.archived_count, 2)
+        self.assertEqual(run.last_notification_id, old[1].id)
+        self.assertFalse(NotificationDeliveryLog.objects.exists())
+
+        second = archive_old_notifications_task(batch_size=2)
+
+        self.assertEqual(second["archived_count"], 1)
+        self.assertTrue(second["finished"])
+        run.refresh_from_db()
+        self.assertIsNotNone(run.finished_at)
+        self.assertEqual(run.archived_count, 3)
+        self.assertEqual(list(Notification.objects.values_list("id", flat=True)), [recent.id])
+        archived = ArchivedNotification.objects.get(original_notification_id=old[2].id)
+        self.assertEqual(archived.recipient, self.employee)
+        self.assertEqual(archived.title, "120 days old")
+        self.assertTrue(archived.is_read)
+        self.assertEqual(ArchivedNotification.objects.count(), 3)
+
+    def test_finished_run_is_not_reused(self):
+        archive_old_notifications_task()
+        self._notification(100)
+
+        result = archive_old_notifications_task()
+
+        self.assertEqual(result["archived_count"], 1)
+        self.assertEqual(NotificationArchiveRun.objects.filter(finished_at__isnull=False).count(), 2)
+
+    def test_archiving_unread_notifications_lowers_the_unread_count(self):
+        for age in (200, 150, 120):
+            self._notification(age)
+        self._notification(10)
+        service = UnreadCountService()
+        self.assertEqual(service.get_count(self.employee.id), 4)
+
+        archive_old_notifications_task()
+
+        self.assertEqual(service.get_count(self.employee.id), 1)
+        self.employee.notification_unread_counter.refresh_from_db()
+        self.assertEqual(self.employee.notification_unread_counter.unread_count, 1)
@@ -0,0 +1,179 @@
+from fnmatch import fnmatch
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import SimpleTestCase
+
+from payroll.services.notification_service import NotificationCacheService
+
+
+class NotificationCacheNamespaceTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.service = NotificationCacheService()
+
+    def test_invalidation_moves_recipient_to_a_new_namespace(self):
+        self.service.set_notifications("42", ["cached"], read_status="unread")
+        self.service.set_notifications("43", ["other"], read_status="unread")
+        self.service.set_unread_count("42", 5)
+
+        self.assertTrue(self.service.invalidate_user_cache("42"))
+
+        self.assertIsNone(self.service.get_notifications("42", read_status="unread"))
+        # The unread counter is maintained, not invalidated
+        self.assertEqual(self.service.get_unread_count("42"), 5)
+        self.assertEqual(cache.get("notifications:42:version"), 1)
+        self.assertEqual(self.service.get_notifications("43", read_status="unread"), ["other"])
+
+        self.service.set_notifications("42", ["fresh"], read_status="unread")
+        self.service.invalidate_users_cache(["42", "43"])
+        self.assertEqual(cache.get("notifications:42:version"), 2)
+        self.assertIsNone(self.service.get_notifications("42", read_status="unread"))
+        self.assertIsNone(self.service.get_notifications("43", read_status="unread"))
+
+
+class FakeRedis:
+    """In-memory stand-in for the redis-py client calls the Redis paths make."""
+
+    def __init__(self, data=None):
+        self.data = {key: str(value).encode() for key, value in (data or {}).items()}
+        self.pipelines = []
+        self.scripts = []
+
+    def scan_iter(self, match=None, count=None):
+        return iter([key.encode() for key in sorted(self.data) if fnmatch(key, match)])
+
+    def mget(self, keys):
+        return [self.data.get(key) for key in keys]
+
+    def delete(self, *keys):
+        for key in keys:
+            self.data.pop(key.decode() if isinstance(key, bytes) else key, None)
+
+    def incr(self, key, amount=1):
+        value = int(self.data.get(key, b"0")) + amount
+        self.data[key] = str(value).encode()
+        return value
+
+    def pipeline(self, transaction=True):
+        pipeline = FakePipeline(self)
+        self.pipelines.append(pipeline)
+        return pipeline
+
+    def register_script(self, script):
+        self.scripts.append(script)
+        return FakeIncrIfExistsScript(self)
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+        self.executed = False
+
+    def incr(self, key, amount=1):
+        self.commands.append(lambda: self.redis.incr(key, amount))
+
+    def execute(self):
+        self.executed = True
+        return [command() for command in self.commands]
+
+
+class FakeIncrIfExistsScript:
+    """Runs ``INCR_IF_EXISTS_SCRIPT`` semantics: INCRBY only an existing key."""
+
+    def __init__(self, redis):
+        self.redis = redis
+
+    def __call__(self, keys, args, client):
+        def run():
+            if keys[0] in self.redis.data:
+                return self.redis.incr(keys[0], int(args[0]))
+            return None
+
+        client.commands.append(run)
+
+
+@patch("django_redis.get_redis_connection")
+class NotificationCacheRedisTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.service = NotificationCacheService()
+
+    def _key(self, *parts):
+        return cache.make_key(self.service._get_cache_key(*parts))
+
+    def test_version_bumps_go_out_in_one_pipeline(self, get_redis_connection):
+        redis = FakeRedis({self._key("42", "version"): 1})
+        get_redis_connection.return_value = redis
+
+        self.service.invalidate_users_cache(["42", "43"])
+
+        self.assertEqual(len(redis.pipelines), 1)
+        self.assertTrue(redis.pipelines[0].executed)
+        self.assertEqual(redis.data[self._key("42", "version")], b"2")
+        self.assertEqual(redis.data[self._key("43", "version")], b"1")
+
+    def test_unread_increments_skip_uncached_counters(self, get_redis_connection):
+        redis = FakeRedis({self._key("42", "unread_count"): 5})
+        get_redis_connection.return_value = redis
+
+        self.service.incr_unread_counts({"42": -2, "43": 1})
+
+        self.assertEqual(redis.scripts, [NotificationCacheService.INCR_IF_EXISTS_SCRIPT])
+        self.assertEqual(len(redis.pipelines), 1)
+        self.assertEqual(len(redis.pipelines[0].commands), 2)
+        self.assertEqual(redis.data[self._key("42", "unread_count")], b"3")
+        self.assertNotIn(self._key("43", "unread_count"), redis.data)
+
+
+@patch("django_redis.get_redis_connection")
+class PruneNotificationCacheTests(SimpleTestCase):
+    def setUp(self):
+        key = self._key
+        self.stale = [key("42", "v1", "all", "all", "all", "50", "0"), key("43", "v1", "unread")]
+        self.current = [key("42", "v2", "all", "all", "all", "50", "0"), key("43", "v0", "unread")]
+        self.kept = [key("42", "version"), key("42", "unread_count")]
+        self.redis = FakeRedis(
+            {
+                **{name: "cached" for name in self.stale + self.current},
+                key("42", "version"): 2,
+                key("42", "unread_count"): 3,
+            }
+        )
+
+    def _key(self, *parts):
+        return cache.make_key(NotificationCacheService()._get_cache_key(*parts))
+
+    def _prune(self, get_redis_connection, *args):
+        get_redis_connection.return_value = self.redis
+        out = StringIO()
+        call_command("prune_notification_cache", "--batch-size", "2", *args, stdout=out)
+        return out.getvalue()
+
+    def test_prunes_only_entries_from_old_versions(self, get_redis_connection):
+        output = self._prune(get_redis_connection)
+
+        self.assertIn("Deleted 2 of 6", output)
+        self.assertEqual(sorted(self.redis.data), sorted(self.current + self.kept))
+
+    def test_dry_run_counts_without_deleting(self, get_redis_connection):
+        output = self._prune(get_redis_connection, "--dry-run")
+
+        self.assertIn("Would delete 2 of 6", output)
+        self.assertEqual(len(self.redis.data), 6)
+
+    def test_all_deletes_every_namespaced_entry(self, get_redis_connection):
+        output = self._prune(get_redis_connection, "--all")
+
+        self.assertIn("Deleted 4 of 6", output)
+        self.assertEqual(sorted(self.redis.data), sorted(self.kept))
+
+    def test_non_redis_cache_is_rejected(self, get_redis_connection):
+        get_redis_connection.side_effect = NotImplementedError
+
+        with self.assertRaisesMessage(CommandError, "not Redis"):
+            call_command("prune_notification_cache", stdout=StringIO())
@@ -0,0 +1,329 @@
+from datetime import datetime, time, timezone as dt_timezone
+from unittest.mock import patch
+
+from celery.exceptions import Retry
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+
+from company.models import Company
+from payroll.handlers.delivery_handlers import (
+    InAppHandler,
+    SMSHandler,
+    WebSocketBroadcaster,
+)
+from payroll.models import Notification
+from payroll.models.notification import NotificationDeliveryLog, NotificationPreference
+from payroll.services.notification_service import NotificationService
+from payroll.tasks import (
+    deliver_notification_batch_task,
+    deliver_notification_task,
+    release_scheduled_notifications_task,
+)
+
+
+User = get_user_model()
+
+
+class BulkNotificationDeliveryTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.company = Company.objects.create(name="Bulk Notify Co")
+        self.employees = []
+        for index in range(3):
+            user = User.objects.create_user(
+                email=f"bulk{index}@test.com",
+                password="password123",
+                company=self.company,
+                active_company=self.company,
+            )
+            self.employees.append(user.employee_user)
+
+    @patch("payroll.tasks.deliver_notification_batch_task.apply_async")
+    def test_send_bulk_notification_inserts_in_bulk_and_queues_one_task_per_channel(
+        self, apply_async
+    ):
+        NotificationPreference.objects.create(
+            employee=self.employees[2], notifications_enabled=False
+        )
+
+        # Preferences, missing preferences, notifications, unread counters
+        with self.assertNumQueries(4):
+            notifications = NotificationService().send_bulk_notification(
+                recipients=self.employees,
+                notification_type="PAYSLIP_AVAILABLE",
+                title="Payslip Available",
+                message="Your payslip is ready.",
+                priority="HIGH",
+            )
+
+        self.assertEqual(len(notifications), 2)
+        self.assertEqual(
+            set(Notification.objects.values_list("recipient_id", flat=True)),
+            {self.employees[0].id, self.employees[1].id},
+        )
+        self.assertEqual(NotificationPreference.objects.count(), 3)
+        # Default preferences leave push and SMS off
+        self.assertEqual(apply_async.call_count, 2)
+        ids = sorted(str(notification.id) for notification in notifications)
+        for call in apply_async.call_args_list:
+            self.assertEqual(sorted(call.kwargs["args"][0]), ids)
+            self.assertEqual(call.kwargs["queue"], "notifications_high")
+        self.assertEqual(
+            {call.kwargs["args"][1] for call in apply_async.call_args_list},
+            {"in_app", "email"},
+        )
+
+    @patch("payroll.tasks.deliver_notification_task.apply_async")
+    def test_send_notification_routes_channels_from_preferences(self, apply_async):
+        employee = self.employees[0]
+        NotificationPreference.objects.create(
+            employee=employee,
+            sms_enabled=True,
+            push_enabled=True,
+            push_digest_frequency="daily",
+            type_preferences={"PAYSLIP_AVAILABLE": {"email": False}},
+            quiet_hours_enabled=True,
+            quiet_hours_start=time(22, 0),
+            quiet_hours_end=time(7, 0),
+            quiet_hours_timezone="Africa/Lagos",
+        )
+        # 23:30 in Lagos, inside the overnight quiet hours
+        quiet_now = datetime(2026, 3, 2, 22, 30, tzinfo=dt_timezone.utc)
+
+        with patch("django.utils.timezone.now", return_value=quiet_now):
+            notification = NotificationService().send_notification(
+                recipient=employee,
+                notification_type="PAYSLIP_AVAILABLE",
+                title="Payslip Available",
+                message="Your payslip is ready.",
+                priority="HIGH",
+            )
+
+        # Nothing is queued until quiet hours end
+        apply_async.assert_not_called()
+        notification.refresh_from_db()
+        self.assertEqual(
+            notification.scheduled_until,
+            datetime(2026, 3, 3, 6, 0, tzinfo=dt_timezone.utc),
+        )
+        # Email is off for this type and SMS is below its CRITICAL threshold.
+        # Push has no digest run, so its digest setting does not hold it back
+        self.assertEqual(notification.delivery_status["push"]["status"], "SCHEDULED")
+        self.assertEqual(notification.delivery_status["in_app"]["status"], "SCHEDULED")
+        self.assertNotIn("email", notification.delivery_status)
+
+        service = NotificationService()
+        with patch("django.utils.timezone.now", return_value=quiet_now):
+            self.assertEqual(service.release_scheduled_notifications(), 0)
+        morning = datetime(2026, 3, 3, 6, 1, tzinfo=dt_timezone.utc)
+        with patch("django.utils.timezone.now", return_value=morning), patch(
+            "payroll.tasks.deliver_notification_batch_task.apply_async"
+        ) as batch_apply_async:
+            self.assertEqual(release_scheduled_notifications_task()["released_count"], 1)
+            self.assertEqual(service.release_scheduled_notifications(), 0)
+
+        self.assertEqual(
+            sorted(call.kwargs["args"][1] for call in batch_apply_async.call_args_list),
+            ["in_app", "push"],
+        )
+        for call in batch_apply_async.call_args_list:
+            self.assertEqual(call.kwargs["args"][0], [str(notification.id)])
+            self.assertEqual(call.kwargs["queue"], "notifications_high")
+        notification.refresh_from_db()
+        self.assertIsNone(notification.scheduled_until)
+
+    def test_only_daily_and_weekly_email_digests_hold_back_delivery(self):
+        service = NotificationService()
+        routes = {}
+        for frequency in ("hourly", "daily", "weekly"):
+            preference = NotificationPreference(
+                employee=self.employees[0],
+                push_enabled=True,
+                email_digest_frequency=frequency,
+                push_digest_frequency=frequency,
+            )
+            routes[frequency] = service.preference_service.route_channels(
+                preference, "INFO", "HIGH", service.DELIVERY_CHANNELS
+            )
+
+        self.assertEqual(routes["hourly"]["digest"], [])
+        self.assertEqual(routes["hourly"]["send"], ["in_app", "email", "push"])
+        for frequency in ("daily", "weekly"):
+            self.assertEqual(routes[frequency]["digest"], ["email"])
+            self.assertEqual(routes[frequency]["send"], ["in_app", "push"])
+
+    def test_batch_task_skips_delivered_and_logs_failures_in_bulk(self):
+        delivered, failed, raising = [
+            Notification.objects.create(
+                recipient=employee,
+                notification_type="INFO",
+                title="Heads up",
+                message="Message",
+            )
+            for employee in self.employees
+        ]
+        NotificationDeliveryLog.objects.create(
+            notification=delivered,
+            channel="sms",
+            recipient=self.employees[0],
+            status="DELIVERED",
+        )
+
+        def deliver(handler, notification, recipient_id):
+            if notification.id == raising.id:
+                raise ConnectionError("gateway down")
+            return {"success": False, "message": "Recipient phone number not found"}
+
+        with patch.object(SMSHandler, "deliver", autospec=True, side_effect=deliver), patch(
+            "payroll.tasks.notification_tasks.deliver_notification_task.apply_async"
+        ) as retry:
+            summary = deliver_notification_batch_task(
+                [str(delivered.id), str(failed.id), str(raising.id)], "sms"
+            )
+
+        self.assertEqual(summary, {"delivered": 0, "failed": 1, "skipped": 1, "retried": 1})
+        log = NotificationDeliveryLog.objects.get(notification=failed)
+        self.assertEqual(log.status, "FAILED")
+        self.assertEqual(log.error_message, "Recipient phone number not found")
+        self.assertFalse(NotificationDeliveryLog.objects.filter(notification=raising).exists())
+        retry.assert_called_once()
+        self.assertEqual(retry.call_args.kwargs["args"], [str(raising.id), "sms", str(self.employees[2].id)])
+
+    def test_delivery_logs_are_upserted_once_per_attempt(self):
+        notification = Notification.objects.create(
+            recipient=self.employees[0],
+            notification_type="INFO",
+            title="Heads up",
+            message="Message",
+        )
+        recipient_id = str(self.employees[0].id)
+        outcomes = iter([False, True])
+
+        def deliver(handler, notification, recipient_id):
+            if next(outcomes):
+                handler._log_delivery(
+                    notification=notification,
+                    recipient_id=recipient_id,
+                    channel="sms",
+                    status="DELIVERED",
+                    metadata={"message_sid": "SM1"},
+                )
+                return {"success": True, "message": "SMS sent successfully"}
+            return {"success": False, "error": "Rate limit exceeded for SMS delivery"}
+
+        with patch.object(SMSHandler, "deliver", autospec=True, side_effect=deliver):
+            failed = deliver_notification_task(str(notification.id), "sms", recipient_id)
+            delivered = deliver_notification_task(
+                str(notification.id), "sms", recipient_id, retry_count=1
+            )
+
+        self.assertEqual(failed["status"], "FAILED")
+        self.assertEqual(delivered["status"], "DELIVERED")
+        log = NotificationDeliveryLog.objects.get(notification=notification, channel="sms")
+        self.assertEqual(failed["delivery_log_id"], log.id)
+        self.assertEqual(delivered["delivery_log_id"], log.id)
+        self.assertEqual(log.status, "DELIVERED")
+        self.assertEqual(log.metadata, {"message_sid": "SM1"})
+        self.assertIsNotNone(log.delivered_at)
+        self.assertEqual(log.retry_count, 1)
+
+    def test_failed_in_app_batch_still_broadcasts_handled_notifications(self):
+        notifications = [
+            Notification.objects.create(
+                recipient=employee,
+                notification_type="INFO",
+                title="Heads up",
+                message="Message",
+            )
+            for employee in self.employees[:2]
+        ]
+        deliver_in_app = InAppHandler.deliver
+        handled = []
+        broadcast = []
+
+        def deliver(handler, notification, recipient_id):
+            handled.append(notification.id)
+            if len(handled) == 2:
+                raise ConnectionError("channel layer down")
+            return deliver_in_app(handler, notification, recipient_id)
+
+        def flush(broadcaster):
+            broadcast.append(len(broadcaster))
+            return 1
+
+        with patch.object(InAppHandler, "deliver", autospec=True, side_effect=deliver), patch.object(
+            WebSocketBroadcaster, "flush", autospec=True, side_effect=flush
+        ), patch(
+            "payroll.tasks.notification_tasks.deliver_notification_task.apply_async",
+            side_effect=OSError("broker unavailable"),
+        ), patch.object(
+            deliver_notification_batch_task, "retry", side_effect=Retry()
+        ) as retry:
+            with self.assertRaises(Retry):
+                deliver_notification_batch_task(
+                    [str(notification.id) for notification in notifications], "in_app"
+                )
+
+        self.assertEqual(broadcast, [1])
+        self.assertEqual(
+            list(
+                NotificationDeliveryLog.objects.filter(status="DELIVERED").values_list(
+                    "notification_id", flat=True
+                )
+            ),
+            handled[:1],
+        )
+        self.assertEqual(retry.call_args.kwargs["args"], [[str(handled[1])], "in_app"])
+
+    def test_failed_batch_retries_only_undelivered_notifications(self):
+        notifications = [
+            Notification.objects.create(
+                recipient=employee,
+                notification_type="INFO",
+                title="Heads up",
+                message="Message",
+            )
+            for employee in self.employees
+        ]
+        raising = notifications[1]
+        sent = []
+
+        def deliver(handler, notification, recipient_id):
+            if notification.id == raising.id:
+                raise ConnectionError("gateway down")
+            sent.append(notification.id)
+            handler._log_delivery(
+                notification=notification,
+                recipient_id=recipient_id,
+                channel="sms",
+                status="DELIVERED",
+            )
+            return {"success": True, "message": "SMS sent successfully"}
+
+        with patch.object(SMSHandler, "deliver", autospec=True, side_effect=deliver), patch(
+            "payroll.tasks.notification_tasks.deliver_notification_task.apply_async",
+            side_effect=OSError("broker unavailable"),
+        ), patch.object(
+            deliver_notification_batch_task, "retry", side_effect=Retry()
+        ) as retry:
+            with self.assertRaises(Retry):
+                deliver_notification_batch_task(
+                    [str(notification.id) for notification in notifications], "sms"
+                )
+
+        self.assertEqual(
+            set(
+                NotificationDeliveryLog.objects.filter(status="DELIVERED").values_list(
+                    "notification_id", flat=True
+                )
+            ),
+            set(sent),
+        )
+        pending_ids = retry.call_args.kwargs["args"][0]
+        self.assertIn(str(raising.id), pending_ids)
+        self.assertEqual(
+            set(pending_ids) | {str(notification_id) for notification_id in sent},
+            {str(notification.id) for notification in notifications},
+        )
+        self.assertFalse(set(pending_ids) & {str(notification_id) for notification_id in sent})
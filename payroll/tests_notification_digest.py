@@ -0,0 +1,97 @@
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.core import mail
+from django.core.cache import cache
+from django.test import TestCase
+
+from company.models import Company
+from payroll.models import Notification
+from payroll.models.notification import NotificationPreference
+from payroll.tasks import deliver_notification_batch_task, send_daily_digest_task
+
+
+User = get_user_model()
+
+
+class DigestGenerationTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        company = Company.objects.create(name="Digest Co")
+        self.employees = []
+        for index, frequency in enumerate(["daily", "daily", "immediate"]):
+            user = User.objects.create_user(
+                email=f"digest{index}@test.com",
+                password="password123",
+                company=company,
+                active_company=company,
+            )
+            employee = user.employee_user
+            NotificationPreference.objects.create(
+                employee=employee, email_digest_frequency=frequency
+            )
+            self.employees.append(employee)
+
+    def _notify(self, employee, notification_type="INFO", **kwargs):
+        return Notification.objects.create(
+            recipient=employee,
+            notification_type=notification_type,
+            title="Heads up",
+            message="Message",
+            **kwargs,
+        )
+
+    @patch("payroll.tasks.deliver_notification_batch_task.apply_async")
+    def test_daily_digest_is_built_for_all_subscribers_in_bulk(self, apply_async):
+        first = [self._notify(self.employees[0]), self._notify(self.employees[0], "WARNING")]
+        self._notify(self.employees[0], is_read=True)
+        second = self._notify(self.employees[1])
+        unsubscribed = self._notify(self.employees[2])
+
+        result = send_daily_digest_task()
+
+        self.assertEqual(result["digest_count"], 2)
+        self.assertEqual(result["batch_count"], 1)
+        digests = {
+            digest.recipient_id: digest
+            for digest in Notification.objects.filter(aggregation_key__startswith="digest:")
+        }
+        self.assertEqual(set(digests), {self.employees[0].id, self.employees[1].id})
+        digest = digests[self.employees[0].id]
+        self.assertEqual(digest.aggregation_count, 2)
+        self.assertEqual(
+            digest.template_context["grouped"],
+            {"INFO": [str(first[0].id)], "WARNING": [str(first[1].id)]},
+        )
+        self.assertEqual(set(digest.aggregated_with.all()), set(first))
+        self.assertEqual(list(digests[self.employees[1].id].aggregated_with.all()), [second])
+        self.assertEqual(
+            set(Notification.objects.filter(is_aggregated=True).values_list("id", flat=True)),
+            {first[0].id, first[1].id, second.id, *(d.id for d in digests.values())},
+        )
+        unsubscribed.refresh_from_db()
+        self.assertFalse(unsubscribed.is_aggregated)
+
+        apply_async.assert_called_once()
+        self.assertEqual(
+            sorted(apply_async.call_args.kwargs["args"][0]),
+            sorted(str(digest.id) for digest in digests.values()),
+        )
+        self.assertEqual(apply_async.call_args.kwargs["args"][1], "email")
+
+        # A second run has nothing left to digest
+        self.assertEqual(send_daily_digest_task()["digest_count"], 0)
+
+    def test_email_batch_sends_each_digest_to_the_recipient(self):
+        self._notify(self.employees[0])
+        self._notify(self.employees[1])
+        with patch("payroll.tasks.deliver_notification_batch_task.apply_async") as apply_async:
+            send_daily_digest_task()
+
+        summary = deliver_notification_batch_task(*apply_async.call_args.kwargs["args"])
+
+        self.assertEqual(summary["delivered"], 2)
+        self.assertEqual(
+            sorted(message.to[0] for message in mail.outbox),
+            ["digest0@test.com", "digest1@test.com"],
+        )
@@ -0,0 +1,74 @@
+from dataclasses import FrozenInstanceError
+from datetime import time
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from company.models import Company
+from payroll.models.notification import NotificationPreference
+from payroll.services.notification_service import PreferenceService, PreferenceSnapshot
+
+
+User = get_user_model()
+
+
+class PreferenceCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        PreferenceService.local_cache.clear()
+        self.addCleanup(PreferenceService.local_cache.clear)
+        company = Company.objects.create(name="Preference Co")
+        user = User.objects.create_user(
+            email="prefs@test.com",
+            password="password123",
+            company=company,
+            active_company=company,
+        )
+        self.employee = user.employee_user
+        NotificationPreference.objects.create(
+            employee=self.employee,
+            type_preferences={"INFO": {"email": False}},
+            quiet_hours_enabled=True,
+            quiet_hours_start=time(22, 0),
+            quiet_hours_end=time(6, 30),
+        )
+
+    def test_cached_preferences_are_rebuilt_without_queries(self):
+        service = PreferenceService()
+        service.get_preferences(self.employee)
+
+        with self.assertNumQueries(0):
+            snapshot = service.get_preferences(self.employee)
+            self.assertFalse(snapshot.should_send("INFO", "email", "HIGH", ignore_quiet_hours=True))
+            self.assertTrue(snapshot.should_send("INFO", "in_app", "HIGH", ignore_quiet_hours=True))
+
+        self.assertIsInstance(snapshot, PreferenceSnapshot)
+        self.assertEqual(snapshot.quiet_hours_end, time(6, 30))
+        with self.assertRaises(FrozenInstanceError):
+            snapshot.email_enabled = False
+        with self.assertRaises(TypeError):
+            snapshot.type_preferences["INFO"] = {}
+
+    def test_update_preferences_invalidates_cached_copy(self):
+        service = PreferenceService()
+        self.assertTrue(service.get_preferences(self.employee).email_enabled)
+
+        service.update_preferences(self.employee, {"email_enabled": False})
+
+        self.assertFalse(service.get_preferences(self.employee).email_enabled)
+
+    @override_settings(NOTIFICATION_PREFERENCE_LOCAL_CACHE_SIZE=8)
+    def test_local_tier_serves_hits_and_is_evicted_on_save(self):
+        service = PreferenceService()
+        service.get_preferences(self.employee)
+        cache.clear()
+
+        with self.assertNumQueries(0):
+            self.assertTrue(service.get_preferences(self.employee).in_app_enabled)
+
+        preference = NotificationPreference.objects.get(employee=self.employee)
+        preference.in_app_enabled = False
+        preference.save()
+
+        self.assertFalse(service.get_preferences(self.employee).in_app_enabled)
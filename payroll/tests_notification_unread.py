@@ -0,0 +1,104 @@
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db.models import QuerySet
+from django.test import TestCase
+
+from company.models import Company
+from payroll.models import Notification, NotificationUnreadCounter
+from payroll.services.notification_service import NotificationService, UnreadCountService
+from payroll.tasks import reconcile_unread_counts_task
+
+
+User = get_user_model()
+
+
+class UnreadCounterTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        company = Company.objects.create(name="Unread Co")
+        user = User.objects.create_user(
+            email="unread@test.com",
+            password="password123",
+            company=company,
+            active_company=company,
+        )
+        self.employee = user.employee_user
+        self.service = UnreadCountService()
+
+    def _notify(self, **kwargs):
+        return Notification.objects.create(
+            recipient=self.employee,
+            notification_type="INFO",
+            title="Heads up",
+            message="Message",
+            **kwargs,
+        )
+
+    def _stored(self):
+        return NotificationUnreadCounter.objects.get(employee=self.employee).unread_count
+
+    def test_counter_follows_writes_without_counting(self):
+        first = self._notify()
+        self.assertEqual(self.service.get_count(str(self.employee.id)), 1)
+
+        second = self._notify()
+        third = self._notify()
+        self._notify(is_read=True)
+        with self.assertNumQueries(0):
+            self.assertEqual(NotificationService().get_unread_count(self.employee), 3)
+
+        first.mark_as_read()
+        first.mark_as_read()
+        second.soft_delete()
+        self.assertEqual(self._stored(), 1)
+        cache.clear()
+        # A cache miss reads the counter row instead of counting
+        with self.assertNumQueries(1):
+            self.assertEqual(self.service.get_count(str(self.employee.id)), 1)
+
+        first.mark_as_unread()
+        self.assertEqual(self.service.get_count(str(self.employee.id)), 2)
+
+        NotificationService().delete_all_notifications(self.employee)
+        self.assertEqual(self.service.get_count(str(self.employee.id)), 0)
+        self._notify()
+        third.refresh_from_db()
+        self.assertTrue(third.is_deleted)
+        NotificationService().mark_all_as_read(self.employee)
+        self.assertEqual(self._stored(), 0)
+        self.assertEqual(self.service.get_count(str(self.employee.id)), 0)
+
+    def test_mark_all_as_read_keeps_notifications_created_meanwhile(self):
+        self._notify()
+        self._notify()
+        self.assertEqual(self.service.get_count(str(self.employee.id)), 2)
+        update = QuerySet.update
+
+        def update_then_notify(queryset, **kwargs):
+            updated = update(queryset, **kwargs)
+            if queryset.model is Notification and kwargs.get("is_read"):
+                self._notify()
+            return updated
+
+        with patch.object(QuerySet, "update", autospec=True, side_effect=update_then_notify):
+            self.assertEqual(NotificationService().mark_all_as_read(self.employee), 2)
+
+        self.assertEqual(self._stored(), 1)
+        self.assertEqual(self.service.get_count(str(self.employee.id)), 1)
+
+    def test_reconciler_repairs_drifted_counters(self):
+        self._notify()
+        self._notify()
+        self.service.get_count(str(self.employee.id))
+        # Bulk updates outside the services do not adjust the counter
+        Notification.objects.filter(recipient=self.employee).update(is_read=True)
+        self.assertEqual(self.service.get_count(str(self.employee.id)), 2)
+
+        result = reconcile_unread_counts_task()
+
+        self.assertEqual(result["repaired_count"], 1)
+        self.assertEqual(self._stored(), 0)
+        self.assertEqual(self.service.get_count(str(self.employee.id)), 0)
+        self.assertEqual(reconcile_unread_counts_task()["repaired_count"], 0)
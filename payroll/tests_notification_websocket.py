@@ -0,0 +1,81 @@
+import json
+from unittest.mock import AsyncMock
+
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+from django.test import SimpleTestCase
+
+from payroll.consumers.notification_consumer import NotificationConsumer
+from payroll.handlers import WebSocketBroadcaster
+from payroll.handlers.delivery_handlers import notification_group_name
+
+
+class WebSocketBroadcasterTests(SimpleTestCase):
+    def test_flush_sends_one_message_per_recipient_group(self):
+        channel_layer = get_channel_layer()
+        channels = {}
+        for recipient_id in (1, 2):
+            channels[recipient_id] = async_to_sync(channel_layer.new_channel)()
+            async_to_sync(channel_layer.group_add)(
+                notification_group_name(recipient_id), channels[recipient_id]
+            )
+
+        broadcaster = WebSocketBroadcaster()
+        broadcaster.add(1, {"id": "a", "title": "First"})
+        broadcaster.add(1, {"id": "b", "title": "Second"})
+        broadcaster.add(2, {"id": "c", "title": "Third"})
+
+        self.assertEqual(len(broadcaster), 3)
+        self.assertEqual(broadcaster.flush(), 2)
+        self.assertEqual(len(broadcaster), 0)
+
+        message = async_to_sync(channel_layer.receive)(channels[1])
+        self.assertEqual(message["type"], "notification.batch")
+        self.assertEqual(
+            [json.loads(payload)["id"] for payload in message["payloads"]], ["a", "b"]
+        )
+        message = async_to_sync(channel_layer.receive)(channels[2])
+        self.assertEqual([json.loads(payload)["id"] for payload in message["payloads"]], ["c"])
+
+    def test_flush_without_payloads_sends_nothing(self):
+        self.assertEqual(WebSocketBroadcaster().flush(), 0)
+
+
+class NotificationConsumerCoalescingTests(SimpleTestCase):
+    def _consumer(self):
+        consumer = NotificationConsumer()
+        consumer.COALESCE_WINDOW = 0
+        consumer.pending_payloads = []
+        consumer.flush_task = None
+        consumer.send = AsyncMock()
+        consumer.send_unread_count = AsyncMock()
+        return consumer
+
+    def test_burst_is_sent_as_one_frame(self):
+        consumer = self._consumer()
+
+        async def receive_burst():
+            await consumer.notification_batch({"payloads": ['{"id": "a"}', '{"id": "b"}']})
+            await consumer.notification_message({"notification": {"id": "c"}})
+            await consumer.flush_task
+
+        async_to_sync(receive_burst)()
+
+        consumer.send.assert_awaited_once()
+        frame = json.loads(consumer.send.call_args.kwargs["text_data"])
+        self.assertEqual(frame["type"], "notifications")
+        self.assertEqual([item["id"] for item in frame["notifications"]], ["a", "b", "c"])
+        consumer.send_unread_count.assert_awaited_once()
+        self.assertIsNone(consumer.flush_task)
+
+    def test_single_notification_keeps_notification_frame(self):
+        consumer = self._consumer()
+
+        async def receive_one():
+            await consumer.notification_batch({"payloads": ['{"id": "a"}']})
+            await consumer.flush_task
+
+        async_to_sync(receive_one)()
+
+        frame = json.loads(consumer.send.call_args.kwargs["text_data"])
+        self.assertEqual(frame, {"type": "notification", "notification": {"id": "a"}})
@@ -9,6 +9,7 @@ from payroll.forms import (
     RatingForm,
 )
 from payroll import models
+from payroll.services.notification_service import UnreadCountService
 from django.contrib.auth.decorators import login_required
 from django.views.decorators.http import require_POST
 
@@ -1126,9 +1127,7 @@ def index(request):
             notifications = get_employee_notifications(employee_profile)
 
             # Get unread count
-            unread_count = models.Notification.objects.filter(
-                recipient=employee_profile, is_read=False
-            ).count()
+            unread_count = UnreadCountService().get_count(str(employee_profile.id))
 
             # Count pending requests
             pending_requests_count = (
@@ -413,7 +413,9 @@ def notification_type_preferences(request, notification_type):
         preferences = preference_service.get_preferences(employee_profile)
 
         # Update type preferences
-        type_preferences = preferences.type_preferences or {}
+        type_preferences = {
+            key: dict(channels) for key, channels in preferences.type_preferences.items()
+        }
         type_preferences[notification_type] = {
             "in_app": in_app_enabled,
             "email": email_enabled,
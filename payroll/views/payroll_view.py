@@ -65,6 +65,7 @@ from accounting.models import Account
 from accounting.models import Journal
 from accounting.utils import create_journal_entry
 from accounting.permissions import (
+    has_group,
     is_auditor,
     can_view_payroll_data,
     can_modify_payroll_data,
@@ -87,7 +88,7 @@ def _can_manage_employee_requests(user):
     """
     return user.is_authenticated and (
         user.is_superuser
-        or user.groups.filter(name="HR").exists()
+        or has_group(user, "HR")
         or getattr(user, "is_manager", False)
         or user.has_perm("payroll.change_leaverequest")
         or user.has_perm("payroll.change_iou")
@@ -1421,7 +1422,9 @@ def audit_trail_list(request):
     query = request.GET.get("q")
     user_filter = request.GET.get("user")
     action_filter = request.GET.get("action")
-    logs = AuditTrail.objects.all().order_by("-timestamp")
+    logs = AuditTrail.objects.select_related("user", "content_type").order_by(
+        "-timestamp"
+    )
     if query:
         logs = logs.filter(
             Q(user__email__icontains=query)